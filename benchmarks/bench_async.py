@@ -0,0 +1,228 @@
+"""
+Benchmark Async - Jalur asyncio vs jalur thread pada 10 / 100 / 500 request bersamaan
+
+Database pengganti server: file SQLite berisi buku sintetis (CatalogGenerator),
+dengan latency jaringan disimulasikan (--rtt-ms) di setiap query agar mirip
+MySQL di mesin lain. Beban campuran per request: listing satu halaman (keyset),
+pencarian, dan sebagian kecil tambah buku.
+
+- threaded: LibraryController biasa, satu thread per request yang sedang berjalan
+  (ThreadPoolExecutor sebesar tingkat konkurensi), latency = time.sleep
+- async: AsyncLibraryController di satu event loop dengan pool koneksi kecil
+  (--pool-size), latency = asyncio.sleep
+
+Yang dilaporkan: throughput, latency p50/p95/p99 per request, dan jumlah
+thread terbanyak selama putaran.
+
+Cara pakai:
+    python -m benchmarks.bench_async --rows 50000
+    python -m benchmarks.bench_async --concurrency 10,100,500 --rtt-ms 5 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from benchmarks.data_generator import CatalogGenerator
+from benchmarks.run_benchmarks import percentiles
+from controllers.async_controller import AsyncLibraryController
+from controllers.library_controller import LibraryController
+from database.async_connection import AsyncDatabaseConnection
+from database.async_storage import AsyncStorage
+from database.sqlite_backend import SQLiteBackend
+from database.storage_backend import insert_columns
+from models.book_model import Book
+
+
+class RemoteSQLiteBackend(SQLiteBackend):
+    """SQLiteBackend dengan satu round trip jaringan (time.sleep) per query"""
+
+    rtt = 0.0
+
+    def _fetch_all(self, query, params=()):
+        time.sleep(self.rtt)
+        return super()._fetch_all(query, params)
+
+    def _insert(self, table, query, params):
+        time.sleep(self.rtt)
+        return super()._insert(table, query, params)
+
+
+class RemoteAsyncConnection(AsyncDatabaseConnection):
+    """AsyncDatabaseConnection dengan satu round trip jaringan (asyncio.sleep) per query"""
+
+    rtt = 0.0
+
+    async def fetch_all(self, query, params=None):
+        await asyncio.sleep(self.rtt)
+        return await super().fetch_all(query, params)
+
+    @asynccontextmanager
+    async def transaction(self):
+        await asyncio.sleep(self.rtt)
+        async with super().transaction() as connection:
+            yield connection
+
+
+def prepare_database(path, rows, seed):
+    """File SQLite berisi `rows` buku sintetis"""
+    storage = SQLiteBackend(path)
+    columns = insert_columns('books')
+    records = [tuple(book[column] for column in columns)
+               for book in CatalogGenerator(seed=seed).books(rows)]
+    storage.bulk_insert('books', records, batch_size=5000)
+    storage.close()
+    return records
+
+
+def build_workload(records, requests, write_ratio, seed):
+    """
+    Returns: List of (jenis, argumen) - 'list' (cursor), 'search' (kata kunci), 'add' (data buku)
+    """
+    rng = random.Random(seed)
+    workload = []
+    for number in range(requests):
+        record = rng.choice(records)
+        roll = rng.random()
+        if roll < write_ratio:
+            workload.append(('add', {'title': f"Benchmark {number} {record[0]}",
+                                     'author': record[1], 'year': record[2], 'isbn': None}))
+        elif roll < write_ratio + 0.3:
+            workload.append(('search', rng.choice(record[0].split())))
+        else:
+            workload.append(('list', (record[0], 0)))
+    return workload
+
+
+class ThreadCounter:
+    """Mencatat jumlah thread terbanyak selama benchmark"""
+
+    def __init__(self):
+        self.peak = threading.active_count()
+
+    def sample(self):
+        count = threading.active_count()
+        if count > self.peak:
+            self.peak = count
+
+
+def run_threaded(controller, workload, concurrency):
+    threads = ThreadCounter()
+
+    def handle(request):
+        kind, argument = request
+        started = time.perf_counter()
+        if kind == 'list':
+            controller.get_books_page(after=argument)
+        elif kind == 'search':
+            controller.find_books(argument)
+        else:
+            controller._insert_item('books', Book(**argument))
+        threads.sample()
+        return (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        samples = list(executor.map(handle, workload))
+    elapsed = time.perf_counter() - started
+    return summarize('threaded', concurrency, samples, elapsed, threads.peak)
+
+
+async def run_async(async_controller, workload, concurrency):
+    threads = ThreadCounter()
+    requests = iter(workload)
+    samples = []
+
+    async def client():
+        # `concurrency` klien, masing-masing mengirim request berikutnya setelah selesai
+        for kind, argument in requests:
+            started = time.perf_counter()
+            if kind == 'list':
+                await async_controller.get_books_page(after=argument)
+            elif kind == 'search':
+                await async_controller.find_books(argument)
+            else:
+                await async_controller.add_book(Book(**argument))
+            threads.sample()
+            samples.append((time.perf_counter() - started) * 1000)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    result = summarize('async', concurrency, samples, elapsed, threads.peak)
+    result['pool'] = async_controller.get_pool_stats()
+    return result
+
+
+def summarize(mode, concurrency, samples, elapsed, peak_threads):
+    return {
+        'mode': mode,
+        'concurrency': concurrency,
+        'requests': len(samples),
+        'elapsed_s': elapsed,
+        'requests_per_second': len(samples) / elapsed if elapsed else 0.0,
+        'latency': percentiles(samples),
+        'peak_threads': peak_threads
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark jalur async vs thread")
+    parser.add_argument('--rows', type=int, default=50000)
+    parser.add_argument('--requests', type=int, default=2000, help="Request per putaran")
+    parser.add_argument('--concurrency', default="10,100,500",
+                        help="Daftar jumlah request bersamaan, dipisah koma")
+    parser.add_argument('--rtt-ms', type=float, default=2.0, help="Latency jaringan simulasi per query")
+    parser.add_argument('--pool-size', type=int, default=10, help="Ukuran pool koneksi async")
+    parser.add_argument('--write-ratio', type=float, default=0.05, help="Bagian request tambah buku")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+    levels = [int(value) for value in args.concurrency.split(',') if value.strip()]
+
+    RemoteSQLiteBackend.rtt = RemoteAsyncConnection.rtt = args.rtt_ms / 1000
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench_async.db')
+        records = prepare_database(path, args.rows, args.seed)
+        storage = RemoteSQLiteBackend(path)
+        controller = LibraryController(None, storage)
+        db = RemoteAsyncConnection.for_sqlite(path, max_size=args.pool_size)
+        async_controller = AsyncLibraryController(controller, AsyncStorage(storage, db))
+
+        async def run_levels():
+            # Satu event loop untuk semua putaran (pool async terikat ke loop-nya)
+            for number, concurrency in enumerate(levels):
+                workload = build_workload(records, args.requests, args.write_ratio, args.seed + number)
+                results.append(run_threaded(controller, workload, concurrency))
+                results.append(await run_async(async_controller, workload, concurrency))
+            await async_controller.close()
+
+        asyncio.run(run_levels())
+        storage.close()
+
+    if args.json:
+        print(json.dumps({'rows': args.rows, 'rtt_ms': args.rtt_ms,
+                          'pool_size': args.pool_size, 'results': results}, indent=2))
+        return
+
+    print(f"Baris: {args.rows:,}, {args.requests} request per putaran, RTT {args.rtt_ms} ms, "
+          f"pool async {args.pool_size}")
+    print(f"{'mode':<9} {'konkuren':>8} {'req/s':>9} {'p50 ms':>9} {'p95 ms':>9} "
+          f"{'p99 ms':>9} {'thread':>7}")
+    for result in results:
+        latency = result['latency']
+        print(f"{result['mode']:<9} {result['concurrency']:>8} {result['requests_per_second']:>9.0f} "
+              f"{latency['p50_ms']:>9.2f} {latency['p95_ms']:>9.2f} {latency['p99_ms']:>9.2f} "
+              f"{result['peak_threads']:>7}")
+
+
+if __name__ == "__main__":
+    main()
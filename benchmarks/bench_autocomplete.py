@@ -0,0 +1,144 @@
+"""
+Benchmark Autocomplete - Latency saran prefix dan memory PrefixIndex
+
+Buku sintetis (CatalogGenerator) dimasukkan ke PrefixIndex (title + author)
+sampai jumlah teks unik mencapai --entries (default 1 juta), lalu diukur:
+- Waktu build (satu kali scan + compact) dan memory index (get_stats), dibandingkan
+  memory list of str biasa untuk teks yang sama, plus max RSS proses
+- Memory IdBitmap id buku yang sudah dihitung (dipelihara controller tanpa index
+  pencarian, mode 'like' / 'fulltext')
+- Latency suggest top-k per panjang prefix (p50/p95/p99)
+- Latency add (insert item baru) dan suggest saat masih ada entri extra
+- Pembanding: scan LIKE 'prefix%' di seluruh teks (yang dilakukan database tanpa index)
+
+Cara pakai:
+    python -m benchmarks.bench_autocomplete --entries 1000000
+    python -m benchmarks.bench_autocomplete --entries 100000 --json
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+
+from benchmarks.data_generator import CatalogGenerator
+from benchmarks.run_benchmarks import max_rss_mb, percentiles
+from search.prefix_index import PrefixIndex, IdBitmap, normalize
+
+
+def build_index(entries, seed):
+    """Isi index sampai `entries` teks unik; Returns: (index, jumlah buku, detik)"""
+    index = PrefixIndex(['title', 'author'])
+    generator = CatalogGenerator(seed=seed)
+    books = 0
+    started = time.perf_counter()
+    while len(index) < entries:
+        for book in generator.books(10000, start=books):
+            index.add(book)
+        books += 10000
+    index.compact()
+    return index, books, time.perf_counter() - started
+
+
+def build_counted_ids(books):
+    """Bitmap id 1..books seperti LibraryController.suggested_ids setelah build"""
+    counted = IdBitmap()
+    for item_id in range(1, books + 1):
+        counted.add(item_id)
+    return counted
+
+
+def sample_prefixes(index, rng, count, length):
+    """Prefix dari teks yang benar-benar ada di index (huruf awal yang umum ikut terambil)"""
+    prefixes = []
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    while len(prefixes) < count:
+        seed_text = rng.choice(letters)
+        suggestions = index.suggest(seed_text, k=50)
+        if not suggestions:
+            continue
+        text = normalize(rng.choice(suggestions)[0])
+        if len(text) >= length:
+            prefixes.append(text[:length])
+    return prefixes
+
+
+def measure(function, values):
+    samples = []
+    for value in values:
+        started = time.perf_counter()
+        function(value)
+        samples.append((time.perf_counter() - started) * 1000)
+    return percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark autocomplete PrefixIndex")
+    parser.add_argument('--entries', type=int, default=1_000_000)
+    parser.add_argument('--queries', type=int, default=500, help="Jumlah query per panjang prefix")
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    index, books, build_s = build_index(args.entries, args.seed)
+    rss_after_build = max_rss_mb()
+    stats = index.get_stats()
+    counted_bytes = build_counted_ids(books).memory_bytes()
+
+    rng = random.Random(args.seed)
+    latency = {}
+    for length in (1, 2, 3, 5):
+        prefixes = sample_prefixes(index, rng, args.queries, length)
+        latency[f"prefix_{length}"] = measure(lambda p: index.suggest(p, args.top_k), prefixes)
+
+    # Insert item baru lalu suggest sebelum compact (teks baru ada di extra)
+    new_books = list(CatalogGenerator(seed=args.seed + 1).books(args.queries))
+    latency['add'] = measure(index.add, new_books)
+    prefixes = [normalize(book['title'])[:3] for book in new_books]
+    latency['suggest_with_extra'] = measure(lambda p: index.suggest(p, args.top_k), prefixes)
+
+    # Pembanding: scan seluruh teks seperti LIKE 'prefix%' tanpa index
+    keys = sorted({normalize(book[field]) for book in CatalogGenerator(seed=args.seed).books(books)
+                   for field in ('title', 'author')})
+    like_prefixes = prefixes[:20]
+    latency['like_scan'] = measure(lambda p: [key for key in keys if key.startswith(p)], like_prefixes)
+    list_bytes = sys.getsizeof(keys) + sum(sys.getsizeof(key) for key in keys)
+    del keys
+
+    results = {
+        'entries': stats['entries'],
+        'books_scanned': books,
+        'build_s': build_s,
+        'memory': {
+            'index_bytes': stats['memory_bytes'],
+            'bytes_per_entry': stats['bytes_per_entry'],
+            'counted_ids_bytes': counted_bytes,
+            'max_rss_after_build_mb': rss_after_build,
+            # list of str berisi teks yang sama (belum termasuk count) sebagai pembanding
+            'plain_list_of_str_mb': list_bytes / 1024 / 1024
+        },
+        'latency_ms': latency
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    memory = results['memory']
+    print(f"{results['entries']:,} teks unik dari {books:,} buku, build {build_s:.1f} detik")
+    print(f"Memory index   : {memory['index_bytes'] / 1024 / 1024:8.1f} MB "
+          f"({memory['bytes_per_entry']:.1f} byte/entri)")
+    print(f"Id terhitung   : {memory['counted_ids_bytes'] / 1024:8.1f} KB "
+          f"(IdBitmap {books:,} id, mode tanpa index pencarian)")
+    if memory['max_rss_after_build_mb'] is not None:
+        print(f"Max RSS build  : {memory['max_rss_after_build_mb']:8.1f} MB (seluruh proses)")
+    print(f"List of str    : {memory['plain_list_of_str_mb']:8.1f} MB (pembanding)")
+    for name, value in latency.items():
+        print(f"{name:<20} p50={value['p50_ms']:8.3f} ms  p95={value['p95_ms']:8.3f} ms  "
+              f"p99={value['p99_ms']:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Benchmark Fuzzy Search - Latency dan recall TrigramIndex untuk kata kunci salah ketik
+
+Katalog buku sintetis dibuat di memory, lalu kata kunci diambil dari data
+(nama penulis lengkap, atau dua kata judul) dan diberi salah ketik acak
+(hapus / sisip / ganti / tukar huruf). Satu query dianggap berhasil jika
+10 hasil teratas memuat buku yang memang dicari:
+- query penulis: buku dengan penulis persis itu
+- query judul: buku yang judulnya memuat kedua kata asli
+
+Dibandingkan: LIKE '%kata kunci%' (cara lama), InvertedIndex (kata persis),
+dan TrigramIndex (fuzzy), masing-masing untuk kata kunci bersih dan salah ketik.
+
+Cara pakai:
+    python -m benchmarks.bench_fuzzy --rows 100000
+    python -m benchmarks.bench_fuzzy --rows 200000 --typos 2 --json
+"""
+
+import argparse
+import json
+import random
+import string
+import time
+
+from benchmarks.bench_search import generate_rows, like_scan
+from benchmarks.run_benchmarks import percentiles
+from search.inverted_index import InvertedIndex, tokenize
+from search.trigram_index import TrigramIndex
+
+
+TOP_K = 10
+
+
+def add_typo(word, rng):
+    """Satu salah ketik acak pada kata"""
+    position = rng.randrange(len(word))
+    kind = rng.choice(('delete', 'insert', 'replace', 'swap'))
+    letter = rng.choice(string.ascii_lowercase)
+    if kind == 'delete':
+        return word[:position] + word[position + 1:]
+    if kind == 'insert':
+        return word[:position] + letter + word[position:]
+    if kind == 'replace':
+        return word[:position] + letter + word[position + 1:]
+    position = min(position, len(word) - 2)
+    return word[:position] + word[position + 1] + word[position] + word[position + 2:]
+
+
+def misspell(text, rng, typos):
+    """Memberi `typos` salah ketik pada kata-kata yang panjangnya >= 4 huruf"""
+    words = text.split()
+    candidates = [i for i, word in enumerate(words) if len(word) >= 4]
+    for _ in range(typos):
+        if candidates:
+            i = rng.choice(candidates)
+            words[i] = add_typo(words[i], rng)
+    return " ".join(words)
+
+
+def build_queries(rows, count, typos, rng):
+    """
+    Returns: List of (jenis, query bersih, query salah ketik, function cek hasil)
+    """
+    queries = []
+    while len(queries) < count:
+        row = rng.choice(rows)
+        if len(queries) % 2 == 0:
+            author = row[2]
+            if not any(len(word) >= 4 for word in author.split()):
+                continue
+            wanted = author.casefold()
+            check = (lambda wanted: lambda result: result[2].casefold() == wanted)(wanted)
+            queries.append(('author', author, misspell(author, rng, typos), check))
+        else:
+            words = [word for word in row[1].split() if len(word) >= 4]
+            if len(words) < 2:
+                continue
+            picked = rng.sample(words, 2)
+            wanted = {word.casefold() for word in picked}
+            check = (lambda wanted: lambda result: wanted <= set(tokenize(result[1])))(wanted)
+            query = " ".join(picked)
+            queries.append(('title', query, misspell(query, rng, typos), check))
+    return queries
+
+
+def evaluate(search, queries, clean):
+    """Returns: (recall per jenis query, ringkasan latency)"""
+    hits = {}
+    totals = {}
+    samples = []
+    for kind, clean_query, typo_query, check in queries:
+        query = clean_query if clean else typo_query
+        started = time.perf_counter()
+        results = search(query)
+        samples.append((time.perf_counter() - started) * 1000)
+        totals[kind] = totals.get(kind, 0) + 1
+        if any(check(row) for row in results[:TOP_K]):
+            hits[kind] = hits.get(kind, 0) + 1
+    recall = {kind: hits.get(kind, 0) / total for kind, total in totals.items()}
+    recall['all'] = sum(hits.values()) / max(1, len(queries))
+    return recall, percentiles(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark fuzzy search (trigram) dengan salah ketik")
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--queries', type=int, default=400)
+    parser.add_argument('--typos', type=int, default=1, help="Salah ketik per query")
+    parser.add_argument('--like-queries', type=int, default=50,
+                        help="Jumlah query untuk LIKE (full scan, lambat)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    rows = list(generate_rows(args.rows, seed=args.seed))
+    builds = {}
+    indexes = {'inverted_index': InvertedIndex({'title': 2, 'author': 1}),
+               'trigram_index': TrigramIndex({'title': 2, 'author': 1})}
+    for name, index in indexes.items():
+        started = time.perf_counter()
+        for row in rows:
+            index.add(row[0], {'title': row[1], 'author': row[2]}, row)
+        builds[name] = {'build_s': time.perf_counter() - started, 'stats': index.get_stats()}
+
+    queries = build_queries(rows, args.queries, args.typos, random.Random(args.seed))
+    searchers = {
+        'like_scan': (lambda q: like_scan(rows, q)[:TOP_K], queries[:args.like_queries]),
+        'inverted_index': (lambda q: [r for _, _, r in indexes['inverted_index'].search(q, TOP_K)],
+                           queries),
+        'trigram_index': (lambda q: [r for _, _, r in indexes['trigram_index'].search(q, TOP_K)],
+                          queries)
+    }
+
+    results = {'rows': args.rows, 'typos_per_query': args.typos, 'builds': builds, 'modes': {}}
+    for name, (search, mode_queries) in searchers.items():
+        for clean in (True, False):
+            recall, latency = evaluate(search, mode_queries, clean)
+            results['modes'][f"{name}/{'clean' if clean else 'typo'}"] = {
+                'queries': len(mode_queries),
+                'recall_at_10': recall,
+                'latency': latency
+            }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Baris: {args.rows:,}, {args.typos} salah ketik per query")
+    for name, build in builds.items():
+        print(f"Build {name:<15}: {build['build_s']:.2f} s {build['stats']}")
+    print(f"{'mode':<26} {'query':>6} {'recall@10':>10} {'penulis':>8} {'judul':>8} "
+          f"{'p50 ms':>9} {'p95 ms':>9}")
+    for name, value in results['modes'].items():
+        recall = value['recall_at_10']
+        print(f"{name:<26} {value['queries']:>6} {recall['all']:>10.1%} "
+              f"{recall.get('author', 0):>8.1%} {recall.get('title', 0):>8.1%} "
+              f"{value['latency']['p50_ms']:>9.2f} {value['latency']['p95_ms']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark Hydration - Biaya membuat object dari row database
+
+Membandingkan (waktu dan peak memory via tracemalloc):
+1. legacy     : class dengan __dict__ per instance (seperti Book sebelum __slots__)
+2. slotted    : Book.from_db_row dengan __slots__
+3. row_view   : BookRow (lazy), hanya membungkus tuple
+4. row_title  : BookRow + akses get_title() (kasus listing judul saja)
+
+Cara pakai:
+    python -m benchmarks.bench_hydration --rows 1000000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+
+from models.book_model import Book
+from models.row_view import BookRow
+
+
+class LegacyBook:
+    """Layout lama: attribute private di __dict__ per instance"""
+
+    def __init__(self, title, author, year=None, isbn=None):
+        self.__id = None
+        self._title = title
+        self.__author = author
+        self.__year = year
+        self.__isbn = isbn
+
+    def set_id(self, item_id):
+        self.__id = item_id
+
+    @staticmethod
+    def from_db_row(row):
+        book = LegacyBook(
+            title=row[1],
+            author=row[2],
+            year=row[3],
+            isbn=row[4]
+        )
+        book.set_id(row[0])
+        return book
+
+
+def make_rows(count):
+    return [(i, f"Judul Buku {i}", f"Penulis {i % 5000}", 1950 + i % 75, f"978-{i:010d}")
+            for i in range(1, count + 1)]
+
+
+def measure(label, rows, build):
+    """
+    Bangun object untuk semua row dua kali: sekali untuk waktu (tanpa tracemalloc
+    yang memperlambat alokasi), sekali untuk peak memory di luar list row itu sendiri
+    """
+    gc.collect()
+    start = time.perf_counter()
+    objects = build(rows)
+    elapsed = time.perf_counter() - start
+    count = len(objects)
+    del objects
+
+    gc.collect()
+    tracemalloc.start()
+    objects = build(rows)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return {
+        'variant': label,
+        'rows': count,
+        'elapsed_s': elapsed,
+        'ns_per_row': elapsed / count * 1e9 if count else 0.0,
+        'peak_mb': peak / 1024 / 1024,
+        'bytes_per_row': peak / count if count else 0.0
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark hydration Book dari row database")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    results = [
+        measure('legacy', rows, lambda rs: [LegacyBook.from_db_row(r) for r in rs]),
+        measure('slotted', rows, lambda rs: [Book.from_db_row(r) for r in rs]),
+        measure('row_view', rows, lambda rs: [BookRow(r) for r in rs]),
+        measure('row_title', rows,
+                lambda rs: [v for v in map(BookRow, rs) if v.get_title() is not None]),
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for r in results:
+        print(f"{r['variant']:<10} {r['elapsed_s']:6.2f} s  {r['ns_per_row']:7.0f} ns/row  "
+              f"peak={r['peak_mb']:8.1f} MB  {r['bytes_per_row']:6.0f} B/row")
+
+
+if __name__ == "__main__":
+    main()
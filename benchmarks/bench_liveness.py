@@ -0,0 +1,123 @@
+"""
+Benchmark Liveness - Mengukur penghematan round trip dari strategi ping berbasis idle
+
+Koneksi disimulasikan (tanpa server MySQL): setiap ping dan setiap query
+menunggu RTT yang sama sehingga selisih waktu mencerminkan round trip yang dihemat.
+
+Cara pakai:
+    python -m benchmarks.bench_liveness --queries 2000 --rtt-ms 0.5
+"""
+
+import argparse
+import json
+import time
+
+from database.db_connection import DatabaseConnection
+
+
+class SimulatedCursor:
+    """Cursor palsu: satu round trip per execute"""
+
+    def __init__(self, connection):
+        self.__connection = connection
+
+    def execute(self, query, params=()):
+        self.__connection.round_trip()
+
+    def fetchall(self):
+        return [(1, 'Clean Code')]
+
+    def fetchone(self):
+        return (1, 'Clean Code')
+
+    def close(self):
+        pass
+
+
+class SimulatedConnection:
+    """Koneksi palsu dengan latency jaringan yang bisa diatur"""
+
+    def __init__(self, rtt):
+        self.__rtt = rtt
+        self.round_trips = 0
+
+    def round_trip(self):
+        self.round_trips += 1
+        time.sleep(self.__rtt)
+
+    def cursor(self, **kwargs):
+        return SimulatedCursor(self)
+
+    def ping(self, reconnect=False):
+        self.round_trip()
+
+    def is_connected(self):
+        self.round_trip()
+        return True
+
+    def commit(self):
+        self.round_trip()
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+def run_workload(db, queries):
+    """Jalankan sejumlah query baca, return waktu total (detik)"""
+    start = time.perf_counter()
+    for _ in range(queries):
+        db.fetch_one("SELECT id, title FROM books WHERE id = %s", (1,))
+    return time.perf_counter() - start
+
+
+def bench(queries, rtt, idle_threshold):
+    connection = SimulatedConnection(rtt)
+    db = DatabaseConnection()
+    db.set_connection_factory(lambda: connection)
+    db.configure_liveness(idle_threshold=idle_threshold)
+    elapsed = run_workload(db, queries)
+    return {
+        'idle_threshold': idle_threshold,
+        'queries': queries,
+        'round_trips': connection.round_trips,
+        'round_trips_per_query': connection.round_trips / queries,
+        'elapsed_s': elapsed,
+        'latency_avg_ms': elapsed / queries * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark strategi liveness koneksi")
+    parser.add_argument('--queries', type=int, default=2000)
+    parser.add_argument('--rtt-ms', type=float, default=0.5, help="Round trip time simulasi")
+    parser.add_argument('--idle-threshold', type=float, default=30.0)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    rtt = args.rtt_ms / 1000
+    results = {
+        'ping_every_query': bench(args.queries, rtt, idle_threshold=0),
+        'idle_threshold': bench(args.queries, rtt, idle_threshold=args.idle_threshold)
+    }
+    before = results['ping_every_query']
+    after = results['idle_threshold']
+    results['round_trips_saved'] = before['round_trips'] - after['round_trips']
+    results['speedup'] = before['elapsed_s'] / after['elapsed_s'] if after['elapsed_s'] else None
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name in ('ping_every_query', 'idle_threshold'):
+        r = results[name]
+        print(f"{name:<18} round trips/query={r['round_trips_per_query']:.2f} "
+              f"avg={r['latency_avg_ms']:.3f} ms total={r['elapsed_s']:.2f} s")
+    print(f"Round trip dihemat: {results['round_trips_saved']} "
+          f"(speedup {results['speedup']:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
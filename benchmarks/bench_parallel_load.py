@@ -0,0 +1,115 @@
+"""
+Benchmark Parallel Load - Skala import paralel pada 1 / 2 / 4 / 8 worker
+
+File CSV sintetis dibuat sekali (CatalogGenerator), lalu dimuat ke database
+kosong untuk setiap jumlah worker. Sebagai pembanding ikut diukur BulkImporter
+(satu proses, tanpa process pool).
+
+Untuk SQLite setiap putaran memakai file database baru. Untuk MySQL tabel
+books TIDAK dikosongkan: jalankan di database khusus benchmark dan perhatikan
+bahwa jumlah baris terus bertambah antar putaran.
+
+Cara pakai:
+    python -m benchmarks.bench_parallel_load --rows 500000
+    python -m benchmarks.bench_parallel_load --workers 1,2,4 --json
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from benchmarks.data_generator import CatalogGenerator, write_file
+from database.backend_factory import create_backend
+from services.bulk_importer import BulkImporter
+from services.parallel_loader import ParallelLoader
+
+
+def run_single(engine, sqlite_path, path, batch_size, commit_every):
+    """BulkImporter satu proses sebagai baseline"""
+    storage = create_backend(engine, sqlite_path)
+    try:
+        report = BulkImporter(storage, batch_size=batch_size,
+                              commit_every=commit_every).import_file(path, 'book')
+    finally:
+        storage.close()
+    return {
+        'mode': 'single-process',
+        'workers': 1,
+        'rows': report.inserted,
+        'elapsed_s': report.elapsed,
+        'rows_per_second': report.rows_per_second,
+        'consistent': None
+    }
+
+
+def run_parallel(engine, sqlite_path, path, workers, batch_size, commit_every):
+    loader = ParallelLoader(engine=engine, sqlite_path=sqlite_path, workers=workers,
+                            batch_size=batch_size, commit_every=commit_every)
+    report = loader.load_file(path, 'book')
+    return {
+        'mode': 'parallel',
+        'workers': workers,
+        'rows': report.inserted,
+        'elapsed_s': report.elapsed,
+        'rows_per_second': report.rows_per_second,
+        'consistent': report.consistent,
+        'error': report.error
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark skala import paralel")
+    parser.add_argument('--rows', type=int, default=200000)
+    parser.add_argument('--workers', default='1,2,4,8',
+                        type=lambda text: [int(n) for n in text.split(',')])
+    parser.add_argument('--engine', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--commit-every', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        source = os.path.join(workdir, 'books.csv')
+        began = time.perf_counter()
+        write_file(source, CatalogGenerator(seed=args.seed).books(args.rows))
+        generated_s = time.perf_counter() - began
+
+        def database(name):
+            return os.path.join(workdir, f"{name}.db") if args.engine == 'sqlite' else None
+
+        results = [run_single(args.engine, database('single'), source,
+                              args.batch_size, args.commit_every)]
+        for workers in args.workers:
+            results.append(run_parallel(args.engine, database(f"parallel-{workers}"), source,
+                                        workers, args.batch_size, args.commit_every))
+
+    baseline = results[0]['rows_per_second'] or 1.0
+    for result in results:
+        result['speedup'] = result['rows_per_second'] / baseline
+
+    if args.json:
+        print(json.dumps({
+            'rows': args.rows,
+            'engine': args.engine,
+            'cpu_count': os.cpu_count(),
+            'generate_s': generated_s,
+            'results': results
+        }, indent=2))
+        return
+
+    print(f"{args.rows:,} buku, engine {args.engine}, {os.cpu_count()} CPU "
+          f"(file dibuat dalam {generated_s:.1f} detik)")
+    print(f"{'mode':<16} {'worker':>6} {'detik':>8} {'baris/detik':>12} {'speedup':>8} {'konsisten':>10}")
+    for result in results:
+        consistent = '-' if result['consistent'] is None else str(result['consistent'])
+        print(f"{result['mode']:<16} {result['workers']:>6} {result['elapsed_s']:>8.2f} "
+              f"{result['rows_per_second']:>12,.0f} {result['speedup']:>7.2f}x {consistent:>10}")
+        if result.get('error'):
+            print(f"   ❌ {result['error']}")
+
+
+if __name__ == "__main__":
+    main()
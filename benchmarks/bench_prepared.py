@@ -0,0 +1,225 @@
+"""
+Benchmark Prepared Statement - Latency query tetap MySQLBackend dengan vs tanpa prepare
+
+Operasi yang diukur sama dengan yang dipanggil LibraryController berulang kali:
+halaman pertama, halaman berikutnya (keyset), pencarian LIKE, pencarian FULLTEXT,
+dan INSERT satu buku. Setiap operasi dijalankan bergantian dengan prepared
+statement aktif dan mati (cache hasil query dimatikan agar setiap panggilan
+sampai ke server).
+
+Dua mode:
+- Server MySQL sungguhan (default): gunakan database khusus benchmark yang
+  sudah berisi tabel (database_setup.sql), karena benchmark ikut INSERT buku
+- --simulate: koneksi palsu tanpa server. Statement biasa membayar parse + RTT
+  setiap eksekusi, prepared statement membayar parse + RTT sekali saat PREPARE
+  lalu RTT saja. Berguna untuk memeriksa jalur kode dan jumlah prepare/eksekusi
+
+Cara pakai:
+    python -m benchmarks.bench_prepared --database library_bench --iterations 2000
+    python -m benchmarks.bench_prepared --simulate --rtt-ms 0.2 --parse-ms 0.1 --json
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks.data_generator import CatalogGenerator
+from benchmarks.run_benchmarks import percentiles
+from database.db_connection import DatabaseConnection
+from database.mysql_backend import MySQLBackend
+from database.storage_backend import insert_columns
+
+
+class SimulatedCursor:
+    """Cursor palsu; prepared=True meniru mysql.connector (prepare ulang jika objek query berbeda)"""
+
+    def __init__(self, connection, prepared):
+        self.__connection = connection
+        self.__prepared = prepared
+        self.__executed = None
+        self.__rows = []
+        self.lastrowid = None
+        self.rowcount = -1
+        self.description = None
+
+    def execute(self, query, params=()):
+        connection = self.__connection
+        if not self.__prepared:
+            connection.parse()
+        elif query is not self.__executed:
+            connection.parse()
+            connection.round_trip()    # COM_STMT_PREPARE
+            self.__executed = query
+        connection.round_trip()
+        if query.lstrip().upper().startswith('INSERT'):
+            self.lastrowid = connection.next_id()
+            self.rowcount = 1
+            self.__rows = []
+        else:
+            self.__rows = connection.rows(query)
+            self.rowcount = len(self.__rows)
+
+    def fetchall(self):
+        rows, self.__rows = self.__rows, []
+        return rows
+
+    def fetchmany(self, size=1):
+        rows, self.__rows = self.__rows[:size], self.__rows[size:]
+        return rows
+
+    def fetchone(self):
+        rows = self.fetchmany(1)
+        return rows[0] if rows else None
+
+    def close(self):
+        pass
+
+
+class SimulatedConnection:
+    """Koneksi palsu dengan biaya round trip dan parse statement yang bisa diatur"""
+
+    def __init__(self, rtt, parse):
+        self.__rtt = rtt
+        self.__parse = parse
+        self.__last_id = 0
+        self.round_trips = 0
+        self.parses = 0
+        self.__page = [(i, f"Buku {i:05d}", "Penulis", 2000 + i % 25, None) for i in range(1, 22)]
+
+    def round_trip(self):
+        self.round_trips += 1
+        time.sleep(self.__rtt)
+
+    def parse(self):
+        self.parses += 1
+        time.sleep(self.__parse)
+
+    def next_id(self):
+        self.__last_id += 1
+        return self.__last_id
+
+    def rows(self, query):
+        if 'information_schema' in query:
+            return [(0,)]
+        return list(self.__page)
+
+    def cursor(self, prepared=False, **kwargs):
+        return SimulatedCursor(self, prepared)
+
+    def ping(self, reconnect=False):
+        self.round_trip()
+
+    def is_connected(self):
+        return True
+
+    def commit(self):
+        self.round_trip()
+
+    def rollback(self):
+        self.round_trip()
+
+    def close(self):
+        pass
+
+
+def operations(storage, keywords, books):
+    """Returns: List of (nama, callable) - satu panggilan per operasi"""
+    _, after = storage.list_page('books', None, 20)
+    columns = insert_columns('books')
+    state = {'keyword': 0, 'book': 0}
+
+    def search(mode):
+        def run():
+            state['keyword'] = (state['keyword'] + 1) % len(keywords)
+            storage.search_mode = mode
+            storage.search('books', keywords[state['keyword']], limit=50)
+        return run
+
+    def insert():
+        state['book'] = (state['book'] + 1) % len(books)
+        book = books[state['book']]
+        storage.insert('books', {column: book[column] for column in columns})
+
+    return [
+        ('list_first', lambda: storage.list_page('books', None, 20)),
+        ('list_next', lambda: storage.list_page('books', after, 20)),
+        ('search_like', search('like')),
+        ('search_fulltext', search('fulltext')),
+        ('insert', insert)
+    ]
+
+
+def measure(db, storage, iterations, keywords, books, prepared):
+    if prepared:
+        db.enable_prepared_statements()
+    else:
+        db.disable_prepared_statements()
+    samples = {}
+    for name, run in operations(storage, keywords, books):
+        run()  # Pemanasan: koneksi, PREPARE pertama, buffer server
+        timings = []
+        for _ in range(iterations):
+            started = time.perf_counter()
+            run()
+            timings.append((time.perf_counter() - started) * 1000)
+        samples[name] = percentiles(timings)
+    return {'prepared': prepared, 'operations': samples, 'statements': db.get_statement_stats()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark prepared statement vs query biasa")
+    parser.add_argument('--iterations', type=int, default=1000, help="Panggilan per operasi")
+    parser.add_argument('--database', default='library_bench', help="Database MySQL khusus benchmark")
+    parser.add_argument('--simulate', action='store_true', help="Tanpa server MySQL (koneksi palsu)")
+    parser.add_argument('--rtt-ms', type=float, default=0.2, help="Simulasi: round trip jaringan")
+    parser.add_argument('--parse-ms', type=float, default=0.1, help="Simulasi: parse + optimize statement")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    db = DatabaseConnection.create_endpoint(database=args.database)
+    db.disable_cache()
+    db.disable_instrumentation()
+    simulated = None
+    if args.simulate:
+        simulated = SimulatedConnection(args.rtt_ms / 1000, args.parse_ms / 1000)
+        db.set_connection_factory(lambda: simulated)
+    storage = MySQLBackend(db, maintain_stats=False)
+
+    generator = CatalogGenerator(seed=args.seed)
+    books = list(generator.books(max(100, args.iterations)))
+    keywords = [book['title'].split()[-1] for book in books[:100]]
+
+    results = []
+    for prepared in (False, True):
+        if simulated is not None:
+            parses_before = simulated.parses
+        result = measure(db, storage, args.iterations, keywords, books, prepared)
+        if simulated is not None:
+            result['server_parses'] = simulated.parses - parses_before
+        results.append(result)
+    storage.close()
+
+    if args.json:
+        print(json.dumps({'simulated': args.simulate, 'iterations': args.iterations,
+                          'results': results}, indent=2))
+        return
+
+    print(f"{'Simulasi' if args.simulate else 'MySQL ' + db.get_endpoint()}: "
+          f"{args.iterations} panggilan per operasi")
+    print(f"{'operasi':<16} {'biasa p50':>10} {'prep p50':>9} {'biasa p95':>10} {'prep p95':>9} {'selisih':>8}")
+    plain, prepared = results
+    for name, stats in plain['operations'].items():
+        other = prepared['operations'][name]
+        change = (other['p50_ms'] - stats['p50_ms']) / stats['p50_ms'] * 100 if stats['p50_ms'] else 0.0
+        print(f"{name:<16} {stats['p50_ms']:>10.3f} {other['p50_ms']:>9.3f} "
+              f"{stats['p95_ms']:>10.3f} {other['p95_ms']:>9.3f} {change:>+7.1f}%")
+    counters = prepared['statements']
+    print(f"\nPrepared: {counters['prepares']} prepare, {counters['executes']} eksekusi, "
+          f"{counters['fallbacks']} tanpa prepare")
+    if args.simulate:
+        print(f"Parse di server: biasa {plain['server_parses']}, prepared {prepared['server_parses']}")
+
+
+if __name__ == "__main__":
+    main()
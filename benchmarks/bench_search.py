@@ -0,0 +1,130 @@
+"""
+Benchmark Search - Membandingkan pencarian LIKE (full scan) dengan inverted index
+
+Mode default (tanpa MySQL): katalog sintetis dibuat di memory, LIKE '%kata%'
+disimulasikan dengan scan substring di setiap baris (itulah yang dilakukan
+MySQL tanpa index), lalu dibandingkan dengan InvertedIndex.
+
+Mode --mysql: menjalankan query LIKE dan FULLTEXT ke database library_db
+(isi dulu dengan data besar, misal lewat `python main.py import`).
+
+Cara pakai:
+    python -m benchmarks.bench_search --rows 1000000
+    python -m benchmarks.bench_search --mysql --json
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.data_generator import CatalogGenerator
+from search.inverted_index import InvertedIndex
+
+
+# Campuran kata sangat umum, sedang, dan jarang (posisi di kosakata Zipf)
+DEFAULT_QUERIES = ["python", "design patterns", "sejarah indonesia", "kimia budaya", "martin"]
+
+
+def generate_rows(count, seed=42):
+    """Baris buku sintetis (id, title, author, year, isbn) yang deterministik"""
+    for book_id, book in enumerate(CatalogGenerator(seed=seed).books(count), start=1):
+        yield (book_id, book['title'], book['author'], book['year'], book['isbn'])
+
+
+def like_scan(rows, keyword):
+    """Simulasi WHERE title LIKE '%kw%' OR author LIKE '%kw%' (case-insensitive)"""
+    needle = keyword.casefold()
+    return [row for row in rows if needle in row[1].casefold() or needle in row[2].casefold()]
+
+
+def measure(function, queries, repeat):
+    """Jalankan setiap query beberapa kali, return latency (ms) p50/p95/max"""
+    samples = []
+    for _ in range(repeat):
+        for query in queries:
+            start = time.perf_counter()
+            function(query)
+            samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        'p50_ms': statistics.median(samples),
+        'p95_ms': samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+        'max_ms': samples[-1],
+        'samples': len(samples)
+    }
+
+
+def bench_in_process(rows_count, queries, repeat):
+    rows = list(generate_rows(rows_count))
+
+    start = time.perf_counter()
+    index = InvertedIndex({'title': 2, 'author': 1})
+    for row in rows:
+        index.add(row[0], {'title': row[1], 'author': row[2]}, row)
+    build_time = time.perf_counter() - start
+
+    return {
+        'rows': rows_count,
+        'index_build_s': build_time,
+        'index_stats': index.get_stats(),
+        # LIKE memakai satu kata kunci utuh sebagai substring, seperti kode lama
+        'like_scan': measure(lambda q: like_scan(rows, q), queries, repeat),
+        'inverted_index_top50': measure(lambda q: index.search(q, k=50), queries, repeat)
+    }
+
+
+def bench_mysql(queries, repeat):
+    from database.db_connection import DatabaseConnection
+
+    db = DatabaseConnection()
+    like_query = """
+        SELECT id, title, author, year, isbn FROM books
+        WHERE title LIKE %s OR author LIKE %s ORDER BY title
+    """
+    fulltext_query = """
+        SELECT id, title, author, year, isbn,
+               MATCH(title, author) AGAINST (%s IN NATURAL LANGUAGE MODE) AS score
+        FROM books
+        WHERE MATCH(title, author) AGAINST (%s IN NATURAL LANGUAGE MODE)
+        ORDER BY score DESC, title LIMIT 50
+    """
+    result = {
+        'rows': (db.fetch_one("SELECT COUNT(*) FROM books") or (0,))[0],
+        'like': measure(lambda q: db.fetch_all(like_query, (f"%{q}%",) * 2), queries, repeat),
+        'fulltext_top50': measure(lambda q: db.fetch_all(fulltext_query, (q, q)), queries, repeat)
+    }
+    db.close_connection()
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LIKE vs inverted index / FULLTEXT")
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--query', action='append', help="Kata kunci (boleh diulang)")
+    parser.add_argument('--mysql', action='store_true', help="Benchmark ke MySQL library_db")
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    queries = args.query or DEFAULT_QUERIES
+    if args.mysql:
+        results = bench_mysql(queries, args.repeat)
+    else:
+        results = bench_in_process(args.rows, queries, args.repeat)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Baris: {results['rows']:,}")
+    if 'index_build_s' in results:
+        print(f"Build index: {results['index_build_s']:.2f} s {results['index_stats']}")
+    for name, value in results.items():
+        if isinstance(value, dict) and 'p50_ms' in value:
+            print(f"{name:<22} p50={value['p50_ms']:9.2f} ms  p95={value['p95_ms']:9.2f} ms  "
+                  f"max={value['max_ms']:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+"""
+Benchmark Snapshot - Katalog dari snapshot mmap vs langsung dari SQLite
+
+Database berisi buku & majalah sintetis (CatalogGenerator). Snapshot ditulis
+sekali dari database, lalu setiap mode diukur di proses baru (agar memory
+tidak tercampur):
+- buka backend sampai halaman pertama tampil
+- menelusuri seluruh buku per halaman (keyset, seperti display_all_books)
+- lompat ke halaman tengah (page_cursor)
+- pencarian substring (SQLite: mode 'like' agar hasilnya setara)
+- memory: RssAnon (memory milik proses) dan RssFile (halaman file / page cache)
+  dari /proc/self/status, hanya di Linux
+
+Cara pakai:
+    python -m benchmarks.bench_snapshot --rows 200000
+    python -m benchmarks.bench_snapshot --rows 50000 --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.data_generator import CatalogGenerator
+from benchmarks.run_benchmarks import percentiles
+from database.sqlite_backend import SQLiteBackend
+from database.snapshot_backend import SnapshotBackend, write_snapshot
+from database.storage_backend import insert_columns
+
+
+def memory_kb():
+    """Returns: (RssAnon, RssFile) dalam KB, atau (None, None) jika tidak tersedia"""
+    values = {}
+    try:
+        with open('/proc/self/status') as status:
+            for line in status:
+                name, _, value = line.partition(':')
+                if name in ('RssAnon', 'RssFile'):
+                    values[name] = int(value.split()[0])
+    except OSError:
+        pass
+    return values.get('RssAnon'), values.get('RssFile')
+
+
+def prepare(directory, rows, seed):
+    """Returns: (path database, path snapshot, laporan write_snapshot)"""
+    database = os.path.join(directory, 'bench_snapshot.db')
+    storage = SQLiteBackend(database)
+    generator = CatalogGenerator(seed=seed)
+    for table, records in (('books', generator.books(rows)),
+                           ('magazines', generator.magazines(max(1, rows // 10)))):
+        columns = insert_columns(table)
+        storage.bulk_insert(table, [tuple(record[column] for column in columns) for record in records],
+                            batch_size=5000)
+    snapshot = os.path.join(directory, 'bench_snapshot.snap')
+    report = write_snapshot(storage, snapshot)
+    storage.close()
+    return database, snapshot, report
+
+
+def measure(mode, database, snapshot, keywords, page_size=20):
+    """Satu mode di proses ini; Returns: Dictionary hasil"""
+    anon_before, file_before = memory_kb()
+    started = time.perf_counter()
+    if mode == 'snapshot':
+        storage = SnapshotBackend(snapshot)
+    else:
+        storage = SQLiteBackend(database, search_mode='like')
+    storage.list_page('books', None, page_size)
+    first_page_ms = (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    after = None
+    pages = 0
+    while True:
+        _, after = storage.list_page('books', after, page_size)
+        pages += 1
+        if after is None:
+            break
+    browse_s = time.perf_counter() - started
+
+    middle = storage.count('books') // 2
+    started = time.perf_counter()
+    storage.list_page('books', storage.page_cursor('books', middle), page_size)
+    jump_ms = (time.perf_counter() - started) * 1000
+
+    samples = []
+    for keyword in keywords:
+        started = time.perf_counter()
+        storage.search('books', keyword, limit=50)
+        samples.append((time.perf_counter() - started) * 1000)
+
+    anon_after, file_after = memory_kb()
+    storage.close()
+    return {
+        'mode': mode,
+        'first_page_ms': first_page_ms,
+        'pages': pages,
+        'browse_s': browse_s,
+        'pages_per_second': pages / browse_s if browse_s else 0.0,
+        'jump_ms': jump_ms,
+        'search': percentiles(samples),
+        'rss_anon_kb': None if anon_before is None else anon_after - anon_before,
+        'rss_file_kb': None if file_before is None else file_after - file_before
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark snapshot mmap vs SQLite")
+    parser.add_argument('--rows', type=int, default=100000, help="Jumlah buku")
+    parser.add_argument('--searches', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    # Dipakai proses anak: ukur satu mode lalu cetak hasil JSON
+    parser.add_argument('--child', nargs=3, metavar=('MODE', 'DATABASE', 'SNAPSHOT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    generator = CatalogGenerator(seed=args.seed + 1)
+    keywords = [book['title'].split()[-1] for book in generator.books(args.searches)]
+    if args.child:
+        print(json.dumps(measure(*args.child, keywords)))
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database, snapshot, report = prepare(directory, args.rows, args.seed)
+        results = []
+        for mode in ('sqlite', 'snapshot'):
+            output = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_snapshot', '--searches', str(args.searches),
+                 '--seed', str(args.seed), '--child', mode, database, snapshot],
+                check=True, capture_output=True, text=True).stdout
+            results.append(json.loads(output))
+        sizes = {'database_bytes': os.path.getsize(database), 'snapshot_bytes': report['bytes']}
+
+    if args.json:
+        print(json.dumps({'rows': args.rows, 'write_snapshot_s': report['elapsed'], **sizes,
+                          'results': results}, indent=2))
+        return
+
+    print(f"Buku: {args.rows:,}, snapshot {sizes['snapshot_bytes'] / 1024 / 1024:.1f} MB "
+          f"(database {sizes['database_bytes'] / 1024 / 1024:.1f} MB), ditulis {report['elapsed']:.2f} detik")
+    print(f"{'mode':<9} {'hal.1 ms':>9} {'hal/detik':>10} {'lompat ms':>10} {'cari p50':>9} "
+          f"{'cari p95':>9} {'anon KB':>9} {'file KB':>9}")
+    for result in results:
+        search = result['search']
+        print(f"{result['mode']:<9} {result['first_page_ms']:>9.2f} {result['pages_per_second']:>10,.0f} "
+              f"{result['jump_ms']:>10.2f} {search['p50_ms']:>9.2f} {search['p95_ms']:>9.2f} "
+              f"{result['rss_anon_kb'] if result['rss_anon_kb'] is not None else '-':>9} "
+              f"{result['rss_file_kb'] if result['rss_file_kb'] is not None else '-':>9}")
+
+
+if __name__ == "__main__":
+    main()
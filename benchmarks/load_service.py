@@ -0,0 +1,196 @@
+"""
+Load Generator - Beban HTTP campuran untuk service katalog (python main.py serve)
+
+Tanpa --url, service dijalankan di proses ini di atas file SQLite sementara berisi
+buku & majalah sintetis (CatalogGenerator). Dengan --url, beban dikirim ke service
+yang sudah berjalan (misal dengan MySQL).
+
+Setiap client (thread) mengirim request berurutan selama --duration detik:
+listing (halaman pertama lalu beberapa halaman lanjutan), pencarian, ambil per id,
+dan sebagian kecil tambah item. Dilaporkan throughput, latency p50/p95/p99 per
+jenis request dari sisi client, dan /metrics dari sisi server.
+
+Cara pakai:
+    python -m benchmarks.load_service --clients 32 --duration 10
+    python -m benchmarks.load_service --url http://127.0.0.1:8080 --clients 64 --json
+"""
+
+import argparse
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from urllib.parse import quote
+
+from benchmarks.data_generator import CatalogGenerator
+from benchmarks.run_benchmarks import percentiles
+from database.storage_backend import insert_columns
+
+
+def request(base_url, method, path, payload=None, timeout=30.0):
+    """Returns: (status, body JSON)"""
+    data = None if payload is None else json.dumps(payload).encode('utf-8')
+    req = urllib.request.Request(base_url + path, data=data, method=method,
+                                 headers={'Content-Type': 'application/json'})
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            return response.status, json.loads(response.read())
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read() or b"{}")
+
+
+def start_local_service(directory, rows, workers, seed):
+    """Service di proses ini dengan SQLite sementara; Returns: (service, controller)"""
+    from controllers.library_controller import LibraryController
+    from database.sqlite_backend import SQLiteBackend
+    from services.http_service import CatalogService
+    from views.json_view import JsonView
+
+    storage = SQLiteBackend(os.path.join(directory, 'load_service.db'))
+    generator = CatalogGenerator(seed=seed)
+    for table, records in (('books', generator.books(rows)),
+                           ('magazines', generator.magazines(max(1, rows // 5)))):
+        columns = insert_columns(table)
+        storage.bulk_insert(table, [tuple(record[column] for column in columns) for record in records],
+                            batch_size=5000)
+    controller = LibraryController(JsonView(), storage)
+    service = CatalogService(controller, port=0, workers=workers)
+    service.start()
+    return service, controller
+
+
+class LoadClient(threading.Thread):
+    """Satu client: kirim request campuran sampai deadline"""
+
+    def __init__(self, base_url, deadline, write_ratio, keywords, new_books, seed):
+        super().__init__(daemon=True)
+        self.base_url = base_url
+        self.deadline = deadline
+        self.write_ratio = write_ratio
+        self.keywords = keywords
+        self.new_books = new_books
+        self.rng = random.Random(seed)
+        self.samples = {}
+        self.errors = 0
+        self.ids = []
+
+    def run(self):
+        while time.perf_counter() < self.deadline:
+            table = 'books' if self.rng.random() < 0.8 else 'magazines'
+            roll = self.rng.random()
+            if roll < self.write_ratio and table == 'books':
+                self.call('add', 'POST', "/books", next(self.new_books))
+            elif roll < 0.35:
+                self.call('search', 'GET', f"/{table}/search?q={quote(self.rng.choice(self.keywords))}")
+            elif roll < 0.55 and self.ids:
+                table, item_id = self.rng.choice(self.ids)
+                self.call('get', 'GET', f"/{table}/{item_id}")
+            else:
+                self.browse(table)
+
+    def browse(self, table):
+        """Halaman pertama lalu 0-3 halaman lanjutan memakai cursor"""
+        body = self.call('list', 'GET', f"/{table}?limit=20")
+        for _ in range(self.rng.randrange(4)):
+            if not body or not body.get('next'):
+                break
+            body = self.call('list', 'GET', f"/{table}?limit=20&after={body['next']}")
+
+    def call(self, kind, method, path, payload=None):
+        started = time.perf_counter()
+        try:
+            status, body = request(self.base_url, method, path, payload)
+        except (OSError, ValueError):
+            status, body = None, None
+        self.samples.setdefault(kind, []).append((time.perf_counter() - started) * 1000)
+        if status is None or status >= 400:
+            self.errors += 1
+            return None
+        # Id dari hasil listing / pencarian dipakai lagi untuk request ambil per id
+        table = path.split('/')[1].split('?')[0]
+        for item in body.get('items', [body])[:5]:
+            if item.get('id') is not None and len(self.ids) < 1000:
+                self.ids.append((table, item['id']))
+        return body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load generator service HTTP/JSON katalog")
+    parser.add_argument('--url', default=None, help="Service yang sudah berjalan (default: jalankan lokal)")
+    parser.add_argument('--rows', type=int, default=20000, help="Jumlah buku untuk service lokal")
+    parser.add_argument('--workers', type=int, default=8, help="Worker service lokal")
+    parser.add_argument('--clients', type=int, default=16, help="Jumlah client bersamaan")
+    parser.add_argument('--duration', type=float, default=10.0, help="Detik")
+    parser.add_argument('--write-ratio', type=float, default=0.05, help="Bagian request tambah buku")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--json', action='store_true', help="Output JSON")
+    args = parser.parse_args()
+
+    directory = None
+    service = controller = None
+    base_url = args.url
+    if base_url is None:
+        directory = tempfile.TemporaryDirectory()
+        service, controller = start_local_service(directory.name, args.rows, args.workers, args.seed)
+        base_url = service.url
+    base_url = base_url.rstrip('/')
+
+    generator = CatalogGenerator(seed=args.seed)
+    keywords = sorted({word for book in generator.books(500)
+                       for word in book['title'].split() + book['author'].split()[-1:]})
+    deadline = time.perf_counter() + args.duration
+    # Buku baru per client: urutan berbeda (start) dari generator yang sama, dibuat saat dibutuhkan
+    clients = [LoadClient(base_url, deadline, args.write_ratio, keywords,
+                          generator.books(10 ** 9, start=(number + 1) * 10 ** 9), args.seed + number)
+               for number in range(args.clients)]
+    started = time.perf_counter()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.perf_counter() - started
+
+    merged = {}
+    for client in clients:
+        for kind, samples in client.samples.items():
+            merged.setdefault(kind, []).extend(samples)
+    total = sum(len(samples) for samples in merged.values())
+    _, server_metrics = request(base_url, 'GET', "/metrics")
+    results = {
+        'url': base_url,
+        'clients': args.clients,
+        'elapsed_s': elapsed,
+        'requests': total,
+        'errors': sum(client.errors for client in clients),
+        'requests_per_second': total / elapsed if elapsed else 0.0,
+        'client_latency': {kind: percentiles(samples) for kind, samples in sorted(merged.items())},
+        'server': server_metrics
+    }
+
+    if service is not None:
+        service.shutdown()
+        controller.close()
+        directory.cleanup()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{base_url}: {args.clients} client, {elapsed:.1f} detik, {total:,} request "
+          f"({results['requests_per_second']:,.0f} req/s), {results['errors']} error")
+    print(f"{'jenis':<8} {'jumlah':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for kind, latency in results['client_latency'].items():
+        print(f"{kind:<8} {latency['count']:>8} {latency['p50_ms']:>9.2f} {latency['p95_ms']:>9.2f} "
+              f"{latency['p99_ms']:>9.2f}")
+    print("Server (/metrics):")
+    for route, stats in server_metrics.get('routes', {}).items():
+        print(f"  {route:<24} {stats['count']:>8} p50={stats['p50_ms']:.2f} ms "
+              f"p99={stats['p99_ms']:.2f} ms error={stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
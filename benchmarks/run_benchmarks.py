@@ -0,0 +1,331 @@
+"""
+Benchmark Suite - Perilaku LibraryController dan layer database saat katalog membesar
+
+Untuk setiap ukuran katalog (default 10k / 100k / 1M buku) diukur:
+- Throughput insert (bulk_insert, baris/detik)
+- Latency listing: halaman pertama dan halaman lanjutan (keyset) p50/p95/p99
+- Latency pencarian lewat controller p50/p95/p99
+  (diukur --repeat putaran; --compare memakai median p95 antar putaran)
+- Peak memory Python (tracemalloc, fase listing + pencarian) dan max RSS proses
+
+Data dimuat bertahap (10k -> 100k -> 1M) dengan generator deterministik,
+sehingga database harus kosong di awal. Untuk MySQL gunakan database khusus benchmark.
+
+Cara pakai:
+    python -m benchmarks.run_benchmarks --engine sqlite --output hasil.json
+    python -m benchmarks.run_benchmarks --engine mysql --sizes 10000,100000
+    python -m benchmarks.run_benchmarks --compare baseline.json --fail-on-regression
+
+p95 dari sedikit sampel sangat bergantung pada noise mesin. Untuk --compare
+gunakan minimal 100 sampel per putaran (--queries, --pages) dan --repeat 3 atau
+lebih; perubahan di bawah --threshold (default 20%) tidak dianggap regresi.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+from benchmarks.data_generator import CatalogGenerator
+from controllers.library_controller import LibraryController
+from database.backend_factory import create_backend
+from database.storage_backend import insert_columns
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+INSERT_CHUNK = 10000
+
+# Metrik yang dibandingkan dengan baseline: (bagian, key, True jika makin besar makin baik)
+# Latency memakai median p95 antar putaran (baseline lama tanpa key itu: p95_ms)
+TRACKED_METRICS = [
+    ('insert', 'rows_per_second', True),
+    ('list_first_page', 'p95_median_ms', False),
+    ('list_next_page', 'p95_median_ms', False),
+    ('search', 'p95_median_ms', False),
+    ('memory', 'tracemalloc_peak_mb', False),
+]
+
+# Sampel per putaran yang dianggap cukup untuk p95 yang stabil
+MIN_STABLE_SAMPLES = 100
+
+
+def percentiles(samples):
+    """Ringkasan latency (ms)"""
+    if not samples:
+        return {'count': 0}
+    ordered = sorted(samples)
+
+    def pick(fraction):
+        return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+    return {
+        'count': len(ordered),
+        'mean_ms': statistics.fmean(ordered),
+        'p50_ms': pick(0.50),
+        'p95_ms': pick(0.95),
+        'p99_ms': pick(0.99),
+        'max_ms': ordered[-1]
+    }
+
+
+def repeated(rounds):
+    """
+    Gabungan beberapa putaran pengukuran
+    Args:
+        rounds: List of list latency (ms), satu list per putaran
+    Returns: percentiles() semua sampel + p95 setiap putaran dan mediannya
+    """
+    summary = percentiles([ms for samples in rounds for ms in samples])
+    round_p95 = [percentiles(samples)['p95_ms'] for samples in rounds if samples]
+    if round_p95:
+        summary['p95_rounds_ms'] = round_p95
+        summary['p95_median_ms'] = statistics.median(round_p95)
+    return summary
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def max_rss_mb():
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux melaporkan KB, macOS melaporkan byte
+    return usage / 1024 / 1024 if sys.platform == 'darwin' else usage / 1024
+
+
+def load_books(storage, generator, count, start, batch_size):
+    """Insert buku sintetis per chunk, return metrik throughput"""
+    columns = insert_columns('books')
+    records = generator.books(count, start=start)
+    inserted = 0
+    began = time.perf_counter()
+    while inserted < count:
+        chunk = []
+        for record in records:
+            chunk.append(tuple(record[column] for column in columns))
+            if len(chunk) >= INSERT_CHUNK:
+                break
+        if not chunk:
+            break
+        inserted += storage.bulk_insert('books', chunk, batch_size)
+    elapsed = time.perf_counter() - began
+    return {
+        'rows': inserted,
+        'elapsed_s': elapsed,
+        'rows_per_second': inserted / elapsed if elapsed else 0.0
+    }
+
+
+def bench_listing(controller, generator, pages, rng, repeat=1):
+    """Halaman pertama berulang + halaman lanjutan dari posisi acak di katalog"""
+    first_rounds, following_rounds = [], []
+    for _ in range(repeat):
+        first = []
+        for _ in range(pages):
+            _, ms = timed(controller.get_books_page)
+            first.append(ms)
+        first_rounds.append(first)
+
+        following = []
+        for _ in range(pages):
+            # Cursor keyset bisa dimulai dari judul mana saja (id 0 = sebelum semua id)
+            cursor = (rng.choice(generator.words[:2000]).title(), 0)
+            (items, _), ms = timed(controller.get_books_page, cursor)
+            for item in items:
+                item.display_info()
+            following.append(ms)
+        following_rounds.append(following)
+    return repeated(first_rounds), repeated(following_rounds)
+
+
+def bench_search(controller, terms, repeat=1):
+    rounds = []
+    for _ in range(repeat):
+        samples = []
+        for term in terms:
+            _, ms = timed(controller.find_books, term)
+            samples.append(ms)
+        rounds.append(samples)
+    return repeated(rounds)
+
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+                              text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run(args):
+    storage = create_backend(args.engine, args.sqlite_path)
+    if args.engine == 'mysql' and not args.with_cache:
+        # Cache hasil query membuat latency listing/search tidak mencerminkan database
+        storage.db.disable_cache()
+
+    existing = storage.count('books')
+    if existing and not args.allow_existing:
+        storage.close()
+        raise SystemExit(f"Tabel books sudah berisi {existing:,} baris. Gunakan database kosong "
+                         "atau --allow-existing.")
+
+    controller = LibraryController(None, storage)
+    if args.search_mode:
+        controller.search_mode = args.search_mode
+    generator = CatalogGenerator(seed=args.seed)
+    rng = random.Random(args.seed)
+    terms = generator.search_terms(args.queries)
+
+    results = []
+    loaded = 0
+    for size in sorted(args.sizes):
+        print(f"▶ {size:,} buku ...", file=sys.stderr)
+        insert = load_books(storage, generator, size - loaded, loaded, args.batch_size)
+        loaded = size
+
+        # tracemalloc memperlambat alokasi, jadi baru dinyalakan setelah fase insert
+        tracemalloc.start()
+        index_build_s = None
+        if controller.search_mode == 'index':
+            began = time.perf_counter()
+            controller.build_search_indexes()
+            index_build_s = time.perf_counter() - began
+
+        list_first, list_next = bench_listing(controller, generator, args.pages, rng, args.repeat)
+        search = bench_search(controller, terms, args.repeat)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        results.append({
+            'size': size,
+            'insert': insert,
+            'index_build_s': index_build_s,
+            'list_first_page': list_first,
+            'list_next_page': list_next,
+            'search': search,
+            'memory': {
+                'tracemalloc_peak_mb': peak / 1024 / 1024,
+                'max_rss_mb': max_rss_mb()
+            }
+        })
+
+    storage.close()
+    return {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'engine': args.engine,
+            'sqlite_path': args.sqlite_path if args.engine == 'sqlite' else None,
+            'search_mode': controller.search_mode,
+            'seed': args.seed,
+            'batch_size': args.batch_size,
+            'queries': args.queries,
+            'pages': args.pages,
+            'repeat': args.repeat
+        },
+        'results': results
+    }
+
+
+def compare(current, baseline, threshold):
+    """
+    Bandingkan dengan hasil sebelumnya
+    Returns: List of (size, metrik, nilai lama, nilai baru, perubahan %, regresi?)
+    """
+    old_by_size = {entry['size']: entry for entry in baseline.get('results', [])}
+    rows = []
+    for entry in current['results']:
+        old = old_by_size.get(entry['size'])
+        if not old:
+            continue
+        for section, key, higher_is_better in TRACKED_METRICS:
+            if key not in old.get(section, {}):
+                key = 'p95_ms' if key == 'p95_median_ms' else key
+            new_value = entry.get(section, {}).get(key)
+            old_value = old.get(section, {}).get(key)
+            if not new_value or not old_value:
+                continue
+            change = (new_value - old_value) / old_value * 100
+            worse = -change if higher_is_better else change
+            rows.append((entry['size'], f"{section}.{key}", old_value, new_value, change,
+                         worse > threshold))
+    return rows
+
+
+def print_summary(report):
+    print(f"Engine: {report['meta']['engine']}  search: {report['meta']['search_mode']}  "
+          f"rev: {report['meta']['git_revision']}")
+    print(f"{'size':>9} {'insert/s':>10} {'first p95':>10} {'next p95':>10} "
+          f"{'search p50':>11} {'p95':>8} {'p99':>8} {'peak MB':>8}")
+    for r in report['results']:
+        print(f"{r['size']:>9,} {r['insert']['rows_per_second']:>10,.0f} "
+              f"{r['list_first_page']['p95_ms']:>10.2f} {r['list_next_page']['p95_ms']:>10.2f} "
+              f"{r['search']['p50_ms']:>11.2f} {r['search']['p95_ms']:>8.2f} "
+              f"{r['search']['p99_ms']:>8.2f} {r['memory']['tracemalloc_peak_mb']:>8.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite katalog perpustakaan")
+    parser.add_argument('--engine', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--sqlite-path', default=':memory:')
+    parser.add_argument('--sizes', default='10000,100000,1000000',
+                        type=lambda text: [int(size) for size in text.split(',')])
+    parser.add_argument('--queries', type=int, default=200, help="Jumlah query pencarian")
+    parser.add_argument('--pages', type=int, default=100, help="Jumlah sampel listing")
+    parser.add_argument('--repeat', type=int, default=3,
+                        help="Putaran pengukuran latency (regresi dinilai dari median p95)")
+    parser.add_argument('--batch-size', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--search-mode', choices=['fulltext', 'like', 'index'], default=None)
+    parser.add_argument('--with-cache', action='store_true',
+                        help="Biarkan query cache aktif (MySQL)")
+    parser.add_argument('--allow-existing', action='store_true',
+                        help="Jalankan walaupun tabel books tidak kosong")
+    parser.add_argument('--output', help="Simpan hasil JSON ke file")
+    parser.add_argument('--compare', help="File JSON hasil sebelumnya sebagai baseline")
+    parser.add_argument('--threshold', type=float, default=20.0,
+                        help="Persen penurunan yang dianggap regresi")
+    parser.add_argument('--fail-on-regression', action='store_true')
+    args = parser.parse_args()
+
+    report = run(args)
+    print_summary(report)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"Hasil disimpan ke {args.output}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            baseline = json.load(f)
+        if min(args.queries, args.pages) < MIN_STABLE_SAMPLES or args.repeat < 3:
+            print(f"⚠️ p95 dari kurang dari {MIN_STABLE_SAMPLES} sampel atau kurang dari 3 putaran "
+                  "tidak stabil; regresi bisa berasal dari noise", file=sys.stderr)
+        regressions = 0
+        for size, metric, old, new, change, regressed in compare(report, baseline, args.threshold):
+            flag = "REGRESI" if regressed else ""
+            regressions += regressed
+            print(f"{size:>9,} {metric:<32} {old:>12.2f} -> {new:>12.2f} ({change:+6.1f}%) {flag}")
+        if regressions and args.fail_on_regression:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
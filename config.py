@@ -0,0 +1,158 @@
+"""
+Konfigurasi Aplikasi
+Semua pengaturan yang bisa diubah tanpa menyentuh kode utama
+"""
+
+# Pengaturan connection pool untuk DatabaseConnection
+# enabled=False -> mode lama (satu koneksi bersama, diserialisasi dengan lock)
+POOL_CONFIG = {
+    'enabled': False,
+    'min_size': 1,          # Jumlah koneksi yang selalu disiapkan
+    'max_size': 10,         # Batas maksimal koneksi yang boleh dibuka
+    'timeout': 5.0,         # Detik menunggu koneksi kosong sebelum menyerah
+    'idle_timeout': 300.0,  # Koneksi idle lebih lama dari ini akan ditutup
+    'reap_interval': 60.0   # Interval (detik) pengecekan koneksi idle
+}
+
+# Strategi liveness koneksi: koneksi hanya di-ping jika sudah idle lebih lama
+# dari idle_threshold; query baca yang gagal karena koneksi putus diulang otomatis
+LIVENESS_CONFIG = {
+    'idle_threshold': 30.0,  # Detik idle sebelum koneksi divalidasi dengan ping
+    'read_retries': 1        # Berapa kali query SELECT diulang setelah reconnect
+}
+
+# Mode pencarian pada search_books / search_magazines:
+# - 'like'    : LIKE '%kata%' (default; cocok untuk potongan kata, full table scan)
+# - 'fulltext': MATCH ... AGAINST memakai FULLTEXT index MySQL (ranking relevansi).
+#               Hanya kata utuh yang cocok ('Cle' tidak menemukan 'Clean Code') dan
+#               butuh FULLTEXT index dari database_setup.sql
+# - 'index'   : inverted index di memory, dibangun saat startup & diupdate saat insert
+# - 'fuzzy'   : trigram index di memory, toleran salah ketik (misal 'Robet Martn')
+SEARCH_CONFIG = {
+    'mode': 'like',
+    'top_k': 50  # Jumlah hasil teratas yang ditampilkan
+}
+
+# Autocomplete kata kunci pencarian: prefix index judul / penulis / penerbit di memory,
+# dibangun saat startup (satu scan per tabel) dan diupdate setiap insert
+AUTOCOMPLETE_CONFIG = {
+    'enabled': True,
+    'top_k': 8,         # Jumlah saran yang ditampilkan
+    'min_prefix': 1     # Panjang ketikan minimal sebelum saran muncul
+}
+
+# Cache hasil DatabaseConnection.fetch_all, di-invalidate per tabel setiap ada penulisan
+CACHE_CONFIG = {
+    'enabled': True,
+    'max_entries': 1024,                # Jumlah hasil query yang disimpan
+    'max_bytes': 32 * 1024 * 1024,      # Perkiraan total ukuran maksimal (32 MB)
+    'ttl': 30.0                         # Detik sebelum hasil dianggap basi
+}
+
+# Engine penyimpanan katalog:
+# - 'mysql' : server MySQL (lihat DatabaseConnection)
+# - 'sqlite': file SQLite tanpa server, atau ':memory:' untuk benchmark / load test
+STORAGE_CONFIG = {
+    'engine': 'mysql',
+    'sqlite_path': 'library.db'
+}
+
+
+# Instrumentasi query DatabaseConnection: statistik per statement (dinormalisasi)
+# dan slow-query log. Ringkasan ditampilkan saat aplikasi ditutup.
+INSTRUMENTATION_CONFIG = {
+    'enabled': True,
+    'slow_query_ms': 200.0,     # Query lebih lambat dari ini dicatat di slow-query log (None = mati)
+    'explain_slow': False,      # Sertakan hasil EXPLAIN untuk SELECT yang lambat
+    'slow_query_log': None,     # Path file log (None = logging default / stderr)
+    'report_top': 10            # Jumlah statement teratas pada ringkasan shutdown
+}
+
+# Tampilan daftar item di console
+# - layout 'table' : satu baris per item (ringkas, cocok untuk katalog besar)
+# - layout 'detail': format display_info() lengkap per item
+DISPLAY_CONFIG = {
+    'layout': 'table',
+    'page_size': 20,        # Jumlah item per halaman pada menu "Tampilkan Semua"
+    'render_batch': 200     # Jumlah baris yang digabung dalam satu kali write ke layar
+}
+
+# Write-behind untuk tambah buku / majalah dari menu: item divalidasi dan langsung
+# dikonfirmasi, lalu disimpan oleh thread latar belakang dalam satu transaksi per batch
+WRITE_BEHIND_CONFIG = {
+    'enabled': False,
+    'max_batch': 50,                        # Flush segera jika antrian mencapai jumlah ini
+    'flush_interval': 2.0,                  # Detik maksimal item menunggu di antrian
+    'spill_file': 'pending_writes.jsonl',   # File cadangan jika penyimpanan ke database gagal
+    'retry_interval': 10.0,                 # Detik antar percobaan ulang isi spill file
+    'reject_file': 'rejected_writes.jsonl'  # Baris yang ditolak database (tidak dicoba lagi)
+}
+
+# Sinkronisasi inkremental lewat watermark (updated_at, id): thread latar belakang
+# menarik baris yang berubah (juga dari proses lain) untuk memperbarui index pencarian
+# dan membuang cache tabel yang berubah. Baris yang dihapus baru hilang saat full resync.
+SYNC_CONFIG = {
+    'enabled': False,
+    'poll_interval': 5.0,           # Detik antar polling perubahan
+    'lag': 2.0,                     # Detik toleransi commit terlambat (watermark tidak maju melewati ini)
+    'batch_size': 1000,             # Jumlah baris per query perubahan
+    'full_resync_interval': None    # Detik antar full resync otomatis (None = hanya manual)
+}
+
+# Statistik katalog (buku per tahun, penulis teratas, majalah per penerbit) disimpan
+# di tabel catalog_stats dan diperbarui di transaksi yang sama dengan setiap INSERT
+# (tambah item, import massal, write-behind), sehingga dashboard tidak perlu GROUP BY
+STATS_CONFIG = {
+    'enabled': True,
+    'top_n': 10     # Jumlah penulis / penerbit teratas yang ditampilkan
+}
+
+# Pemisahan baca/tulis: INSERT selalu ke primary (STORAGE_CONFIG), query baca dibagi
+# round-robin ke replica yang sehat. Replica yang gagal dilewati (failover) dan dicek
+# ulang setiap health_interval detik. Selama sticky_seconds setelah menulis, baca
+# diarahkan ke primary agar item yang baru ditambahkan langsung terlihat.
+REPLICATION_CONFIG = {
+    'enabled': False,
+    # MySQL: dictionary yang menimpa config DatabaseConnection, misal {'host': 'replica1', 'port': 3306}
+    # SQLite: path file salinan, misal 'replica1.db' (lihat SQLiteBackend.backup_to)
+    'replicas': [],
+    'sticky_seconds': 5.0,      # Lama read-your-writes setelah penulisan
+    'health_interval': 10.0     # Detik sebelum replica yang gagal dicoba lagi
+}
+
+# Jalur asyncio (AsyncStorage / AsyncLibraryController): satu event loop melayani
+# banyak request bersamaan dengan pool koneksi kecil. MySQL butuh driver aiomysql;
+# SQLite menjalankan setiap koneksi pool di thread khususnya (sqlite3 tidak async).
+ASYNC_CONFIG = {
+    'pool_size': 10,    # Jumlah koneksi maksimal di pool async
+    'timeout': 5.0      # Detik menunggu koneksi kosong sebelum PoolTimeoutError
+}
+
+# Mode service (python main.py serve): katalog sebagai HTTP/JSON API untuk kiosk dan
+# web front-end. Request diproses worker pool berukuran tetap; koneksi MySQL memakai
+# connection pool seukuran worker.
+SERVICE_CONFIG = {
+    'host': '127.0.0.1',
+    'port': 8080,
+    'workers': 8,                   # Jumlah request yang diproses bersamaan
+    'max_body_bytes': 64 * 1024,    # Ukuran maksimal body POST
+    'request_timeout': 10.0,        # Detik menunggu klien mengirim request sebelum koneksi ditutup
+    'max_pending': 32,              # Koneksi yang boleh antre menunggu worker, sisanya dijawab 503
+    'metrics_window': 2048,         # Request terakhir per endpoint untuk p50/p95/p99
+    'access_log': False             # Satu baris log per request ke stderr
+}
+
+# Cold start mode console: menu tampil sebelum koneksi database dan index pencarian
+# siap. Ukur dengan: python main.py --startup-profile
+STARTUP_CONFIG = {
+    'prewarm': True,            # Buka koneksi database di thread latar belakang
+    'defer_indexes': True       # Bangun index pencarian/autocomplete di latar belakang
+}
+
+# Prepared statement: query tetap MySQLBackend (list, search, insert per tabel)
+# di-prepare sekali per koneksi lalu dipakai ulang dengan protokol binary.
+# Bandingkan latency-nya dengan: python -m benchmarks.bench_prepared
+PREPARED_CONFIG = {
+    'enabled': True,
+    'max_per_connection': 64    # Statement prepared per koneksi (LRU, lihat max_prepared_stmt_count)
+}
\ No newline at end of file
@@ -0,0 +1,117 @@
+"""
+Async Controller - Operasi list / search / add katalog sebagai coroutine
+Pasangan LibraryController untuk server asyncio: satu event loop melayani
+banyak request bersamaan, query database lewat AsyncStorage (pool async)
+"""
+
+from controllers.library_controller import LibraryController, ITEM_FACTORIES, PAGE_SIZE
+from database.backend_factory import create_async_storage
+
+
+class AsyncLibraryController:
+    """
+    Versi async dari operasi data LibraryController
+
+    Index pencarian, autocomplete, dan antrian write-behind dipakai bersama
+    LibraryController di belakangnya (tidak dibangun dua kali); hanya akses
+    database yang diganti menjadi coroutine.
+    """
+
+    def __init__(self, controller, storage=None):
+        """
+        Args:
+            controller: LibraryController yang memegang index di memory
+            storage: AsyncStorage (default: dibuat untuk backend controller)
+        """
+        self.controller = controller
+        self.storage = storage or create_async_storage(dialect=controller.storage)
+
+    @classmethod
+    def create(cls, view=None, storage=None):
+        """Membuat LibraryController (tanpa menu) beserta pasangan async-nya"""
+        return cls(LibraryController(view, storage))
+
+    # ========== LISTING ==========
+
+    async def list_page(self, table, after=None, limit=PAGE_SIZE):
+        """
+        Keyset pagination pada (title, id), lihat LibraryController._fetch_page
+        Returns: (list of items, next_cursor)
+        """
+        rows, next_cursor = await self.storage.list_page(table, after, limit)
+        return self.controller._page_items(table, rows, after, next_cursor), next_cursor
+
+    async def get_books_page(self, after=None, limit=PAGE_SIZE):
+        """Returns: (list of Book, next_cursor)"""
+        return await self.list_page("books", after, limit)
+
+    async def get_magazines_page(self, after=None, limit=PAGE_SIZE):
+        """Returns: (list of Magazine, next_cursor)"""
+        return await self.list_page("magazines", after, limit)
+
+    async def count(self, table):
+        """Jumlah item tersimpan dalam tabel"""
+        return await self.storage.count(table)
+
+    # ========== SEARCH ==========
+
+    async def search(self, table, keyword):
+        """
+        Mencari item sesuai search_mode controller, hasil terurut relevansi
+        Mode 'index' / 'fuzzy' dijawab index di memory tanpa menunggu database
+        Returns: List of items
+        """
+        controller = self.controller
+        rows = controller._search_pending(table, keyword)
+        if table in controller.search_indexes:
+            rows += controller._index_search(table, keyword)
+        else:
+            rows += await self.storage.search(table, keyword, limit=controller.search_top_k)
+        factory = ITEM_FACTORIES[table]
+        return [factory(row) for row in rows]
+
+    async def find_books(self, keyword):
+        """Returns: List of Book terurut relevansi"""
+        return await self.search("books", keyword)
+
+    async def find_magazines(self, keyword):
+        """Returns: List of Magazine terurut relevansi"""
+        return await self.search("magazines", keyword)
+
+    # ========== ADD ==========
+
+    async def add_item(self, table, item):
+        """
+        Menyimpan item baru lalu memperbarui index pencarian
+        Jika write-behind aktif, item divalidasi dan masuk antrian (id belum ada)
+
+        Returns: id item baru, atau None jika gagal / masih di antrian
+        Raises: ValueError jika data item tidak valid
+        """
+        controller = self.controller
+        if controller.write_queue is not None:
+            item.validate()
+            controller.write_queue.submit(table, item.to_dict())
+            return None
+
+        data = item.to_dict()
+        item_id = await self.storage.insert(table, data)
+        if item_id is not None:
+            item.set_id(item_id)
+            controller._index_new_item(table, item_id, data)
+        return item_id
+
+    async def add_book(self, book):
+        """Returns: id buku baru, atau None jika gagal"""
+        return await self.add_item("books", book)
+
+    async def add_magazine(self, magazine):
+        """Returns: id majalah baru, atau None jika gagal"""
+        return await self.add_item("magazines", magazine)
+
+    def get_pool_stats(self):
+        return self.storage.get_pool_stats()
+
+    async def close(self):
+        """Menutup pool async (backend controller tetap terbuka)"""
+        await self.storage.close()
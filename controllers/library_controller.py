@@ -3,9 +3,36 @@ Library Controller - Pengatur alur aplikasi
 Bagian CONTROLLER dari MVC
 """
 
+import threading
+
 from models.book_model import Book
 from models.magazine_model import Magazine
-from database.db_connection import DatabaseConnection
+from models.row_view import BookRow, MagazineRow, CatalogEntry
+from database.backend_factory import create_backend
+from database.storage_backend import CATALOG_TABLES, STATS_METRICS
+from search.inverted_index import InvertedIndex, tokenize
+from search.prefix_index import PrefixIndex, IdBitmap
+from search.trigram_index import TrigramIndex
+from services.unified_catalog import UnifiedCatalog
+from config import (SEARCH_CONFIG, INSTRUMENTATION_CONFIG, DISPLAY_CONFIG,
+                    WRITE_BEHIND_CONFIG, SYNC_CONFIG, STATS_CONFIG, AUTOCOMPLETE_CONFIG)
+
+
+# Jumlah item per halaman pada listing
+PAGE_SIZE = DISPLAY_CONFIG.get('page_size', 20)
+
+# Index pencarian di memory per SEARCH_CONFIG['mode'] (mode lain diserahkan ke backend)
+SEARCH_INDEX_TYPES = {
+    'index': InvertedIndex,
+    'fuzzy': TrigramIndex
+}
+
+# Factory untuk setiap tabel (row database -> object)
+# Row view menunda pembuatan Book / Magazine sampai field selain id/title dibutuhkan
+ITEM_FACTORIES = {
+    'books': BookRow,
+    'magazines': MagazineRow
+}
 
 
 class LibraryController:
@@ -17,37 +44,175 @@ class LibraryController:
     2. Memproses logika aplikasi
     3. Memanggil Model untuk operasi database
     4. Mengirim data ke View untuk ditampilkan
+    
+    Penyimpanan diakses lewat StorageBackend (MySQL / SQLite) sehingga
+    controller tidak bergantung pada satu engine database.
     """
     
-    def __init__(self, view):
+    def __init__(self, view, storage=None, defer_indexes=False):
         """
         Initialize controller dengan view
         
         Args:
             view: Instance dari ConsoleView
+            storage: StorageBackend (default: sesuai STORAGE_CONFIG)
+            defer_indexes: Bangun index pencarian & autocomplete di thread latar
+                           belakang agar menu langsung tampil (lihat STARTUP_CONFIG)
         """
         self.view = view
-        self.db = DatabaseConnection()
+        self.storage = storage or create_backend()
+        self.search_mode = SEARCH_CONFIG.get('mode', 'like')
+        self.search_top_k = SEARCH_CONFIG.get('top_k', 50)
+        self.search_indexes = {}
+        # Saran kata kunci (prefix index judul / penulis / penerbit) per tabel
+        self.autocomplete = AUTOCOMPLETE_CONFIG.get('enabled', True)
+        self.suggest_top_k = AUTOCOMPLETE_CONFIG.get('top_k', 8)
+        self.suggest_min_prefix = AUTOCOMPLETE_CONFIG.get('min_prefix', 1)
+        self.suggesters = {}
+        # Id yang sudah dihitung suggester (IdBitmap), hanya jika tidak ada index
+        # pencarian yang mencatat id (mode 'fulltext' / 'like'); lihat _apply_changes
+        self.suggested_ids = {}
+        # Index dipakai bersama thread sync / write-behind dan menu
+        self.index_lock = threading.RLock()
+        # Selama index dibangun di latar belakang: tabel -> item baru yang disusulkan
+        self.index_backlog = None
+        self.index_builder = None
+        self.index_cancel = threading.Event()
+        self.write_queue = None
+        self.sync = None
+        # Listing & pencarian gabungan buku + majalah (query kedua tabel bersamaan)
+        self.catalog = UnifiedCatalog(self.storage, searcher=self._search_rows)
+        
+        if SYNC_CONFIG.get('enabled'):
+            options = {k: v for k, v in SYNC_CONFIG.items() if k != 'enabled'}
+            self.enable_sync(**options)  # Sekaligus membangun index pencarian
+        elif self.search_mode in SEARCH_INDEX_TYPES or self.autocomplete:
+            if defer_indexes:
+                self.build_search_indexes_in_background()
+            else:
+                self.build_search_indexes()
+        if WRITE_BEHIND_CONFIG.get('enabled'):
+            options = {k: v for k, v in WRITE_BEHIND_CONFIG.items() if k != 'enabled'}
+            self.enable_write_behind(**options)
     
     def run(self):
         """Main loop aplikasi"""
         self.view.show_header()
         
-        while True:
-            self.view.show_main_menu()
-            choice = self.view.get_input()
-            
-            if choice == '1':
-                self.handle_book_menu()
-            elif choice == '2':
-                self.handle_magazine_menu()
-            elif choice == '0':
-                if self.view.confirm("Yakin ingin keluar?"):
-                    self.view.show_info("Terima kasih telah menggunakan aplikasi!")
-                    self.db.close_connection()
-                    break
-            else:
-                self.view.show_error("Pilihan tidak valid!")
+        try:
+            while True:
+                self.view.show_main_menu()
+                choice = self.view.get_input()
+                
+                if choice == '1':
+                    self.handle_book_menu()
+                elif choice == '2':
+                    self.handle_magazine_menu()
+                elif choice == '3':
+                    self.handle_catalog_menu()
+                elif choice == '4':
+                    self.handle_stats_menu()
+                elif choice == '0':
+                    if self.view.confirm("Yakin ingin keluar?"):
+                        self.view.show_info("Terima kasih telah menggunakan aplikasi!")
+                        break
+                else:
+                    self.view.show_error("Pilihan tidak valid!")
+        finally:
+            # Juga dijalankan saat Ctrl+C agar antrian write-behind tidak hilang
+            self.flush_writes()
+            self.stop_sync()
+            self.show_query_stats()
+            self.close()
+    
+    def close(self):
+        """Menyimpan sisa antrian, menghentikan thread latar belakang, dan menutup backend"""
+        if self.index_builder is not None:
+            self.index_cancel.set()
+            self.index_builder.join()
+            self.index_builder = None
+        self.flush_writes()
+        self.stop_sync()
+        self.catalog.close()
+        self.storage.close()
+    
+    def enable_write_behind(self, max_batch=50, flush_interval=2.0,
+                            spill_file='pending_writes.jsonl', retry_interval=10.0,
+                            reject_file='rejected_writes.jsonl'):
+        """
+        Mengaktifkan write-behind: tambah item dikonfirmasi tanpa menunggu commit,
+        disimpan di latar belakang per batch (lihat WriteBehindQueue)
+        """
+        from services.write_behind import WriteBehindQueue
+        
+        self.write_queue = WriteBehindQueue(
+            self.storage,
+            max_batch=max_batch,
+            flush_interval=flush_interval,
+            spill_file=spill_file,
+            retry_interval=retry_interval,
+            on_flushed=self._index_new_item,
+            reject_file=reject_file
+        )
+    
+    def flush_writes(self):
+        """Menyimpan sisa antrian write-behind lalu menghentikan worker-nya"""
+        if self.write_queue is None:
+            return
+        queue = self.write_queue
+        self.write_queue = None
+        stats = queue.close()
+        if stats['rejected']:
+            self.view.show_error(
+                f"{stats['rejected']} item ditolak database dan tidak disimpan "
+                f"(lihat {queue.reject_file})")
+        if stats['spill_pending']:
+            self.view.show_error(
+                f"{stats['spill_pending']} item belum tersimpan ({stats['last_error']}). "
+                f"Data aman di {queue.spill_file} dan akan dikirim "
+                "ulang saat aplikasi dijalankan lagi.")
+        elif stats['flushed']:
+            self.view.show_info(f"{stats['flushed']} item dari antrian tersimpan ke database")
+    
+    def enable_sync(self, poll_interval=5.0, lag=2.0, batch_size=1000, full_resync_interval=None):
+        """
+        Mengaktifkan sinkronisasi inkremental: thread latar belakang menarik baris
+        yang berubah (termasuk dari proses lain) untuk memperbarui index pencarian
+        dan membuang cache tabel yang berubah (lihat CatalogSync)
+        """
+        from services.catalog_sync import CatalogSync
+        
+        self.sync = CatalogSync(
+            self.storage,
+            batch_size=batch_size,
+            poll_interval=poll_interval,
+            lag=lag,
+            full_resync_interval=full_resync_interval
+        )
+        self.sync.add_listener(self._apply_changes, on_reset=self._reset_search_index)
+        # Watermark diambil sebelum scan agar perubahan selama scan tidak terlewat
+        self.sync.mark_current()
+        if self.search_mode in SEARCH_INDEX_TYPES or self.autocomplete:
+            self.build_search_indexes()
+        self.sync.start()
+    
+    def resync_catalog(self):
+        """Memaksa full resync (misal setelah ada item yang dihapus langsung di database)"""
+        if self.sync is None:
+            return None
+        return self.sync.full_resync()
+    
+    def stop_sync(self):
+        """Menghentikan thread sinkronisasi"""
+        if self.sync is not None:
+            self.sync.stop()
+            self.sync = None
+    
+    def show_query_stats(self):
+        """Ringkasan statistik query (statement terlambat/terbanyak) saat shutdown"""
+        stats = self.storage.get_query_stats(INSTRUMENTATION_CONFIG.get('report_top', 10))
+        if stats and stats['total_queries']:
+            self.view.show_query_stats(stats)
     
     def handle_book_menu(self):
         """Handle menu buku"""
@@ -89,19 +254,385 @@ class LibraryController:
             if choice != '0':
                 self.view.pause()
     
+    def handle_catalog_menu(self):
+        """Handle menu katalog gabungan (buku + majalah)"""
+        while True:
+            self.view.show_catalog_menu()
+            choice = self.view.get_input()
+            
+            if choice == '1':
+                self.display_catalog()
+            elif choice == '2':
+                self.search_catalog()
+            elif choice == '0':
+                break
+            else:
+                self.view.show_error("Pilihan tidak valid!")
+            
+            if choice != '0':
+                self.view.pause()
+    
+    def handle_stats_menu(self):
+        """Handle menu statistik katalog"""
+        while True:
+            self.view.show_stats_menu()
+            choice = self.view.get_input()
+            
+            if choice == '1':
+                self.display_catalog_stats()
+            elif choice == '2':
+                self.rebuild_catalog_stats()
+            elif choice == '0':
+                break
+            else:
+                self.view.show_error("Pilihan tidak valid!")
+            
+            if choice != '0':
+                self.view.pause()
+    
+    # ========== PAGINATION ==========
+    
+    def _fetch_page(self, table, after=None, limit=PAGE_SIZE):
+        """
+        Keyset pagination pada (title, id)
+        
+        Berbeda dengan OFFSET, halaman berikutnya dicari lewat index mulai dari
+        (title, id) terakhir halaman sebelumnya, sehingga biaya tiap halaman tetap
+        sama berapapun posisinya.
+        
+        Args:
+            after: Cursor (title, id) item terakhir halaman sebelumnya, None = halaman pertama
+            limit: Jumlah item per halaman
+        
+        Returns: (list of items, next_cursor) - next_cursor None jika halaman terakhir
+        """
+        rows, next_cursor = self.storage.list_page(table, after, limit)
+        return self._page_items(table, rows, after, next_cursor), next_cursor
+    
+    def _page_items(self, table, rows, after, next_cursor):
+        """Row satu halaman -> items, ditambah item write-behind yang jatuh di halaman itu"""
+        factory = ITEM_FACTORIES[table]
+        items = [factory(row) for row in rows]
+        
+        # Item write-behind yang belum tersimpan disisipkan ke halaman sesuai urutan judul
+        low = after[0].casefold() if after else None
+        high = rows[-1][1].casefold() if rows and next_cursor is not None else None
+        pending = [factory(row) for row in self._pending_rows(table)
+                   if (low is None or row[1].casefold() > low)
+                   and (high is None or row[1].casefold() <= high)]
+        if pending:
+            items = sorted(items + pending, key=lambda item: item.get_title().casefold())
+        return items
+    
+    def _pending_rows(self, table):
+        """Item di antrian write-behind dalam format row (id None karena belum tersimpan)"""
+        if self.write_queue is None:
+            return []
+        names = CATALOG_TABLES[table]['columns'][1:]
+        return [(None,) + tuple(data.get(name) for name in names)
+                for data in self.write_queue.pending(table)]
+    
+    def _iter_items(self, table):
+        """Generator semua item terurut judul, streaming tanpa fetchall"""
+        factory = ITEM_FACTORIES[table]
+        for row in self.storage.iter_rows(table):
+            yield factory(row)
+    
+    def _browse_pages(self, table, title, empty_message, page_size=PAGE_SIZE):
+        """
+        Navigasi halaman di console (next/prev/lompat) memakai cursor keyset
+        
+        Total item diambil sekali lewat COUNT query. Cursor setiap halaman yang
+        sudah dikunjungi disimpan agar bisa kembali; halaman yang belum pernah
+        dibuka (lompat) dicari lewat storage.page_cursor.
+        """
+        total = self.storage.count(table) + len(self._pending_rows(table))
+        if not total:
+            self.view.show_info(empty_message)
+            return
+        total_pages = (total + page_size - 1) // page_size
+        
+        cursors = {1: None}  # cursors[n] = cursor untuk membuka halaman ke-n
+        page_number = 1
+        while True:
+            if page_number not in cursors:
+                cursors[page_number] = self.storage.page_cursor(table, (page_number - 1) * page_size)
+            items, next_cursor = self._fetch_page(table, cursors[page_number], page_size)
+            if next_cursor is not None:
+                cursors[page_number + 1] = next_cursor
+            
+            self.view.display_items(items, f"{title} - HALAMAN {page_number}/{total_pages}", total=total)
+            action = self.view.get_page_action(
+                has_prev=page_number > 1,
+                has_next=next_cursor is not None,
+                total_pages=total_pages
+            )
+            if action == 'n' and next_cursor is not None:
+                page_number += 1
+            elif action == 'p' and page_number > 1:
+                page_number -= 1
+            elif isinstance(action, int):
+                page_number = action
+            elif action != 'r':
+                return
+    
+    # ========== SEARCH ==========
+    
+    def build_search_indexes(self):
+        """
+        Membangun index di memory untuk books dan magazines: inverted index
+        (mode 'index') atau trigram index (mode 'fuzzy'), dan prefix index
+        autocomplete (jika aktif)
+        Data dibaca streaming (iter_rows) dalam satu kali scan per tabel
+        """
+        for table, spec in CATALOG_TABLES.items():
+            index_type = SEARCH_INDEX_TYPES.get(self.search_mode)
+            index = index_type(spec['search_fields']) if index_type else None
+            suggester = PrefixIndex(spec['search_fields']) if self.autocomplete else None
+            counted = IdBitmap() if suggester is not None and index is None else None
+            names = spec['columns']
+            # Build di latar belakang: id yang sudah ter-scan tidak disusulkan dua kali
+            scanned = set() if self.index_backlog is not None else None
+            for row in self.storage.iter_rows(table):
+                if self.index_cancel.is_set():
+                    return
+                if scanned is not None:
+                    scanned.add(row[0])
+                values = dict(zip(names, row))
+                if index is not None:
+                    index.add(row[0], values, row)
+                if suggester is not None:
+                    suggester.add(values)
+                if counted is not None:
+                    counted.add(row[0])
+            with self.index_lock:
+                # Item yang ditambahkan selama scan (build di latar belakang)
+                backlog = self.index_backlog.pop(table, []) if self.index_backlog else []
+                for item_id, data in backlog:
+                    if item_id in scanned:
+                        continue
+                    row = (item_id,) + tuple(data.get(name) for name in names[1:])
+                    if index is not None:
+                        index.add(item_id, data, row)
+                    if suggester is not None:
+                        suggester.add(data)
+                    if counted is not None:
+                        counted.add(item_id)
+                if index is not None:
+                    self.search_indexes[table] = index
+                if suggester is not None:
+                    suggester.compact()
+                    self.suggesters[table] = suggester
+                if counted is not None:
+                    self.suggested_ids[table] = counted
+    
+    def build_search_indexes_in_background(self):
+        """
+        Membangun index di thread latar belakang: sampai index satu tabel selesai,
+        pencarian tabel itu dilayani backend dan autocomplete belum memberi saran
+        Returns: Thread builder (join() untuk menunggu selesai)
+        """
+        with self.index_lock:
+            self.index_backlog = {table: [] for table in CATALOG_TABLES}
+        
+        def build():
+            try:
+                self.build_search_indexes()
+            finally:
+                with self.index_lock:
+                    self.index_backlog = None
+        
+        self.index_builder = threading.Thread(target=build, name='index-build', daemon=True)
+        self.index_builder.start()
+        return self.index_builder
+    
+    def _index_new_item(self, table, item_id, data):
+        """Update index pencarian & autocomplete setelah insert agar langsung up to date"""
+        if item_id is None:
+            return
+        names = CATALOG_TABLES[table]['columns']
+        row = (item_id,) + tuple(data.get(name) for name in names[1:])
+        with self.index_lock:
+            if self.index_backlog and table in self.index_backlog:
+                # Index tabel ini masih dibangun: disusulkan saat build selesai
+                self.index_backlog[table].append((item_id, data))
+                return
+            index = self.search_indexes.get(table)
+            suggester = self.suggesters.get(table)
+            if index is not None:
+                index.add(item_id, data, row)
+            if suggester is not None:
+                suggester.add(data)
+                if table in self.suggested_ids:
+                    self.suggested_ids[table].add(item_id)
+    
+    def _apply_changes(self, table, rows):
+        """Listener CatalogSync: baris baru / berubah menggantikan versi lamanya di index"""
+        index = self.search_indexes.get(table)
+        suggester = self.suggesters.get(table)
+        # Id yang sudah dihitung: dari index pencarian, atau bitmap suggested_ids tanpa index
+        counted = index if index is not None else self.suggested_ids.get(table)
+        names = CATALOG_TABLES[table]['columns']
+        with self.index_lock:
+            for row in rows:
+                values = dict(zip(names, row))
+                # Popularitas autocomplete hanya dihitung untuk baris baru: baris yang
+                # sudah ditambahkan lewat controller atau terkirim ulang di jendela lag dilewati
+                if suggester is not None and (counted is None or row[0] not in counted):
+                    suggester.add(values)
+                    if counted is not None and counted is not index:
+                        counted.add(row[0])
+                if index is not None:
+                    index.add(row[0], values, row)
+    
+    def _reset_search_index(self, table):
+        """Listener CatalogSync: index dikosongkan sebelum full resync mengisinya ulang"""
+        with self.index_lock:
+            for indexes in (self.search_indexes, self.suggesters, self.suggested_ids):
+                if table in indexes:
+                    indexes[table].clear()
+    
+    def suggest(self, prefix, table=None):
+        """
+        Saran kata kunci untuk ketikan `prefix` (judul / penulis / penerbit)
+        Args:
+            prefix: Awal teks yang sudah diketik
+            table: 'books' / 'magazines', atau None untuk semua tabel
+        Returns: List of teks, paling populer dulu
+        """
+        if len(prefix.strip()) < self.suggest_min_prefix:
+            return []
+        tables = [table] if table else list(self.suggesters)
+        candidates = {}
+        with self.index_lock:
+            for name in tables:
+                suggester = self.suggesters.get(name)
+                if suggester is None:
+                    continue
+                for text, count, _ in suggester.suggest(prefix, self.suggest_top_k):
+                    candidates[text] = candidates.get(text, 0) + count
+        ranked = sorted(candidates.items(), key=lambda entry: (-entry[1], entry[0].casefold()))
+        return [text for text, _ in ranked[:self.suggest_top_k]]
+    
+    def _suggester_for(self, table=None):
+        """Callable autocomplete untuk ConsoleView.get_search_keyword (None jika nonaktif)"""
+        if not self.suggesters:
+            return None
+        return lambda prefix: self.suggest(prefix, table)
+    
+    def _search(self, table, keyword):
+        """
+        Mencari item sesuai search_mode, hasil terurut relevansi
+        Returns: List of items
+        """
+        factory = ITEM_FACTORIES[table]
+        return [factory(row) for row in self._search_rows(table, keyword)]
+    
+    def _search_rows(self, table, keyword):
+        """
+        Row hasil pencarian satu tabel (item write-behind di depan)
+        Mode 'index' / 'fuzzy' memakai index di memory, mode lain diserahkan ke backend
+        """
+        pending = self._search_pending(table, keyword)
+        if table in self.search_indexes:
+            return pending + self._index_search(table, keyword)
+        
+        rows = self.storage.search(table, keyword, limit=self.search_top_k)
+        return pending + list(rows or [])
+    
+    def _index_search(self, table, keyword):
+        """Row hasil index pencarian di memory (mode 'index' / 'fuzzy')"""
+        with self.index_lock:
+            results = self.search_indexes[table].search(keyword, k=self.search_top_k)
+        return [row for _, _, row in results]
+    
+    def _search_pending(self, table, keyword):
+        """Item write-behind yang cocok dengan keyword (kata apa saja di field pencarian)"""
+        rows = self._pending_rows(table)
+        terms = tokenize(keyword)
+        if not rows or not terms:
+            return []
+        names = CATALOG_TABLES[table]['columns']
+        positions = [names.index(field) for field in CATALOG_TABLES[table]['search_fields']]
+        return [row for row in rows
+                if any(term in tokenize(str(row[position] or ""))
+                       for position in positions for term in terms)]
+    
+    def _insert_item(self, table, item):
+        """
+        Menyimpan item baru lewat backend lalu memperbarui index pencarian
+        Returns: id item baru, atau None jika gagal
+        """
+        data = item.to_dict()
+        item_id = self.storage.insert(table, data)
+        if item_id is not None:
+            item.set_id(item_id)
+            self._index_new_item(table, item_id, data)
+        return item_id
+    
+    def get_item(self, table, item_id):
+        """
+        Satu item berdasarkan id
+        Returns: Item, atau None jika tidak ditemukan
+        """
+        row = self.storage.get_by_id(table, item_id)
+        return ITEM_FACTORIES[table](row) if row else None
+    
+    def create_item(self, table, data):
+        """
+        Membuat dan menyimpan item dari dictionary (misal body request JSON)
+        Jika write-behind aktif, item masuk antrian dan id-nya masih None
+        
+        Returns: (item, tersimpan) - tersimpan False jika masih di antrian
+        Raises: ValueError jika data tidak valid, RuntimeError jika INSERT gagal
+        """
+        item = ITEM_FACTORIES[table].MODEL.from_dict(data)
+        item.validate()
+        if self.write_queue is not None:
+            self.write_queue.submit(table, item.to_dict())
+            return item, False
+        if self._insert_item(table, item) is None:
+            raise RuntimeError(f"Gagal menyimpan item ke {table}")
+        return item, True
+    
+    def _add_item(self, table, item, label):
+        """
+        Menyimpan item dari menu tambah: langsung (INSERT + commit) atau lewat
+        antrian write-behind jika aktif. Item antrian divalidasi di sini karena
+        error database baru diketahui setelah user melanjutkan pekerjaan.
+        """
+        if self.write_queue is None:
+            if self._insert_item(table, item) is not None:
+                self.view.show_success(f"{label} berhasil ditambahkan!")
+            else:
+                self.view.show_error(f"Gagal menambahkan {label.lower()}!")
+            return
+        
+        try:
+            item.validate()
+        except ValueError as e:
+            self.view.show_error(f"Gagal menambahkan {label.lower()}: {e}")
+            return
+        self.write_queue.submit(table, item.to_dict())
+        self.view.show_success(f"{label} diterima dan sedang disimpan di latar belakang!")
+    
     # ========== BOOK OPERATIONS ==========
     
+    def get_books_page(self, after=None, limit=PAGE_SIZE):
+        """
+        Satu halaman buku terurut judul (keyset pagination)
+        Returns: (list of Book, next_cursor)
+        """
+        return self._fetch_page("books", after, limit)
+    
+    def iter_books(self):
+        """Generator semua buku terurut judul, streaming tanpa fetchall"""
+        return self._iter_items("books")
+    
     def display_all_books(self):
-        """Menampilkan semua buku dari database"""
-        query = "SELECT id, title, author, year, isbn FROM books ORDER BY title"
-        rows = self.db.fetch_all(query)
-        
-        if rows:
-            # Convert database rows menjadi Book objects
-            books = [Book.from_db_row(row) for row in rows]
-            self.view.display_items(books, "DAFTAR BUKU")
-        else:
-            self.view.show_info("Belum ada buku dalam database.")
+        """Menampilkan semua buku dari database per halaman"""
+        self._browse_pages("books", "DAFTAR BUKU",
+                           "Belum ada buku dalam database.")
     
     def add_book(self):
         """Menambahkan buku baru"""
@@ -116,52 +647,44 @@ class LibraryController:
                 isbn=book_data['isbn']
             )
             
-            # Insert ke database
-            query = """
-                INSERT INTO books (title, author, year, isbn)
-                VALUES (%s, %s, %s, %s)
-            """
-            data = book.to_dict()
-            params = (data['title'], data['author'], data['year'], data['isbn'])
-            
-            if self.db.execute_query(query, params):
-                self.view.show_success("Buku berhasil ditambahkan!")
-            else:
-                self.view.show_error("Gagal menambahkan buku!")
+            self._add_item("books", book, "Buku")
+    
+    def find_books(self, keyword):
+        """
+        Mencari buku berdasarkan judul / penulis
+        Returns: List of Book terurut relevansi
+        """
+        return self._search("books", keyword)
     
     def search_books(self):
         """Mencari buku berdasarkan keyword"""
-        keyword = self.view.get_search_keyword()
+        keyword = self.view.get_search_keyword(self._suggester_for("books"))
         
         if keyword:
-            query = """
-                SELECT id, title, author, year, isbn 
-                FROM books 
-                WHERE title LIKE %s OR author LIKE %s
-                ORDER BY title
-            """
-            search_param = f"%{keyword}%"
-            rows = self.db.fetch_all(query, (search_param, search_param))
+            books = self.find_books(keyword)
             
-            if rows:
-                books = [Book.from_db_row(row) for row in rows]
+            if books:
                 self.view.display_items(books, f"HASIL PENCARIAN: '{keyword}'")
             else:
                 self.view.show_info(f"Tidak ditemukan buku dengan keyword '{keyword}'")
     
     # ========== MAGAZINE OPERATIONS ==========
     
+    def get_magazines_page(self, after=None, limit=PAGE_SIZE):
+        """
+        Satu halaman majalah terurut judul (keyset pagination)
+        Returns: (list of Magazine, next_cursor)
+        """
+        return self._fetch_page("magazines", after, limit)
+    
+    def iter_magazines(self):
+        """Generator semua majalah terurut judul, streaming tanpa fetchall"""
+        return self._iter_items("magazines")
+    
     def display_all_magazines(self):
-        """Menampilkan semua majalah dari database"""
-        query = "SELECT id, title, publisher, issue_number FROM magazines ORDER BY title"
-        rows = self.db.fetch_all(query)
-        
-        if rows:
-            # Convert database rows menjadi Magazine objects
-            magazines = [Magazine.from_db_row(row) for row in rows]
-            self.view.display_items(magazines, "DAFTAR MAJALAH")
-        else:
-            self.view.show_info("Belum ada majalah dalam database.")
+        """Menampilkan semua majalah dari database per halaman"""
+        self._browse_pages("magazines", "DAFTAR MAJALAH",
+                           "Belum ada majalah dalam database.")
     
     def add_magazine(self):
         """Menambahkan majalah baru"""
@@ -175,35 +698,136 @@ class LibraryController:
                 issue_number=magazine_data['issue_number']
             )
             
-            # Insert ke database
-            query = """
-                INSERT INTO magazines (title, publisher, issue_number)
-                VALUES (%s, %s, %s)
-            """
-            data = magazine.to_dict()
-            params = (data['title'], data['publisher'], data['issue_number'])
-            
-            if self.db.execute_query(query, params):
-                self.view.show_success("Majalah berhasil ditambahkan!")
-            else:
-                self.view.show_error("Gagal menambahkan majalah!")
+            self._add_item("magazines", magazine, "Majalah")
+    
+    def find_magazines(self, keyword):
+        """
+        Mencari majalah berdasarkan judul / penerbit
+        Returns: List of Magazine terurut relevansi
+        """
+        return self._search("magazines", keyword)
     
     def search_magazines(self):
         """Mencari majalah berdasarkan keyword"""
-        keyword = self.view.get_search_keyword()
+        keyword = self.view.get_search_keyword(self._suggester_for("magazines"))
         
         if keyword:
-            query = """
-                SELECT id, title, publisher, issue_number 
-                FROM magazines 
-                WHERE title LIKE %s OR publisher LIKE %s
-                ORDER BY title
-            """
-            search_param = f"%{keyword}%"
-            rows = self.db.fetch_all(query, (search_param, search_param))
+            magazines = self.find_magazines(keyword)
             
-            if rows:
-                magazines = [Magazine.from_db_row(row) for row in rows]
+            if magazines:
                 self.view.display_items(magazines, f"HASIL PENCARIAN: '{keyword}'")
             else:
-                self.view.show_info(f"Tidak ditemukan majalah dengan keyword '{keyword}'")
\ No newline at end of file
+                self.view.show_info(f"Tidak ditemukan majalah dengan keyword '{keyword}'")
+    
+    # ========== KATALOG GABUNGAN ==========
+    
+    def _catalog_items(self, entries):
+        """(table, row) dari UnifiedCatalog -> item dengan satu format tabel untuk semua jenis"""
+        return [CatalogEntry(ITEM_FACTORIES[table](row)) for table, row in entries]
+    
+    def get_catalog_page(self, cursors=None, limit=PAGE_SIZE):
+        """
+        Satu halaman buku + majalah terurut judul (keyset pagination per tabel)
+        Returns: (list of item, next_cursors) - next_cursors None jika halaman terakhir
+        """
+        entries, next_cursors = self.catalog.list_page(cursors, limit)
+        return self._catalog_items(entries), next_cursors
+    
+    def iter_catalog(self):
+        """Generator semua buku + majalah terurut judul (k-way merge, streaming)"""
+        for table, row in self.catalog.iter_entries():
+            yield ITEM_FACTORIES[table](row)
+    
+    def find_all(self, keyword):
+        """
+        Mencari di buku dan majalah sekaligus
+        Returns: List of item terurut judul
+        """
+        return self._catalog_items(self.catalog.search(keyword))
+    
+    def display_catalog(self, page_size=PAGE_SIZE):
+        """
+        Menampilkan seluruh katalog (buku + majalah) per halaman
+        Cursor gabungan tidak bisa dihitung dari OFFSET, jadi navigasi hanya
+        next/prev lewat cursor halaman yang sudah dikunjungi
+        """
+        total = self.catalog.count()
+        if not total:
+            self.view.show_info("Katalog masih kosong.")
+            return
+        total_pages = (total + page_size - 1) // page_size
+        
+        cursors = {1: None}
+        page_number = 1
+        while True:
+            items, next_cursors = self.get_catalog_page(cursors[page_number], page_size)
+            if next_cursors is not None:
+                cursors[page_number + 1] = next_cursors
+            
+            self.view.display_items(items, f"KATALOG - HALAMAN {page_number}/{total_pages}", total=total)
+            action = self.view.get_page_action(
+                has_prev=page_number > 1,
+                has_next=next_cursors is not None
+            )
+            if action == 'n' and next_cursors is not None:
+                page_number += 1
+            elif action == 'p' and page_number > 1:
+                page_number -= 1
+            elif action != 'r':
+                return
+    
+    def search_catalog(self):
+        """Mencari buku dan majalah dengan satu keyword"""
+        keyword = self.view.get_search_keyword(self._suggester_for())
+        
+        if keyword:
+            items = self.find_all(keyword)
+            
+            if items:
+                self.view.display_items(items, f"HASIL PENCARIAN: '{keyword}'")
+            else:
+                self.view.show_info(f"Tidak ditemukan item dengan keyword '{keyword}'")
+    
+    # ========== STATISTIK ==========
+    
+    def get_catalog_stats(self, top_n=None):
+        """
+        Statistik katalog dari tabel ringkasan (tanpa GROUP BY pada tabel katalog)
+        Returns: Dictionary metric -> list of (kelompok, jumlah)
+        """
+        top_n = top_n or STATS_CONFIG.get('top_n', 10)
+        years = self.storage.get_stats('books_by_year', order_by='bucket')
+        # Bucket disimpan sebagai teks: urutkan tahun secara angka, tanpa tahun di akhir
+        years = sorted(years, key=lambda row: (not row[0].isdigit(), int(row[0]) if row[0].isdigit() else 0))
+        return {
+            'books_by_year': years,
+            'books_by_author': self.storage.get_stats('books_by_author', limit=top_n),
+            'magazines_by_publisher': self.storage.get_stats('magazines_by_publisher', limit=top_n)
+        }
+    
+    def display_catalog_stats(self):
+        """Menampilkan dashboard statistik katalog"""
+        if not self.storage.stats_enabled():
+            self.view.show_error("Statistik tidak aktif (cek STATS_CONFIG / tabel catalog_stats)")
+            return
+        stats = self.get_catalog_stats()
+        top_n = STATS_CONFIG.get('top_n', 10)
+        self.view.show_catalog_stats({
+            "Buku per Tahun": stats['books_by_year'],
+            f"{top_n} Penulis Teratas": stats['books_by_author'],
+            f"{top_n} Penerbit Majalah Teratas": stats['magazines_by_publisher']
+        })
+    
+    def rebuild_catalog_stats(self):
+        """Menghitung ulang statistik dari seluruh data katalog (satu kali baca per tabel)"""
+        if not self.storage.stats_enabled():
+            self.view.show_error("Statistik tidak aktif (cek STATS_CONFIG / tabel catalog_stats)")
+            return None
+        try:
+            summary = self.storage.rebuild_stats()
+        except Exception as e:
+            self.view.show_error(f"Gagal menghitung ulang statistik: {e}")
+            return None
+        groups = ", ".join(f"{metric}: {summary[metric]}" for metric in STATS_METRICS)
+        self.view.show_success(f"Statistik dihitung ulang ({groups} kelompok)")
+        return summary
\ No newline at end of file
@@ -0,0 +1,485 @@
+"""
+Async Connection Module
+Versi asyncio dari DatabaseConnection: fetch_all / fetch_one / fetch_iter /
+execute_* sebagai coroutine, dengan pool koneksi async. Satu event loop bisa
+melayani ratusan request bersamaan tanpa satu thread per query.
+
+Driver:
+- MySQL: aiomysql (opsional, pip install aiomysql), benar-benar non-blocking
+- SQLite: tidak ada driver async, jadi setiap koneksi sqlite3 dijalankan di
+  thread khususnya sendiri. Jumlah thread = ukuran pool, bukan jumlah request.
+"""
+
+import asyncio
+import sqlite3
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from database.connection_pool import PoolTimeoutError
+
+try:
+    import aiomysql
+except ImportError:  # Driver async MySQL opsional
+    aiomysql = None
+
+
+class ThreadedConnection:
+    """
+    Koneksi DB-API blocking yang semua operasinya dijalankan di satu thread
+    khusus (sqlite3 hanya boleh dipakai dari thread yang membuatnya)
+    """
+
+    def __init__(self):
+        self.__executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='async-db')
+        self.__raw = None
+        self.closed = False
+
+    @classmethod
+    async def open(cls, connect):
+        """
+        Args:
+            connect: Callable tanpa argumen yang membuat koneksi DB-API (dijalankan di thread koneksi)
+        """
+        connection = cls()
+        try:
+            connection.__raw = await connection.__run(connect)
+        except BaseException:
+            connection.__executor.shutdown(wait=False)
+            raise
+        return connection
+
+    async def __run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.__executor, function, *args)
+
+    def __execute(self, query, params):
+        cursor = self.__raw.cursor()
+        cursor.execute(query, params or ())
+        return cursor
+
+    async def fetch_all(self, query, params=()):
+        def work():
+            cursor = self.__execute(query, params)
+            try:
+                return cursor.fetchall()
+            finally:
+                cursor.close()
+        return await self.__run(work)
+
+    async def fetch_iter(self, query, params=(), batch_size=500):
+        cursor = await self.__run(self.__execute, query, params)
+        try:
+            while True:
+                rows = await self.__run(cursor.fetchmany, batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+        finally:
+            await self.__run(cursor.close)
+
+    async def execute(self, query, params=()):
+        """Returns: (lastrowid, rowcount) - belum di-commit"""
+        def work():
+            cursor = self.__execute(query, params)
+            try:
+                return cursor.lastrowid, cursor.rowcount
+            finally:
+                cursor.close()
+        return await self.__run(work)
+
+    async def executemany(self, query, rows):
+        def work():
+            cursor = self.__raw.cursor()
+            try:
+                cursor.executemany(query, rows)
+            finally:
+                cursor.close()
+        await self.__run(work)
+
+    async def begin(self):
+        # sqlite3 membuka transaksi sendiri pada statement tulis pertama
+        pass
+
+    async def commit(self):
+        await self.__run(self.__raw.commit)
+
+    async def rollback(self):
+        await self.__run(self.__raw.rollback)
+
+    async def close(self):
+        if self.closed:
+            return
+        self.closed = True
+        try:
+            await self.__run(self.__raw.close)
+        finally:
+            self.__executor.shutdown(wait=False)
+
+
+class AioMySQLConnection:
+    """Koneksi aiomysql dengan method yang sama dengan ThreadedConnection"""
+
+    def __init__(self, raw):
+        self.__raw = raw
+
+    @classmethod
+    async def open(cls, config):
+        """
+        Args:
+            config: Pengaturan DatabaseConnection (host, user, password, database, port)
+        """
+        options = dict(config)
+        options['db'] = options.pop('database', None)
+        # autocommit: SELECT tidak menahan snapshot REPEATABLE READ di koneksi pool,
+        # transaksi tulis dibuka eksplisit lewat begin()
+        return cls(await aiomysql.connect(autocommit=True, **options))
+
+    @property
+    def closed(self):
+        return self.__raw.closed
+
+    async def fetch_all(self, query, params=()):
+        async with self.__raw.cursor() as cursor:
+            await cursor.execute(query, params or None)
+            return await cursor.fetchall()
+
+    async def fetch_iter(self, query, params=(), batch_size=500):
+        # SSCursor: baris dikirim server sedikit demi sedikit (unbuffered)
+        async with self.__raw.cursor(aiomysql.SSCursor) as cursor:
+            await cursor.execute(query, params or None)
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    yield row
+
+    async def execute(self, query, params=()):
+        async with self.__raw.cursor() as cursor:
+            await cursor.execute(query, params or None)
+            return cursor.lastrowid, cursor.rowcount
+
+    async def executemany(self, query, rows):
+        async with self.__raw.cursor() as cursor:
+            await cursor.executemany(query, rows)
+
+    async def begin(self):
+        await self.__raw.begin()
+
+    async def commit(self):
+        await self.__raw.commit()
+
+    async def rollback(self):
+        await self.__raw.rollback()
+
+    async def close(self):
+        self.__raw.close()
+
+
+class AsyncConnectionPool:
+    """
+    Pool koneksi untuk asyncio (pasangan ConnectionPool yang thread-safe)
+
+    Coroutine yang meminjam koneksi saat pool penuh menunggu di antrian FIFO
+    (tidak memblokir event loop). Koneksi yang dikembalikan langsung diserahkan
+    ke penunggu terlama, sehingga request baru tidak menyalip yang sudah antri.
+    Koneksi dibuat saat dibutuhkan dan dipakai ulang LIFO.
+
+    Semua method dipanggil dari satu event loop, jadi tidak perlu lock.
+    """
+
+    def __init__(self, connection_factory, max_size=10, timeout=5.0):
+        """
+        Args:
+            connection_factory: Coroutine function tanpa argumen yang membuat koneksi baru
+            max_size: Jumlah maksimal koneksi
+            timeout: Detik menunggu koneksi kosong saat acquire
+        """
+        if max_size < 1:
+            raise ValueError("max_size pool harus >= 1")
+        self.__factory = connection_factory
+        self.__max_size = max_size
+        self.__timeout = timeout
+        self.__idle = deque()
+        self.__waiters = deque()    # Future penunggu, hasilnya koneksi atau None (slot kosong)
+        self.__size = 0
+        self.__closed = False
+        self.__stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'created': 0,
+            'discarded': 0
+        }
+
+    async def acquire(self, timeout=None):
+        """
+        Meminjam koneksi dari pool
+        Raises: PoolTimeoutError jika tidak ada koneksi dalam batas waktu
+        """
+        if self.__closed:
+            raise PoolTimeoutError("Pool sudah ditutup")
+        connection = None
+        while self.__idle:
+            connection = self.__idle.pop()
+            if not connection.closed:
+                break
+            self.__size -= 1
+            self.__stats['discarded'] += 1
+            connection = None
+
+        if connection is None:
+            if self.__size < self.__max_size:
+                self.__size += 1  # Reservasi slot sebelum membuat koneksi
+            else:
+                connection = await self.__wait(self.__timeout if timeout is None else timeout)
+        self.__stats['checkouts'] += 1
+        if connection is not None:
+            return connection
+
+        try:
+            connection = await self.__factory()
+        except BaseException:
+            self.__size -= 1
+            self.__grant_slot()
+            raise
+        self.__stats['created'] += 1
+        return connection
+
+    async def __wait(self, timeout):
+        """Antri sampai release menyerahkan koneksi (atau None = boleh membuat koneksi baru)"""
+        waiter = asyncio.get_running_loop().create_future()
+        self.__waiters.append(waiter)
+        self.__stats['waits'] += 1
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except asyncio.TimeoutError:
+            self.__stats['timeouts'] += 1
+            raise PoolTimeoutError(f"Tidak ada koneksi kosong setelah {timeout:.1f} detik") from None
+        except asyncio.CancelledError:
+            # Koneksi sempat diserahkan tepat saat dibatalkan: teruskan ke penunggu lain
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                self.__put_back(waiter.result())
+            raise
+        finally:
+            waited = time.monotonic() - started
+            self.__stats['wait_time_total'] += waited
+            self.__stats['wait_time_max'] = max(self.__stats['wait_time_max'], waited)
+
+    def __hand_off(self, value):
+        """Serahkan koneksi / slot ke penunggu terlama; False jika tidak ada yang menunggu"""
+        while self.__waiters:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(value)
+                return True
+        return False
+
+    def __grant_slot(self):
+        if self.__size < self.__max_size and self.__hand_off(None):
+            self.__size += 1
+
+    def __put_back(self, connection):
+        if connection is None:
+            self.__size -= 1
+            self.__grant_slot()
+        elif not self.__hand_off(connection):
+            self.__idle.append(connection)
+
+    async def release(self, connection, discard=False):
+        """Mengembalikan koneksi ke pool (discard=True jika koneksi rusak)"""
+        if discard or self.__closed or connection.closed:
+            self.__size -= 1
+            if discard:
+                self.__stats['discarded'] += 1
+            self.__grant_slot()
+            await connection.close()
+            return
+        self.__put_back(connection)
+
+    @asynccontextmanager
+    async def connection(self, timeout=None):
+        """
+        Meminjam koneksi selama blok async with
+
+        Contoh:
+            async with pool.connection() as connection:
+                rows = await connection.fetch_all("SELECT ...")
+        """
+        connection = await self.acquire(timeout)
+        try:
+            yield connection
+        except BaseException:
+            # Batalkan transaksi yang menggantung; jika gagal, koneksi dianggap rusak
+            try:
+                await connection.rollback()
+                discard = False
+            except Exception:
+                discard = True
+            await self.release(connection, discard=discard)
+            raise
+        else:
+            await self.release(connection)
+
+    async def close(self):
+        """Menutup semua koneksi idle; koneksi yang sedang dipinjam ditutup saat dikembalikan"""
+        self.__closed = True
+        while self.__waiters:
+            waiter = self.__waiters.popleft()
+            if not waiter.done():
+                waiter.set_exception(PoolTimeoutError("Pool sudah ditutup"))
+        idle = list(self.__idle)
+        self.__idle.clear()
+        self.__size -= len(idle)
+        for connection in idle:
+            await connection.close()
+
+    def get_stats(self):
+        """Statistik pool (checkouts, waits, wait time, ukuran)"""
+        stats = dict(self.__stats)
+        stats['size'] = self.__size
+        stats['idle'] = len(self.__idle)
+        stats['in_use'] = self.__size - len(self.__idle)
+        stats['max_size'] = self.__max_size
+        stats['wait_ratio'] = stats['waits'] / stats['checkouts'] if stats['checkouts'] else 0.0
+        return stats
+
+
+class AsyncDatabaseConnection:
+    """
+    Akses database untuk asyncio dengan perilaku yang sama dengan DatabaseConnection:
+    query baca yang gagal di-print dan mengembalikan None / berhenti, query tulis
+    mengembalikan False / None, transaction() melempar error ke pemanggil.
+    """
+
+    def __init__(self, pool, errors=(Exception,)):
+        """
+        Args:
+            pool: AsyncConnectionPool
+            errors: Class error driver yang ditangani (misal sqlite3.Error)
+        """
+        self.pool = pool
+        self.errors = tuple(errors) + (PoolTimeoutError,)
+        self.read_errors = 0
+
+    @classmethod
+    def for_sqlite(cls, path, max_size=4, timeout=5.0):
+        """
+        Pool koneksi sqlite3 ke satu file (setiap koneksi di thread-nya sendiri)
+        File database harus sudah ada schema-nya (buat lewat SQLiteBackend)
+        """
+        if path == ':memory:':
+            raise ValueError("Database ':memory:' tidak bisa dibagi ke beberapa koneksi")
+
+        def connect():
+            connection = sqlite3.connect(path, timeout=60.0)
+            connection.execute("PRAGMA synchronous=NORMAL")
+            return connection
+
+        pool = AsyncConnectionPool(lambda: ThreadedConnection.open(connect), max_size, timeout)
+        return cls(pool, errors=(sqlite3.Error,))
+
+    @classmethod
+    def for_mysql(cls, config, max_size=10, timeout=5.0):
+        """
+        Pool koneksi aiomysql
+        Args:
+            config: Pengaturan koneksi, misal DatabaseConnection().get_config()
+        Raises: RuntimeError jika aiomysql belum terpasang
+        """
+        if aiomysql is None:
+            raise RuntimeError("Driver async MySQL belum terpasang: pip install aiomysql")
+        pool = AsyncConnectionPool(lambda: AioMySQLConnection.open(config), max_size, timeout)
+        return cls(pool, errors=(aiomysql.Error,))
+
+    async def fetch_all(self, query, params=None):
+        """
+        Execute query SELECT dan return semua hasil
+        Returns: List of tuples atau None jika error
+        """
+        try:
+            async with self.pool.connection() as connection:
+                return await connection.fetch_all(query, params)
+        except self.errors as e:
+            self.read_errors += 1
+            print(f"❌ Error fetch data: {e}")
+            return None
+
+    async def fetch_one(self, query, params=None):
+        """
+        Execute query SELECT dan return satu hasil
+        Returns: Tuple atau None
+        """
+        rows = await self.fetch_all(query, params)
+        return rows[0] if rows else None
+
+    async def fetch_iter(self, query, params=None, batch_size=500):
+        """
+        Async generator: baris dibaca per batch_size, koneksi dipinjam selama iterasi
+
+        Contoh:
+            async for row in db.fetch_iter("SELECT ..."):
+                ...
+        """
+        try:
+            async with self.pool.connection() as connection:
+                async for row in connection.fetch_iter(query, params, batch_size):
+                    yield row
+        except self.errors as e:
+            self.read_errors += 1
+            print(f"❌ Error fetch data: {e}")
+
+    async def execute_query(self, query, params=None):
+        """
+        Execute query INSERT, UPDATE, DELETE lalu commit
+        Returns: True jika sukses, False jika gagal
+        """
+        try:
+            async with self.transaction() as connection:
+                await connection.execute(query, params)
+            return True
+        except self.errors as e:
+            print(f"❌ Error execute query: {e}")
+            return False
+
+    async def execute_insert(self, query, params=None):
+        """
+        Execute query INSERT satu baris lalu commit
+        Returns: id baris baru, atau None jika gagal
+        """
+        try:
+            async with self.transaction() as connection:
+                new_id, _ = await connection.execute(query, params)
+            return new_id
+        except self.errors as e:
+            print(f"❌ Error execute query: {e}")
+            return None
+
+    @asynccontextmanager
+    async def transaction(self):
+        """
+        Beberapa statement dalam satu transaksi: commit jika blok selesai tanpa
+        error, rollback jika terjadi error
+
+        Contoh:
+            async with db.transaction() as connection:
+                await connection.execute(query, params)
+                await connection.executemany(query, rows)
+
+        Raises: Error driver / PoolTimeoutError (pemanggil yang menangani)
+        """
+        async with self.pool.connection() as connection:
+            await connection.begin()
+            yield connection
+            await connection.commit()
+
+    def get_pool_stats(self):
+        return self.pool.get_stats()
+
+    async def close(self):
+        await self.pool.close()
@@ -0,0 +1,86 @@
+"""
+Async Storage - Operasi katalog (list, count, search, insert) sebagai coroutine
+SQL tidak ditulis ulang: semua query disusun oleh StorageBackend engine yang sama
+(dialek), lalu dijalankan lewat AsyncDatabaseConnection
+"""
+
+from database.storage_backend import STATS_TABLE, ROW_ORDERS, insert_columns, stats_deltas
+
+
+class AsyncStorage:
+    """
+    Pasangan async dari StorageBackend untuk operasi yang dipakai controller
+
+    Args:
+        dialect: StorageBackend engine yang sama (menyusun SQL, membuat schema,
+                 dan cache-nya dibuang setelah INSERT lewat jalur async)
+        db: AsyncDatabaseConnection ke database yang sama
+    """
+
+    def __init__(self, dialect, db):
+        self.dialect = dialect
+        self.db = db
+
+    async def list_page(self, table, after=None, limit=20):
+        """
+        Satu halaman keyset (lihat StorageBackend.list_page)
+        Returns: (rows, next_cursor)
+        """
+        query, params = self.dialect.list_page_query(table, after, limit)
+        rows = await self.db.fetch_all(query, params)
+        return self.dialect.page_result(rows or [], limit)
+
+    async def count(self, table):
+        """Jumlah baris dalam tabel"""
+        self.dialect._columns(table)
+        row = await self.db.fetch_one(f"SELECT COUNT(*) FROM {table}")
+        return row[0] if row else 0
+
+    async def search(self, table, keyword, limit=50):
+        """
+        Mencari baris sesuai search_mode dialek; query berikutnya (misal LIKE)
+        dicoba jika query index teks gagal
+        Returns: List of rows terurut relevansi
+        """
+        for query, params in self.dialect.search_queries(table, keyword, limit):
+            rows = await self.db.fetch_all(query, params)
+            if rows is not None:
+                return rows
+        return []
+
+    async def iter_rows(self, table, filters=None, order_by='title'):
+        """Async generator semua baris (atau yang lolos filter), lihat StorageBackend.iter_rows"""
+        columns = self.dialect._columns(table)
+        if order_by not in ROW_ORDERS:
+            raise ValueError(f"Urutan tidak didukung: {order_by}")
+        where, params = self.dialect._where(table, filters)
+        query = f"SELECT {columns} FROM {table}{where} ORDER BY {ROW_ORDERS[order_by]}"
+        async for row in self.db.fetch_iter(query, params):
+            yield row
+
+    async def insert(self, table, data):
+        """
+        Menyimpan satu item beserta statistiknya dalam satu transaksi
+        Args:
+            data: Dictionary hasil Model.to_dict()
+        Returns: id baris baru, atau None jika gagal
+        """
+        query = self.dialect.insert_query(table)
+        params = tuple(data.get(column) for column in insert_columns(table))
+        deltas = stats_deltas(table, [params]) if self.dialect.stats_enabled() else []
+        try:
+            async with self.db.transaction() as connection:
+                new_id, _ = await connection.execute(query, params)
+                if deltas:
+                    await connection.executemany(self.dialect.STATS_UPSERT, deltas)
+        except self.db.errors as e:
+            print(f"❌ Error execute query: {e}")
+            return None
+        self.dialect.invalidate_cache(table, STATS_TABLE)
+        return new_id
+
+    def get_pool_stats(self):
+        return self.db.get_pool_stats()
+
+    async def close(self):
+        await self.db.close()
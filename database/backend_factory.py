@@ -0,0 +1,118 @@
+"""
+Backend Factory - Memilih StorageBackend sesuai konfigurasi
+Demonstrasi Factory Pattern: pemanggil tidak perlu tahu class konkret yang dipakai
+"""
+
+from config import STORAGE_CONFIG, SEARCH_CONFIG, STATS_CONFIG, REPLICATION_CONFIG, ASYNC_CONFIG
+
+
+ENGINES = ('mysql', 'sqlite')
+
+
+def create_backend(engine=None, sqlite_path=None):
+    """
+    Membuat backend penyimpanan
+    
+    Args:
+        engine: 'mysql' atau 'sqlite' (default: STORAGE_CONFIG['engine'])
+        sqlite_path: Path file SQLite atau ':memory:' (default: STORAGE_CONFIG['sqlite_path'])
+    
+    Returns: Instance StorageBackend
+    """
+    engine = engine or STORAGE_CONFIG.get('engine', 'mysql')
+    # Mode 'index' / 'fuzzy' dilayani controller; backend tetap memakai index teks engine-nya
+    search_mode = SEARCH_CONFIG.get('mode', 'like')
+    if search_mode not in ('fulltext', 'like'):
+        search_mode = 'fulltext'
+    maintain_stats = STATS_CONFIG.get('enabled', True)
+    
+    primary = _create_engine_backend(engine, sqlite_path, search_mode, maintain_stats)
+    if not REPLICATION_CONFIG.get('enabled') or not REPLICATION_CONFIG.get('replicas'):
+        return primary
+    
+    from database.replicated_backend import ReplicatedBackend
+    replicas = [_create_replica(engine, spec, search_mode, maintain_stats)
+                for spec in REPLICATION_CONFIG['replicas']]
+    return ReplicatedBackend(
+        primary,
+        replicas,
+        sticky_seconds=REPLICATION_CONFIG.get('sticky_seconds', 5.0),
+        health_interval=REPLICATION_CONFIG.get('health_interval', 10.0)
+    )
+
+
+def _create_engine_backend(engine, sqlite_path, search_mode, maintain_stats):
+    # Import di dalam function: mode SQLite tidak butuh driver MySQL terpasang
+    if engine == 'mysql':
+        from database.mysql_backend import MySQLBackend
+        return MySQLBackend(search_mode=search_mode, maintain_stats=maintain_stats)
+    if engine == 'sqlite':
+        from database.sqlite_backend import SQLiteBackend
+        path = sqlite_path or STORAGE_CONFIG.get('sqlite_path', 'library.db')
+        return SQLiteBackend(path, search_mode=search_mode, maintain_stats=maintain_stats)
+    raise ValueError(f"Engine penyimpanan tidak dikenal: {engine} (pilihan: {', '.join(ENGINES)})")
+
+
+def _create_replica(engine, spec, search_mode, maintain_stats):
+    """
+    Backend baca untuk satu entri REPLICATION_CONFIG['replicas']
+    MySQL: dictionary yang menimpa DATABASE_CONFIG (misal host / port replica)
+    SQLite: path file salinan database
+    Returns: (nama, StorageBackend)
+    """
+    if engine == 'mysql':
+        from database.db_connection import DatabaseConnection
+        from database.mysql_backend import MySQLBackend
+        db = DatabaseConnection.create_endpoint(**spec)
+        return db.get_endpoint(), MySQLBackend(db=db, search_mode=search_mode,
+                                               maintain_stats=maintain_stats)
+    from database.sqlite_backend import SQLiteBackend
+    return spec, SQLiteBackend(spec, search_mode=search_mode, maintain_stats=maintain_stats)
+
+
+def create_snapshot_backend(path, engine=None, sqlite_path=None):
+    """
+    Membuka snapshot katalog (mmap, hanya-baca) dengan database sebagai sumber
+    pembanding: tabel yang basi dibaca dari database, dan jika database tidak
+    bisa dihubungi snapshot dipakai offline (lihat SnapshotBackend.check_freshness)
+
+    Returns: (SnapshotBackend, list tabel basi atau None jika offline)
+    Raises: SnapshotError jika file snapshot tidak valid
+    """
+    from database.snapshot_backend import SnapshotBackend
+    
+    snapshot = SnapshotBackend(path, source=create_backend(engine, sqlite_path))
+    return snapshot, snapshot.check_freshness()
+
+
+def create_async_storage(engine=None, sqlite_path=None, dialect=None):
+    """
+    Membuat AsyncStorage (jalur asyncio) untuk database yang sama dengan create_backend
+
+    Args:
+        engine: 'mysql' atau 'sqlite' (default: STORAGE_CONFIG['engine'])
+        sqlite_path: Path file SQLite (':memory:' tidak didukung, harus bisa dibuka banyak koneksi)
+        dialect: StorageBackend yang sudah ada (misal milik controller); None = buat baru
+
+    Returns: Instance AsyncStorage
+    Raises: RuntimeError jika engine MySQL dipakai tanpa aiomysql
+    """
+    from database.async_connection import AsyncDatabaseConnection
+    from database.async_storage import AsyncStorage
+
+    engine = engine or STORAGE_CONFIG.get('engine', 'mysql')
+    pool_size = ASYNC_CONFIG.get('pool_size', 10)
+    timeout = ASYNC_CONFIG.get('timeout', 5.0)
+    if dialect is None:
+        dialect = create_backend(engine, sqlite_path)
+    # ReplicatedBackend: jalur async membaca dan menulis ke primary
+    primary = getattr(dialect, 'primary', dialect)
+
+    if engine == 'mysql':
+        db = AsyncDatabaseConnection.for_mysql(primary.db.get_config(), pool_size, timeout)
+    elif engine == 'sqlite':
+        path = sqlite_path or STORAGE_CONFIG.get('sqlite_path', 'library.db')
+        db = AsyncDatabaseConnection.for_sqlite(path, pool_size, timeout)
+    else:
+        raise ValueError(f"Engine penyimpanan tidak dikenal: {engine} (pilihan: {', '.join(ENGINES)})")
+    return AsyncStorage(dialect, db)
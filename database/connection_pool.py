@@ -0,0 +1,308 @@
+"""
+Connection Pool Module
+Menyediakan banyak koneksi database yang bisa dipinjam secara bersamaan (thread-safe)
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+
+class PoolTimeoutError(Exception):
+    """Dilempar ketika tidak ada koneksi kosong sampai batas waktu tunggu habis"""
+    pass
+
+
+class PooledConnection:
+    """
+    Pembungkus koneksi mentah beserta metadata untuk pool
+
+    __slots__ dipakai agar overhead per koneksi tetap kecil
+    """
+
+    __slots__ = ('raw', 'created_at', 'last_used')
+
+    def __init__(self, raw):
+        now = time.monotonic()
+        self.raw = raw
+        self.created_at = now
+        self.last_used = now
+
+
+class ConnectionPool:
+    """
+    Pool koneksi thread-safe dengan ukuran minimal/maksimal
+
+    Fitur:
+    1. Checkout dengan timeout (menunggu jika semua koneksi sedang dipakai)
+    2. Health check per koneksi saat checkout (hanya jika sudah idle > validate_after)
+    3. Idle reaping: koneksi yang terlalu lama menganggur ditutup oleh thread latar
+    4. Statistik (checkouts, waits, wait time) untuk menentukan ukuran pool
+    """
+
+    def __init__(self, connection_factory, min_size=1, max_size=10, timeout=5.0,
+                 idle_timeout=300.0, reap_interval=60.0, health_check=None,
+                 validate_after=0.0):
+        """
+        Args:
+            connection_factory: Callable tanpa argumen yang membuat koneksi baru
+            min_size: Jumlah koneksi yang dipertahankan walaupun idle
+            max_size: Jumlah maksimal koneksi (idle + sedang dipakai)
+            timeout: Detik menunggu koneksi kosong saat checkout
+            idle_timeout: Detik sebelum koneksi idle ditutup (None = tidak pernah)
+            reap_interval: Interval thread reaper (None = reaper tidak dijalankan)
+            health_check: Callable(raw_connection) -> bool
+            validate_after: Detik idle sebelum health check dijalankan saat checkout
+                (0 = selalu dicek)
+        """
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Ukuran pool tidak valid (0 <= min_size <= max_size, max_size >= 1)")
+
+        self.__factory = connection_factory
+        self.__min_size = min_size
+        self.__max_size = max_size
+        self.__timeout = timeout
+        self.__idle_timeout = idle_timeout
+        self.__health_check = health_check or (lambda raw: raw.is_connected())
+        self.__validate_after = validate_after
+
+        self.__idle = deque()
+        self.__size = 0  # Total koneksi terbuka (idle + dipakai + sedang dibuat)
+        self.__closed = False
+        self.__lock = threading.Lock()
+        self.__available = threading.Condition(self.__lock)
+        self.__stats = {
+            'checkouts': 0,
+            'waits': 0,
+            'wait_time_total': 0.0,
+            'wait_time_max': 0.0,
+            'timeouts': 0,
+            'created': 0,
+            'closed': 0,
+            'discarded': 0,
+            'reaped': 0,
+            'health_checks': 0,
+            'health_checks_skipped': 0
+        }
+
+        for _ in range(min_size):
+            self.__idle.append(self.__create())
+
+        self.__reaper = None
+        self.__stop_reaper = threading.Event()
+        if reap_interval and idle_timeout is not None:
+            self.__reaper = threading.Thread(
+                target=self.__reap_loop, args=(reap_interval,),
+                name="ConnectionPoolReaper", daemon=True
+            )
+            self.__reaper.start()
+
+    # ========== INTERNAL ==========
+
+    def __create(self):
+        """Membuat koneksi baru (dipanggil TANPA memegang lock kecuali saat init)"""
+        raw = self.__factory()
+        pooled = PooledConnection(raw)
+        with self.__lock:
+            self.__size += 1
+            self.__stats['created'] += 1
+        return pooled
+
+    def __close_raw(self, pooled):
+        """Menutup koneksi mentah tanpa melempar error"""
+        try:
+            pooled.raw.close()
+        except Exception:
+            pass
+
+    def __is_healthy(self, pooled):
+        """Health check hanya untuk koneksi yang sudah idle cukup lama"""
+        if time.monotonic() - pooled.last_used <= self.__validate_after:
+            with self.__lock:
+                self.__stats['health_checks_skipped'] += 1
+            return True
+        with self.__lock:
+            self.__stats['health_checks'] += 1
+        try:
+            return bool(self.__health_check(pooled.raw))
+        except Exception:
+            return False
+
+    def __reap_loop(self, interval):
+        while not self.__stop_reaper.wait(interval):
+            self.reap_idle()
+
+    # ========== PUBLIC API ==========
+
+    def acquire(self, timeout=None):
+        """
+        Meminjam koneksi dari pool
+        Returns: PooledConnection
+        Raises: PoolTimeoutError jika tidak ada koneksi dalam batas waktu
+        """
+        timeout = self.__timeout if timeout is None else timeout
+        deadline = time.monotonic() + timeout
+        waited = False
+        wait_started = None
+
+        while True:
+            pooled = None
+            must_create = False
+            with self.__available:
+                while True:
+                    if self.__closed:
+                        raise PoolTimeoutError("Pool sudah ditutup")
+                    if self.__idle:
+                        pooled = self.__idle.pop()  # LIFO: koneksi paling "hangat"
+                        break
+                    if self.__size < self.__max_size:
+                        self.__size += 1  # Reservasi slot sebelum membuat koneksi
+                        must_create = True
+                        break
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self.__stats['timeouts'] += 1
+                        raise PoolTimeoutError(
+                            f"Tidak ada koneksi kosong setelah {timeout:.1f} detik"
+                        )
+                    if not waited:
+                        waited = True
+                        wait_started = time.monotonic()
+                        self.__stats['waits'] += 1
+                    self.__available.wait(remaining)
+
+            if must_create:
+                try:
+                    raw = self.__factory()
+                except Exception:
+                    with self.__available:
+                        self.__size -= 1
+                        self.__available.notify()
+                    raise
+                pooled = PooledConnection(raw)
+                with self.__lock:
+                    self.__stats['created'] += 1
+            elif not self.__is_healthy(pooled):
+                # Koneksi mati: buang dan coba lagi
+                self.__close_raw(pooled)
+                with self.__available:
+                    self.__size -= 1
+                    self.__stats['discarded'] += 1
+                    self.__stats['closed'] += 1
+                continue
+
+            with self.__lock:
+                self.__stats['checkouts'] += 1
+                if waited:
+                    wait_time = time.monotonic() - wait_started
+                    self.__stats['wait_time_total'] += wait_time
+                    self.__stats['wait_time_max'] = max(self.__stats['wait_time_max'], wait_time)
+            pooled.last_used = time.monotonic()
+            return pooled
+
+    def release(self, pooled, discard=False):
+        """
+        Mengembalikan koneksi ke pool
+
+        Args:
+            pooled: PooledConnection yang didapat dari acquire()
+            discard: True jika koneksi rusak dan harus ditutup
+        """
+        pooled.last_used = time.monotonic()
+        with self.__available:
+            if discard or self.__closed:
+                self.__size -= 1
+                self.__stats['closed'] += 1
+                if discard:
+                    self.__stats['discarded'] += 1
+            else:
+                self.__idle.append(pooled)
+                pooled = None
+            self.__available.notify()
+        if pooled is not None:
+            self.__close_raw(pooled)
+
+    @contextmanager
+    def connection(self, timeout=None):
+        """
+        Context manager untuk meminjam koneksi mentah
+
+        Contoh:
+            with pool.connection() as conn:
+                cursor = conn.cursor()
+        """
+        pooled = self.acquire(timeout)
+        try:
+            yield pooled.raw
+        except BaseException:
+            # Batalkan transaksi yang menggantung; jika gagal, koneksi dianggap rusak
+            try:
+                pooled.raw.rollback()
+                discard = False
+            except Exception:
+                discard = True
+            self.release(pooled, discard=discard)
+            raise
+        else:
+            self.release(pooled)
+
+    def reap_idle(self):
+        """
+        Menutup koneksi yang idle lebih lama dari idle_timeout
+        Jumlah koneksi tidak akan turun di bawah min_size
+        Returns: Jumlah koneksi yang ditutup
+        """
+        if self.__idle_timeout is None:
+            return 0
+
+        now = time.monotonic()
+        reaped = []
+        with self.__available:
+            keep = deque()
+            # Koneksi terlama ada di kiri deque (pop() mengambil dari kanan)
+            while self.__idle:
+                pooled = self.__idle.popleft()
+                expired = now - pooled.last_used > self.__idle_timeout
+                if expired and self.__size - len(reaped) > self.__min_size:
+                    reaped.append(pooled)
+                else:
+                    keep.append(pooled)
+            self.__idle = keep
+            self.__size -= len(reaped)
+            self.__stats['reaped'] += len(reaped)
+            self.__stats['closed'] += len(reaped)
+
+        for pooled in reaped:
+            self.__close_raw(pooled)
+        return len(reaped)
+
+    def close_all(self):
+        """Menutup semua koneksi idle dan menghentikan reaper"""
+        self.__stop_reaper.set()
+        with self.__available:
+            self.__closed = True
+            idle = list(self.__idle)
+            self.__idle.clear()
+            self.__size -= len(idle)
+            self.__stats['closed'] += len(idle)
+            self.__available.notify_all()
+        for pooled in idle:
+            self.__close_raw(pooled)
+
+    def get_stats(self):
+        """
+        Statistik pool untuk sizing
+        Returns: Dictionary berisi counter dan kondisi pool saat ini
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['size'] = self.__size
+            stats['idle'] = len(self.__idle)
+            stats['in_use'] = self.__size - len(self.__idle)
+            stats['min_size'] = self.__min_size
+            stats['max_size'] = self.__max_size
+        checkouts = stats['checkouts']
+        stats['wait_ratio'] = stats['waits'] / checkouts if checkouts else 0.0
+        stats['wait_time_avg'] = stats['wait_time_total'] / stats['waits'] if stats['waits'] else 0.0
+        return stats
@@ -3,8 +3,63 @@ Database Connection Module
 Mengelola koneksi ke MySQL database dengan ENCAPSULATION
 """
 
-import mysql.connector
-from mysql.connector import Error
+import logging
+import threading
+import time
+from contextlib import contextmanager
+
+from config import POOL_CONFIG, LIVENESS_CONFIG, CACHE_CONFIG, INSTRUMENTATION_CONFIG, PREPARED_CONFIG
+from database.connection_pool import ConnectionPool, PoolTimeoutError
+from database.query_cache import QueryCache, extract_tables
+from database.query_stats import QueryStats, QueryEvent, normalize_statement
+from database.statement_cache import PreparedStatementCache, StatementCursor
+
+
+slow_query_logger = logging.getLogger('library.slow_query')
+
+
+# Driver MySQL diimport saat koneksi pertama dibuat, bukan saat modul ini diimport,
+# sehingga --help, mode SQLite, dan tampilan menu tidak menunggu import mysql.connector
+mysql_connector = None
+
+
+class DriverNotLoadedError(Exception):
+    """Pengganti mysql.connector.Error selama driver belum diimport"""
+
+
+# Class error driver yang ditangkap; diganti mysql.connector.Error oleh load_driver()
+Error = DriverNotLoadedError
+
+
+def load_driver():
+    """
+    Import mysql.connector (sekali saja)
+    Returns: Modul mysql.connector
+    """
+    global mysql_connector, Error
+    if mysql_connector is None:
+        import mysql.connector
+        Error = mysql.connector.Error
+        mysql_connector = mysql.connector
+    return mysql_connector
+
+
+# Kode error MySQL client yang menandakan koneksi ke server sudah putus
+# 2006: server has gone away, 2013: lost connection during query,
+# 2055: lost connection (system error)
+CONNECTION_LOST_ERRNOS = {2006, 2013, 2055}
+
+
+def is_connection_lost(error):
+    """Cek apakah error disebabkan koneksi yang putus (bukan kesalahan query)"""
+    return getattr(error, 'errno', None) in CONNECTION_LOST_ERRNOS
+
+
+def count_rows(result):
+    """Jumlah baris dari hasil fetchall (list) / fetchone (tuple atau None)"""
+    if result is None:
+        return 0
+    return len(result) if isinstance(result, list) else 1
 
 
 class DatabaseConnection:
@@ -14,19 +69,47 @@ class DatabaseConnection:
     Konsep OOP yang diterapkan:
     1. ENCAPSULATION: Private attributes untuk config dan connection
     2. Singleton Pattern: Hanya ada satu instance koneksi
+    
+    Dua mode koneksi:
+    - Single: satu koneksi bersama, akses diserialisasi dengan lock
+    - Pool: setiap query meminjam koneksi sendiri dari ConnectionPool
+    
+    Liveness: koneksi tidak di-ping di setiap query, hanya setelah idle
+    melewati idle_threshold. Query baca yang terkena koneksi putus
+    otomatis reconnect dan diulang.
+    
+    Cache: hasil fetch_all disimpan di QueryCache dan dibuang per tabel
+    setiap kali execute_query / execute_insert / execute_many menulis ke tabel itu.
+    
+    Instrumentasi: setiap query yang sampai ke database diukur (waktu, jumlah
+    baris, error), dicatat di QueryStats, dan dikirim ke query hook. Query yang
+    lebih lambat dari slow_query_ms ditulis ke logger 'library.slow_query'.
+    
+    Prepared statement: statement yang didaftarkan lewat register_statements
+    (misal query list / search / insert milik MySQLBackend) di-prepare sekali per
+    koneksi dan dipakai ulang oleh fetch_all, execute_insert, dan transaction().
     """
     
     _instance = None
+    _instance_lock = threading.Lock()
     
-    def __new__(cls):
-        """Singleton pattern: hanya buat satu instance"""
+    def __new__(cls, *args, **kwargs):
+        """Singleton pattern: hanya buat satu instance (aman untuk multi-thread)"""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance.__initialized = False
+            with cls._instance_lock:
+                if cls._instance is None:
+                    instance = super().__new__(cls)
+                    instance.__initialized = False
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self):
-        """Initialize database configuration"""
+    def __init__(self, config=None):
+        """
+        Initialize database configuration
+        
+        Args:
+            config: Pengaturan koneksi yang menimpa default (dipakai create_endpoint)
+        """
         if self.__initialized:
             return
         
@@ -37,76 +120,645 @@ class DatabaseConnection:
             'password': '',  # Sesuaikan dengan password MySQL Anda
             'database': 'library_db'
         }
+        if config:
+            self.__config.update(config)
+        # autocommit: SELECT tidak meninggalkan transaksi terbuka. Tanpa itu koneksi
+        # (terutama di pool) terus membaca snapshot REPEATABLE READ pertamanya dan
+        # tidak melihat baris yang di-commit koneksi / proses lain
+        self.__connection_factory = lambda: load_driver().connect(**{'autocommit': True, **self.__config})
         self.__connection = None
+        self.__last_used = 0.0
+        self.__lock = threading.RLock()
+        self.__pool = None
+        self.__idle_threshold = LIVENESS_CONFIG.get('idle_threshold', 30.0)
+        self.__read_retries = LIVENESS_CONFIG.get('read_retries', 1)
+        self.__liveness_stats = {
+            'pings': 0,
+            'pings_skipped': 0,
+            'reconnects': 0,
+            'read_retries': 0,
+            'read_errors': 0    # Query baca yang gagal setelah semua retry
+        }
+        # Penghitung liveness dinaikkan dari banyak thread sekaligus pada mode pool
+        self.__liveness_lock = threading.Lock()
+        self.__cache = None
+        self.__query_stats = None
+        self.__query_hooks = []
+        self.__slow_query_ms = None
+        self.__explain_slow = False
+        self.__statements = None
+        self.__statement_texts = set()
         self.__initialized = True
+        
+        if CACHE_CONFIG.get('enabled'):
+            options = {k: v for k, v in CACHE_CONFIG.items() if k != 'enabled'}
+            self.enable_cache(**options)
+        if INSTRUMENTATION_CONFIG.get('enabled'):
+            self.enable_instrumentation(
+                slow_query_ms=INSTRUMENTATION_CONFIG.get('slow_query_ms'),
+                explain_slow=INSTRUMENTATION_CONFIG.get('explain_slow', False),
+                slow_query_log=INSTRUMENTATION_CONFIG.get('slow_query_log')
+            )
+        if PREPARED_CONFIG.get('enabled'):
+            self.enable_prepared_statements(PREPARED_CONFIG.get('max_per_connection', 64))
+        if POOL_CONFIG.get('enabled'):
+            options = {k: v for k, v in POOL_CONFIG.items() if k != 'enabled'}
+            self.enable_pool(**options)
+    
+    @classmethod
+    def create_endpoint(cls, **overrides):
+        """
+        Membuat koneksi TERPISAH dari singleton, misal ke server replica
+        Pengaturan yang tidak diberikan (user, password, database) sama dengan
+        koneksi utama; pool, cache, dan instrumentasi mengikuti config.py
+        
+        Contoh:
+            replica = DatabaseConnection.create_endpoint(host='10.0.0.12')
+        """
+        primary = cls()
+        endpoint = object.__new__(cls)
+        endpoint.__initialized = False
+        endpoint.__init__(config=dict(primary.__config, **overrides))
+        return endpoint
+    
+    def get_config(self):
+        """Salinan pengaturan koneksi (host, user, password, database, ...)"""
+        return dict(self.__config)
+    
+    def get_endpoint(self):
+        """Alamat server untuk laporan, misal 'localhost:3306'"""
+        return f"{self.__config.get('host')}:{self.__config.get('port', 3306)}"
+    
+    def __create_connection(self):
+        """Factory koneksi baru, dipakai oleh mode single maupun pool"""
+        return self.__connection_factory()
+    
+    def __count_liveness(self, *keys):
+        with self.__liveness_lock:
+            for key in keys:
+                self.__liveness_stats[key] += 1
+    
+    def __ping(self, connection):
+        """Satu round trip ke server untuk memastikan koneksi masih hidup"""
+        self.__count_liveness('pings')
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Error:
+            return False
+    
+    def __drop_connection(self):
+        """Buang koneksi single yang sudah putus agar dibuat ulang saat dipakai"""
+        self.__discard_statements(self.__connection)
+        try:
+            if self.__connection is not None:
+                self.__connection.close()
+        except Error:
+            pass
+        self.__connection = None
+    
+    def set_connection_factory(self, factory):
+        """
+        Mengganti cara membuat koneksi (misal untuk benchmark atau koneksi khusus)
+        
+        Args:
+            factory: Callable tanpa argumen yang mengembalikan koneksi DB-API
+        """
+        with self.__lock:
+            self.__connection_factory = factory
+            self.__drop_connection()
+    
+    def configure_liveness(self, idle_threshold=None, read_retries=None):
+        """
+        Mengatur strategi liveness
+        
+        Args:
+            idle_threshold: Detik idle sebelum ping (0 = ping setiap query, perilaku lama)
+            read_retries: Jumlah pengulangan query baca setelah koneksi putus
+        """
+        if idle_threshold is not None:
+            self.__idle_threshold = idle_threshold
+        if read_retries is not None:
+            self.__read_retries = read_retries
+    
+    def get_liveness_stats(self):
+        """
+        Statistik liveness (ping yang dilakukan/dilewati, reconnect, retry, read error)
+        Returns: Dictionary
+        """
+        with self.__liveness_lock:
+            stats = dict(self.__liveness_stats)
+        pool_stats = self.get_pool_stats()
+        if pool_stats:
+            stats['pings_skipped'] += pool_stats['health_checks_skipped']
+        return stats
+    
+    # ========== QUERY CACHE ==========
+    
+    def enable_cache(self, max_entries=1024, max_bytes=32 * 1024 * 1024, ttl=30.0):
+        """Mengaktifkan cache hasil fetch_all"""
+        self.__cache = QueryCache(max_entries=max_entries, max_bytes=max_bytes, ttl=ttl)
+    
+    def disable_cache(self):
+        """Mematikan cache hasil fetch_all"""
+        self.__cache = None
+    
+    def invalidate_cache(self, *tables):
+        """
+        Membuang hasil cache yang membaca tabel tertentu (tanpa argumen: semua)
+        Dipanggil otomatis setelah penulisan; panggil manual jika menulis lewat transaction()
+        """
+        if self.__cache is not None:
+            self.__cache.invalidate(*tables)
+    
+    def get_cache_stats(self):
+        """
+        Statistik cache (hits, misses, evictions, dll)
+        Returns: Dictionary atau None jika cache tidak aktif
+        """
+        return self.__cache.get_stats() if self.__cache else None
+    
+    def __invalidate_written_tables(self, query):
+        if self.__cache is not None:
+            tables = extract_tables(query)
+            if tables:
+                self.__cache.invalidate(*tables)
+    
+    # ========== INSTRUMENTASI ==========
+    
+    def enable_instrumentation(self, slow_query_ms=200.0, explain_slow=False, slow_query_log=None):
+        """
+        Mengaktifkan statistik query dan slow-query log
+        
+        Args:
+            slow_query_ms: Batas (ms) query dianggap lambat, None = slow-query log mati
+            explain_slow: Jalankan EXPLAIN untuk SELECT lambat dan ikut dicatat di log
+            slow_query_log: Path file untuk slow-query log (default: handler logging yang ada)
+        """
+        self.__query_stats = QueryStats()
+        self.__slow_query_ms = slow_query_ms
+        self.__explain_slow = explain_slow
+        if slow_query_log and not any(getattr(handler, 'baseFilename', None) == slow_query_log
+                                      for handler in slow_query_logger.handlers):
+            handler = logging.FileHandler(slow_query_log, encoding='utf-8')
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            slow_query_logger.addHandler(handler)
+    
+    def disable_instrumentation(self):
+        """Mematikan statistik query dan slow-query log (query hook tetap aktif)"""
+        self.__query_stats = None
+        self.__slow_query_ms = None
+    
+    def add_query_hook(self, hook):
+        """
+        Mendaftarkan callable yang dipanggil setelah setiap query selesai
+        
+        Args:
+            hook: Callable(QueryEvent); exception dari hook dicatat lalu diabaikan
+        """
+        self.__query_hooks = self.__query_hooks + [hook]
+    
+    def remove_query_hook(self, hook):
+        """Menghapus query hook yang sebelumnya didaftarkan"""
+        self.__query_hooks = [h for h in self.__query_hooks if h is not hook]
+    
+    def get_query_stats(self, top=None):
+        """
+        Statistik per statement, diurutkan dari total waktu terbesar
+        Returns: Dictionary (lihat QueryStats.snapshot) atau None jika instrumentasi mati
+        """
+        return self.__query_stats.snapshot(top) if self.__query_stats else None
+    
+    def reset_query_stats(self):
+        """Mengosongkan statistik query"""
+        if self.__query_stats is not None:
+            self.__query_stats.reset()
+    
+    def __observe(self, query, params, started, rows, error=None, connection=None):
+        """Catat satu eksekusi query: statistik, slow-query log, lalu query hook"""
+        stats = self.__query_stats
+        hooks = self.__query_hooks
+        if stats is None and not hooks:
+            return
+        event = QueryEvent(query, params, (time.perf_counter() - started) * 1000, rows, error)
+        slow = self.__slow_query_ms is not None and event.elapsed_ms >= self.__slow_query_ms
+        if stats is not None:
+            stats.record(event, slow)
+            if slow:
+                self.__log_slow_query(event, connection)
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                slow_query_logger.warning("Query hook %r gagal: %s", hook, e)
+    
+    def __log_slow_query(self, event, connection):
+        message = (f"SLOW QUERY {event.elapsed_ms:.1f} ms, {event.rows} baris: "
+                   f"{normalize_statement(event.statement)}")
+        if self.__explain_slow and connection is not None and event.error is None:
+            plan = self.__explain(connection, event.statement, event.params)
+            if plan:
+                message += "\n  EXPLAIN:\n" + "\n".join(f"    {row}" for row in plan)
+        slow_query_logger.warning(message)
+    
+    def __explain(self, connection, query, params):
+        """EXPLAIN hanya untuk SELECT (menjalankan EXPLAIN pada tulis tidak berguna di log)"""
+        if not query.lstrip().upper().startswith('SELECT'):
+            return None
+        try:
+            cursor = connection.cursor()
+            cursor.execute("EXPLAIN " + query, params or ())
+            plan = cursor.fetchall()
+            cursor.close()
+            return plan
+        except Error as e:
+            return [f"(EXPLAIN gagal: {e})"]
+    
+    # ========== PREPARED STATEMENT ==========
+    
+    def enable_prepared_statements(self, max_per_connection=64):
+        """
+        Mengaktifkan prepared statement untuk statement yang didaftarkan
+        
+        Args:
+            max_per_connection: Jumlah maksimal statement prepared per koneksi
+        """
+        statements = PreparedStatementCache(max_per_connection=max_per_connection)
+        statements.register(*self.__statement_texts)
+        self.__statements = statements
+    
+    def disable_prepared_statements(self):
+        """Semua statement kembali dijalankan dengan cursor biasa"""
+        self.__statements = None
+    
+    def register_statements(self, *queries):
+        """
+        Mendaftarkan teks SQL yang dijalankan sebagai prepared statement
+        Teks harus sama persis dengan yang nanti dikirim ke fetch_all / execute_insert
+        (nilai dikirim lewat params, bukan disisipkan ke teks)
+        """
+        self.__statement_texts.update(queries)
+        if self.__statements is not None:
+            self.__statements.register(*queries)
+    
+    def get_statement_stats(self):
+        """
+        Statistik prepared statement (prepares vs executes, retries, fallbacks)
+        Returns: Dictionary atau None jika prepared statement tidak aktif
+        """
+        return self.__statements.get_stats() if self.__statements else None
+    
+    def __discard_statements(self, connection):
+        if self.__statements is not None and connection is not None:
+            self.__statements.discard(connection)
+    
+    def __execute(self, connection, query, params):
+        """
+        Menjalankan query dengan statement prepared jika terdaftar, selain itu cursor biasa
+        Returns: (cursor, prepared) - cursor prepared milik cache, jangan ditutup
+        """
+        statements = self.__statements
+        if statements is not None:
+            cursor = statements.execute(connection, query, params)
+            if cursor is not None:
+                return cursor, True
+        cursor = connection.cursor()
+        cursor.execute(query, params or ())
+        return cursor, False
+    
+    # ========== POOL MODE ==========
+    
+    def enable_pool(self, min_size=1, max_size=10, timeout=5.0,
+                    idle_timeout=300.0, reap_interval=60.0):
+        """
+        Mengaktifkan mode connection pool
+        Returns: True jika pool berhasil dibuat, False jika gagal
+        """
+        with self.__lock:
+            if self.__pool is not None:
+                self.__pool.close_all()
+            try:
+                self.__pool = ConnectionPool(
+                    self.__create_connection,
+                    min_size=min_size,
+                    max_size=max_size,
+                    timeout=timeout,
+                    idle_timeout=idle_timeout,
+                    reap_interval=reap_interval,
+                    health_check=self.__ping,
+                    validate_after=self.__idle_threshold
+                )
+                print(f"✅ Connection pool aktif (min={min_size}, max={max_size})")
+                return True
+            except Error as e:
+                print(f"❌ Error membuat connection pool: {e}")
+                self.__pool = None
+                return False
+    
+    def is_pooled(self):
+        """Cek apakah mode pool sedang aktif"""
+        return self.__pool is not None
+    
+    def get_pool_stats(self):
+        """
+        Statistik pool (checkouts, waits, wait time, dll)
+        Returns: Dictionary atau None jika mode pool tidak aktif
+        """
+        return self.__pool.get_stats() if self.__pool else None
+    
+    @contextmanager
+    def borrow_connection(self):
+        """
+        Meminjam koneksi untuk satu operasi lalu mengembalikannya
+        
+        Mode pool: koneksi diambil dari pool (thread lain bisa jalan paralel)
+        Mode single: koneksi bersama dikunci selama operasi berlangsung
+        
+        Koneksi yang terbukti putus (lihat is_connection_lost) langsung dibuang.
+        """
+        pool = self.__pool
+        if pool is not None:
+            pooled = pool.acquire()
+            try:
+                yield pooled.raw
+            except BaseException as e:
+                discard = is_connection_lost(e)
+                if not discard:
+                    try:
+                        pooled.raw.rollback()
+                    except Exception:
+                        discard = True
+                if discard:
+                    self.__discard_statements(pooled.raw)
+                pool.release(pooled, discard=discard)
+                raise
+            else:
+                pool.release(pooled)
+        else:
+            with self.__lock:
+                connection = self.get_connection()
+                try:
+                    yield connection
+                except Error as e:
+                    if is_connection_lost(e):
+                        self.__drop_connection()
+                    raise
+                self.__last_used = time.monotonic()
+    
+    # ========== SINGLE MODE ==========
     
     def get_connection(self):
         """
         Mendapatkan koneksi database
-        Membuat koneksi baru jika belum ada atau sudah tertutup
+        Membuat koneksi baru jika belum ada, atau jika sudah idle lama dan ping gagal
         """
         try:
-            if self.__connection is None or not self.__connection.is_connected():
-                self.__connection = mysql.connector.connect(**self.__config)
+            with self.__lock:
+                if self.__connection is not None:
+                    idle = time.monotonic() - self.__last_used
+                    if idle <= self.__idle_threshold:
+                        self.__count_liveness('pings_skipped')
+                        return self.__connection
+                    if self.__ping(self.__connection):
+                        return self.__connection
+                    self.__drop_connection()
+                    self.__count_liveness('reconnects')
+                
+                self.__connection = self.__create_connection()
+                self.__last_used = time.monotonic()
                 print("✅ Koneksi database berhasil")
-            return self.__connection
+                return self.__connection
         except Error as e:
             print(f"❌ Error koneksi database: {e}")
             return None
     
     def close_connection(self):
-        """Menutup koneksi database"""
+        """Menutup koneksi database (termasuk semua koneksi di pool)"""
+        if self.__pool is not None:
+            self.__pool.close_all()
+            self.__pool = None
+            print("✅ Connection pool ditutup")
+        self.__discard_statements(self.__connection)
         if self.__connection and self.__connection.is_connected():
             self.__connection.close()
             print("✅ Koneksi database ditutup")
+        self.__connection = None
+    
+    # ========== QUERY OPERATIONS ==========
+    
+    def __run_read(self, query, params, fetch, prepared=False):
+        """
+        Menjalankan query SELECT dengan reconnect-and-retry
+        SELECT bersifat idempotent sehingga aman diulang saat koneksi putus
+        
+        prepared: Boleh memakai prepared statement (fetch harus membaca semua baris)
+        """
+        attempts = 1 + max(0, self.__read_retries)
+        for attempt in range(attempts):
+            started = time.perf_counter()
+            try:
+                with self.borrow_connection() as connection:
+                    if not connection:
+                        return None
+                    if prepared:
+                        cursor, cached = self.__execute(connection, query, params)
+                    else:
+                        cursor, cached = connection.cursor(), False
+                        cursor.execute(query, params or ())
+                    result = fetch(cursor)
+                    if not cached:
+                        cursor.close()
+                    self.__observe(query, params, started, count_rows(result), connection=connection)
+                    return result
+            except Error as e:
+                self.__observe(query, params, started, 0, error=e)
+                if is_connection_lost(e) and attempt + 1 < attempts:
+                    self.__count_liveness('read_retries', 'reconnects')
+                    continue
+                raise
     
     def execute_query(self, query, params=None):
         """
         Execute query INSERT, UPDATE, DELETE
         Returns: True jika sukses, False jika gagal
+        
+        Tidak diulang otomatis: query tulis belum tentu idempotent
+        """
+        started = time.perf_counter()
+        try:
+            with self.borrow_connection() as connection:
+                if connection:
+                    cursor = connection.cursor()
+                    cursor.execute(query, params or ())
+                    connection.commit()
+                    rows = cursor.rowcount
+                    cursor.close()
+                    self.__invalidate_written_tables(query)
+                    self.__observe(query, params, started, rows)
+                    return True
+        except (Error, PoolTimeoutError) as e:
+            self.__observe(query, params, started, 0, error=e)
+            print(f"❌ Error execute query: {e}")
+            return False
+    
+    def execute_insert(self, query, params=None):
+        """
+        Execute query INSERT satu baris
+        Returns: id (AUTO_INCREMENT) baris baru, atau None jika gagal
         """
+        started = time.perf_counter()
         try:
-            connection = self.get_connection()
-            if connection:
-                cursor = connection.cursor()
-                cursor.execute(query, params or ())
+            with self.borrow_connection() as connection:
+                if connection:
+                    cursor, cached = self.__execute(connection, query, params)
+                    connection.commit()
+                    new_id = cursor.lastrowid
+                    if not cached:
+                        cursor.close()
+                    self.__invalidate_written_tables(query)
+                    self.__observe(query, params, started, 1)
+                    return new_id
+        except (Error, PoolTimeoutError) as e:
+            self.__observe(query, params, started, 0, error=e)
+            print(f"❌ Error execute query: {e}")
+            return None
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Context manager untuk beberapa statement dalam satu transaksi
+        Commit jika blok selesai tanpa error, rollback jika terjadi error
+        Statement terdaftar yang dijalankan dengan cursor.execute memakai prepared statement
+        Koneksi berjalan dengan autocommit, jadi transaksi dimulai eksplisit di sini
+        
+        Contoh:
+            with db.transaction() as cursor:
+                cursor.executemany(query, rows)
+        
+        Raises: Error / PoolTimeoutError (tidak di-print, pemanggil yang menangani)
+        """
+        with self.borrow_connection() as connection:
+            if not connection:
+                raise Error("Koneksi database tidak tersedia")
+            start_transaction = getattr(connection, 'start_transaction', None)
+            if start_transaction is not None:
+                start_transaction()
+            cursor = connection.cursor()
+            if self.__statements is not None:
+                cursor = StatementCursor(connection, cursor, self.__statements)
+            try:
+                yield cursor
                 connection.commit()
+            except BaseException:
+                try:
+                    connection.rollback()
+                except Error:
+                    pass
+                raise
+            finally:
                 cursor.close()
-                return True
-        except Error as e:
+    
+    def execute_many(self, query, params_list):
+        """
+        Execute satu query INSERT untuk banyak baris dalam satu transaksi
+        mysql.connector menggabungkan INSERT ... VALUES menjadi multi-row insert
+        Returns: True jika sukses, False jika gagal
+        """
+        started = time.perf_counter()
+        try:
+            with self.transaction() as cursor:
+                cursor.executemany(query, params_list)
+            self.__invalidate_written_tables(query)
+            self.__observe(query, None, started, len(params_list))
+            return True
+        except (Error, PoolTimeoutError) as e:
+            self.__observe(query, None, started, 0, error=e)
             print(f"❌ Error execute query: {e}")
             return False
     
     def fetch_all(self, query, params=None):
         """
         Execute query SELECT dan return semua hasil
+        Hasil diambil dari cache jika ada dan belum basi
         Returns: List of tuples atau None jika error
         """
+        cache = self.__cache
+        if cache is not None:
+            cached = cache.get(query, params)
+            if cached is not None:
+                return cached
+            # Diambil sebelum query: hasil yang selesai setelah penulisan + invalidate tidak di-cache
+            generation = cache.generation(query)
         try:
-            connection = self.get_connection()
-            if connection:
-                cursor = connection.cursor()
-                cursor.execute(query, params or ())
-                results = cursor.fetchall()
-                cursor.close()
-                return results
-        except Error as e:
+            results = self.__run_read(query, params, lambda cursor: cursor.fetchall(), prepared=True)
+            if cache is not None and results is not None:
+                cache.put(query, params, results, generation)
+            return results
+        except (Error, PoolTimeoutError) as e:
+            self.__count_liveness('read_errors')
             print(f"❌ Error fetch data: {e}")
             return None
     
+    def fetch_iter(self, query, params=None, batch_size=500, raise_errors=False):
+        """
+        Execute query SELECT dan yield hasil satu per satu (generator)
+        
+        raise_errors: Error diteruskan ke pemanggil (setelah dicatat) alih-alih
+            di-print dan menghentikan iterasi diam-diam. Dipakai pemanggil yang
+            harus tahu apakah panggilan INI gagal: read_errors di get_liveness_stats
+            ikut bertambah oleh thread lain yang memakai koneksi / pool yang sama
+        
+        Memakai cursor unbuffered: baris dikirim server sedikit demi sedikit
+        (fetchmany per batch_size) sehingga memory konstan berapapun jumlah barisnya.
+        
+        Koneksi dipinjam selama generator berjalan. Pada mode single, habiskan
+        atau close() generator sebelum menjalankan query lain.
+        
+        Waktu yang dicatat instrumentasi mencakup waktu konsumen memproses baris.
+        """
+        started = time.perf_counter()
+        rows_read = 0
+        try:
+            with self.borrow_connection() as connection:
+                if not connection:
+                    if raise_errors:
+                        raise Error("Koneksi database tidak tersedia")
+                    return
+                cursor = connection.cursor(buffered=False)
+                try:
+                    cursor.execute(query, params or ())
+                    while True:
+                        rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        rows_read += len(rows)
+                        yield from rows
+                    self.__observe(query, params, started, rows_read)
+                finally:
+                    # Generator ditutup sebelum habis: sisa baris harus dibuang
+                    # agar koneksi bisa dipakai query berikutnya
+                    try:
+                        consume_results = getattr(connection, 'consume_results', None)
+                        if consume_results:
+                            consume_results()
+                        cursor.close()
+                    except Error:
+                        pass
+        except (Error, PoolTimeoutError) as e:
+            self.__observe(query, params, started, rows_read, error=e)
+            self.__count_liveness('read_errors')
+            if raise_errors:
+                raise
+            print(f"❌ Error fetch data: {e}")
+    
     def fetch_one(self, query, params=None):
         """
         Execute query SELECT dan return satu hasil
         Returns: Tuple atau None
         """
         try:
-            connection = self.get_connection()
-            if connection:
-                cursor = connection.cursor()
-                cursor.execute(query, params or ())
-                result = cursor.fetchone()
-                cursor.close()
-                return result
-        except Error as e:
+            return self.__run_read(query, params, lambda cursor: cursor.fetchone())
+        except (Error, PoolTimeoutError) as e:
+            self.__count_liveness('read_errors')
             print(f"❌ Error fetch data: {e}")
             return None
\ No newline at end of file
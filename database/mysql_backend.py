@@ -0,0 +1,168 @@
+"""
+MySQL Backend - Implementasi StorageBackend di atas DatabaseConnection
+"""
+
+from database.db_connection import DatabaseConnection
+from database.storage_backend import StorageBackend, CATALOG_TABLES, STATS_TABLE
+from search.inverted_index import tokenize
+
+
+# InnoDB FULLTEXT mengabaikan kata yang lebih pendek dari innodb_ft_min_token_size
+FULLTEXT_MIN_TOKEN = 3
+
+
+class MySQLBackend(StorageBackend):
+    """
+    Backend MySQL (INHERITANCE dari StorageBackend)
+
+    Semua query lewat DatabaseConnection sehingga pool, liveness,
+    dan cache tetap berlaku. Query list, search, dan insert setiap tabel
+    didaftarkan sebagai prepared statement (lihat PREPARED_CONFIG).
+    """
+
+    PLACEHOLDER = "%s"
+    STATS_UPSERT = f"""
+        INSERT INTO {STATS_TABLE} (metric, bucket, item_count) VALUES (%s, %s, %s)
+        ON DUPLICATE KEY UPDATE item_count = item_count + VALUES(item_count)
+    """
+    STATS_SHARE_LOCK = " LOCK IN SHARE MODE"
+
+    def __init__(self, db=None, search_mode='fulltext', maintain_stats=True):
+        super().__init__(search_mode, maintain_stats)
+        self.db = db or DatabaseConnection()
+        self.__has_stats_table = None
+        self.db.register_statements(*self.fixed_statements())
+
+    def fixed_statements(self):
+        """
+        Teks SQL yang dijalankan berulang kali oleh controller (nilai lewat params):
+        halaman pertama & berikutnya, pencarian, dan INSERT untuk setiap tabel katalog
+        """
+        statements = []
+        for table in CATALOG_TABLES:
+            statements.append(self.list_page_query(table)[0])
+            statements.append(self.list_page_query(table, ('', 0))[0])
+            statements.append(self._search_like_query(table, '')[0])
+            if self.search_mode == 'fulltext':
+                # Teks query FULLTEXT tidak bergantung pada kata kunci (selama cukup panjang)
+                statements.append(self._search_fulltext_query(table, 'x' * FULLTEXT_MIN_TOKEN, 0)[0])
+            statements.append(self.insert_query(table))
+        return statements
+
+    def _fetch_all(self, query, params=()):
+        rows = self.db.fetch_all(query, params)
+        if rows is None:
+            self._count_read_error()
+            return []
+        return rows
+
+    def _fetch_iter(self, query, params=()):
+        # Error panggilan ini sendiri (raise_errors), bukan selisih penghitung koneksi
+        # yang juga dinaikkan thread lain di pool
+        try:
+            yield from self.db.fetch_iter(query, params, raise_errors=True)
+        except Exception as e:
+            self._count_read_error()
+            print(f"❌ Error fetch data: {e}")
+
+    def _insert(self, table, query, params):
+        if not self.stats_enabled():
+            return self.db.execute_insert(query, params)
+        # Baris dan statistiknya harus tersimpan di transaksi yang sama
+        try:
+            return self._insert_rows(table, query, [params])[0]
+        except Exception as e:
+            print(f"❌ Error execute query: {e}")
+            return None
+
+    def _insert_many(self, table, query, rows, batch_size):
+        with self.db.transaction() as cursor:
+            for start in range(0, len(rows), batch_size):
+                cursor.executemany(query, rows[start:start + batch_size])
+            self._write_stats(cursor, table, rows)
+        # Penulisan lewat transaction() tidak otomatis meng-invalidate cache
+        self.db.invalidate_cache(table, STATS_TABLE)
+
+    def _insert_rows(self, table, query, rows):
+        ids = []
+        with self.db.transaction() as cursor:
+            for row in rows:
+                cursor.execute(query, row)
+                ids.append(cursor.lastrowid)
+            self._write_stats(cursor, table, rows)
+        self.db.invalidate_cache(table, STATS_TABLE)
+        return ids
+
+    def _transaction(self, work, tables=()):
+        with self.db.transaction() as cursor:
+            result = work(cursor)
+        if tables:
+            self.db.invalidate_cache(*tables)
+        return result
+
+    def stats_enabled(self):
+        """
+        Statistik hanya dipelihara jika tabel catalog_stats sudah dibuat
+        (database lama: lihat bagian migrasi di database_setup.sql)
+        """
+        if not self.maintain_stats:
+            return False
+        if self.__has_stats_table is None:
+            rows = list(self.db.fetch_iter(
+                "SELECT COUNT(*) FROM information_schema.tables "
+                "WHERE table_schema = DATABASE() AND table_name = %s", (STATS_TABLE,)))
+            if not rows:
+                return False  # Gagal mengecek (koneksi); dicoba lagi pada INSERT berikutnya
+            self.__has_stats_table = rows[0][0] > 0
+        return self.__has_stats_table
+
+    def search(self, table, keyword, limit=50):
+        """
+        Mode 'fulltext': MATCH ... AGAINST dengan ranking relevansi,
+        fallback ke LIKE jika FULLTEXT tidak bisa dipakai
+        """
+        *preferred, fallback = self.search_queries(table, keyword, limit)
+        for query, params in preferred:
+            rows = self.db.fetch_all(query, params)
+            if rows is not None:
+                return rows
+        return self._fetch_all(*fallback)
+
+    def search_queries(self, table, keyword, limit=50):
+        queries = [self._search_like_query(table, keyword)]
+        if self.search_mode == 'fulltext':
+            fulltext = self._search_fulltext_query(table, keyword, limit)
+            if fulltext is not None:
+                queries.insert(0, fulltext)
+        return queries
+
+    def _search_fulltext_query(self, table, keyword, limit):
+        """
+        Pencarian MATCH ... AGAINST memakai FULLTEXT index
+        Returns: (query, params), atau None jika kata kunci terlalu pendek untuk FULLTEXT
+        """
+        if not any(len(term) >= FULLTEXT_MIN_TOKEN for term in tokenize(keyword)):
+            return None
+        fields = ", ".join(CATALOG_TABLES[table]['search_fields'])
+        match = f"MATCH({fields}) AGAINST (%s IN NATURAL LANGUAGE MODE)"
+        query = f"""
+            SELECT {self._columns(table)}, {match} AS score
+            FROM {table}
+            WHERE {match}
+            ORDER BY score DESC, title
+            LIMIT %s
+        """
+        return query, (keyword, keyword, limit)
+
+    def invalidate_cache(self, *tables):
+        self.db.invalidate_cache(*tables)
+
+    def get_query_stats(self, top=None):
+        stats = self.db.get_query_stats(top)
+        statement_stats = self.db.get_statement_stats()
+        if stats is not None and statement_stats is not None:
+            stats['prepared'] = statement_stats
+        return stats
+
+    def close(self):
+        self.db.close_connection()
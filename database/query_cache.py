@@ -0,0 +1,180 @@
+"""
+Query Cache Module
+Cache hasil query SELECT (LRU + TTL) yang di-invalidate per tabel saat ada penulisan
+"""
+
+import re
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+
+TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE)\s+`?(\w+)`?", re.IGNORECASE)
+
+
+def normalize_query(query):
+    """Samakan whitespace agar query yang sama dengan indentasi berbeda memakai key yang sama"""
+    return " ".join(query.split())
+
+
+def extract_tables(query):
+    """Daftar tabel yang disebut dalam query (FROM / JOIN / INTO / UPDATE)"""
+    return frozenset(name.lower() for name in TABLE_PATTERN.findall(query))
+
+
+def estimate_size(rows):
+    """Perkiraan ukuran (byte) list of tuples hasil query"""
+    size = sys.getsizeof(rows)
+    for row in rows:
+        size += sys.getsizeof(row)
+        for value in row:
+            size += sys.getsizeof(value)
+    return size
+
+
+class CacheEntry:
+    """Satu hasil query yang di-cache"""
+
+    __slots__ = ('rows', 'tables', 'size', 'expires_at')
+
+    def __init__(self, rows, tables, size, expires_at):
+        self.rows = rows
+        self.tables = tables
+        self.size = size
+        self.expires_at = expires_at
+
+
+class QueryCache:
+    """
+    Cache LRU dengan batas jumlah entry, batas total byte, dan TTL
+
+    Key cache = (query yang dinormalisasi, params). Setiap entry mencatat
+    tabel yang dibaca sehingga invalidate('books') hanya membuang entry
+    yang membaca tabel books.
+
+    Setiap invalidate menaikkan generasi tabelnya. Pembaca mengambil generation()
+    sebelum query; put() dengan generasi yang sudah berubah dibuang, sehingga hasil
+    baca yang dimulai sebelum penulisan tidak masuk cache setelah invalidate.
+    """
+
+    def __init__(self, max_entries=1024, max_bytes=32 * 1024 * 1024, ttl=30.0):
+        """
+        Args:
+            max_entries: Jumlah maksimal hasil query yang disimpan
+            max_bytes: Perkiraan total ukuran maksimal semua hasil
+            ttl: Umur maksimal (detik) sebuah hasil sebelum dianggap basi
+        """
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__ttl = ttl
+        self.__entries = OrderedDict()
+        self.__total_bytes = 0
+        self.__generations = {}     # tabel -> jumlah invalidate
+        self.__generation = 0       # invalidate tanpa argumen (semua tabel)
+        self.__lock = threading.Lock()
+        self.__stats = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'invalidations': 0,
+            'skipped_too_large': 0,
+            'skipped_stale': 0      # put() dari query yang berjalan saat tabelnya di-invalidate
+        }
+
+    @staticmethod
+    def make_key(query, params):
+        return (normalize_query(query), tuple(params) if params else ())
+
+    def __remove(self, key):
+        entry = self.__entries.pop(key)
+        self.__total_bytes -= entry.size
+
+    def get(self, query, params=None):
+        """
+        Mengambil hasil dari cache
+        Returns: List of tuples (salinan), atau None jika tidak ada / sudah basi
+        """
+        key = self.make_key(query, params)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.__stats['misses'] += 1
+                return None
+            if entry.expires_at < time.monotonic():
+                self.__remove(key)
+                self.__stats['expirations'] += 1
+                self.__stats['misses'] += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.__stats['hits'] += 1
+            return list(entry.rows)
+
+    def __generation_of(self, tables):
+        return (self.__generation,) + tuple(self.__generations.get(table, 0) for table in sorted(tables))
+
+    def generation(self, query):
+        """Penanda generasi tabel-tabel query; ambil sebelum query lalu berikan ke put()"""
+        tables = extract_tables(query)
+        with self.__lock:
+            return self.__generation_of(tables)
+
+    def put(self, query, params, rows, generation=None):
+        """
+        Menyimpan hasil query; entry paling lama tidak dipakai dibuang jika penuh
+        generation: Hasil generation() sebelum query; jika tabelnya sudah di-invalidate
+                    sejak itu, hasil dianggap basi dan tidak disimpan
+        """
+        size = estimate_size(rows)
+        if size > self.__max_bytes:
+            with self.__lock:
+                self.__stats['skipped_too_large'] += 1
+            return
+
+        key = self.make_key(query, params)
+        tables = extract_tables(query)
+        entry = CacheEntry(list(rows), tables, size, time.monotonic() + self.__ttl)
+        with self.__lock:
+            if generation is not None and self.__generation_of(tables) != generation:
+                self.__stats['skipped_stale'] += 1
+                return
+            if key in self.__entries:
+                self.__remove(key)
+            self.__entries[key] = entry
+            self.__total_bytes += size
+            while (len(self.__entries) > self.__max_entries
+                   or self.__total_bytes > self.__max_bytes):
+                oldest = next(iter(self.__entries))
+                self.__remove(oldest)
+                self.__stats['evictions'] += 1
+
+    def invalidate(self, *tables):
+        """
+        Membuang semua entry yang membaca salah satu tabel
+        Tanpa argumen: kosongkan seluruh cache
+        Returns: Jumlah entry yang dibuang
+        """
+        names = {table.lower() for table in tables}
+        with self.__lock:
+            if names:
+                for name in names:
+                    self.__generations[name] = self.__generations.get(name, 0) + 1
+                keys = [key for key, entry in self.__entries.items() if entry.tables & names]
+            else:
+                self.__generation += 1
+                keys = list(self.__entries)
+            for key in keys:
+                self.__remove(key)
+            self.__stats['invalidations'] += len(keys)
+            return len(keys)
+
+    def get_stats(self):
+        """Counter hit/miss/eviction dan ukuran cache saat ini"""
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['entries'] = len(self.__entries)
+            stats['bytes'] = self.__total_bytes
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
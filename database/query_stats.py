@@ -0,0 +1,135 @@
+"""
+Query Stats Module
+Statistik per statement (dinormalisasi): jumlah eksekusi, waktu, baris, dan histogram latency
+"""
+
+import re
+import threading
+
+
+STRING_LITERAL = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"")
+NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+PLACEHOLDER = re.compile(r"%s|\?")
+IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+# Batas atas bucket histogram latency (ms); bucket terakhir = lebih dari itu
+HISTOGRAM_BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000)
+
+
+def normalize_statement(statement):
+    """
+    Samakan statement yang hanya berbeda nilai literal / jumlah parameter
+    Contoh: "SELECT * FROM books WHERE id = 5" -> "SELECT * FROM books WHERE id = ?"
+    """
+    text = STRING_LITERAL.sub("?", statement)
+    text = NUMBER_LITERAL.sub("?", text)
+    text = PLACEHOLDER.sub("?", text)
+    text = IN_LIST.sub("(...)", text)
+    return " ".join(text.split())
+
+
+class QueryEvent:
+    """Informasi satu eksekusi query yang dikirim ke hook"""
+
+    __slots__ = ('statement', 'params', 'elapsed_ms', 'rows', 'error')
+
+    def __init__(self, statement, params, elapsed_ms, rows, error):
+        self.statement = statement
+        self.params = params
+        self.elapsed_ms = elapsed_ms
+        self.rows = rows
+        self.error = error
+
+
+class StatementStats:
+    """Akumulasi statistik untuk satu statement yang sudah dinormalisasi"""
+
+    __slots__ = ('count', 'errors', 'total_ms', 'min_ms', 'max_ms', 'rows', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.min_ms = None
+        self.max_ms = 0.0
+        self.rows = 0
+        self.histogram = [0] * (len(HISTOGRAM_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms, rows, error):
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.min_ms = elapsed_ms if self.min_ms is None else min(self.min_ms, elapsed_ms)
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        self.rows += rows or 0
+        if error is not None:
+            self.errors += 1
+        for position, bound in enumerate(HISTOGRAM_BUCKETS_MS):
+            if elapsed_ms < bound:
+                self.histogram[position] += 1
+                break
+        else:
+            self.histogram[-1] += 1
+
+    def to_dict(self):
+        labels = [f"<{bound}ms" for bound in HISTOGRAM_BUCKETS_MS]
+        labels.append(f">={HISTOGRAM_BUCKETS_MS[-1]}ms")
+        return {
+            'count': self.count,
+            'errors': self.errors,
+            'total_ms': self.total_ms,
+            'avg_ms': self.total_ms / self.count if self.count else 0.0,
+            'min_ms': self.min_ms or 0.0,
+            'max_ms': self.max_ms,
+            'rows': self.rows,
+            'histogram': dict(zip(labels, self.histogram))
+        }
+
+
+class QueryStats:
+    """
+    Kumpulan StatementStats, thread-safe
+
+    Dipakai sebagai hook DatabaseConnection: setiap query yang selesai dicatat
+    berdasarkan bentuk statement-nya sehingga query "panas" mudah ditemukan.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        self.__statements = {}
+        self.__slow_queries = 0
+
+    def record(self, event, slow=False):
+        key = normalize_statement(event.statement)
+        with self.__lock:
+            stats = self.__statements.get(key)
+            if stats is None:
+                stats = StatementStats()
+                self.__statements[key] = stats
+            stats.add(event.elapsed_ms, event.rows, event.error)
+            if slow:
+                self.__slow_queries += 1
+
+    def reset(self):
+        with self.__lock:
+            self.__statements.clear()
+            self.__slow_queries = 0
+
+    def snapshot(self, top=None):
+        """
+        Ringkasan statistik, statement dengan total waktu terbesar di depan
+        Returns: Dictionary {'statements': [...], 'total_queries', 'total_ms', 'slow_queries'}
+        """
+        with self.__lock:
+            items = [(statement, stats.to_dict()) for statement, stats in self.__statements.items()]
+            slow_queries = self.__slow_queries
+        items.sort(key=lambda item: item[1]['total_ms'], reverse=True)
+        total_queries = sum(stats['count'] for _, stats in items)
+        total_ms = sum(stats['total_ms'] for _, stats in items)
+        if top is not None:
+            items = items[:top]
+        return {
+            'total_queries': total_queries,
+            'total_ms': total_ms,
+            'slow_queries': slow_queries,
+            'statements': [dict(stats, statement=statement) for statement, stats in items]
+        }
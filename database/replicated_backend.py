@@ -0,0 +1,260 @@
+"""
+Replicated Backend - Pemisahan baca/tulis antara primary dan replica
+Demonstrasi COMPOSITION: ReplicatedBackend adalah StorageBackend yang
+membungkus beberapa StorageBackend lain (satu primary, beberapa replica).
+Karena bekerja di level StorageBackend, replica bisa berupa server MySQL
+maupun file SQLite (untuk uji coba lokal).
+"""
+
+import itertools
+import threading
+import time
+
+from database.storage_backend import StorageBackend, STATS_TABLE
+
+
+class Replica:
+    """Satu endpoint replica beserta status kesehatannya"""
+
+    def __init__(self, name, backend):
+        self.name = name
+        self.backend = backend
+        self.healthy = True
+        self.failures = 0
+        self.retry_at = 0.0
+        self.reads = 0
+        self.last_error = None
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'healthy': self.healthy,
+            'reads': self.reads,
+            'failures': self.failures,
+            'last_error': self.last_error
+        }
+
+
+class ReplicatedBackend(StorageBackend):
+    """
+    Tulis ke primary, baca dibagi round-robin ke replica yang sehat
+
+    - Failover: replica yang query-nya gagal ditandai tidak sehat dan query
+      diulang di replica berikutnya, lalu di primary jika semua replica gagal
+    - Health check: replica tidak sehat di-ping lagi setelah health_interval
+      detik dan dipakai kembali jika sudah bisa dihubungi
+    - Read-your-writes: selama sticky_seconds setelah penulisan, semua baca
+      diarahkan ke primary agar data yang baru ditulis langsung terlihat
+      meskipun replica masih tertinggal. Berlaku untuk satu proses aplikasi
+      (satu sesi perpustakaan), termasuk penulisan oleh thread write-behind.
+    """
+
+    def __init__(self, primary, replicas, sticky_seconds=5.0, health_interval=10.0):
+        """
+        Args:
+            primary: StorageBackend untuk semua penulisan
+            replicas: List of (nama, StorageBackend) untuk pembacaan
+            sticky_seconds: Lama baca diarahkan ke primary setelah menulis
+            health_interval: Detik sebelum replica yang gagal dicoba lagi
+        """
+        super().__init__(primary.search_mode, primary.maintain_stats)
+        self.PLACEHOLDER = primary.PLACEHOLDER
+        self.STATS_UPSERT = primary.STATS_UPSERT
+        self.STATS_SHARE_LOCK = primary.STATS_SHARE_LOCK
+        self.primary = primary
+        self.replicas = [Replica(name, backend) for name, backend in replicas]
+        self.sticky_seconds = sticky_seconds
+        self.health_interval = health_interval
+
+        self.__lock = threading.Lock()
+        self.__rotation = itertools.count()
+        self.__last_write = None
+        self.__stats = {'primary_reads': 0, 'replica_reads': 0, 'sticky_reads': 0, 'failovers': 0}
+
+    # ========== ROUTING ==========
+
+    def __mark_written(self, *tables):
+        """Catat waktu tulis (read-your-writes) dan buang cache replica yang basi"""
+        with self.__lock:
+            self.__last_write = time.monotonic()
+        if tables:
+            for replica in self.replicas:
+                replica.backend.invalidate_cache(*tables)
+
+    def __is_sticky(self):
+        last_write = self.__last_write
+        return last_write is not None and time.monotonic() - last_write < self.sticky_seconds
+
+    def __read_order(self):
+        """
+        Urutan backend untuk satu query baca: replica sehat (round-robin),
+        replica yang sudah waktunya dicek ulang, lalu primary sebagai cadangan
+        """
+        if not self.replicas:
+            return [(None, self.primary)]
+        if self.__is_sticky():
+            with self.__lock:
+                self.__stats['sticky_reads'] += 1
+            return [(None, self.primary)]
+
+        now = time.monotonic()
+        start = next(self.__rotation) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        candidates = [replica for replica in ordered if replica.healthy]
+        for replica in ordered:
+            if not replica.healthy and now >= replica.retry_at and self.__recheck(replica):
+                candidates.append(replica)
+        return [(replica, replica.backend) for replica in candidates] + [(None, self.primary)]
+
+    def __recheck(self, replica):
+        """Health check replica yang sebelumnya gagal"""
+        errors_before = replica.backend.thread_read_errors()
+        alive = replica.backend.ping() and replica.backend.thread_read_errors() == errors_before
+        with self.__lock:
+            replica.healthy = alive
+            if not alive:
+                replica.retry_at = time.monotonic() + self.health_interval
+        return alive
+
+    def __record_read(self, replica):
+        with self.__lock:
+            if replica is None:
+                self.__stats['primary_reads'] += 1
+            else:
+                replica.reads += 1
+                self.__stats['replica_reads'] += 1
+
+    def __record_failure(self, replica, error):
+        with self.__lock:
+            replica.healthy = False
+            replica.failures += 1
+            replica.last_error = str(error)
+            replica.retry_at = time.monotonic() + self.health_interval
+            self.__stats['failovers'] += 1
+
+    def __read(self, operation):
+        """
+        Jalankan operation(backend) di backend baca pertama yang berhasil
+        Backend engine tidak raise saat query gagal, jadi kegagalan dideteksi
+        dari bertambahnya read_errors thread ini (thread_read_errors)
+        Jika primary sebagai cadangan terakhir juga gagal, error dicatat di
+        read_errors backend ini agar terlihat oleh pemanggil
+        """
+        for replica, backend in self.__read_order():
+            errors_before = backend.thread_read_errors()
+            try:
+                result = operation(backend)
+            except Exception as e:
+                if replica is None:
+                    raise
+                self.__record_failure(replica, e)
+                continue
+            if backend.thread_read_errors() > errors_before:
+                if replica is not None:
+                    self.__record_failure(replica, "query baca gagal")
+                    continue
+                self._count_read_error()
+                return result
+            self.__record_read(replica)
+            return result
+
+    # ========== IMPLEMENTASI HOOK ==========
+
+    def _fetch_all(self, query, params=()):
+        return self.__read(lambda backend: backend._fetch_all(query, params))
+
+    def _fetch_iter(self, query, params=()):
+        for replica, backend in self.__read_order():
+            errors_before = backend.thread_read_errors()
+            received = False
+            for row in backend._fetch_iter(query, params):
+                received = True
+                yield row
+            if backend.thread_read_errors() > errors_before:
+                if replica is not None:
+                    self.__record_failure(replica, "query baca gagal")
+                    # Failover hanya jika replica gagal sebelum mengirim baris apa pun
+                    if not received:
+                        continue
+                # Baris yang sudah dikirim tidak bisa diulang dari backend lain:
+                # iterasi berhenti dan pemanggil melihat read_errors bertambah
+                self._count_read_error()
+                return
+            self.__record_read(replica)
+            return
+
+    def _insert(self, table, query, params):
+        item_id = self.primary._insert(table, query, params)
+        self.__mark_written(table, STATS_TABLE)
+        return item_id
+
+    def _insert_many(self, table, query, rows, batch_size):
+        try:
+            self.primary._insert_many(table, query, rows, batch_size)
+        finally:
+            self.__mark_written(table, STATS_TABLE)
+
+    def _insert_rows(self, table, query, rows):
+        try:
+            return self.primary._insert_rows(table, query, rows)
+        finally:
+            self.__mark_written(table, STATS_TABLE)
+
+    def _transaction(self, work, tables=()):
+        try:
+            return self.primary._transaction(work, tables)
+        finally:
+            self.__mark_written(*tables)
+
+    def search(self, table, keyword, limit=50):
+        return self.__read(lambda backend: backend.search(table, keyword, limit))
+
+    def search_queries(self, table, keyword, limit=50):
+        return self.primary.search_queries(table, keyword, limit)
+
+    def stats_enabled(self):
+        return self.primary.stats_enabled()
+
+    # Sinkronisasi watermark harus membaca sumber yang paling baru
+    def current_timestamp(self):
+        return self.primary.current_timestamp()
+
+    def changed_since(self, table, watermark=None, limit=1000):
+        return self.primary.changed_since(table, watermark, limit)
+
+    def invalidate_cache(self, *tables):
+        """
+        Tabel diubah dari luar backend ini (misal proses lain): cache semua
+        endpoint dibuang dan baca berikutnya diarahkan ke primary (read-your-writes)
+        """
+        self.primary.invalidate_cache(*tables)
+        self.__mark_written(*tables)
+
+    def get_query_stats(self, top=None):
+        return self.primary.get_query_stats(top)
+
+    def check_health(self):
+        """
+        Ping semua replica sekarang juga
+        Returns: Dictionary nama replica -> sehat (bool)
+        """
+        for replica in self.replicas:
+            self.__recheck(replica)
+        return {replica.name: replica.healthy for replica in self.replicas}
+
+    def get_replication_stats(self):
+        """
+        Statistik routing dan status replica
+        (primary_reads sudah termasuk sticky_reads, yaitu baca ke primary karena read-your-writes)
+        Returns: Dictionary
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['replicas'] = [replica.to_dict() for replica in self.replicas]
+            stats['sticky'] = self.__is_sticky()
+        return stats
+
+    def close(self):
+        for replica in self.replicas:
+            replica.backend.close()
+        self.primary.close()
@@ -0,0 +1,600 @@
+"""
+Snapshot Backend - Katalog hanya-baca dari file snapshot biner (mmap)
+Untuk terminal cabang yang sering terputus dari MySQL: snapshot ditulis dari
+database dalam satu kali scan (python main.py snapshot katalog.snap), lalu
+dibuka dengan mmap sehingga listing dan pencarian dilayani tanpa parsing
+dan tanpa memuat katalog ke memory (halaman file dibaca saat disentuh).
+
+Format file (little-endian), per tabel terurut (title, id) seperti di database:
+    MAGIC
+    [records]   baris fixed-width: angka int64, teks (offset, panjang) uint32 ke heap
+    [heap]      teks UTF-8 per baris berurutan, dipisah byte NUL
+    [id index]  int64 id terurut + int64 posisi baris (get_by_id, cursor)
+    metadata JSON (tabel, offset section, jumlah baris, kunci urutan judul, waktu database)
+    uint32 panjang metadata, MAGIC
+"""
+
+import json
+import mmap
+import os
+import re
+import shutil
+import string
+import struct
+import tempfile
+import time
+import unicodedata
+from array import array
+from bisect import bisect_left
+
+from database.storage_backend import StorageBackend, CATALOG_TABLES, FILTER_OPERATORS, ROW_ORDERS
+
+
+MAGIC = b"SHRSNAP1"
+VERSION = 1
+
+# Kolom bertipe angka (int64); kolom lain teks
+INTEGER_COLUMNS = ('id', 'year', 'issue_number')
+
+# Penanda NULL: angka = int64 terkecil, teks = panjang 0xFFFFFFFF
+NULL_INTEGER = -2 ** 63
+NULL_LENGTH = 0xFFFFFFFF
+MAX_HEAP_BYTES = 0xFFFFFFFF
+
+FOOTER = struct.Struct("<I8s")
+
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+
+
+def nocase_key(title):
+    """Urutan SQLite COLLATE NOCASE: hanya huruf A-Z yang disamakan besar/kecilnya"""
+    return title.translate(ASCII_LOWER)
+
+
+def accent_insensitive_key(title):
+    """Perkiraan collation MySQL *_ai_ci: tanpa beda huruf besar/kecil dan aksen"""
+    if title.isascii():
+        return title.lower()
+    decomposed = unicodedata.normalize('NFKD', title)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+# Kunci urutan judul yang dicocokkan dengan urutan database saat snapshot ditulis;
+# yang cocok disimpan di metadata 'order_key' dan dipakai position_after
+ORDER_KEYS = {
+    'nocase': nocase_key,
+    'accent_insensitive': accent_insensitive_key
+}
+
+
+class SnapshotError(Exception):
+    """File snapshot tidak valid atau operasi yang tidak didukung snapshot"""
+
+
+def record_struct(table):
+    """Struct satu baris tabel: 'q' per kolom angka, 'II' (offset, panjang) per kolom teks"""
+    return struct.Struct("<" + "".join("q" if column in INTEGER_COLUMNS else "II"
+                                       for column in CATALOG_TABLES[table]['columns']))
+
+
+def first_position(count, reached):
+    """Binary search: posisi pertama di 0..count dengan reached(posisi) True (monoton)"""
+    low, high = 0, count
+    while low < high:
+        middle = (low + high) // 2
+        if reached(middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+
+def _pad(output):
+    """Section berikutnya dimulai di kelipatan 8 byte (array int64 bisa di-cast langsung)"""
+    output.write(b"\0" * (-output.tell() % 8))
+    return output.tell()
+
+
+def write_snapshot(storage, path, batch_size=5000):
+    """
+    Menulis snapshot semua tabel katalog dari storage dalam satu kali scan per tabel
+    (iter_rows terurut judul). Record ditulis langsung ke file, teks ke file heap
+    sementara yang kemudian disambung di belakangnya. File ditulis ke path.tmp lalu
+    diganti atomik, sehingga snapshot lama yang sedang dibuka tetap utuh.
+
+    Returns: Dictionary {'path', 'rows': {tabel: jumlah}, 'bytes', 'elapsed'}
+    Raises: SnapshotError jika pembacaan database gagal atau teks satu tabel melebihi 4 GB
+    """
+    started = time.perf_counter()
+    # Diambil sebelum scan: perubahan selama scan membuat snapshot dianggap basi
+    db_timestamp = storage.current_timestamp()
+    temporary = path + ".tmp"
+    metadata = {'version': VERSION, 'created_at': time.time(),
+                'db_timestamp': None if db_timestamp is None else str(db_timestamp),
+                'tables': {}}
+
+    try:
+        with open(temporary, 'wb') as output:
+            output.write(MAGIC)
+            for table, spec in CATALOG_TABLES.items():
+                columns = spec['columns']
+                packer = record_struct(table)
+                ids = array('q')
+                records_offset = _pad(output)
+                buffer = []
+                # Kunci urutan yang masih konsisten dengan urutan (title, id) dari database
+                order_keys = dict(ORDER_KEYS)
+                previous = {}
+                errors_before = storage.thread_read_errors()
+                with tempfile.TemporaryFile() as heap:
+                    heap_size = 0
+                    for row in storage.iter_rows(table):
+                        fields = []
+                        for column, value in zip(columns, row):
+                            if column in INTEGER_COLUMNS:
+                                fields.append(NULL_INTEGER if value is None else int(value))
+                            elif value is None:
+                                fields += (heap_size, NULL_LENGTH)
+                            else:
+                                data = str(value).encode('utf-8')
+                                heap.write(data + b"\0")
+                                fields += (heap_size, len(data))
+                                heap_size += len(data) + 1
+                        buffer.append(packer.pack(*fields))
+                        ids.append(row[0])
+                        for name, key_function in list(order_keys.items()):
+                            key = (key_function(row[1] or ""), row[0])
+                            if name in previous and key < previous[name]:
+                                del order_keys[name]
+                            else:
+                                previous[name] = key
+                        if len(buffer) >= batch_size:
+                            output.write(b"".join(buffer))
+                            buffer.clear()
+                    if storage.thread_read_errors() > errors_before:
+                        raise SnapshotError(f"Gagal membaca tabel {table} dari database")
+                    if heap_size > MAX_HEAP_BYTES:
+                        raise SnapshotError(f"Teks tabel {table} melebihi 4 GB")
+                    output.write(b"".join(buffer))
+
+                    heap_offset = output.tell()
+                    heap.seek(0)
+                    shutil.copyfileobj(heap, output)
+
+                # Index id: posisi baris diurutkan menurut id
+                order = sorted(range(len(ids)), key=ids.__getitem__)
+                ids_offset = _pad(output)
+                array('q', (ids[position] for position in order)).tofile(output)
+                array('q', order).tofile(output)
+
+                metadata['tables'][table] = {
+                    'columns': list(columns),
+                    'rows': len(ids),
+                    'records': records_offset,
+                    'record_size': packer.size,
+                    'heap': heap_offset,
+                    'heap_size': heap_size,
+                    'ids': ids_offset,
+                    'order_key': next(iter(order_keys), None)
+                }
+
+            encoded = json.dumps(metadata).encode('utf-8')
+            output.write(encoded)
+            output.write(FOOTER.pack(len(encoded), MAGIC))
+            size = output.tell()
+    except BaseException:
+        # Snapshot setengah jadi tidak pernah menggantikan yang lama
+        os.remove(temporary)
+        raise
+
+    os.replace(temporary, path)
+    return {
+        'path': path,
+        'rows': {table: info['rows'] for table, info in metadata['tables'].items()},
+        'bytes': size,
+        'elapsed': time.perf_counter() - started
+    }
+
+
+class _TableView:
+    """Satu tabel di dalam snapshot: akses baris langsung ke mmap"""
+
+    def __init__(self, buffer, table, info):
+        if tuple(info['columns']) != CATALOG_TABLES[table]['columns']:
+            raise SnapshotError(f"Kolom {table} di snapshot berbeda dengan CATALOG_TABLES")
+        self.buffer = buffer
+        self.columns = CATALOG_TABLES[table]['columns']
+        self.rows = info['rows']
+        self.records = info['records']
+        self.record_size = info['record_size']
+        self.heap = info['heap']
+        self.heap_size = info['heap_size']
+        # Snapshot lama / collation yang tidak dikenali: None (position_after scan linear)
+        self.order_key = ORDER_KEYS.get(info.get('order_key'))
+        packer = record_struct(table)
+        if packer.size != self.record_size:
+            raise SnapshotError(f"Ukuran record {table} di snapshot tidak cocok")
+        self.unpack = packer.unpack_from
+        self.section = memoryview(buffer)[info['ids']:info['ids'] + 16 * self.rows]
+        self.sorted_ids = self.section[:8 * self.rows].cast('q')
+        self.positions = self.section[8 * self.rows:].cast('q')
+
+        # Slot struct per kolom: (nama, indeks nilai pertama, teks?)
+        self.slots = []
+        index = 0
+        for column in self.columns:
+            text = column not in INTEGER_COLUMNS
+            self.slots.append((column, index, text))
+            index += 2 if text else 1
+        # Kolom yang dicari (LIKE) -> indeks offset teksnya di struct
+        self.search_slots = [index for column, index, _ in self.slots
+                             if column in CATALOG_TABLES[table]['search_fields']]
+
+    def raw(self, position):
+        return self.unpack(self.buffer, self.records + position * self.record_size)
+
+    def text(self, offset, length):
+        if length == NULL_LENGTH:
+            return None
+        start = self.heap + offset
+        return self.buffer[start:start + length].decode('utf-8')
+
+    def row(self, position):
+        """Baris ke-position (urutan judul) sebagai tuple seperti hasil query database"""
+        values = self.raw(position)
+        row = []
+        for _, index, text in self.slots:
+            if text:
+                row.append(self.text(values[index], values[index + 1]))
+            else:
+                value = values[index]
+                row.append(None if value == NULL_INTEGER else value)
+        return tuple(row)
+
+    def title(self, position):
+        _, offset, length = self.raw(position)[:3]
+        return self.text(offset, length)
+
+    def position_of(self, item_id):
+        """Posisi baris dengan id tersebut, atau None"""
+        index = bisect_left(self.sorted_ids, item_id)
+        if index < self.rows and self.sorted_ids[index] == item_id:
+            return self.positions[index]
+        return None
+
+    def position_after(self, after):
+        """Posisi baris pertama setelah cursor (title, id)"""
+        title, item_id = after
+        position = self.position_of(item_id)
+        if position is not None and self.title(position) == title:
+            return position + 1
+        # Cursor dari sumber lain (baris sudah tidak ada): binary search dengan kunci
+        # yang terbukti sama urutannya dengan collation database saat snapshot ditulis
+        if self.order_key is not None:
+            key_function = self.order_key
+            key = (key_function(title or ""), item_id)
+            return first_position(self.rows, lambda position: (
+                key_function(self.title(position) or ""), self.raw(position)[0]) > key)
+        # Urutan tidak dikenali: casefold belum tentu monoton, jadi scan dari awal
+        key = ((title or "").casefold(), item_id)
+        for position in range(self.rows):
+            if ((self.title(position) or "").casefold(), self.raw(position)[0]) > key:
+                return position
+        return self.rows
+
+    def owner(self, offset):
+        """Posisi baris pemilik teks di offset heap (heap ditulis berurutan mengikuti baris)"""
+        return first_position(self.rows, lambda position: self.raw(position)[1] > offset) - 1
+
+    def release(self):
+        """Melepas memoryview ke mmap (syarat mmap bisa ditutup)"""
+        for view in (self.sorted_ids, self.positions, self.section):
+            view.release()
+
+
+class SnapshotBackend(StorageBackend):
+    """
+    Backend hanya-baca di atas file snapshot (INHERITANCE dari StorageBackend)
+
+    Listing, lompat halaman, ambil per id, dan pencarian substring (setara mode
+    'like') dibaca langsung dari mmap. Jika `source` (backend database) diberikan:
+    - check_freshness() membandingkan snapshot dengan database; tabel yang basi
+      dibaca dari database
+    - penulisan diteruskan ke database dan tabelnya sejak itu dibaca dari database
+    Tanpa source (offline) penulisan ditolak.
+    """
+
+    def __init__(self, path, source=None):
+        """
+        Args:
+            path: File hasil write_snapshot
+            source: StorageBackend database asal (boleh None = offline)
+        Raises: SnapshotError jika file bukan snapshot yang valid
+        """
+        super().__init__('like', source.maintain_stats if source is not None else False)
+        if source is not None:
+            self.PLACEHOLDER = source.PLACEHOLDER
+            self.STATS_UPSERT = source.STATS_UPSERT
+            self.STATS_SHARE_LOCK = source.STATS_SHARE_LOCK
+        self.path = path
+        self.source = source
+        # Tabel yang dibaca dari source (snapshot basi atau sudah ditulisi)
+        self.stale_tables = set()
+
+        self.__file = open(path, 'rb')
+        try:
+            self.__buffer = mmap.mmap(self.__file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.metadata = self.__read_metadata()
+            self.__tables = {table: _TableView(self.__buffer, table, info)
+                             for table, info in self.metadata['tables'].items()}
+        except (ValueError, KeyError, SnapshotError) as e:
+            self.__file.close()
+            raise SnapshotError(f"Snapshot {path} tidak valid: {e}") from e
+        missing = set(CATALOG_TABLES) - set(self.__tables)
+        if missing:
+            self.close()
+            raise SnapshotError(f"Snapshot {path} tidak berisi tabel: {', '.join(sorted(missing))}")
+
+    def __read_metadata(self):
+        buffer = self.__buffer
+        if len(buffer) < len(MAGIC) + FOOTER.size or buffer[:len(MAGIC)] != MAGIC:
+            raise SnapshotError("bukan file snapshot")
+        length, magic = FOOTER.unpack_from(buffer, len(buffer) - FOOTER.size)
+        if magic != MAGIC:
+            raise SnapshotError("file terpotong")
+        end = len(buffer) - FOOTER.size
+        metadata = json.loads(buffer[end - length:end].decode('utf-8'))
+        if metadata.get('version') != VERSION:
+            raise SnapshotError(f"versi {metadata.get('version')} tidak didukung")
+        return metadata
+
+    # ========== KESEGARAN ==========
+
+    def check_freshness(self):
+        """
+        Membandingkan snapshot dengan database: tabel basi jika ada baris yang
+        dibuat / diubah sejak snapshot ditulis dan isinya berbeda dengan snapshot,
+        atau jumlah barisnya berbeda (ada yang dihapus).
+        Tabel basi sejak itu dibaca dari database. Jika database tidak bisa
+        dihubungi, source dilepas dan backend berjalan offline.
+
+        Returns: List tabel yang basi, atau None jika database tidak bisa dihubungi
+        """
+        source = self.source
+        if source is None:
+            return None
+        errors_before = source.thread_read_errors()
+        try:
+            reachable = source.ping() and source.thread_read_errors() == errors_before
+        except Exception:
+            reachable = False
+        if not reachable:
+            self.source = None
+            source.close()
+            return None
+
+        stale = [table for table in self.__tables if self.__is_stale(source, table)]
+        self.stale_tables.update(stale)
+        return stale
+
+    def __is_stale(self, source, table, batch_size=500):
+        view = self.__tables[table]
+        written_at = self.metadata['db_timestamp']
+        if written_at is None or view.rows != source.count(table):
+            return True
+        # Baris dengan updated_at >= waktu snapshot; yang ditulis di detik yang sama
+        # sebelum scan sudah ada di snapshot dengan isi yang sama
+        watermark = (written_at, None)
+        while True:
+            rows = source.changed_since(table, watermark, limit=batch_size)
+            for row in rows:
+                position = view.position_of(row[0])
+                if position is None or view.row(position) != tuple(row[:-1]):
+                    return True
+            if len(rows) < batch_size:
+                return False
+            watermark = (rows[-1][-1], rows[-1][0])
+
+    def get_snapshot_info(self):
+        """Returns: Dictionary {'path', 'created_at', 'rows', 'online', 'stale_tables'}"""
+        return {
+            'path': self.path,
+            'created_at': self.metadata['created_at'],
+            'rows': {table: view.rows for table, view in self.__tables.items()},
+            'online': self.source is not None,
+            'stale_tables': sorted(self.stale_tables)
+        }
+
+    def __reader(self, table):
+        """None = baca dari snapshot, selain itu backend database untuk tabel ini"""
+        if table not in CATALOG_TABLES:
+            raise ValueError(f"Tabel tidak dikenal: {table}")
+        if table in self.stale_tables and self.source is not None:
+            return self.source
+        return None
+
+    def __mark_written(self, *tables):
+        self.stale_tables.update(table for table in tables if table in CATALOG_TABLES)
+
+    def __require_source(self):
+        if self.source is None:
+            raise SnapshotError("Snapshot hanya-baca: database tidak terhubung")
+        return self.source
+
+    # ========== BACA DARI SNAPSHOT ==========
+
+    def list_page(self, table, after=None, limit=20):
+        source = self.__reader(table)
+        if source is not None:
+            return source.list_page(table, after, limit)
+        view = self.__tables[table]
+        start = 0 if after is None else view.position_after(after)
+        rows = [view.row(position) for position in range(start, min(start + limit + 1, view.rows))]
+        return self.page_result(rows, limit)
+
+    def get_by_id(self, table, item_id):
+        source = self.__reader(table)
+        if source is not None:
+            return source.get_by_id(table, item_id)
+        view = self.__tables[table]
+        position = view.position_of(item_id)
+        return None if position is None else view.row(position)
+
+    def page_cursor(self, table, offset):
+        """Posisi baris diketahui langsung dari offset (tanpa scan)"""
+        source = self.__reader(table)
+        if source is not None:
+            return source.page_cursor(table, offset)
+        view = self.__tables[table]
+        if offset <= 0 or offset > view.rows:
+            return None
+        row = view.row(offset - 1)
+        return row[1], row[0]
+
+    def count(self, table):
+        source = self.__reader(table)
+        if source is not None:
+            return source.count(table)
+        return self.__tables[table].rows
+
+    def iter_rows(self, table, filters=None, order_by='title'):
+        source = self.__reader(table)
+        if source is not None:
+            return source.iter_rows(table, filters, order_by)
+        if order_by not in ROW_ORDERS:
+            raise ValueError(f"Urutan tidak didukung: {order_by}")
+        view = self.__tables[table]
+        checks = self.__filter_checks(table, filters)
+        positions = range(view.rows) if order_by == 'title' else view.positions
+        return (row for row in map(view.row, positions)
+                if all(check(row) for check in checks))
+
+    @staticmethod
+    def __filter_checks(table, filters):
+        """Filter [(kolom, operator, nilai)] -> list of callable(row), NULL tidak pernah lolos"""
+        columns = CATALOG_TABLES[table]['columns']
+        comparisons = {
+            '=': lambda value, target: value == target,
+            '!=': lambda value, target: value != target,
+            '<': lambda value, target: value < target,
+            '<=': lambda value, target: value <= target,
+            '>': lambda value, target: value > target,
+            '>=': lambda value, target: value >= target,
+            # Seperti LIKE: tanpa beda huruf besar/kecil
+            '~': lambda value, target: str(target).casefold() in str(value).casefold()
+        }
+        checks = []
+        for column, operator, target in filters or ():
+            if column not in columns:
+                raise ValueError(f"Kolom tidak dikenal di {table}: {column}")
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"Operator filter tidak didukung: {operator}")
+            if operator != '~' and isinstance(target, str):
+                target = target.casefold()
+            position = columns.index(column)
+            compare = comparisons[operator]
+
+            def check(row, position=position, compare=compare, target=target, operator=operator):
+                value = row[position]
+                if value is None:
+                    return False
+                if operator != '~' and isinstance(value, str):
+                    value = value.casefold()
+                return compare(value, target)
+
+            checks.append(check)
+        return checks
+
+    def search(self, table, keyword, limit=50):
+        """
+        Pencarian substring (setara LIKE '%kata%', huruf ASCII tanpa beda besar/kecil)
+        di search_fields, langsung di heap teks mmap; hasil terurut judul
+        """
+        source = self.__reader(table)
+        if source is not None:
+            return source.search(table, keyword, limit)
+        needle = keyword.replace("\0", "").encode('utf-8')
+        if not needle:
+            return []
+        view = self.__tables[table]
+        pattern = re.compile(re.escape(needle), re.IGNORECASE)
+        results = []
+        last = -1
+        for match in pattern.finditer(self.__buffer, view.heap, view.heap + view.heap_size):
+            offset = match.start() - view.heap
+            position = view.owner(offset)
+            if position <= last:
+                continue
+            values = view.raw(position)
+            if any(values[index] <= offset and match.end() - view.heap <= values[index] + values[index + 1]
+                   for index in view.search_slots if values[index + 1] != NULL_LENGTH):
+                results.append(view.row(position))
+                last = position
+                if len(results) >= limit:
+                    break
+        return results
+
+    # ========== IMPLEMENTASI HOOK (diteruskan ke database) ==========
+
+    def _fetch_all(self, query, params=()):
+        if self.source is None:
+            return []
+        return self.source._fetch_all(query, params)
+
+    def _fetch_iter(self, query, params=()):
+        if self.source is None:
+            return iter(())
+        return self.source._fetch_iter(query, params)
+
+    def _insert(self, table, query, params):
+        if self.source is None:
+            print("❌ Snapshot hanya-baca: database tidak terhubung, item tidak disimpan")
+            return None
+        item_id = self.source._insert(table, query, params)
+        self.__mark_written(table)
+        return item_id
+
+    def _insert_many(self, table, query, rows, batch_size):
+        try:
+            self.__require_source()._insert_many(table, query, rows, batch_size)
+        finally:
+            self.__mark_written(table)
+
+    def _insert_rows(self, table, query, rows):
+        try:
+            return self.__require_source()._insert_rows(table, query, rows)
+        finally:
+            self.__mark_written(table)
+
+    def _transaction(self, work, tables=()):
+        try:
+            return self.__require_source()._transaction(work, tables)
+        finally:
+            self.__mark_written(*tables)
+
+    def stats_enabled(self):
+        return self.source is not None and self.source.stats_enabled()
+
+    def current_timestamp(self):
+        return self.source.current_timestamp() if self.source is not None else None
+
+    def changed_since(self, table, watermark=None, limit=1000):
+        return self.source.changed_since(table, watermark, limit) if self.source is not None else []
+
+    def invalidate_cache(self, *tables):
+        """Tabel diubah dari luar: sejak itu dibaca dari database (jika terhubung)"""
+        if self.source is not None:
+            self.source.invalidate_cache(*tables)
+        self.__mark_written(*(tables or CATALOG_TABLES))
+
+    def get_query_stats(self, top=None):
+        return self.source.get_query_stats(top) if self.source is not None else None
+
+    def close(self):
+        for view in self.__tables.values():
+            view.release()
+        self.__tables = {}
+        self.__buffer.close()
+        self.__file.close()
+        if self.source is not None:
+            self.source.close()
@@ -0,0 +1,249 @@
+"""
+SQLite Backend - Implementasi StorageBackend tanpa server database
+Bisa memakai file (mode embedded untuk perpustakaan cabang) atau ':memory:'
+(cepat untuk benchmark dan load test lokal)
+"""
+
+import sqlite3
+import threading
+
+from database.storage_backend import StorageBackend, CATALOG_TABLES, STATS_TABLE
+from search.inverted_index import tokenize
+
+
+SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL COLLATE NOCASE,
+    author TEXT NOT NULL COLLATE NOCASE,
+    year INTEGER,
+    isbn TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_books_title ON books (title, id);
+CREATE INDEX IF NOT EXISTS idx_books_author ON books (author);
+CREATE INDEX IF NOT EXISTS idx_books_updated ON books (updated_at, id);
+
+CREATE TABLE IF NOT EXISTS magazines (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL COLLATE NOCASE,
+    publisher TEXT COLLATE NOCASE,
+    issue_number INTEGER,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT DEFAULT CURRENT_TIMESTAMP
+);
+CREATE INDEX IF NOT EXISTS idx_magazines_title ON magazines (title, id);
+CREATE INDEX IF NOT EXISTS idx_magazines_publisher ON magazines (publisher);
+CREATE INDEX IF NOT EXISTS idx_magazines_updated ON magazines (updated_at, id);
+
+CREATE TABLE IF NOT EXISTS catalog_stats (
+    metric TEXT NOT NULL,
+    bucket TEXT NOT NULL COLLATE NOCASE,
+    item_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (metric, bucket)
+);
+CREATE INDEX IF NOT EXISTS idx_catalog_stats_count ON catalog_stats (metric, item_count);
+"""
+
+# Pengganti "ON UPDATE CURRENT_TIMESTAMP" milik MySQL
+UPDATED_AT_TRIGGER = """
+CREATE TRIGGER IF NOT EXISTS trg_{table}_updated_at AFTER UPDATE ON {table}
+FOR EACH ROW WHEN NEW.updated_at = OLD.updated_at
+BEGIN
+    UPDATE {table} SET updated_at = CURRENT_TIMESTAMP WHERE id = NEW.id;
+END;
+"""
+
+# FTS5 external-content table: index full-text yang selalu sinkron lewat trigger
+FTS_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS {table}_fts USING fts5({fields}, content='{table}', content_rowid='id');
+CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_insert AFTER INSERT ON {table} BEGIN
+    INSERT INTO {table}_fts(rowid, {fields}) VALUES (NEW.id, {new_fields});
+END;
+CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_delete AFTER DELETE ON {table} BEGIN
+    INSERT INTO {table}_fts({table}_fts, rowid, {fields}) VALUES ('delete', OLD.id, {old_fields});
+END;
+CREATE TRIGGER IF NOT EXISTS trg_{table}_fts_update AFTER UPDATE OF {fields} ON {table} BEGIN
+    INSERT INTO {table}_fts({table}_fts, rowid, {fields}) VALUES ('delete', OLD.id, {old_fields});
+    INSERT INTO {table}_fts(rowid, {fields}) VALUES (NEW.id, {new_fields});
+END;
+"""
+
+
+class SQLiteBackend(StorageBackend):
+    """
+    Backend SQLite (INHERITANCE dari StorageBackend)
+
+    Satu koneksi dipakai bersama dan dilindungi lock. Pencarian 'fulltext'
+    memakai FTS5 dengan ranking bm25 jika modul FTS5 tersedia.
+    """
+
+    PLACEHOLDER = "?"
+    STATS_UPSERT = f"""
+        INSERT INTO {STATS_TABLE} (metric, bucket, item_count) VALUES (?, ?, ?)
+        ON CONFLICT (metric, bucket) DO UPDATE SET item_count = item_count + excluded.item_count
+    """
+
+    def __init__(self, path=':memory:', search_mode='fulltext', maintain_stats=True):
+        """
+        Args:
+            path: Path file database SQLite, atau ':memory:'
+            search_mode: 'fulltext' (FTS5) atau 'like'
+            maintain_stats: Perbarui tabel catalog_stats di setiap INSERT
+        """
+        super().__init__(search_mode, maintain_stats)
+        self.path = path
+        self.__lock = threading.RLock()
+        # timeout: beberapa proses (misal loader paralel) bisa antre menulis ke file yang sama
+        self.__connection = sqlite3.connect(path, check_same_thread=False, timeout=60.0)
+        self.__has_fts = False
+        self.__create_schema()
+
+    def __create_schema(self):
+        with self.__lock:
+            connection = self.__connection
+            if self.path != ':memory:':
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.execute("PRAGMA synchronous=NORMAL")
+            connection.executescript(SQLITE_SCHEMA)
+            for table, spec in CATALOG_TABLES.items():
+                connection.executescript(UPDATED_AT_TRIGGER.format(table=table))
+                fields = list(spec['search_fields'])
+                try:
+                    connection.executescript(FTS_SCHEMA.format(
+                        table=table,
+                        fields=", ".join(fields),
+                        new_fields=", ".join(f"NEW.{field}" for field in fields),
+                        old_fields=", ".join(f"OLD.{field}" for field in fields)
+                    ))
+                    self.__has_fts = True
+                except sqlite3.OperationalError:
+                    # SQLite tanpa FTS5: pencarian memakai LIKE
+                    self.__has_fts = False
+            connection.commit()
+
+    # ========== IMPLEMENTASI HOOK ==========
+
+    def _fetch_all(self, query, params=()):
+        try:
+            with self.__lock:
+                return self.__connection.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            self._count_read_error()
+            print(f"❌ Error fetch data: {e}")
+            return []
+
+    def _fetch_iter(self, query, params=()):
+        # Lock dipegang per batch, bukan selama iterasi: scan panjang (misal membangun
+        # index di latar belakang) tidak menahan query lain sampai selesai
+        try:
+            with self.__lock:
+                cursor = self.__connection.execute(query, params)
+            try:
+                while True:
+                    with self.__lock:
+                        rows = cursor.fetchmany(500)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                with self.__lock:
+                    cursor.close()
+        except sqlite3.Error as e:
+            self._count_read_error()
+            print(f"❌ Error fetch data: {e}")
+
+    def _insert(self, table, query, params):
+        try:
+            with self.__lock:
+                cursor = self.__connection.execute(query, params)
+                self._write_stats(self.__connection, table, [params])
+                self.__connection.commit()
+                return cursor.lastrowid
+        except sqlite3.Error as e:
+            self.__connection.rollback()
+            print(f"❌ Error execute query: {e}")
+            return None
+
+    def _insert_many(self, table, query, rows, batch_size):
+        with self.__lock:
+            try:
+                for start in range(0, len(rows), batch_size):
+                    self.__connection.executemany(query, rows[start:start + batch_size])
+                self._write_stats(self.__connection, table, rows)
+                self.__connection.commit()
+            except BaseException:
+                self.__connection.rollback()
+                raise
+
+    def _insert_rows(self, table, query, rows):
+        with self.__lock:
+            try:
+                ids = [self.__connection.execute(query, row).lastrowid for row in rows]
+                self._write_stats(self.__connection, table, rows)
+                self.__connection.commit()
+                return ids
+            except BaseException:
+                self.__connection.rollback()
+                raise
+
+    def _transaction(self, work, tables=()):
+        with self.__lock:
+            cursor = self.__connection.cursor()
+            try:
+                if not self.__connection.in_transaction:
+                    # IMMEDIATE: proses lain yang menulis ke file ini menunggu sampai commit
+                    cursor.execute("BEGIN IMMEDIATE")
+                result = work(cursor)
+                self.__connection.commit()
+                return result
+            except BaseException:
+                self.__connection.rollback()
+                raise
+            finally:
+                cursor.close()
+
+    def search(self, table, keyword, limit=50):
+        """
+        Mode 'fulltext': FTS5 MATCH dengan ranking bm25 (bobot sesuai search_fields)
+        Mode 'like' atau tanpa FTS5: LIKE '%kata%'
+        """
+        query, params = self.search_queries(table, keyword, limit)[0]
+        return self._fetch_all(query, params)
+
+    def search_queries(self, table, keyword, limit=50):
+        terms = tokenize(keyword)
+        if self.search_mode != 'fulltext' or not self.__has_fts or not terms:
+            return [self._search_like_query(table, keyword)]
+
+        spec = CATALOG_TABLES[table]
+        columns = ", ".join(f"t.{column}" for column in spec['columns'])
+        weights = ", ".join(str(float(weight)) for weight in spec['search_fields'].values())
+        # Setiap kata di-quote agar karakter khusus FTS5 tidak dianggap operator
+        match = " OR ".join('"' + term.replace('"', '""') + '"' for term in terms)
+        query = f"""
+            SELECT {columns}
+            FROM {table}_fts
+            JOIN {table} t ON t.id = {table}_fts.rowid
+            WHERE {table}_fts MATCH ?
+            ORDER BY bm25({table}_fts, {weights}), t.title
+            LIMIT ?
+        """
+        return [(query, (match, limit))]
+
+    def backup_to(self, path):
+        """
+        Menyalin seluruh isi database ke file lain (sqlite3 backup API)
+        Dipakai untuk membuat / menyegarkan file replica saat uji coba lokal
+        """
+        with self.__lock:
+            target = sqlite3.connect(path)
+            try:
+                self.__connection.backup(target)
+            finally:
+                target.close()
+
+    def close(self):
+        with self.__lock:
+            self.__connection.close()
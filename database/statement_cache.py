@@ -0,0 +1,261 @@
+"""
+Statement Cache Module
+Registry statement SQL tetap yang dijalankan sebagai server-side prepared statement:
+di-prepare sekali per koneksi, lalu dipakai ulang (protokol binary) di setiap eksekusi
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+
+
+# Kode error server yang berarti statement di koneksi ini sudah tidak berlaku
+# 1243: unknown prepared statement handler (misal setelah koneksi di-reconnect)
+# 1615: prepared statement needs to be re-prepared (definisi tabel berubah)
+REPREPARE_ERRNOS = {1243, 1615}
+
+# 1295: statement tidak didukung protokol prepared -> dijalankan biasa seterusnya
+UNSUPPORTED_ERRNOS = {1295}
+
+# 1461: batas max_prepared_stmt_count server tercapai -> eksekusi ini dijalankan biasa
+LIMIT_ERRNOS = {1461}
+
+# Kode error client saat koneksi putus (sama dengan CONNECTION_LOST_ERRNOS di db_connection)
+CONNECTION_LOST_ERRNOS = {2006, 2013, 2055}
+
+
+def close_quietly(cursor):
+    """Menutup cursor prepared (deallocate statement di server), error diabaikan"""
+    try:
+        cursor.close()
+    except Exception:
+        pass
+
+
+class PreparedStatementCache:
+    """
+    Prepared statement per koneksi untuk statement yang didaftarkan (register)
+
+    Setiap koneksi punya LRU berisi cursor prepared (connection.cursor(prepared=True)),
+    satu cursor per teks statement. mysql.connector hanya melewati PREPARE jika
+    objek string yang sama persis dipakai lagi, sehingga cache selalu mengirim
+    objek string milik registry, bukan string buatan pemanggil.
+
+    Koneksi yang dibuang (reconnect, pool discard) kehilangan statement-nya;
+    koneksi baru otomatis mem-prepare ulang saat statement pertama kali dipakai.
+
+    Statement yang tidak terdaftar tidak disentuh: pemanggil memakai cursor biasa.
+    """
+
+    def __init__(self, max_per_connection=64):
+        """
+        Args:
+            max_per_connection: Jumlah maksimal statement prepared per koneksi
+                (yang paling lama tidak dipakai di-deallocate)
+        """
+        self.__max_per_connection = max_per_connection
+        self.__statements = {}
+        self.__connections = weakref.WeakKeyDictionary()
+        self.__unsupported = weakref.WeakKeyDictionary()
+        self.__prepared_before = set()
+        self.__lock = threading.Lock()
+        self.__stats = {
+            'prepares': 0,      # PREPARE yang dikirim ke server
+            'reprepares': 0,    # Bagian dari prepares: statement yang pernah di-prepare di koneksi lain
+            'executes': 0,      # Eksekusi lewat statement prepared
+            'evictions': 0,
+            'retries': 0,       # Eksekusi diulang karena statement tidak berlaku lagi di server
+            'fallbacks': 0      # Statement terdaftar yang terpaksa dijalankan tanpa prepare
+        }
+
+    # ========== REGISTRY ==========
+
+    def register(self, *queries):
+        """Mendaftarkan teks statement yang akan dijalankan sebagai prepared statement"""
+        with self.__lock:
+            for query in queries:
+                self.__statements.setdefault(query, query)
+
+    def unregister(self, query):
+        """Statement dijalankan biasa lagi (cursor prepared-nya ditutup saat dipakai berikutnya)"""
+        with self.__lock:
+            self.__statements.pop(query, None)
+
+    def is_registered(self, query):
+        return query in self.__statements
+
+    # ========== EKSEKUSI ==========
+
+    def __cursor_for(self, connection, statement):
+        """Returns: (cursor prepared, True jika baru dibuat) atau (None, False) jika tidak didukung"""
+        with self.__lock:
+            try:
+                if connection in self.__unsupported:
+                    return None, False
+                cursors = self.__connections.get(connection)
+                if cursors is None:
+                    cursors = self.__connections[connection] = OrderedDict()
+            except TypeError:
+                # Koneksi tanpa weakref (koneksi buatan sendiri): tidak di-cache
+                return None, False
+            cursor = cursors.get(statement)
+            if cursor is not None:
+                cursors.move_to_end(statement)
+                return cursor, False
+        try:
+            cursor = connection.cursor(prepared=True)
+        except (TypeError, NotImplementedError):
+            with self.__lock:
+                self.__unsupported[connection] = True
+            return None, False
+        evicted = []
+        with self.__lock:
+            cursors[statement] = cursor
+            while len(cursors) > self.__max_per_connection:
+                _, oldest = cursors.popitem(last=False)
+                evicted.append(oldest)
+                self.__stats['evictions'] += 1
+        for oldest in evicted:
+            close_quietly(oldest)
+        return cursor, True
+
+    def __forget(self, connection, statement, close):
+        with self.__lock:
+            cursors = self.__connections.get(connection)
+            cursor = cursors.pop(statement, None) if cursors else None
+        if cursor is not None and close:
+            close_quietly(cursor)
+
+    def execute(self, connection, query, params=None):
+        """
+        Menjalankan statement terdaftar sebagai prepared statement di koneksi ini
+
+        Statement yang tidak berlaku lagi di server (1243 / 1615) di-prepare ulang
+        dan dijalankan sekali lagi.
+
+        Returns: Cursor prepared yang sudah dieksekusi (ambil hasilnya dengan fetch*),
+                 atau None jika statement tidak terdaftar / tidak bisa di-prepare
+                 (pemanggil menjalankannya dengan cursor biasa)
+        Raises: Error driver seperti cursor.execute biasa
+        """
+        statement = self.__statements.get(query)
+        if statement is None:
+            return None
+        for attempt in range(2):
+            cursor, created = self.__cursor_for(connection, statement)
+            if cursor is None:
+                with self.__lock:
+                    self.__stats['fallbacks'] += 1
+                return None
+            if created:
+                with self.__lock:
+                    self.__stats['prepares'] += 1
+                    if statement in self.__prepared_before:
+                        self.__stats['reprepares'] += 1
+                    self.__prepared_before.add(statement)
+            try:
+                cursor.execute(statement, params or ())
+            except Exception as e:
+                errno = getattr(e, 'errno', None)
+                # Koneksi putus: cursor tidak bisa ditutup lewat server, cukup dilupakan
+                self.__forget(connection, statement, close=errno not in CONNECTION_LOST_ERRNOS)
+                if errno in REPREPARE_ERRNOS and attempt == 0:
+                    with self.__lock:
+                        self.__stats['retries'] += 1
+                    continue
+                if errno in UNSUPPORTED_ERRNOS:
+                    self.unregister(query)
+                if errno in UNSUPPORTED_ERRNOS or errno in LIMIT_ERRNOS:
+                    with self.__lock:
+                        self.__stats['fallbacks'] += 1
+                    return None
+                raise
+            with self.__lock:
+                self.__stats['executes'] += 1
+            return cursor
+        return None
+
+    def discard(self, connection):
+        """
+        Melupakan semua statement milik koneksi yang ditutup / putus
+        Cursor tidak ditutup: statement di server ikut hilang bersama koneksinya
+        """
+        with self.__lock:
+            try:
+                self.__connections.pop(connection, None)
+                self.__unsupported.pop(connection, None)
+            except TypeError:
+                pass
+
+    def get_stats(self):
+        """
+        Statistik prepared statement (prepares vs executes, evictions, dll)
+        Returns: Dictionary
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['statements'] = len(self.__statements)
+            stats['connections'] = len(self.__connections)
+            stats['cached'] = sum(len(cursors) for cursors in self.__connections.values())
+        return stats
+
+    def reset_stats(self):
+        with self.__lock:
+            for key in self.__stats:
+                self.__stats[key] = 0
+
+
+class StatementCursor:
+    """
+    Cursor untuk DatabaseConnection.transaction() saat prepared statement aktif
+
+    execute() untuk statement terdaftar memakai cursor prepared koneksi ini,
+    statement lain (dan executemany) memakai cursor biasa. lastrowid, rowcount,
+    dan fetch* mengikuti cursor yang terakhir menjalankan statement.
+    """
+
+    def __init__(self, connection, cursor, statements):
+        self.__connection = connection
+        self.__plain = cursor
+        self.__statements = statements
+        self.__active = cursor
+
+    def execute(self, query, params=()):
+        prepared = self.__statements.execute(self.__connection, query, params)
+        if prepared is None:
+            self.__plain.execute(query, params)
+            prepared = self.__plain
+        self.__active = prepared
+
+    def executemany(self, query, params_list):
+        # executemany INSERT digabung driver menjadi multi-row INSERT (lebih cepat dari prepared)
+        self.__plain.executemany(query, params_list)
+        self.__active = self.__plain
+
+    def fetchone(self):
+        return self.__active.fetchone()
+
+    def fetchmany(self, size=1):
+        return self.__active.fetchmany(size)
+
+    def fetchall(self):
+        return self.__active.fetchall()
+
+    @property
+    def lastrowid(self):
+        return self.__active.lastrowid
+
+    @property
+    def rowcount(self):
+        return self.__active.rowcount
+
+    @property
+    def description(self):
+        return self.__active.description
+
+    def close(self):
+        # Cursor prepared tetap terbuka di cache untuk transaksi berikutnya
+        self.__plain.close()
+
+    def __getattr__(self, name):
+        return getattr(self.__plain, name)
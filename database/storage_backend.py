@@ -0,0 +1,523 @@
+"""
+Storage Backend - Interface penyimpanan katalog yang tidak terikat ke satu database
+Demonstrasi ABSTRACTION: Controller hanya mengenal method di class ini,
+sedangkan detail SQL tiap engine ada di child class (MySQL, SQLite)
+"""
+
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+
+
+# Definisi tabel katalog yang dipakai semua backend
+# columns[0] selalu id, columns[1] selalu title (dipakai keyset pagination)
+CATALOG_TABLES = {
+    'books': {
+        'columns': ('id', 'title', 'author', 'year', 'isbn'),
+        'search_fields': {'title': 2, 'author': 1}
+    },
+    'magazines': {
+        'columns': ('id', 'title', 'publisher', 'issue_number'),
+        'search_fields': {'title': 2, 'publisher': 1}
+    }
+}
+
+
+# Operator yang boleh dipakai pada filter iter_rows; '~' = mengandung (LIKE '%nilai%')
+FILTER_OPERATORS = ('=', '!=', '<', '<=', '>', '>=', '~')
+
+# Urutan baris yang didukung iter_rows
+ROW_ORDERS = {
+    'title': 'title, id',   # Urutan tampilan (index title)
+    'id': 'id'              # Urutan primary key, paling murah untuk dump seluruh tabel
+}
+
+
+# Statistik katalog yang dipelihara inkremental di tabel STATS_TABLE
+# metric -> (tabel sumber, kolom yang dikelompokkan)
+STATS_TABLE = 'catalog_stats'
+STATS_METRICS = {
+    'books_by_year': ('books', 'year'),
+    'books_by_author': ('books', 'author'),
+    'magazines_by_publisher': ('magazines', 'publisher')
+}
+
+
+def insert_columns(table):
+    """Kolom yang diisi saat INSERT (semua kecuali id)"""
+    return CATALOG_TABLES[table]['columns'][1:]
+
+
+def stats_bucket(value):
+    """Nilai kelompok statistik (NULL disimpan sebagai string kosong)"""
+    return "" if value is None else str(value)
+
+
+def stats_deltas(table, rows):
+    """
+    Pertambahan statistik untuk baris yang baru di-INSERT
+    Args:
+        rows: List of tuples berurutan sesuai insert_columns(table)
+    Returns: List of (metric, bucket, jumlah), terurut agar urutan lock baris selalu sama
+    """
+    columns = insert_columns(table)
+    positions = [(metric, columns.index(column))
+                 for metric, (source, column) in STATS_METRICS.items() if source == table]
+    counts = Counter()
+    for row in rows:
+        for metric, position in positions:
+            counts[metric, stats_bucket(row[position])] += 1
+    return sorted((metric, bucket, count) for (metric, bucket), count in counts.items())
+
+
+class StorageBackend(ABC):
+    """
+    Abstract Base Class untuk semua engine penyimpanan
+
+    Child class cukup menyediakan cara menjalankan SQL (_fetch_all, _fetch_iter,
+    _insert, _insert_many) dan dialeknya (PLACEHOLDER, search). Operasi umum seperti
+    keyset pagination dan count ditulis sekali di sini.
+    """
+
+    PLACEHOLDER = "%s"
+
+    # Dialek: tambah item_count jika (metric, bucket) sudah ada
+    STATS_UPSERT = None
+    # Dialek: kunci baris yang dibaca saat rebuild agar tidak ada INSERT yang terlewat
+    STATS_SHARE_LOCK = ""
+
+    def __init__(self, search_mode='fulltext', maintain_stats=True):
+        """
+        Args:
+            search_mode: 'fulltext' (index teks engine) atau 'like' (substring scan)
+            maintain_stats: Perbarui tabel statistik di setiap INSERT
+        """
+        self.search_mode = search_mode
+        self.maintain_stats = maintain_stats
+        # Jumlah query baca yang gagal (engine mengembalikan hasil kosong, bukan raise)
+        self.read_errors = 0
+        self.__errors_lock = threading.Lock()
+        self.__thread_errors = threading.local()
+
+    # ========== READ ERROR ==========
+
+    def _count_read_error(self):
+        """Mencatat satu query baca yang gagal (total backend dan thread yang menjalankannya)"""
+        with self.__errors_lock:
+            self.read_errors += 1
+        self.__thread_errors.count = self.thread_read_errors() + 1
+
+    def thread_read_errors(self):
+        """
+        Jumlah query baca gagal yang dijalankan thread ini
+        Dipakai untuk mendeteksi kegagalan satu panggilan: read_errors ikut
+        bertambah oleh query thread lain yang gagal bersamaan
+
+        Contoh:
+            errors_before = storage.thread_read_errors()
+            rows = list(storage.iter_rows('books'))
+            failed = storage.thread_read_errors() > errors_before
+        """
+        return getattr(self.__thread_errors, 'count', 0)
+
+    # ========== HOOK UNTUK CHILD CLASS ==========
+
+    @abstractmethod
+    def _fetch_all(self, query, params=()):
+        """Jalankan SELECT, return list of tuples (list kosong jika gagal)"""
+        pass
+
+    @abstractmethod
+    def _fetch_iter(self, query, params=()):
+        """Jalankan SELECT, yield baris satu per satu"""
+        pass
+
+    @abstractmethod
+    def _insert(self, table, query, params):
+        """Jalankan INSERT satu baris, return id baru atau None jika gagal"""
+        pass
+
+    @abstractmethod
+    def _insert_many(self, table, query, rows, batch_size):
+        """INSERT banyak baris dalam satu transaksi (raise jika gagal)"""
+        pass
+
+    @abstractmethod
+    def _insert_rows(self, table, query, rows):
+        """INSERT per baris dalam satu transaksi, return list id baru (raise jika gagal)"""
+        pass
+
+    @abstractmethod
+    def _transaction(self, work, tables=()):
+        """
+        Jalankan work(cursor) dalam satu transaksi, return hasil work (raise jika gagal)
+        Args:
+            tables: Tabel yang diubah work (cache-nya dibuang setelah commit)
+        """
+        pass
+
+    @abstractmethod
+    def search(self, table, keyword, limit=50):
+        """
+        Mencari baris berdasarkan keyword pada search_fields tabel
+        Returns: List of rows terurut relevansi
+        """
+        pass
+
+    @abstractmethod
+    def close(self):
+        """Menutup koneksi engine"""
+        pass
+
+    # ========== OPERASI UMUM ==========
+
+    def _columns(self, table):
+        if table not in CATALOG_TABLES:
+            raise ValueError(f"Tabel tidak dikenal: {table}")
+        return ", ".join(CATALOG_TABLES[table]['columns'])
+
+    def list_page(self, table, after=None, limit=20):
+        """
+        Satu halaman baris terurut (title, id) dengan keyset pagination
+
+        Args:
+            after: Cursor (title, id) baris terakhir halaman sebelumnya
+            limit: Jumlah baris per halaman
+
+        Returns: (rows, next_cursor) - next_cursor None jika halaman terakhir
+        """
+        query, params = self.list_page_query(table, after, limit)
+        return self.page_result(self._fetch_all(query, params), limit)
+
+    def list_page_query(self, table, after=None, limit=20):
+        """
+        SQL satu halaman keyset (juga dipakai AsyncStorage)
+        Returns: (query, params) - mengambil limit + 1 baris, lihat page_result
+        """
+        columns = self._columns(table)
+        p = self.PLACEHOLDER
+        if after is None:
+            query = f"SELECT {columns} FROM {table} ORDER BY title, id LIMIT {p}"
+            params = (limit + 1,)
+        else:
+            last_title, last_id = after
+            # Setara dengan (title, id) > (last_title, last_id). Syarat "title >= ..."
+            # di depan membuat engine bisa langsung seek di index title; bentuk
+            # "title > ? OR (title = ? AND id > ?)" saja membuat SQLite scan seluruh index
+            query = f"""
+                SELECT {columns}
+                FROM {table}
+                WHERE title >= {p} AND (title > {p} OR id > {p})
+                ORDER BY title, id
+                LIMIT {p}
+            """
+            params = (last_title, last_title, last_id, limit + 1)
+        return query, params
+
+    @staticmethod
+    def page_result(rows, limit):
+        """Hasil list_page_query -> (rows, next_cursor)"""
+        # Ambil limit + 1 baris untuk mengetahui apakah masih ada halaman berikutnya
+        has_next = len(rows) > limit
+        rows = rows[:limit]
+        next_cursor = (rows[-1][1], rows[-1][0]) if has_next else None
+        return rows, next_cursor
+
+    def get_by_id(self, table, item_id):
+        """
+        Satu baris berdasarkan primary key
+        Returns: Tuple, atau None jika tidak ada
+        """
+        columns = self._columns(table)
+        rows = self._fetch_all(f"SELECT {columns} FROM {table} WHERE id = {self.PLACEHOLDER}", (item_id,))
+        return rows[0] if rows else None
+
+    def page_cursor(self, table, offset):
+        """
+        Cursor keyset untuk halaman yang dimulai di posisi offset (lompat halaman)
+        Hanya membaca (title, id) dari index, bukan seluruh kolom baris yang dilewati
+        Returns: (title, id) baris sebelum offset, atau None untuk halaman pertama
+        """
+        self._columns(table)
+        if offset <= 0:
+            return None
+        p = self.PLACEHOLDER
+        query = f"SELECT title, id FROM {table} ORDER BY title, id LIMIT 1 OFFSET {p}"
+        rows = self._fetch_all(query, (offset - 1,))
+        return (rows[0][0], rows[0][1]) if rows else None
+
+    def _where(self, table, filters):
+        """
+        Menyusun klausa WHERE dari filter [(kolom, operator, nilai), ...]
+        Nama kolom dan operator divalidasi, nilai selalu lewat placeholder
+        Returns: (teks WHERE, params)
+        """
+        if not filters:
+            return "", ()
+        conditions = []
+        params = []
+        for column, operator, value in filters:
+            if column not in CATALOG_TABLES[table]['columns']:
+                raise ValueError(f"Kolom tidak dikenal di {table}: {column}")
+            if operator not in FILTER_OPERATORS:
+                raise ValueError(f"Operator filter tidak didukung: {operator}")
+            if operator == '~':
+                conditions.append(f"{column} LIKE {self.PLACEHOLDER}")
+                params.append(f"%{value}%")
+            else:
+                conditions.append(f"{column} {operator} {self.PLACEHOLDER}")
+                params.append(value)
+        return " WHERE " + " AND ".join(conditions), tuple(params)
+
+    def iter_rows(self, table, filters=None, order_by='title'):
+        """
+        Generator semua baris (atau yang lolos filter), streaming tanpa fetchall
+
+        Args:
+            filters: List of (kolom, operator, nilai), lihat FILTER_OPERATORS
+            order_by: 'title' (title, id) atau 'id'
+        """
+        columns = self._columns(table)
+        if order_by not in ROW_ORDERS:
+            raise ValueError(f"Urutan tidak didukung: {order_by}")
+        where, params = self._where(table, filters)
+        query = f"SELECT {columns} FROM {table}{where} ORDER BY {ROW_ORDERS[order_by]}"
+        return self._fetch_iter(query, params)
+
+    def count(self, table):
+        """Jumlah baris dalam tabel"""
+        self._columns(table)
+        rows = self._fetch_all(f"SELECT COUNT(*) FROM {table}")
+        return rows[0][0] if rows else 0
+
+    def count_duplicates(self, table, key_columns):
+        """
+        Jumlah baris berlebih yang memiliki nilai key sama (baris dengan key NULL diabaikan)
+        Contoh: 3 buku dengan ISBN yang sama dihitung sebagai 2 duplikat
+        """
+        self._columns(table)
+        for column in key_columns:
+            if column not in CATALOG_TABLES[table]['columns']:
+                raise ValueError(f"Kolom tidak dikenal di {table}: {column}")
+        keys = ", ".join(key_columns)
+        not_null = " AND ".join(f"{column} IS NOT NULL" for column in key_columns)
+        query = f"""
+            SELECT COALESCE(SUM(n - 1), 0)
+            FROM (SELECT COUNT(*) AS n FROM {table} WHERE {not_null}
+                  GROUP BY {keys} HAVING COUNT(*) > 1) duplicates
+        """
+        rows = self._fetch_all(query)
+        return int(rows[0][0]) if rows else 0
+
+    def insert(self, table, data):
+        """
+        Menyimpan satu item
+        Args:
+            data: Dictionary hasil Model.to_dict()
+        Returns: id baris baru, atau None jika gagal
+        """
+        query = self.insert_query(table)
+        return self._insert(table, query, tuple(data.get(column) for column in insert_columns(table)))
+
+    def bulk_insert(self, table, rows, batch_size=1000):
+        """
+        Menyimpan banyak baris dalam SATU transaksi (executemany per batch_size)
+        Args:
+            rows: List of tuples berurutan sesuai insert_columns(table)
+        Returns: Jumlah baris yang disimpan
+        Raises: Error engine jika gagal (transaksi di-rollback)
+        """
+        query = self.insert_query(table)
+        self._insert_many(table, query, rows, batch_size)
+        return len(rows)
+
+    def insert_batch(self, table, rows):
+        """
+        Menyimpan beberapa baris dalam SATU transaksi dan mengembalikan id masing-masing
+        Berbeda dengan bulk_insert, setiap baris di-INSERT sendiri agar id-nya diketahui
+        Args:
+            rows: List of tuples berurutan sesuai insert_columns(table)
+        Returns: List id baru (urutan sama dengan rows)
+        Raises: Error engine jika gagal (transaksi di-rollback)
+        """
+        query = self.insert_query(table)
+        return self._insert_rows(table, query, rows)
+
+    def insert_query(self, table):
+        """INSERT satu baris berurutan kolom insert_columns(table)"""
+        self._columns(table)
+        columns = insert_columns(table)
+        placeholders = ", ".join([self.PLACEHOLDER] * len(columns))
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})"
+
+    def search_queries(self, table, keyword, limit=50):
+        """
+        SQL pencarian sesuai search_mode, dicoba berurutan: (query, params)
+        berikutnya dipakai jika yang sebelumnya gagal (misal index full-text
+        tidak ada). Engine menambahkan query index teksnya di depan LIKE.
+        Returns: List of (query, params)
+        """
+        return [self._search_like_query(table, keyword)]
+
+    def _search_like(self, table, keyword):
+        """Pencarian substring (LIKE '%kata%') yang didukung semua engine SQL"""
+        return self._fetch_all(*self._search_like_query(table, keyword))
+
+    def _search_like_query(self, table, keyword):
+        fields = CATALOG_TABLES[table]['search_fields']
+        conditions = " OR ".join(f"{field} LIKE {self.PLACEHOLDER}" for field in fields)
+        query = f"""
+            SELECT {self._columns(table)}
+            FROM {table}
+            WHERE {conditions}
+            ORDER BY title
+        """
+        search_param = f"%{keyword}%"
+        return query, (search_param,) * len(fields)
+
+    # ========== STATISTIK ==========
+
+    def stats_enabled(self):
+        """True jika statistik dipelihara saat INSERT (engine bisa menambah syarat)"""
+        return self.maintain_stats
+
+    def _write_stats(self, cursor, table, rows):
+        """Menambahkan delta statistik di transaksi yang sama dengan INSERT baris"""
+        if not self.stats_enabled():
+            return
+        deltas = stats_deltas(table, rows)
+        if deltas:
+            cursor.executemany(self.STATS_UPSERT, deltas)
+
+    def get_stats(self, metric, limit=None, order_by='count'):
+        """
+        Statistik yang sudah dihitung (tanpa GROUP BY pada tabel katalog)
+
+        Args:
+            metric: Salah satu STATS_METRICS
+            limit: Jumlah kelompok teratas (None = semua)
+            order_by: 'count' (terbanyak dulu) atau 'bucket' (urut nilai)
+
+        Returns: List of (bucket, jumlah)
+        """
+        if metric not in STATS_METRICS:
+            raise ValueError(f"Statistik tidak dikenal: {metric}")
+        if order_by not in ('count', 'bucket'):
+            raise ValueError(f"Urutan tidak didukung: {order_by}")
+        p = self.PLACEHOLDER
+        order = "item_count DESC, bucket" if order_by == 'count' else "bucket"
+        query = f"""
+            SELECT bucket, item_count
+            FROM {STATS_TABLE}
+            WHERE metric = {p} AND item_count > 0
+            ORDER BY {order}
+        """
+        params = (metric,)
+        if limit is not None:
+            query += f" LIMIT {p}"
+            params += (limit,)
+        return self._fetch_all(query, params)
+
+    def rebuild_stats(self, batch_size=5000):
+        """
+        Menghitung ulang seluruh statistik dari nol dalam SATU kali baca per tabel
+        (semua metric satu tabel dihitung sekaligus), lalu mengganti isi tabel
+        statistik di transaksi yang sama. INSERT dari koneksi lain menunggu sampai selesai.
+        Returns: Dictionary metric -> jumlah kelompok
+        """
+        def work(cursor):
+            counts = Counter()
+            for table in CATALOG_TABLES:
+                metrics = [(metric, column) for metric, (source, column)
+                           in STATS_METRICS.items() if source == table]
+                if not metrics:
+                    continue
+                cursor.execute(f"SELECT {', '.join(column for _, column in metrics)} "
+                               f"FROM {table}{self.STATS_SHARE_LOCK}")
+                while True:
+                    rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        for position, (metric, _) in enumerate(metrics):
+                            counts[metric, stats_bucket(row[position])] += 1
+            cursor.execute(f"DELETE FROM {STATS_TABLE}")
+            cursor.executemany(self.STATS_UPSERT, sorted(
+                (metric, bucket, count) for (metric, bucket), count in counts.items()))
+            # Dihitung dari tabel: collation *_ci / NOCASE menggabungkan nama beda kapitalisasi
+            cursor.execute(f"SELECT metric, COUNT(*) FROM {STATS_TABLE} GROUP BY metric")
+            summary = {metric: 0 for metric in STATS_METRICS}
+            summary.update(dict(cursor.fetchall()))
+            return summary
+
+        return self._transaction(work, tables=(STATS_TABLE,))
+
+    def ping(self):
+        """True jika database bisa dihubungi (dipakai health check replica)"""
+        return self.current_timestamp() is not None
+
+    def prewarm(self):
+        """
+        Membuka koneksi (termasuk import driver) di thread latar belakang, misal
+        selagi menu pertama ditampilkan, agar query pertama tidak menunggu koneksi
+        Returns: Thread yang sedang berjalan
+        """
+        thread = threading.Thread(target=self.ping, name='db-prewarm', daemon=True)
+        thread.start()
+        return thread
+
+    def current_timestamp(self):
+        """
+        Waktu sekarang menurut database, sebanding dengan nilai kolom updated_at
+        (SQLite: teks 'YYYY-MM-DD HH:MM:SS' UTC, MySQL: datetime). Tidak lewat cache.
+        Returns: Timestamp, atau None jika gagal
+        """
+        rows = list(self._fetch_iter("SELECT CURRENT_TIMESTAMP"))
+        return rows[0][0] if rows else None
+
+    def changed_since(self, table, watermark=None, limit=1000):
+        """
+        Baris yang dibuat / diubah setelah watermark, terurut (updated_at, id)
+        Dibaca lewat index (updated_at, id) dan tidak lewat cache
+
+        Args:
+            watermark: (updated_at, id) baris terakhir yang sudah diproses;
+                       (updated_at, None) = semua baris SEBELUM updated_at tersebut;
+                       None = dari awal tabel
+            limit: Jumlah baris maksimal
+
+        Returns: List of tuples (kolom katalog..., updated_at)
+        """
+        columns = self._columns(table)
+        p = self.PLACEHOLDER
+        if watermark is None:
+            where, params = "", ()
+        elif watermark[1] is None:
+            where, params = f"WHERE updated_at >= {p}", (watermark[0],)
+        else:
+            # Keyset seperti list_page: (updated_at, id) > watermark
+            last_updated, last_id = watermark
+            where = f"WHERE updated_at >= {p} AND (updated_at > {p} OR id > {p})"
+            params = (last_updated, last_updated, last_id)
+        query = f"""
+            SELECT {columns}, updated_at
+            FROM {table}
+            {where}
+            ORDER BY updated_at, id
+            LIMIT {p}
+        """
+        return list(self._fetch_iter(query, params + (limit,)))
+
+    def invalidate_cache(self, *tables):
+        """
+        Membuang hasil baca yang di-cache engine (tanpa argumen: semua tabel)
+        Perlu dipanggil jika tabel diubah dari luar backend ini, misal oleh proses lain
+        """
+        pass
+
+    def get_query_stats(self, top=None):
+        """
+        Statistik query per statement jika engine mendukung instrumentasi
+        Returns: Dictionary (lihat QueryStats.snapshot) atau None
+        """
+        return None
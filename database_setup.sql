@@ -18,7 +18,9 @@ CREATE TABLE IF NOT EXISTS books (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_title (title),
-    INDEX idx_author (author)
+    INDEX idx_author (author),
+    INDEX idx_updated (updated_at, id),
+    FULLTEXT INDEX ft_books_search (title, author)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
 -- Tabel untuk Majalah
@@ -30,9 +32,37 @@ CREATE TABLE IF NOT EXISTS magazines (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
     INDEX idx_title (title),
-    INDEX idx_publisher (publisher)
+    INDEX idx_publisher (publisher),
+    INDEX idx_updated (updated_at, id),
+    FULLTEXT INDEX ft_magazines_search (title, publisher)
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
 
+-- Statistik katalog yang diperbarui aplikasi setiap INSERT
+-- metric: books_by_year / books_by_author / magazines_by_publisher
+-- bucket: nilai kelompok (tahun / nama), '' untuk NULL
+CREATE TABLE IF NOT EXISTS catalog_stats (
+    metric VARCHAR(32) NOT NULL,
+    bucket VARCHAR(255) NOT NULL,
+    item_count INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (metric, bucket),
+    INDEX idx_metric_count (metric, item_count)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+-- =====================================================
+-- MIGRASI: FULLTEXT INDEX UNTUK DATABASE YANG SUDAH ADA
+-- (jalankan sekali jika tabel dibuat sebelum index ini ditambahkan)
+-- =====================================================
+
+-- ALTER TABLE books ADD FULLTEXT INDEX ft_books_search (title, author);
+-- ALTER TABLE magazines ADD FULLTEXT INDEX ft_magazines_search (title, publisher);
+
+-- Index untuk sinkronisasi inkremental (baris yang berubah sejak watermark updated_at)
+-- ALTER TABLE books ADD INDEX idx_updated (updated_at, id);
+-- ALTER TABLE magazines ADD INDEX idx_updated (updated_at, id);
+
+-- Tabel catalog_stats: buat tabel di atas, lalu isi sekali lewat menu
+-- "Statistik Katalog" -> "Hitung Ulang" atau query di bagian data sample
+
 -- =====================================================
 -- DATA SAMPLE UNTUK TESTING (OPSIONAL)
 -- =====================================================
@@ -53,6 +83,15 @@ INSERT INTO magazines (title, publisher, issue_number) VALUES
 ('Wired', 'Condé Nast', 156),
 ('Scientific American', 'Springer Nature', 234);
 
+-- Statistik untuk data yang dimasukkan langsung lewat SQL (hasil sama dengan rebuild_stats)
+DELETE FROM catalog_stats;
+INSERT INTO catalog_stats (metric, bucket, item_count)
+SELECT 'books_by_year', COALESCE(CAST(year AS CHAR), ''), COUNT(*) FROM books GROUP BY 2;
+INSERT INTO catalog_stats (metric, bucket, item_count)
+SELECT 'books_by_author', author, COUNT(*) FROM books GROUP BY 2;
+INSERT INTO catalog_stats (metric, bucket, item_count)
+SELECT 'magazines_by_publisher', COALESCE(publisher, ''), COUNT(*) FROM magazines GROUP BY 2;
+
 -- =====================================================
 -- QUERY UNTUK VERIFIKASI
 -- =====================================================
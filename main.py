@@ -4,24 +4,210 @@ Main Entry Point - Aplikasi Sistem Manajemen Perpustakaan
 Demonstrasi lengkap konsep:
 - OOP: Abstraction, Inheritance, Polymorphism, Encapsulation
 - MVC: Model-View-Controller Architecture
-- Database Integration dengan MySQL
+- Database Integration dengan MySQL (atau SQLite tanpa server)
+
+Cara pakai:
+    python main.py                                  # Mode interaktif (console)
+    python main.py import book katalog.csv          # Import data massal
+    python main.py import book katalog.csv --workers 4              # Import paralel
+    python main.py export book buku.parquet --where "year>=2000"   # Export katalog
+    python main.py --engine sqlite --sqlite-path perpustakaan.db   # Tanpa server MySQL
+    python main.py serve --port 8080 --workers 8    # Service HTTP/JSON (kiosk, web)
+    python main.py --startup-profile                # Laporan waktu cold start
+    python main.py snapshot katalog.snap            # Tulis snapshot katalog (mmap)
+    python main.py --snapshot katalog.snap          # Baca katalog dari snapshot (bisa offline)
 """
 
-from views.console_view import ConsoleView
-from controllers.library_controller import LibraryController
+import time
 
+# Titik nol pengukuran startup (--startup-profile)
+STARTED = time.perf_counter()
 
-def main():
-    """
-    Function utama untuk menjalankan aplikasi
+import argparse
+
+from config import SERVICE_CONFIG, STARTUP_CONFIG
+
+
+def parse_args(argv=None):
+    """Parsing argumen command line"""
+    parser = argparse.ArgumentParser(description="Sistem Manajemen Perpustakaan")
+    parser.add_argument('--engine', choices=['mysql', 'sqlite'], default=None,
+                        help="Engine penyimpanan (default: STORAGE_CONFIG di config.py)")
+    parser.add_argument('--sqlite-path', default=None,
+                        help="File database SQLite, atau :memory:")
+    parser.add_argument('--snapshot', default=None, metavar='PATH',
+                        help="Baca katalog dari file snapshot (hanya-baca, tetap jalan saat database mati)")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="Ukur waktu import, time-to-menu dan time-to-first-query lalu keluar")
+    subparsers = parser.add_subparsers(dest='command')
     
-    Alur kerja:
-    1. Buat instance View
-    2. Buat instance Controller dengan View
-    3. Jalankan Controller (yang akan handle semua logic)
-    """
+    import_parser = subparsers.add_parser('import', help="Import data massal dari CSV / JSONL")
+    import_parser.add_argument('item_type', choices=['book', 'magazine'])
+    import_parser.add_argument('path', help="Path file .csv atau .jsonl")
+    import_parser.add_argument('--format', choices=['csv', 'jsonl'], default=None)
+    import_parser.add_argument('--batch-size', type=int, default=1000,
+                               help="Jumlah baris per multi-row INSERT")
+    import_parser.add_argument('--commit-every', type=int, default=10,
+                               help="Jumlah batch per transaksi")
+    import_parser.add_argument('--reject-file', default=None,
+                               help="Simpan baris yang ditolak ke file JSONL")
+    import_parser.add_argument('--workers', type=int, default=1,
+                               help="Jumlah proses paralel (file dibagi per rentang byte)")
     
-    print("""
+    export_parser = subparsers.add_parser('export', help="Export katalog ke CSV / JSONL / Parquet / Arrow")
+    export_parser.add_argument('item_type', choices=['book', 'magazine'])
+    export_parser.add_argument('path', help="File tujuan, misal buku.csv.gz atau buku.parquet")
+    export_parser.add_argument('--format', choices=['csv', 'jsonl', 'parquet', 'arrow'], default=None,
+                               help="Default: dari ekstensi file")
+    export_parser.add_argument('--compression', choices=['gzip', 'zstd'], default=None,
+                               help="Default: dari ekstensi file (.gz / .zst)")
+    export_parser.add_argument('--where', action='append', default=[], metavar='FILTER',
+                               help="Filter baris, misal year>=2000 atau author~Martin (boleh berulang)")
+    export_parser.add_argument('--batch-size', type=int, default=5000,
+                               help="Jumlah baris per write")
+    
+    serve_parser = subparsers.add_parser('serve', help="Jalankan katalog sebagai service HTTP/JSON")
+    serve_parser.add_argument('--host', default=SERVICE_CONFIG.get('host', '127.0.0.1'))
+    serve_parser.add_argument('--port', type=int, default=SERVICE_CONFIG.get('port', 8080))
+    serve_parser.add_argument('--workers', type=int, default=SERVICE_CONFIG.get('workers', 8),
+                              help="Jumlah request yang diproses bersamaan")
+    serve_parser.add_argument('--access-log', action='store_true',
+                              default=SERVICE_CONFIG.get('access_log', False),
+                              help="Tulis satu baris log per request")
+    
+    snapshot_parser = subparsers.add_parser('snapshot', help="Tulis snapshot katalog untuk --snapshot")
+    snapshot_parser.add_argument('path', help="File tujuan, misal katalog.snap")
+    
+    return parser.parse_args(argv)
+
+
+def run_import(args):
+    """Menjalankan import data massal dari command line"""
+    from services.bulk_importer import BulkImporter
+    from views.console_view import ConsoleView
+    from database.backend_factory import create_backend
+    
+    if args.workers > 1:
+        run_parallel_import(args)
+        return
+    
+    view = ConsoleView()
+    importer = BulkImporter(
+        storage=create_backend(args.engine, args.sqlite_path),
+        batch_size=args.batch_size,
+        commit_every=args.commit_every,
+        reject_file=args.reject_file
+    )
+    
+    def progress(report):
+        print(f"   ... {report.inserted:,} baris tersimpan "
+              f"({report.rows_per_second:,.0f} baris/detik)")
+    
+    report = importer.import_file(args.path, args.item_type, fmt=args.format, progress=progress)
+    view.show_import_report(report)
+    importer.storage.close()
+
+
+def run_parallel_import(args):
+    """Import data massal dengan beberapa proses worker"""
+    from services.parallel_loader import ParallelLoader
+    from views.console_view import ConsoleView
+    
+    view = ConsoleView()
+    loader = ParallelLoader(
+        engine=args.engine,
+        sqlite_path=args.sqlite_path,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        commit_every=args.commit_every,
+        reject_file=args.reject_file
+    )
+    
+    def progress(report):
+        print(f"   ... {report.chunks} rentang selesai, {report.inserted:,} baris tersimpan "
+              f"({report.rows_per_second:,.0f} baris/detik)")
+    
+    report = loader.load_file(args.path, args.item_type, fmt=args.format, progress=progress)
+    view.show_import_report(report)
+    view.show_load_consistency(report)
+
+
+def run_export(args):
+    """Menjalankan export katalog dari command line"""
+    from services.catalog_exporter import CatalogExporter, parse_filter
+    from views.console_view import ConsoleView
+    from database.backend_factory import create_backend
+    
+    view = ConsoleView()
+    try:
+        filters = [parse_filter(text, args.item_type) for text in args.where]
+    except ValueError as e:
+        view.show_error(str(e))
+        return
+    exporter = CatalogExporter(
+        storage=create_backend(args.engine, args.sqlite_path),
+        batch_size=args.batch_size
+    )
+    
+    def progress(report):
+        print(f"   ... {report.rows:,} baris ditulis ({report.rows_per_second:,.0f} baris/detik)")
+    
+    report = exporter.export(args.path, args.item_type, fmt=args.format,
+                             compression=args.compression, filters=filters, progress=progress)
+    view.show_export_report(report)
+    exporter.storage.close()
+
+
+def run_snapshot(args):
+    """Menulis snapshot katalog dari database (satu kali scan per tabel)"""
+    from views.console_view import ConsoleView
+    from database.backend_factory import create_backend
+    from database.snapshot_backend import SnapshotError, write_snapshot
+    
+    view = ConsoleView()
+    storage = create_backend(args.engine, args.sqlite_path)
+    try:
+        report = write_snapshot(storage, args.path)
+    except SnapshotError as e:
+        view.show_error(f"Snapshot gagal: {e}")
+        return
+    finally:
+        storage.close()
+    rows = ", ".join(f"{table} {count:,}" for table, count in report['rows'].items())
+    view.show_success(f"Snapshot ditulis ke {report['path']}: {rows} baris, "
+                      f"{report['bytes'] / 1024 / 1024:.2f} MB, {report['elapsed']:.2f} detik")
+
+
+def run_serve(args):
+    """Menjalankan service HTTP/JSON (Controller yang sama, View JSON)"""
+    from services.http_service import CatalogService
+    from views.json_view import JsonView
+    from controllers.library_controller import LibraryController
+    from database.backend_factory import create_backend
+    
+    controller = LibraryController(JsonView(), create_backend(args.engine, args.sqlite_path))
+    service = CatalogService(
+        controller,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        max_body_bytes=SERVICE_CONFIG.get('max_body_bytes', 64 * 1024),
+        metrics_window=SERVICE_CONFIG.get('metrics_window', 2048),
+        access_log=args.access_log,
+        request_timeout=SERVICE_CONFIG.get('request_timeout', 10.0),
+        max_pending=SERVICE_CONFIG.get('max_pending')
+    )
+    print(f"✅ Service berjalan di {service.url} ({args.workers} worker), Ctrl+C untuk berhenti")
+    try:
+        service.serve_forever()
+    finally:
+        controller.close()
+        # Pesan controller saat shutdown (misal sisa antrian write-behind)
+        for kind, message in controller.view.messages:
+            print(f"{'❌' if kind == 'error' else 'ℹ️ '} {message}")
+
+
+BANNER = """
     ╔════════════════════════════════════════════════════╗
     ║                                                    ║
     ║      SISTEM MANAJEMEN PERPUSTAKAAN SEDERHANA      ║
@@ -33,18 +219,113 @@ def main():
     ║  ✓ Model-View-Controller Pattern                  ║
     ║                                                    ║
     ╚════════════════════════════════════════════════════╝
-    """)
+    """
+
+
+def create_console_controller(args):
+    """
+    View + Controller untuk mode console
+    Koneksi database dibuka di latar belakang (STARTUP_CONFIG['prewarm']) dan
+    index pencarian dibangun di latar belakang (STARTUP_CONFIG['defer_indexes'])
+    selagi menu ditampilkan
+    """
+    from views.console_view import ConsoleView
+    from controllers.library_controller import LibraryController
+    from database.backend_factory import create_backend
+    
+    view = ConsoleView()
+    if args.snapshot:
+        storage = open_snapshot(args, view)
+    else:
+        storage = create_backend(args.engine, args.sqlite_path)
+        if STARTUP_CONFIG.get('prewarm', True):
+            storage.prewarm()
+    return LibraryController(view, storage,
+                             defer_indexes=STARTUP_CONFIG.get('defer_indexes', True))
+
+
+def open_snapshot(args, view):
+    """SnapshotBackend untuk --snapshot, beserta pesan status database / kesegaran"""
+    from database.backend_factory import create_snapshot_backend
+    
+    storage, stale = create_snapshot_backend(args.snapshot, args.engine, args.sqlite_path)
+    if stale is None:
+        view.show_info(f"Database tidak terhubung: katalog dibaca dari snapshot {args.snapshot} "
+                       "(hanya-baca)")
+    elif stale:
+        view.show_info(f"Snapshot tertinggal untuk {', '.join(stale)}: tabel tersebut dibaca dari "
+                       f"database. Perbarui dengan: python main.py snapshot {args.snapshot}")
+    return storage
+
+
+def run_console(args):
+    """
+    Menjalankan aplikasi interaktif
+    
+    Alur kerja:
+    1. Buat instance View
+    2. Buat instance Controller dengan View
+    3. Jalankan Controller (yang akan handle semua logic)
+    """
+    
+    print(BANNER)
+    
+    # Inisialisasi View dan Controller
+    # Controller akan mengelola Model dan komunikasi View-Model
+    controller = create_console_controller(args)
+    
+    # Jalankan aplikasi
+    controller.run()
+
+
+def run_startup_profile(args):
+    """
+    Mengukur cold start mode console tanpa menunggu input: import modul,
+    backend & controller siap, menu tampil, query pertama, index selesai
+    """
+    from services.startup_profile import ImportTimer, StartupProfile
     
+    timer = ImportTimer().install()
+    profile = StartupProfile(STARTED, timer)
+    profile.mark("argumen diproses")
     try:
-        # Inisialisasi View
-        view = ConsoleView()
-        
-        # Inisialisasi Controller dengan View
-        # Controller akan mengelola Model dan komunikasi View-Model
-        controller = LibraryController(view)
-        
-        # Jalankan aplikasi
-        controller.run()
+        controller = create_console_controller(args)
+    finally:
+        timer.uninstall()
+    profile.mark("controller siap")
+    
+    print(BANNER)
+    controller.view.show_header()
+    controller.view.show_main_menu()
+    profile.mark("menu tampil (time-to-menu)")
+    try:
+        controller.get_books_page()
+        profile.mark("query pertama (time-to-first-query)")
+        if controller.index_builder is not None:
+            controller.index_builder.join()
+            profile.mark("index pencarian siap")
+    finally:
+        controller.close()
+    controller.view.show_startup_profile(profile.report())
+
+
+def main(argv=None):
+    """Function utama untuk menjalankan aplikasi"""
+    args = parse_args(argv)
+    
+    try:
+        if args.command == 'import':
+            run_import(args)
+        elif args.command == 'export':
+            run_export(args)
+        elif args.command == 'serve':
+            run_serve(args)
+        elif args.command == 'snapshot':
+            run_snapshot(args)
+        elif args.startup_profile:
+            run_startup_profile(args)
+        else:
+            run_console(args)
         
     except KeyboardInterrupt:
         print("\n\n⚠️  Aplikasi dihentikan oleh user (Ctrl+C)")
@@ -6,6 +6,10 @@ Demonstrasi ABSTRACTION dan ENCAPSULATION
 from abc import ABC, abstractmethod
 
 
+# Nilai maksimal kolom INT di database (year, issue_number)
+MAX_INT = 2147483647
+
+
 class Item(ABC):
     """
     Abstract Base Class untuk semua item di perpustakaan
@@ -13,8 +17,19 @@ class Item(ABC):
     Konsep OOP yang diterapkan:
     1. ABSTRACTION: Class abstract yang memaksa child class mengimplementasi method tertentu
     2. ENCAPSULATION: Attribute private (__id) yang diakses via getter/setter
+    
+    __slots__ dipakai agar setiap object tidak membawa __dict__ sendiri,
+    sehingga jutaan object hasil query tetap hemat memory.
     """
     
+    __slots__ = ('__id', '_title')
+    
+    # Judul kolom untuk tampilan tabel (satu baris per item), lihat display_row()
+    ROW_HEADER = f"{'ID':>6}  JUDUL"
+    
+    # Nama jenis item untuk tampilan gabungan (katalog semua jenis)
+    KIND = "Item"
+    
     def __init__(self, title):
         self.__id = None  # Private attribute (ENCAPSULATION)
         self._title = title  # Protected attribute
@@ -39,6 +54,23 @@ class Item(ABC):
         else:
             raise ValueError("Title tidak boleh kosong")
     
+    def validate(self):
+        """
+        Validasi seluruh attribute sebelum disimpan ke database
+        Memakai setter yang sama sehingga aturan validasi tidak ditulis dua kali
+        Raises: ValueError jika ada data yang tidak valid
+        """
+        self.set_title(self._title)
+        if len(self._title) > 255:
+            raise ValueError("Title maksimal 255 karakter")
+    
+    def display_row(self):
+        """
+        Ringkasan satu baris untuk tampilan tabel (kolom sesuai ROW_HEADER)
+        Child class sebaiknya override agar kolom khususnya ikut tampil
+        """
+        return f"{self.get_id() or '-':>6}  {self._title}"
+    
     @abstractmethod
     def display_info(self):
         """
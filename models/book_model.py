@@ -3,7 +3,7 @@ Book Model - Model untuk data Buku
 Demonstrasi INHERITANCE dan POLYMORPHISM
 """
 
-from models.base_model import Item
+from models.base_model import Item, MAX_INT
 
 
 class Book(Item):
@@ -16,6 +16,11 @@ class Book(Item):
     3. ENCAPSULATION: Menggunakan private attributes
     """
     
+    __slots__ = ('__author', '__year', '__isbn')
+    
+    ROW_HEADER = f"{'ID':>6}  {'JUDUL':<38} {'PENULIS':<22} {'TAHUN':>5}  ISBN"
+    KIND = "Buku"
+    
     def __init__(self, title, author, year=None, isbn=None):
         super().__init__(title)  # Memanggil constructor parent (INHERITANCE)
         self.__author = author
@@ -36,10 +41,10 @@ class Book(Item):
         return self.__year
     
     def set_year(self, year):
-        if year is None or (isinstance(year, int) and year > 0):
+        if year is None or (isinstance(year, int) and 0 < year <= MAX_INT):
             self.__year = year
         else:
-            raise ValueError("Year harus berupa angka positif")
+            raise ValueError(f"Year harus berupa angka positif (maksimal {MAX_INT})")
     
     def get_isbn(self):
         return self.__isbn
@@ -53,13 +58,37 @@ class Book(Item):
         Override method dari parent class
         Ini contoh POLYMORPHISM
         """
-        info = f"📚 Buku: {self.get_title()}\n"
-        info += f"   Penulis: {self.__author}\n"
+        lines = [f"📚 Buku: {self.get_title()}", f"   Penulis: {self.__author}"]
         if self.__year:
-            info += f"   Tahun: {self.__year}\n"
+            lines.append(f"   Tahun: {self.__year}")
         if self.__isbn:
-            info += f"   ISBN: {self.__isbn}\n"
-        return info
+            lines.append(f"   ISBN: {self.__isbn}")
+        lines.append("")
+        return "\n".join(lines)
+    
+    def display_row(self):
+        """Ringkasan satu baris (POLYMORPHISM), kolom sesuai ROW_HEADER"""
+        return Book.format_row((self.get_id(), self.get_title(), self.__author,
+                                self.__year, self.__isbn))
+    
+    @staticmethod
+    def format_row(row):
+        """
+        Format satu baris tabel langsung dari row database (id, title, author, year, isbn)
+        Dipakai juga oleh BookRow agar tidak perlu membuat object Book
+        """
+        return (f"{row[0] or '-':>6}  {row[1]:<38.38} {row[2] or '':<22.22} "
+                f"{row[3] or '':>5}  {row[4] or ''}")
+    
+    def validate(self):
+        """Validasi data buku (title, author, year)"""
+        super().validate()
+        self.set_author(self.__author)
+        if len(self.__author) > 255:
+            raise ValueError("Author maksimal 255 karakter")
+        self.set_year(self.__year)
+        if self.__isbn is not None and len(str(self.__isbn)) > 50:
+            raise ValueError("ISBN maksimal 50 karakter")
     
     def to_dict(self):
         """Convert object ke dictionary untuk database"""
@@ -75,12 +104,23 @@ class Book(Item):
         """
         Factory method untuk membuat object Book dari hasil query database
         row format: (id, title, author, year, isbn)
+        
+        Argumen posisional (title, author, year, isbn) dipakai karena method ini
+        dipanggil sekali per baris hasil query
         """
-        book = Book(
-            title=row[1],
-            author=row[2],
-            year=row[3],
-            isbn=row[4]
-        )
+        book = Book(row[1], row[2], row[3], row[4])
         book.set_id(row[0])
-        return book
\ No newline at end of file
+        return book
+    
+    @staticmethod
+    def from_dict(data):
+        """
+        Factory method untuk membuat object Book dari dictionary
+        Kebalikan dari to_dict(), dipakai oleh import data massal
+        """
+        return Book(
+            title=data.get('title'),
+            author=data.get('author'),
+            year=data.get('year'),
+            isbn=data.get('isbn')
+        )
\ No newline at end of file
@@ -3,7 +3,7 @@ Magazine Model - Model untuk data Majalah
 Demonstrasi INHERITANCE dan POLYMORPHISM
 """
 
-from models.base_model import Item
+from models.base_model import Item, MAX_INT
 
 
 class Magazine(Item):
@@ -17,6 +17,11 @@ class Magazine(Item):
     3. ENCAPSULATION: Private attributes
     """
     
+    __slots__ = ('__publisher', '__issue_number')
+    
+    ROW_HEADER = f"{'ID':>6}  {'JUDUL':<38} {'PENERBIT':<22} EDISI"
+    KIND = "Majalah"
+    
     def __init__(self, title, publisher=None, issue_number=None):
         super().__init__(title)
         self.__publisher = publisher
@@ -33,10 +38,10 @@ class Magazine(Item):
         return self.__issue_number
     
     def set_issue_number(self, issue_number):
-        if issue_number is None or (isinstance(issue_number, int) and issue_number > 0):
+        if issue_number is None or (isinstance(issue_number, int) and 0 < issue_number <= MAX_INT):
             self.__issue_number = issue_number
         else:
-            raise ValueError("Issue number harus berupa angka positif")
+            raise ValueError(f"Issue number harus berupa angka positif (maksimal {MAX_INT})")
     
     # Implementasi abstract method dari parent (POLYMORPHISM)
     def display_info(self):
@@ -44,12 +49,34 @@ class Magazine(Item):
         Override method dari parent class
         Implementasi berbeda dengan Book (POLYMORPHISM)
         """
-        info = f"📰 Majalah: {self.get_title()}\n"
+        lines = [f"📰 Majalah: {self.get_title()}"]
         if self.__publisher:
-            info += f"   Penerbit: {self.__publisher}\n"
+            lines.append(f"   Penerbit: {self.__publisher}")
         if self.__issue_number:
-            info += f"   Edisi: #{self.__issue_number}\n"
-        return info
+            lines.append(f"   Edisi: #{self.__issue_number}")
+        lines.append("")
+        return "\n".join(lines)
+    
+    def display_row(self):
+        """Ringkasan satu baris (POLYMORPHISM), kolom sesuai ROW_HEADER"""
+        return Magazine.format_row((self.get_id(), self.get_title(), self.__publisher,
+                                    self.__issue_number))
+    
+    @staticmethod
+    def format_row(row):
+        """
+        Format satu baris tabel langsung dari row database (id, title, publisher, issue_number)
+        Dipakai juga oleh MagazineRow agar tidak perlu membuat object Magazine
+        """
+        issue = f"#{row[3]}" if row[3] else ""
+        return f"{row[0] or '-':>6}  {row[1]:<38.38} {row[2] or '':<22.22} {issue}"
+    
+    def validate(self):
+        """Validasi data majalah (title, issue_number)"""
+        super().validate()
+        if self.__publisher is not None and len(self.__publisher) > 255:
+            raise ValueError("Publisher maksimal 255 karakter")
+        self.set_issue_number(self.__issue_number)
     
     def to_dict(self):
         """Convert object ke dictionary untuk database"""
@@ -64,11 +91,22 @@ class Magazine(Item):
         """
         Factory method untuk membuat object Magazine dari hasil query database
         row format: (id, title, publisher, issue_number)
+        
+        Argumen posisional (title, publisher, issue_number) dipakai karena method
+        ini dipanggil sekali per baris hasil query
         """
-        magazine = Magazine(
-            title=row[1],
-            publisher=row[2],
-            issue_number=row[3]
-        )
+        magazine = Magazine(row[1], row[2], row[3])
         magazine.set_id(row[0])
-        return magazine
\ No newline at end of file
+        return magazine
+    
+    @staticmethod
+    def from_dict(data):
+        """
+        Factory method untuk membuat object Magazine dari dictionary
+        Kebalikan dari to_dict(), dipakai oleh import data massal
+        """
+        return Magazine(
+            title=data.get('title'),
+            publisher=data.get('publisher'),
+            issue_number=data.get('issue_number')
+        )
\ No newline at end of file
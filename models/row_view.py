@@ -0,0 +1,129 @@
+"""
+Row View - Pembungkus ringan untuk row database (lazy hydration)
+Object Book / Magazine baru dibuat saat benar-benar dibutuhkan
+"""
+
+from models.book_model import Book
+from models.magazine_model import Magazine
+
+
+class ItemRow:
+    """
+    Tampilan read-only atas tuple hasil query
+
+    Getter membaca langsung dari tuple tanpa membuat object Model.
+    Method lain (display_info, to_dict, setter) membuat object Model sekali
+    lalu menyimpannya (materialize), sehingga perilakunya sama persis dengan Model.
+    """
+
+    __slots__ = ('_row', '_item')
+
+    MODEL = None
+
+    def __init__(self, row):
+        self._row = row
+        self._item = None
+
+    def materialize(self):
+        """Membuat (sekali) object Model lengkap dari row"""
+        if self._item is None:
+            self._item = self.MODEL.from_db_row(self._row)
+        return self._item
+
+    def _field(self, position, getter):
+        # Setelah materialize, object Model adalah sumber data (setter mungkin sudah dipanggil)
+        item = self._item
+        return self._row[position] if item is None else getter(item)
+
+    def get_id(self):
+        return self._field(0, self.MODEL.get_id)
+
+    def get_title(self):
+        return self._field(1, self.MODEL.get_title)
+
+    def display_info(self):
+        return self.materialize().display_info()
+
+    def display_row(self):
+        # Tampilan tabel cukup membaca tuple, object Model tidak perlu dibuat
+        item = self._item
+        return self.MODEL.format_row(self._row) if item is None else item.display_row()
+
+    def to_dict(self):
+        return self.materialize().to_dict()
+
+    def __getattr__(self, name):
+        # Dipanggil hanya untuk attribute yang tidak ada di row view (misal setter)
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.materialize(), name)
+
+    def __str__(self):
+        return f"{self.MODEL.__name__}: {self.get_title()}"
+
+
+class BookRow(ItemRow):
+    """Row view untuk buku, row format: (id, title, author, year, isbn)"""
+
+    __slots__ = ()
+
+    MODEL = Book
+    ROW_HEADER = Book.ROW_HEADER
+    KIND = Book.KIND
+
+    def get_author(self):
+        return self._field(2, Book.get_author)
+
+    def get_year(self):
+        return self._field(3, Book.get_year)
+
+    def get_isbn(self):
+        return self._field(4, Book.get_isbn)
+
+
+class MagazineRow(ItemRow):
+    """Row view untuk majalah, row format: (id, title, publisher, issue_number)"""
+
+    __slots__ = ()
+
+    MODEL = Magazine
+    ROW_HEADER = Magazine.ROW_HEADER
+    KIND = Magazine.KIND
+
+    def get_publisher(self):
+        return self._field(2, Magazine.get_publisher)
+
+    def get_issue_number(self):
+        return self._field(3, Magazine.get_issue_number)
+
+
+class CatalogEntry:
+    """
+    Item di daftar gabungan buku + majalah
+    Semua jenis memakai satu judul kolom (kolom pertama = jenis item), sehingga
+    tampilan tabel tidak mengulang header setiap kali jenis item berganti.
+    Method lain diteruskan ke item aslinya.
+    """
+
+    __slots__ = ('item',)
+
+    ROW_HEADER = f"{'JENIS':<7} {'ID':>6}  {'JUDUL':<38} {'PENULIS/PENERBIT':<22} KETERANGAN"
+
+    def __init__(self, item):
+        self.item = item
+
+    def display_row(self):
+        return f"{self.item.KIND:<7} {self.item.display_row()}"
+
+    def __getattr__(self, name):
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.item, name)
+
+    def __str__(self):
+        return str(self.item)
+
+
+# Row view diakui sebagai Book / Magazine (POLYMORPHISM tanpa pewarisan langsung)
+Book.register(BookRow)
+Magazine.register(MagazineRow)
@@ -0,0 +1 @@
+"""Search package"""
\ No newline at end of file
@@ -0,0 +1,241 @@
+"""
+Inverted Index - Index pencarian full-text di memory
+Dipakai sebagai pengganti LIKE '%kata%' yang selalu full table scan
+"""
+
+import heapq
+import math
+import re
+from array import array
+
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text):
+    """Pecah teks menjadi token huruf kecil (casefold agar 'É' == 'é')"""
+    if not text:
+        return []
+    return TOKEN_PATTERN.findall(str(text).casefold())
+
+
+class InvertedIndex:
+    """
+    Inverted index dengan ranking BM25
+
+    Setiap term menyimpan posting list berupa array nomor dokumen internal
+    dan frekuensi term (tf). Array dipakai (bukan dict per dokumen) agar
+    jutaan posting tetap hemat memory.
+
+    Field bisa diberi bobot, misal title lebih penting dari author:
+        InvertedIndex(fields={'title': 2, 'author': 1})
+
+    Update dan hapus memakai tombstone: dokumen lama ditandai mati dan
+    dilewati saat search, lalu posting list dipadatkan (compact) setelah
+    dokumen mati melebihi COMPACT_RATIO dari seluruh dokumen.
+    """
+
+    K1 = 1.2
+    B = 0.75
+    COMPACT_RATIO = 0.2
+
+    def __init__(self, fields):
+        """
+        Args:
+            fields: Dictionary nama_field -> bobot (int)
+        """
+        self.__fields = dict(fields)
+        self.__postings = {}             # term -> (array doc_no, array tf)
+        self.__doc_ids = array('q')      # doc_no -> id di database
+        self.__doc_lengths = array('I')  # doc_no -> panjang dokumen (berbobot)
+        self.__payloads = []             # doc_no -> data yang dikembalikan saat search
+        self.__live = bytearray()        # doc_no -> 1 jika masih berlaku, 0 jika tombstone
+        self.__doc_numbers = {}          # id di database -> doc_no yang berlaku
+        self.__dead = 0
+        self.__total_length = 0
+        self.__norms = None              # Cache normalisasi panjang BM25 per dokumen
+        self.__norms_avg = 1.0           # Rata-rata panjang saat cache dibangun
+        self.__norms_built_at = 0        # Jumlah dokumen saat cache dibangun
+
+    def __len__(self):
+        return len(self.__doc_ids) - self.__dead
+
+    def __contains__(self, doc_id):
+        return doc_id in self.__doc_numbers
+
+    def add(self, doc_id, values, payload=None):
+        """
+        Menambahkan satu dokumen ke index
+        Jika doc_id sudah ada, versi lama diganti (update)
+
+        Args:
+            doc_id: Primary key di database
+            values: Dictionary nama_field -> teks
+            payload: Data yang dikembalikan saat dokumen cocok (misal row database)
+        """
+        if doc_id in self.__doc_numbers:
+            self.remove(doc_id)
+
+        frequencies = {}
+        length = 0
+        for field, weight in self.__fields.items():
+            for term in tokenize(values.get(field)):
+                frequencies[term] = frequencies.get(term, 0) + weight
+                length += weight
+
+        doc_no = len(self.__doc_ids)
+        self.__doc_ids.append(doc_id)
+        self.__doc_lengths.append(length)
+        self.__payloads.append(payload)
+        self.__live.append(1)
+        self.__doc_numbers[doc_id] = doc_no
+        self.__total_length += length
+        if self.__norms is not None:
+            # Insert tunggal tidak membangun ulang cache; rata-rata lama masih cukup akurat
+            self.__norms.append(self.K1 * (1 - self.B + self.B * length / self.__norms_avg))
+
+        for term, tf in frequencies.items():
+            posting = self.__postings.get(term)
+            if posting is None:
+                posting = (array('I'), array('H'))
+                self.__postings[term] = posting
+            posting[0].append(doc_no)
+            posting[1].append(min(tf, 65535))
+
+    def update(self, doc_id, values, payload=None):
+        """Mengganti isi dokumen (sama dengan add untuk doc_id yang sudah ada)"""
+        self.add(doc_id, values, payload)
+
+    def remove(self, doc_id):
+        """
+        Menghapus dokumen dari hasil pencarian
+        Returns: True jika dokumen ada, False jika tidak ditemukan
+        """
+        doc_no = self.__doc_numbers.pop(doc_id, None)
+        if doc_no is None:
+            return False
+        self.__live[doc_no] = 0
+        self.__payloads[doc_no] = None
+        self.__total_length -= self.__doc_lengths[doc_no]
+        self.__dead += 1
+        if self.__dead > len(self.__doc_ids) * self.COMPACT_RATIO:
+            self.compact()
+        return True
+
+    def clear(self):
+        """Mengosongkan index (misal sebelum full resync)"""
+        self.__init__(self.__fields)
+
+    def compact(self):
+        """
+        Membuang tombstone: nomor dokumen disusun ulang dan posting list
+        dokumen mati dihapus. Biayanya sebanding ukuran index, jadi hanya
+        dijalankan setelah cukup banyak dokumen mati.
+        """
+        live = self.__live
+        renumber = array('q', [-1]) * len(self.__doc_ids)
+        doc_ids = array('q')
+        doc_lengths = array('I')
+        payloads = []
+        for doc_no, alive in enumerate(live):
+            if alive:
+                renumber[doc_no] = len(doc_ids)
+                doc_ids.append(self.__doc_ids[doc_no])
+                doc_lengths.append(self.__doc_lengths[doc_no])
+                payloads.append(self.__payloads[doc_no])
+
+        postings = {}
+        for term, (docs, tfs) in self.__postings.items():
+            new_docs = array('I')
+            new_tfs = array('H')
+            for doc_no, tf in zip(docs, tfs):
+                if live[doc_no]:
+                    new_docs.append(renumber[doc_no])
+                    new_tfs.append(tf)
+            if new_docs:
+                postings[term] = (new_docs, new_tfs)
+
+        self.__postings = postings
+        self.__doc_ids = doc_ids
+        self.__doc_lengths = doc_lengths
+        self.__payloads = payloads
+        self.__live = bytearray(b"\x01") * len(doc_ids)
+        self.__doc_numbers = {doc_id: doc_no for doc_no, doc_id in enumerate(doc_ids)}
+        self.__dead = 0
+        self.__norms = None
+
+    def search(self, query, k=50, match_all=False):
+        """
+        Mencari dokumen yang paling relevan
+
+        Args:
+            query: Satu atau beberapa kata kunci
+            k: Jumlah hasil teratas yang dikembalikan
+            match_all: True = semua kata harus ada (AND), False = salah satu (OR)
+
+        Returns: List of (score, doc_id, payload) terurut score tertinggi
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        doc_count = len(self)
+        if not terms or doc_count == 0:
+            return []
+
+        norms = self.__get_norms()
+        scores = {}
+        matched_terms = {}
+        k1 = self.K1
+        get_score = scores.get
+
+        for term in terms:
+            posting = self.__postings.get(term)
+            if posting is None:
+                if match_all:
+                    return []
+                continue
+            docs, tfs = posting
+            df = len(docs)
+            idf = math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+            weight = idf * (k1 + 1)
+            for doc_no, tf in zip(docs, tfs):
+                scores[doc_no] = get_score(doc_no, 0.0) + weight * tf / (tf + norms[doc_no])
+                if match_all:
+                    matched_terms[doc_no] = matched_terms.get(doc_no, 0) + 1
+
+        live = self.__live
+        if match_all:
+            needed = len(terms)
+            candidates = ((s, d) for d, s in scores.items() if matched_terms[d] == needed and live[d])
+        elif self.__dead:
+            candidates = ((s, d) for d, s in scores.items() if live[d])
+        else:
+            candidates = ((s, d) for d, s in scores.items())
+
+        # Skor sama: dokumen yang lebih dulu masuk index didahulukan
+        top = heapq.nlargest(k, candidates, key=lambda pair: (pair[0], -pair[1]))
+        return [(score, self.__doc_ids[doc_no], self.__payloads[doc_no]) for score, doc_no in top]
+
+    def __get_norms(self):
+        """
+        Faktor k1 * (1 - b + b * panjang / rata-rata) per dokumen
+        Dibangun ulang hanya jika jumlah dokumen sudah tumbuh lebih dari 1%
+        """
+        doc_count = len(self.__doc_lengths)
+        if self.__norms is None or doc_count > self.__norms_built_at * 1.01:
+            live_count = doc_count - self.__dead
+            avg_length = (self.__total_length / live_count) if live_count else 1.0
+            avg_length = avg_length or 1.0
+            k1, b = self.K1, self.B
+            self.__norms = array('d', (k1 * (1 - b + b * length / avg_length)
+                                       for length in self.__doc_lengths))
+            self.__norms_avg = avg_length
+            self.__norms_built_at = doc_count
+        return self.__norms
+
+    def get_stats(self):
+        """Statistik ukuran index"""
+        return {
+            'documents': len(self),
+            'tombstones': self.__dead,
+            'terms': len(self.__postings),
+            'postings': sum(len(docs) for docs, _ in self.__postings.values())
+        }
@@ -0,0 +1,327 @@
+"""
+Prefix Index - Autocomplete judul / penulis / penerbit di memory
+Pengganti LIKE 'kata%' (scan) untuk saran kata kunci saat user mengetik
+"""
+
+import bisect
+import heapq
+import sys
+from array import array
+
+
+# Batas atas untuk bisect: semua teks berawalan `prefix` < prefix + MAX_CHAR
+MAX_CHAR = chr(sys.maxunicode)
+
+
+def normalize(text):
+    """Teks pembanding autocomplete: huruf kecil (casefold) dan spasi dirapikan"""
+    if not text:
+        return ""
+    return " ".join(str(text).casefold().split())
+
+
+class _SortedKeys:
+    """Urutan key ternormalisasi di atas heap teks, agar bisa di-bisect tanpa list key"""
+
+    __slots__ = ('text', 'offsets')
+
+    def __init__(self, text, offsets):
+        self.text = text
+        self.offsets = offsets
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, position):
+        return normalize(self.text[self.offsets[position]:self.offsets[position + 1]])
+
+
+class PrefixIndex:
+    """
+    Index prefix untuk autocomplete dengan ranking popularitas
+
+    Setiap entri adalah satu teks unik (setelah normalize) dari field yang
+    di-index, misal judul atau nama penulis. Popularitas = jumlah item yang
+    memakai teks itu (penulis dengan 40 buku lebih dulu disarankan).
+
+    Struktur utama (dibangun ulang sesekali oleh compact):
+    - Semua teks tampilan disambung menjadi satu string terurut key, dengan
+      array offset (bukan jutaan object str), dicari lewat binary search
+    - Segment tree (array max count) di atas urutan itu: top-k satu rentang
+      prefix diambil dengan heap tanpa membaca semua entri di rentang
+
+    Teks baru setelah compact masuk ke list kecil terurut (extra) dan ikut
+    dicari; extra digabung ke struktur utama setelah melebihi
+    REBUILD_RATIO dari jumlah entri (minimal MIN_REBUILD).
+    """
+
+    REBUILD_RATIO = 0.01
+    MIN_REBUILD = 1000
+
+    def __init__(self, fields):
+        """
+        Args:
+            fields: Nama field yang di-index, misal ['title', 'author']
+        """
+        self.__fields = tuple(fields)
+        self.__text = ""
+        self.__offsets = array('I', [0])
+        self.__kinds = bytearray()     # posisi -> bitmask field (bit i = fields[i])
+        self.__size = 1                # Jumlah daun segment tree (pangkat dua)
+        self.__tree = array('I', [0, 0])
+        self.__keys = _SortedKeys(self.__text, self.__offsets)
+        self.__extra = {}              # key -> [teks tampilan, bitmask, count]
+        self.__extra_keys = []         # key extra terurut; None = perlu diurutkan
+        self.__additions = 0
+
+    def __len__(self):
+        return len(self.__keys) + len(self.__extra)
+
+    # ========== UPDATE ==========
+
+    def add(self, values):
+        """
+        Menambahkan satu item (count setiap teksnya bertambah 1)
+
+        Args:
+            values: Dictionary nama_field -> teks (field lain diabaikan)
+        """
+        for bit, field in enumerate(self.__fields):
+            display = values.get(field)
+            key = normalize(display)
+            if key:
+                self.__add_term(key, " ".join(str(display).split()), 1 << bit)
+        self.__additions += 1
+
+    def extend(self, items):
+        """
+        Menambahkan banyak item sekaligus (satu kali scan), lalu compact
+        Args:
+            items: Iterable of dictionary nama_field -> teks
+        """
+        for values in items:
+            self.add(values)
+        self.compact()
+
+    def __add_term(self, key, display, kind):
+        position = self.__find(key)
+        if position is not None:
+            self.__kinds[position] |= kind
+            node = self.__size + position
+            count = self.__tree[node] + 1
+            # Naikkan nilai max sampai ke root (hanya selama masih berubah)
+            while node and self.__tree[node] < count:
+                self.__tree[node] = count
+                node >>= 1
+            return
+
+        entry = self.__extra.get(key)
+        if entry is not None:
+            entry[1] |= kind
+            entry[2] += 1
+            return
+        self.__extra[key] = [display, kind, 1]
+        if self.__extra_keys is not None:
+            if len(self.__extra) <= self.__rebuild_limit():
+                bisect.insort(self.__extra_keys, key)
+            else:
+                # Load massal: urutkan sekali saat dibutuhkan, bukan insort per teks
+                self.__extra_keys = None
+
+    def __find(self, key):
+        keys = self.__keys
+        position = bisect.bisect_left(keys, key)
+        if position < len(keys) and keys[position] == key:
+            return position
+        return None
+
+    def __rebuild_limit(self):
+        return max(self.MIN_REBUILD, int(len(self.__keys) * self.REBUILD_RATIO))
+
+    def compact(self):
+        """Menggabungkan extra ke struktur utama (heap teks + segment tree baru)"""
+        if not self.__extra:
+            self.__extra_keys = []
+            return
+        keys = self.__keys
+        counts = self.__tree
+        size = self.__size
+        current = ((keys[position], keys.text[keys.offsets[position]:keys.offsets[position + 1]],
+                    self.__kinds[position], counts[size + position])
+                   for position in range(len(keys)))
+        additions = ((key, *self.__extra[key]) for key in sorted(self.__extra))
+        merged = heapq.merge(current, additions, key=lambda entry: entry[0])
+
+        parts = []
+        offsets = array('I', [0])
+        kinds = bytearray()
+        leaf_counts = array('I')
+        length = 0
+        for _, display, kind, count in merged:
+            parts.append(display)
+            length += len(display)
+            offsets.append(length)
+            kinds.append(kind)
+            leaf_counts.append(count)
+
+        size = 1
+        while size < len(leaf_counts):
+            size *= 2
+        tree = array('I', bytes(4 * size)) + leaf_counts + array('I', bytes(4 * (size - len(leaf_counts))))
+        for node in range(size - 1, 0, -1):
+            left, right = tree[2 * node], tree[2 * node + 1]
+            tree[node] = left if left >= right else right
+
+        self.__text = "".join(parts)
+        self.__offsets = offsets
+        self.__kinds = kinds
+        self.__size = size
+        self.__tree = tree
+        self.__keys = _SortedKeys(self.__text, offsets)
+        self.__extra = {}
+        self.__extra_keys = []
+
+    def clear(self):
+        """Mengosongkan index (misal sebelum full resync)"""
+        self.__init__(self.__fields)
+
+    # ========== QUERY ==========
+
+    def suggest(self, prefix, k=10):
+        """
+        Teks berawalan `prefix` dengan count terbesar
+
+        Args:
+            prefix: Ketikan user (tidak peka huruf besar / kecil dan spasi ganda)
+            k: Jumlah saran maksimal
+
+        Returns: List of (teks, count, tuple nama field) urut count lalu abjad
+        """
+        key = normalize(prefix)
+        if not key or k <= 0:
+            return []
+        if len(self.__extra) > self.__rebuild_limit():
+            self.compact()
+        elif self.__extra_keys is None:
+            self.__extra_keys = sorted(self.__extra)
+
+        candidates = []
+        keys = self.__keys
+        low = bisect.bisect_left(keys, key)
+        high = bisect.bisect_left(keys, key + MAX_CHAR, low)
+        for position in self.__top_positions(low, high, k):
+            start, end = self.__offsets[position], self.__offsets[position + 1]
+            candidates.append((-self.__tree[self.__size + position], keys[position],
+                               self.__text[start:end], self.__kinds[position]))
+
+        low = bisect.bisect_left(self.__extra_keys, key)
+        high = bisect.bisect_left(self.__extra_keys, key + MAX_CHAR, low)
+        for extra_key in self.__extra_keys[low:high]:
+            display, kind, count = self.__extra[extra_key]
+            candidates.append((-count, extra_key, display, kind))
+
+        return [(display, -negative_count, self.__field_names(kind))
+                for negative_count, _, display, kind in heapq.nsmallest(k, candidates)]
+
+    def __top_positions(self, low, high, k):
+        """
+        Posisi k entri dengan count terbesar di rentang [low, high)
+        Heap berisi node segment tree (-max count, posisi daun pertama, node):
+        node dibuka sampai k daun keluar, jadi biayanya ~k x tinggi tree
+        """
+        if low >= high:
+            return []
+        tree = self.__tree
+        size = self.__size
+        depth = size.bit_length()
+        heap = []
+
+        def push(node):
+            first = node << (depth - node.bit_length())
+            heap.append((-tree[node], first - size, node))
+
+        # Rentang dipecah menjadi node-node segment tree yang menutupinya tepat
+        left, right = low + size, high + size
+        while left < right:
+            if left & 1:
+                push(left)
+                left += 1
+            if right & 1:
+                right -= 1
+                push(right)
+            left >>= 1
+            right >>= 1
+        heapq.heapify(heap)
+
+        positions = []
+        while heap and len(positions) < k:
+            _, first, node = heapq.heappop(heap)
+            if node >= size:
+                positions.append(node - size)
+                continue
+            for child in (2 * node, 2 * node + 1):
+                first = child << (depth - child.bit_length())
+                heapq.heappush(heap, (-tree[child], first - size, child))
+        return positions
+
+    def __field_names(self, kind):
+        return tuple(field for bit, field in enumerate(self.__fields) if kind & (1 << bit))
+
+    def get_stats(self):
+        """
+        Ukuran index dan perkiraan memory (byte) struktur utama + extra
+        Returns: Dictionary
+        """
+        main_bytes = (sys.getsizeof(self.__text) + sys.getsizeof(self.__offsets)
+                      + sys.getsizeof(self.__kinds) + sys.getsizeof(self.__tree))
+        extra_bytes = sys.getsizeof(self.__extra) + sum(
+            sys.getsizeof(key) + sys.getsizeof(entry) + sys.getsizeof(entry[0])
+            for key, entry in self.__extra.items())
+        return {
+            'entries': len(self),
+            'pending': len(self.__extra),
+            'items_added': self.__additions,
+            'text_chars': len(self.__text),
+            'memory_bytes': main_bytes + extra_bytes,
+            'bytes_per_entry': (main_bytes + extra_bytes) / max(1, len(self))
+        }
+
+
+class IdBitmap:
+    """
+    Himpunan id (bilangan bulat >= 0) sebagai bitmap: satu bit per id
+
+    Dipakai controller untuk mengingat id yang sudah dihitung popularitasnya di
+    PrefixIndex. Id AUTO_INCREMENT berurutan, jadi 1 juta baris cukup ~125 KB,
+    bukan ~60 MB seperti set of int.
+    """
+
+    __slots__ = ('__bits', '__count')
+
+    def __init__(self):
+        self.__bits = bytearray()
+        self.__count = 0
+
+    def add(self, item_id):
+        byte, bit = divmod(item_id, 8)
+        if byte >= len(self.__bits):
+            # Tumbuh berlipat agar id yang naik satu per satu tidak menyalin ulang terus
+            self.__bits.extend(bytes(max(byte + 1, len(self.__bits) * 2) - len(self.__bits)))
+        mask = 1 << bit
+        if not self.__bits[byte] & mask:
+            self.__bits[byte] |= mask
+            self.__count += 1
+
+    def __contains__(self, item_id):
+        byte, bit = divmod(item_id, 8)
+        return byte < len(self.__bits) and bool(self.__bits[byte] >> bit & 1)
+
+    def __len__(self):
+        return self.__count
+
+    def clear(self):
+        self.__bits = bytearray()
+        self.__count = 0
+
+    def memory_bytes(self):
+        return sys.getsizeof(self.__bits)
@@ -0,0 +1,255 @@
+"""
+Trigram Index - Pencarian yang toleran salah ketik (fuzzy search) di memory
+Setiap kata dipecah menjadi trigram (3 huruf berurutan), sehingga kata yang
+salah ketik masih berbagi sebagian besar trigram dengan kata aslinya:
+    "martin" -> {"  m", " ma", "mar", "art", "rti", "tin", "in "}
+    "martn"  -> {"  m", " ma", "mar", "art", "rtn", "tn "}  (4 trigram sama)
+"""
+
+import heapq
+import math
+from array import array
+from collections import Counter
+from itertools import chain
+
+from search.inverted_index import tokenize
+
+
+def trigrams(word):
+    """Trigram satu kata (diberi padding agar awal kata lebih menentukan, seperti pg_trgm)"""
+    padded = f"  {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class TrigramIndex:
+    """
+    Index fuzzy dua tingkat dengan interface yang sama dengan InvertedIndex
+
+    1. Kosakata: trigram -> array nomor kata. Kata kunci dicocokkan ke kata
+       di kosakata dengan similarity Jaccard trigram (bagian trigram yang sama)
+       minimal `threshold`; hanya MAX_EXPANSIONS kata termirip yang dipakai.
+       Kata kunci yang lebih pendek dari MIN_FUZZY_LENGTH harus cocok persis
+       (trigram kata pendek terlalu sedikit: "ka" akan mirip "kara", "kapal", ...).
+    2. Posting: nomor kata -> array nomor dokumen + bobot field terbesar.
+
+    Skor dokumen = jumlah, untuk setiap kata kunci, similarity^3 x bobot field x
+    idf kata yang cocok (kata langka lebih menentukan, seperti BM25). Pangkat 3
+    menjaga kecocokan persis kata umum tetap di atas kecocokan samar kata langka.
+
+    Update dan hapus memakai tombstone seperti InvertedIndex.
+    """
+
+    THRESHOLD = 0.3
+    MAX_EXPANSIONS = 20
+    MIN_FUZZY_LENGTH = 4
+    COMPACT_RATIO = 0.2
+
+    def __init__(self, fields, threshold=None):
+        """
+        Args:
+            fields: Dictionary nama_field -> bobot (int)
+            threshold: Similarity minimal kata kunci vs kata di index (0..1)
+        """
+        self.__fields = dict(fields)
+        self.threshold = self.THRESHOLD if threshold is None else threshold
+        self.__words = []                # word_no -> kata
+        self.__word_numbers = {}         # kata -> word_no
+        self.__word_sizes = array('H')   # word_no -> jumlah trigram kata
+        self.__trigrams = {}             # trigram -> array word_no
+        self.__word_docs = []            # word_no -> array doc_no
+        self.__word_weights = []         # word_no -> array bobot field (per doc_no)
+        self.__doc_ids = array('q')      # doc_no -> id di database
+        self.__payloads = []             # doc_no -> data yang dikembalikan saat search
+        self.__live = bytearray()        # doc_no -> 1 jika masih berlaku, 0 jika tombstone
+        self.__doc_numbers = {}          # id di database -> doc_no yang berlaku
+        self.__dead = 0
+
+    def __len__(self):
+        return len(self.__doc_ids) - self.__dead
+
+    def __contains__(self, doc_id):
+        return doc_id in self.__doc_numbers
+
+    def add(self, doc_id, values, payload=None):
+        """
+        Menambahkan satu dokumen ke index
+        Jika doc_id sudah ada, versi lama diganti (update)
+
+        Args:
+            doc_id: Primary key di database
+            values: Dictionary nama_field -> teks
+            payload: Data yang dikembalikan saat dokumen cocok (misal row database)
+        """
+        if doc_id in self.__doc_numbers:
+            self.remove(doc_id)
+
+        weights = {}
+        for field, weight in self.__fields.items():
+            for word in tokenize(values.get(field)):
+                if weight > weights.get(word, 0):
+                    weights[word] = weight
+
+        doc_no = len(self.__doc_ids)
+        self.__doc_ids.append(doc_id)
+        self.__payloads.append(payload)
+        self.__live.append(1)
+        self.__doc_numbers[doc_id] = doc_no
+
+        for word, weight in weights.items():
+            word_no = self.__word_number(word)
+            self.__word_docs[word_no].append(doc_no)
+            self.__word_weights[word_no].append(min(weight, 255))
+
+    def __word_number(self, word):
+        """Nomor kata di kosakata; kata baru didaftarkan beserta trigram-nya"""
+        word_no = self.__word_numbers.get(word)
+        if word_no is not None:
+            return word_no
+        word_no = len(self.__words)
+        self.__words.append(word)
+        self.__word_numbers[word] = word_no
+        grams = trigrams(word)
+        self.__word_sizes.append(min(len(grams), 65535))
+        for gram in grams:
+            posting = self.__trigrams.get(gram)
+            if posting is None:
+                posting = array('I')
+                self.__trigrams[gram] = posting
+            posting.append(word_no)
+        self.__word_docs.append(array('I'))
+        self.__word_weights.append(array('B'))
+        return word_no
+
+    def update(self, doc_id, values, payload=None):
+        """Mengganti isi dokumen (sama dengan add untuk doc_id yang sudah ada)"""
+        self.add(doc_id, values, payload)
+
+    def remove(self, doc_id):
+        """
+        Menghapus dokumen dari hasil pencarian
+        Returns: True jika dokumen ada, False jika tidak ditemukan
+        """
+        doc_no = self.__doc_numbers.pop(doc_id, None)
+        if doc_no is None:
+            return False
+        self.__live[doc_no] = 0
+        self.__payloads[doc_no] = None
+        self.__dead += 1
+        if self.__dead > len(self.__doc_ids) * self.COMPACT_RATIO:
+            self.compact()
+        return True
+
+    def clear(self):
+        """Mengosongkan index (misal sebelum full resync)"""
+        self.__init__(self.__fields, self.threshold)
+
+    def compact(self):
+        """
+        Membuang tombstone dari posting kata (kosakata tetap, kata tanpa
+        dokumen diabaikan saat search)
+        """
+        live = self.__live
+        renumber = array('q', [-1]) * len(self.__doc_ids)
+        doc_ids = array('q')
+        payloads = []
+        for doc_no, alive in enumerate(live):
+            if alive:
+                renumber[doc_no] = len(doc_ids)
+                doc_ids.append(self.__doc_ids[doc_no])
+                payloads.append(self.__payloads[doc_no])
+
+        for word_no, docs in enumerate(self.__word_docs):
+            new_docs = array('I')
+            new_weights = array('B')
+            for doc_no, weight in zip(docs, self.__word_weights[word_no]):
+                if live[doc_no]:
+                    new_docs.append(renumber[doc_no])
+                    new_weights.append(weight)
+            self.__word_docs[word_no] = new_docs
+            self.__word_weights[word_no] = new_weights
+
+        self.__doc_ids = doc_ids
+        self.__payloads = payloads
+        self.__live = bytearray(b"\x01") * len(doc_ids)
+        self.__doc_numbers = {doc_id: doc_no for doc_no, doc_id in enumerate(doc_ids)}
+        self.__dead = 0
+
+    def similar_words(self, word, limit=None):
+        """
+        Kata di kosakata yang mirip dengan `word`
+        Returns: List of (similarity, kata) terurut similarity tertinggi
+        """
+        return [(similarity, self.__words[word_no])
+                for similarity, word_no in self.__similar(word.casefold(), limit)]
+
+    def __similar(self, word, limit=None):
+        if len(word) < self.MIN_FUZZY_LENGTH:
+            word_no = self.__word_numbers.get(word)
+            return [] if word_no is None else [(1.0, word_no)]
+        grams = trigrams(word)
+        size = len(grams)
+        sizes = self.__word_sizes
+        threshold = self.threshold
+        # Jumlah trigram yang sama per kata, dihitung sekaligus (Counter di C)
+        shared_counts = Counter(chain.from_iterable(
+            self.__trigrams[gram] for gram in grams if gram in self.__trigrams))
+        matches = []
+        for word_no, shared in shared_counts.items():
+            similarity = shared / (size + sizes[word_no] - shared)
+            if similarity >= threshold:
+                matches.append((similarity, word_no))
+        return heapq.nlargest(limit or self.MAX_EXPANSIONS, matches)
+
+    def search(self, query, k=50):
+        """
+        Mencari dokumen yang paling mirip dengan kata kunci (toleran salah ketik)
+
+        Args:
+            query: Satu atau beberapa kata kunci
+            k: Jumlah hasil teratas yang dikembalikan
+
+        Returns: List of (score, doc_id, payload) terurut score tertinggi
+        """
+        words = list(dict.fromkeys(tokenize(query)))
+        doc_count = len(self)
+        if not words or doc_count == 0:
+            return []
+
+        scores = {}
+        get_score = scores.get
+        for word in words:
+            # Per kata kunci, setiap dokumen hanya dihitung lewat kata termirip-nya
+            best = {}
+            get_best = best.get
+            for similarity, word_no in self.__similar(word):
+                docs = self.__word_docs[word_no]
+                if not docs:
+                    continue
+                df = len(docs)
+                factor = similarity ** 3 * math.log(1 + (doc_count - df + 0.5) / (df + 0.5))
+                for doc_no, weight in zip(docs, self.__word_weights[word_no]):
+                    score = factor * weight
+                    if score > get_best(doc_no, 0.0):
+                        best[doc_no] = score
+            for doc_no, score in best.items():
+                scores[doc_no] = get_score(doc_no, 0.0) + score
+
+        live = self.__live
+        if self.__dead:
+            candidates = ((s, d) for d, s in scores.items() if live[d])
+        else:
+            candidates = ((s, d) for d, s in scores.items())
+
+        # Skor sama: dokumen yang lebih dulu masuk index didahulukan
+        top = heapq.nlargest(k, candidates, key=lambda pair: (pair[0], -pair[1]))
+        return [(score, self.__doc_ids[doc_no], self.__payloads[doc_no]) for score, doc_no in top]
+
+    def get_stats(self):
+        """Statistik ukuran index"""
+        return {
+            'documents': len(self),
+            'tombstones': self.__dead,
+            'words': len(self.__words),
+            'trigrams': len(self.__trigrams),
+            'postings': sum(len(docs) for docs in self.__word_docs)
+        }
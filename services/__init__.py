@@ -0,0 +1 @@
+"""Services package"""
\ No newline at end of file
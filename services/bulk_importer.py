@@ -0,0 +1,239 @@
+"""
+Bulk Importer - Import katalog dalam jumlah besar dari file CSV / JSONL
+File dibaca secara streaming (baris per baris), divalidasi lewat Model,
+lalu ditulis lewat StorageBackend.bulk_insert: executemany per batch
+dan commit per chunk transaksi
+"""
+
+import csv
+import json
+import os
+import time
+
+from models.book_model import Book
+from models.magazine_model import Magazine
+from database.backend_factory import create_backend
+from database.storage_backend import insert_columns
+
+
+# Definisi setiap jenis item: Model, tabel tujuan, dan kolom yang di-insert
+ITEM_TYPES = {
+    'book': {
+        'model': Book,
+        'table': 'books',
+        'columns': insert_columns('books'),
+        'int_fields': ('year',)
+    },
+    'magazine': {
+        'model': Magazine,
+        'table': 'magazines',
+        'columns': insert_columns('magazines'),
+        'int_fields': ('issue_number',)
+    }
+}
+
+SUPPORTED_FORMATS = ('csv', 'jsonl')
+
+
+def detect_format(path):
+    """Tebak format file dari ekstensinya"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == '.csv':
+        return 'csv'
+    if extension in ('.jsonl', '.ndjson', '.json'):
+        return 'jsonl'
+    raise ValueError(f"Format file tidak dikenali: {path} (gunakan .csv atau .jsonl)")
+
+
+def iter_records(path, fmt):
+    """
+    Generator record dari file, TIDAK memuat seluruh file ke memory
+    Yields: (nomor_baris, dict) atau (nomor_baris, ValueError) untuk baris rusak
+
+    utf-8-sig: BOM di awal file (CSV dari Excel) dibuang, sama dengan ParallelLoader
+    """
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        if fmt == 'csv':
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield reader.line_num, row
+        elif fmt == 'jsonl':
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError as e:
+                    yield line_number, ValueError(f"JSON tidak valid: {e}")
+                    continue
+                if not isinstance(record, dict):
+                    yield line_number, ValueError("Setiap baris JSONL harus berupa object")
+                    continue
+                yield line_number, record
+        else:
+            raise ValueError(f"Format tidak didukung: {fmt}")
+
+
+def build_item(item_type, record):
+    """
+    Membuat object Book / Magazine dari satu record mentah lalu memvalidasinya
+    Raises: ValueError jika record tidak valid
+    """
+    spec = ITEM_TYPES[item_type]
+    data = {}
+    for column in spec['columns']:
+        value = record.get(column)
+        if isinstance(value, str):
+            value = value.strip() or None
+        if value is not None and column in spec['int_fields']:
+            # JSON true/false juga int di Python; 2008.5 tidak boleh terpotong jadi 2008
+            if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+                raise ValueError(f"Kolom '{column}' harus berupa angka: {value!r}")
+            try:
+                value = int(value)
+            except (TypeError, ValueError):
+                raise ValueError(f"Kolom '{column}' harus berupa angka: {value!r}")
+        elif value is not None and not isinstance(value, str):
+            # Nilai JSON non-teks (angka, list, object) akan gagal di validasi Model
+            raise ValueError(f"Kolom '{column}' harus berupa teks: {value!r}")
+        data[column] = value
+
+    item = spec['model'].from_dict(data)
+    item.validate()
+    return item
+
+
+class ImportReport:
+    """Ringkasan hasil import: jumlah baris, penolakan, dan throughput"""
+
+    def __init__(self, item_type, source, max_reject_samples=100):
+        self.item_type = item_type
+        self.source = source
+        self.read = 0
+        self.inserted = 0
+        self.rejected = 0
+        self.failed = 0
+        self.reject_samples = []
+        self.error = None
+        self.elapsed = 0.0
+        self.__max_reject_samples = max_reject_samples
+
+    def add_reject(self, line_number, reason):
+        self.rejected += 1
+        if len(self.reject_samples) < self.__max_reject_samples:
+            self.reject_samples.append((line_number, reason))
+
+    @property
+    def rows_per_second(self):
+        return self.inserted / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'item_type': self.item_type,
+            'source': self.source,
+            'read': self.read,
+            'inserted': self.inserted,
+            'rejected': self.rejected,
+            'failed': self.failed,
+            'elapsed_s': round(self.elapsed, 3),
+            'rows_per_second': round(self.rows_per_second, 1),
+            'reject_samples': self.reject_samples,
+            'error': self.error
+        }
+
+
+class BulkImporter:
+    """
+    Import data massal untuk Book dan Magazine
+
+    Alur:
+    1. Record dibaca satu per satu dari file (streaming)
+    2. Setiap record diubah menjadi Model dan divalidasi
+    3. Record valid dikumpulkan per batch (batch_size baris) -> executemany
+    4. Setiap commit_every batch di-commit dalam satu transaksi
+    """
+
+    def __init__(self, storage=None, batch_size=1000, commit_every=10, reject_file=None):
+        """
+        Args:
+            storage: StorageBackend tujuan (default: sesuai STORAGE_CONFIG)
+            batch_size: Jumlah baris per executemany (multi-row INSERT)
+            commit_every: Jumlah batch per transaksi
+            reject_file: Path file JSONL untuk menyimpan baris yang ditolak (opsional)
+        """
+        if batch_size < 1 or commit_every < 1:
+            raise ValueError("batch_size dan commit_every harus >= 1")
+        self.storage = storage or create_backend()
+        self.batch_size = batch_size
+        self.commit_every = commit_every
+        self.reject_file = reject_file
+
+    def import_file(self, path, item_type, fmt=None, progress=None):
+        """
+        Import satu file ke tabel sesuai item_type
+
+        Args:
+            path: Path file CSV / JSONL
+            item_type: 'book' atau 'magazine'
+            fmt: 'csv' / 'jsonl' (default: dari ekstensi file)
+            progress: Callable(report) yang dipanggil setelah setiap commit
+
+        Returns: ImportReport
+        """
+        if item_type not in ITEM_TYPES:
+            raise ValueError(f"Jenis item tidak dikenal: {item_type}")
+        fmt = fmt or detect_format(path)
+        table = ITEM_TYPES[item_type]['table']
+        columns = ITEM_TYPES[item_type]['columns']
+        chunk_size = self.batch_size * self.commit_every
+
+        report = ImportReport(item_type, path)
+        reject_out = open(self.reject_file, 'w', encoding='utf-8') if self.reject_file else None
+        started = time.perf_counter()
+        chunk = []
+
+        def flush():
+            nonlocal chunk
+            if not chunk:
+                return
+            # Satu transaksi per chunk, executemany per batch_size baris
+            report.inserted += self.storage.bulk_insert(table, chunk, self.batch_size)
+            chunk = []
+            report.elapsed = time.perf_counter() - started
+            if progress:
+                progress(report)
+
+        try:
+            for line_number, record in iter_records(path, fmt):
+                report.read += 1
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    item = build_item(item_type, record)
+                except ValueError as e:
+                    report.add_reject(line_number, str(e))
+                    if reject_out:
+                        reject_out.write(json.dumps({
+                            'line': line_number,
+                            'reason': str(e),
+                            'record': record if isinstance(record, dict) else None
+                        }, ensure_ascii=False) + "\n")
+                    continue
+
+                data = item.to_dict()
+                chunk.append(tuple(data[column] for column in columns))
+                if len(chunk) >= chunk_size:
+                    flush()
+
+            flush()
+        except Exception as e:
+            # Chunk yang sedang ditulis sudah di-rollback oleh backend
+            report.failed = len(chunk)
+            report.error = str(e)
+        finally:
+            if reject_out:
+                reject_out.close()
+            report.elapsed = time.perf_counter() - started
+
+        return report
@@ -0,0 +1,307 @@
+"""
+Catalog Exporter - Export katalog lengkap ke CSV, JSONL, Parquet atau Arrow IPC
+Baris dibaca streaming dari database (server-side cursor lewat iter_rows)
+dan ditulis per batch, sehingga memory tetap konstan berapapun ukuran tabel
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import re
+import time
+
+from database.backend_factory import create_backend
+from database.storage_backend import CATALOG_TABLES, FILTER_OPERATORS
+from services.bulk_importer import ITEM_TYPES
+from models.row_view import BookRow, MagazineRow
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:  # Format kolumnar opsional
+    pyarrow = None
+
+try:
+    import zstandard
+except ImportError:  # Kompresi zstd opsional
+    zstandard = None
+
+
+ROW_VIEWS = {'books': BookRow, 'magazines': MagazineRow}
+
+TEXT_FORMATS = ('csv', 'jsonl')
+COLUMNAR_FORMATS = ('parquet', 'arrow')
+SUPPORTED_FORMATS = TEXT_FORMATS + COLUMNAR_FORMATS
+SUPPORTED_COMPRESSIONS = ('gzip', 'zstd')
+
+FORMAT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.jsonl': 'jsonl',
+    '.ndjson': 'jsonl',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow'
+}
+COMPRESSION_EXTENSIONS = {'.gz': 'gzip', '.zst': 'zstd'}
+
+FILTER_PATTERN = re.compile(r"^\s*(\w+)\s*(" + "|".join(
+    re.escape(op) for op in sorted(FILTER_OPERATORS, key=len, reverse=True)) + r")\s*(.*?)\s*$")
+
+
+def detect_output(path):
+    """
+    Tebak format dan kompresi dari nama file, misal 'buku.csv.gz' -> ('csv', 'gzip')
+    Returns: (format atau None, kompresi atau None)
+    """
+    base, extension = os.path.splitext(path.lower())
+    compression = COMPRESSION_EXTENSIONS.get(extension)
+    if compression:
+        extension = os.path.splitext(base)[1]
+    return FORMAT_EXTENSIONS.get(extension), compression
+
+
+def parse_filter(text, item_type):
+    """
+    Mengubah filter teks "year>=2000" / "author~Martin" menjadi (kolom, operator, nilai)
+    Nilai kolom angka (year, issue_number) diubah ke int
+    Raises: ValueError jika format filter salah
+    """
+    match = FILTER_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Filter tidak valid: {text!r} (contoh: year>=2000, author~Martin)")
+    column, operator, value = match.groups()
+    table = ITEM_TYPES[item_type]['table']
+    if column not in CATALOG_TABLES[table]['columns']:
+        raise ValueError(f"Kolom tidak dikenal di {table}: {column}")
+    if column == 'id' or column in ITEM_TYPES[item_type]['int_fields']:
+        try:
+            value = int(value)
+        except ValueError:
+            raise ValueError(f"Kolom '{column}' harus berupa angka: {value!r}")
+    return column, operator, value
+
+
+def open_text(path, compression):
+    """File teks untuk ditulis, dengan kompresi gzip / zstd (streaming)"""
+    if compression is None:
+        return open(path, 'w', newline='', encoding='utf-8')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', newline='', encoding='utf-8', compresslevel=6)
+    if compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("Kompresi zstd membutuhkan package 'zstandard' (pip install zstandard)")
+        raw = open(path, 'wb')
+        # closefd: menutup writer zstd juga menutup file aslinya
+        writer = zstandard.ZstdCompressor(level=3).stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(writer, newline='', encoding='utf-8')
+    raise ValueError(f"Kompresi tidak didukung: {compression}")
+
+
+# ========== WRITER PER FORMAT ==========
+
+class CsvWriter:
+    """Header sekali di awal, lalu baris per batch"""
+
+    def __init__(self, path, columns, compression):
+        self.__file = open_text(path, compression)
+        self.__writer = csv.DictWriter(self.__file, fieldnames=columns)
+        self.__writer.writeheader()
+
+    def write_batch(self, records):
+        self.__writer.writerows(records)
+
+    def close(self):
+        self.__file.close()
+
+
+class JsonlWriter:
+    """Satu object JSON per baris, satu kali write per batch"""
+
+    def __init__(self, path, columns, compression):
+        self.__file = open_text(path, compression)
+
+    def write_batch(self, records):
+        self.__file.write("".join(json.dumps(record, ensure_ascii=False) + "\n"
+                                  for record in records))
+
+    def close(self):
+        self.__file.close()
+
+
+class ArrowWriter:
+    """
+    Parquet (row group per batch) atau Arrow IPC file (record batch per batch)
+    Kompresi ditangani oleh format itu sendiri, bukan membungkus file
+    """
+
+    def __init__(self, path, columns, compression, fmt, int_columns):
+        if pyarrow is None:
+            raise ValueError(f"Format {fmt} membutuhkan package 'pyarrow' (pip install pyarrow)")
+        self.__schema = pyarrow.schema([
+            (column, pyarrow.int64() if column in int_columns else pyarrow.string())
+            for column in columns
+        ])
+        if fmt == 'parquet':
+            self.__writer = pyarrow.parquet.ParquetWriter(
+                path, self.__schema, compression=compression or 'snappy')
+        else:
+            if compression == 'gzip':
+                raise ValueError("Arrow IPC hanya mendukung kompresi zstd")
+            options = pyarrow.ipc.IpcWriteOptions(compression=compression)
+            self.__writer = pyarrow.ipc.new_file(path, self.__schema, options=options)
+
+    def write_batch(self, records):
+        batch = pyarrow.RecordBatch.from_pylist(records, schema=self.__schema)
+        self.__writer.write_batch(batch)
+
+    def close(self):
+        self.__writer.close()
+
+
+class ExportReport:
+    """Ringkasan hasil export: jumlah baris, ukuran file, dan throughput"""
+
+    def __init__(self, item_type, destination, fmt, compression):
+        self.item_type = item_type
+        self.destination = destination
+        self.fmt = fmt
+        self.compression = compression
+        self.rows = 0
+        self.bytes_written = 0
+        self.elapsed = 0.0
+        self.error = None
+
+    @property
+    def rows_per_second(self):
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def megabytes_per_second(self):
+        return self.bytes_written / 1024 / 1024 / self.elapsed if self.elapsed > 0 else 0.0
+
+    def to_dict(self):
+        return {
+            'item_type': self.item_type,
+            'destination': self.destination,
+            'format': self.fmt,
+            'compression': self.compression,
+            'rows': self.rows,
+            'bytes_written': self.bytes_written,
+            'elapsed_s': round(self.elapsed, 3),
+            'rows_per_second': round(self.rows_per_second, 1),
+            'error': self.error
+        }
+
+
+class CatalogExporter:
+    """
+    Export tabel books / magazines ke file
+
+    Alur:
+    1. Baris dibaca streaming dari backend (iter_rows, urut id)
+    2. Setiap baris dipetakan lewat Model.to_dict() (+ id) agar nama field
+       sama dengan yang dipakai importer
+    3. Record dikumpulkan per batch_size lalu ditulis sekaligus oleh writer format
+    4. File ditulis ke '<path>.part' dan baru diganti namanya setelah selesai
+    """
+
+    def __init__(self, storage=None, batch_size=5000):
+        """
+        Args:
+            storage: StorageBackend sumber (default: sesuai STORAGE_CONFIG)
+            batch_size: Jumlah record per write (dan per record batch Arrow/Parquet)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size harus >= 1")
+        self.storage = storage or create_backend()
+        self.batch_size = batch_size
+
+    def __open_writer(self, path, fmt, compression, item_type, columns):
+        if fmt == 'csv':
+            return CsvWriter(path, columns, compression)
+        if fmt == 'jsonl':
+            return JsonlWriter(path, columns, compression)
+        int_columns = ('id',) + ITEM_TYPES[item_type]['int_fields']
+        return ArrowWriter(path, columns, compression, fmt, int_columns)
+
+    def export(self, path, item_type, fmt=None, compression=None, filters=None, progress=None):
+        """
+        Export satu jenis item ke file
+
+        Args:
+            path: File tujuan; format & kompresi ditebak dari ekstensi jika tidak diberikan
+            item_type: 'book' atau 'magazine'
+            fmt: 'csv', 'jsonl', 'parquet' atau 'arrow'
+            compression: None, 'gzip' atau 'zstd'
+            filters: List of (kolom, operator, nilai), lihat parse_filter
+            progress: Callable(report) yang dipanggil setelah setiap batch
+
+        Returns: ExportReport
+        """
+        if item_type not in ITEM_TYPES:
+            raise ValueError(f"Jenis item tidak dikenal: {item_type}")
+        detected_format, detected_compression = detect_output(path)
+        fmt = fmt or detected_format or 'csv'
+        compression = compression or detected_compression
+        if fmt not in SUPPORTED_FORMATS:
+            raise ValueError(f"Format tidak didukung: {fmt}")
+        if compression not in (None,) + SUPPORTED_COMPRESSIONS:
+            raise ValueError(f"Kompresi tidak didukung: {compression}")
+
+        table = ITEM_TYPES[item_type]['table']
+        columns = list(CATALOG_TABLES[table]['columns'])
+        row_view = ROW_VIEWS[table]
+
+        report = ExportReport(item_type, path, fmt, compression)
+        started = time.perf_counter()
+        partial_path = path + ".part"
+        writer = None
+        rows = None
+        try:
+            writer = self.__open_writer(partial_path, fmt, compression, item_type, columns)
+            # Backend mencetak error baca lalu menghentikan iterasi diam-diam;
+            # tanpa cek ini file yang terpotong dianggap export yang berhasil
+            errors_before = self.storage.thread_read_errors()
+            rows = self.storage.iter_rows(table, filters, order_by='id')
+            batch = []
+            for row in rows:
+                item = row_view(row)
+                record = {'id': item.get_id()}
+                record.update(item.to_dict())
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    writer.write_batch(batch)
+                    report.rows += len(batch)
+                    batch = []
+                    report.elapsed = time.perf_counter() - started
+                    if progress:
+                        progress(report)
+            if self.storage.thread_read_errors() > errors_before:
+                raise RuntimeError(f"Gagal membaca tabel {table} dari database "
+                                   f"(berhenti setelah {report.rows + len(batch)} baris)")
+            if batch:
+                writer.write_batch(batch)
+                report.rows += len(batch)
+            writer.close()
+            writer = None
+            os.replace(partial_path, path)
+            report.bytes_written = os.path.getsize(path)
+        except Exception as e:
+            report.error = str(e)
+            if writer is not None:
+                try:
+                    writer.close()
+                except Exception:
+                    pass
+            if os.path.exists(partial_path):
+                os.remove(partial_path)
+        finally:
+            # Generator yang berhenti di tengah harus ditutup agar koneksi dilepas
+            if rows is not None and hasattr(rows, 'close'):
+                rows.close()
+            report.elapsed = time.perf_counter() - started
+
+        return report
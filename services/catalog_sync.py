@@ -0,0 +1,283 @@
+"""
+Catalog Sync - Sinkronisasi inkremental struktur di memory dengan database
+Setiap tabel punya watermark (updated_at, id): setiap polling hanya baris yang
+berubah sejak watermark yang dibaca (lewat index updated_at), lalu dikirim ke
+listener (cache, search index, snapshot) untuk memperbarui datanya sendiri.
+
+Catatan:
+- Watermark hanya maju melewati baris yang lebih tua dari "waktu database - lag"
+  (updated_at berpresisi detik: baris di detik yang sama masih bisa bertambah).
+  Baris yang lebih baru
+  dikirim ulang pada polling berikutnya sehingga transaksi yang commit
+  terlambat (lebih singkat dari lag) dan beberapa update dalam detik yang
+  sama tidak terlewat. Listener karena itu harus idempotent (upsert).
+- Baris yang DIHAPUS tidak terlihat dari updated_at; gunakan full_resync
+  (manual atau lewat full_resync_interval) untuk membuangnya.
+"""
+
+import threading
+import time
+from datetime import datetime, timedelta
+
+from database.storage_backend import CATALOG_TABLES
+
+
+def shift_timestamp(value, seconds):
+    """
+    Menggeser timestamp dari database sebanyak `seconds` detik
+    Format teks SQLite ('YYYY-MM-DD HH:MM:SS') dipertahankan agar tetap bisa dibandingkan
+    """
+    if isinstance(value, str):
+        moment = datetime.fromisoformat(value) + timedelta(seconds=seconds)
+        return moment.strftime('%Y-%m-%d %H:%M:%S')
+    return value + timedelta(seconds=seconds)
+
+
+class SyncListener:
+    """Pasangan callback yang menerima perubahan untuk tabel tertentu"""
+
+    __slots__ = ('on_rows', 'on_reset', 'tables')
+
+    def __init__(self, on_rows, on_reset=None, tables=None):
+        self.on_rows = on_rows
+        self.on_reset = on_reset
+        self.tables = tables
+
+    def wants(self, table):
+        return self.tables is None or table in self.tables
+
+
+class CatalogSync:
+    """
+    Penarik perubahan berbasis watermark, bisa dijalankan manual (sync_once)
+    atau oleh thread polling (start / stop)
+
+    Alur satu polling per tabel:
+    1. Ambil CURRENT_TIMESTAMP database, batas aman = sekarang - lag
+    2. Baca changed_since(watermark) per batch_size baris, kirim ke listener
+    3. Watermark maju ke baris terakhir yang updated_at-nya < batas aman
+    4. Jika ada perubahan, cache backend untuk tabel itu di-invalidate
+    """
+
+    def __init__(self, storage, tables=None, batch_size=1000, poll_interval=5.0,
+                 lag=2.0, full_resync_interval=None):
+        """
+        Args:
+            storage: StorageBackend sumber perubahan
+            tables: Tabel yang disinkronkan (default: semua CATALOG_TABLES)
+            batch_size: Jumlah baris per query changed_since
+            poll_interval: Detik antar polling pada thread latar belakang
+            lag: Detik toleransi commit terlambat (lebih lama dari transaksi tulis terpanjang)
+            full_resync_interval: Detik antar full resync otomatis (None = hanya manual)
+        """
+        if batch_size < 1 or poll_interval <= 0 or lag < 0:
+            raise ValueError("batch_size harus >= 1, poll_interval > 0, dan lag >= 0")
+        tables = list(tables or CATALOG_TABLES)
+        for table in tables:
+            if table not in CATALOG_TABLES:
+                raise ValueError(f"Tabel tidak dikenal: {table}")
+        self.storage = storage
+        self.tables = tables
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.lag = lag
+        self.full_resync_interval = full_resync_interval
+
+        self.__listeners = []
+        self.__watermarks = {table: None for table in tables}
+        self.__needs_resync = set()
+        self.__sync_lock = threading.Lock()
+        self.__wakeup = threading.Event()
+        self.__stopped = threading.Event()
+        self.__worker = None
+        self.__last_full_resync = time.monotonic()
+        self.__stats = {
+            'polls': 0,
+            'changed_rows': 0,
+            'full_resyncs': 0,
+            'errors': 0,
+            'last_error': None,
+            'last_sync_at': None,
+            'last_sync_ms': 0.0
+        }
+
+    # ========== LISTENER ==========
+
+    def add_listener(self, on_rows, on_reset=None, tables=None):
+        """
+        Mendaftarkan penerima perubahan
+
+        Args:
+            on_rows: Callable(table, rows) - rows berisi tuple kolom katalog
+                     (versi terbaru baris yang dibuat / diubah)
+            on_reset: Callable(table) dipanggil sebelum full resync; listener
+                      mengosongkan datanya karena semua baris akan dikirim ulang
+            tables: Tabel yang ingin diterima (default: semua)
+        """
+        self.__listeners.append(SyncListener(on_rows, on_reset, tables))
+
+    # ========== WATERMARK ==========
+
+    def mark_current(self, *tables):
+        """
+        Menandai bahwa data di memory sudah sesuai database sampai saat ini
+        Panggil SEBELUM membangun struktur dari full scan, agar perubahan yang
+        terjadi selama scan tetap terbaca pada polling berikutnya.
+        """
+        now = self.storage.current_timestamp()
+        if now is None:
+            return False
+        settled = shift_timestamp(now, -self.lag)
+        with self.__sync_lock:
+            for table in tables or self.tables:
+                self.__watermarks[table] = (settled, None)
+        return True
+
+    def get_watermarks(self):
+        with self.__sync_lock:
+            return dict(self.__watermarks)
+
+    # ========== SINKRONISASI ==========
+
+    def sync_once(self, *tables):
+        """
+        Menarik perubahan sejak watermark untuk setiap tabel
+        Tabel tanpa watermark (belum pernah disinkronkan) dibaca seluruhnya
+        Returns: Dictionary tabel -> jumlah baris yang dikirim ke listener
+        """
+        started = time.perf_counter()
+        changed = {}
+        with self.__sync_lock:
+            for table in tables or self.tables:
+                try:
+                    if table in self.__needs_resync:
+                        self.__reset(table)
+                    changed[table] = self.__pull(table)
+                except Exception as e:
+                    # Watermark tidak dimajukan; perubahan dibaca ulang pada polling berikutnya
+                    self.__record_error(f"{table}: {e}")
+                    changed[table] = 0
+            self.__stats['polls'] += 1
+            self.__stats['changed_rows'] += sum(changed.values())
+            self.__stats['last_sync_at'] = time.time()
+            self.__stats['last_sync_ms'] = (time.perf_counter() - started) * 1000
+        return changed
+
+    def full_resync(self, *tables):
+        """
+        Membaca ulang seluruh baris: listener dikosongkan (on_reset) lalu diisi lagi
+        Dipakai untuk membuang baris yang sudah dihapus atau memperbaiki data yang kacau
+        Returns: Dictionary tabel -> jumlah baris
+        """
+        with self.__sync_lock:
+            self.__needs_resync.update(tables or self.tables)
+            self.__last_full_resync = time.monotonic()
+        return self.sync_once(*tables)
+
+    def request_full_resync(self, *tables):
+        """Menjadwalkan full resync pada polling berikutnya (tidak menunggu)"""
+        with self.__sync_lock:
+            self.__needs_resync.update(tables or self.tables)
+        self.__wakeup.set()
+
+    def __reset(self, table):
+        self.__watermarks[table] = None
+        for listener in self.__listeners:
+            if listener.wants(table) and listener.on_reset:
+                listener.on_reset(table)
+        self.__needs_resync.discard(table)
+        self.__stats['full_resyncs'] += 1
+
+    def __pull(self, table):
+        now = self.storage.current_timestamp()
+        if now is None:
+            raise RuntimeError("Gagal membaca waktu database")
+        settled = shift_timestamp(now, -self.lag)
+
+        watermark = self.__watermarks[table]
+        position = watermark
+        total = 0
+        try:
+            while True:
+                rows = self.storage.changed_since(table, position, self.batch_size)
+                if not rows:
+                    break
+                self.__deliver(table, [row[:-1] for row in rows])
+                total += len(rows)
+                for row in rows:
+                    if row[-1] is None:
+                        continue
+                    # Baris urut updated_at: yang sudah "aman" selalu di depan
+                    if row[-1] >= settled:
+                        break
+                    watermark = (row[-1], row[0])
+                position = (rows[-1][-1], rows[-1][0])
+                if len(rows) < self.batch_size:
+                    break
+        finally:
+            # Batch yang sudah terkirim tidak perlu dibaca ulang walau batch berikutnya gagal
+            self.__watermarks[table] = watermark
+            if total:
+                # Perubahan bisa berasal dari proses lain: hasil baca di cache sudah basi
+                self.storage.invalidate_cache(table)
+        return total
+
+    def __deliver(self, table, rows):
+        for listener in self.__listeners:
+            if not listener.wants(table):
+                continue
+            try:
+                listener.on_rows(table, rows)
+            except Exception as e:
+                # Data listener mungkin setengah diperbarui: bangun ulang dari awal
+                self.__needs_resync.add(table)
+                self.__record_error(f"listener {table}: {e}")
+
+    def __record_error(self, message):
+        self.__stats['errors'] += 1
+        self.__stats['last_error'] = message
+
+    # ========== THREAD POLLING ==========
+
+    def start(self):
+        """Menjalankan polling di thread latar belakang"""
+        if self.__worker is not None and self.__worker.is_alive():
+            return
+        self.__stopped.clear()
+        self.__worker = threading.Thread(target=self.__run, name='catalog-sync', daemon=True)
+        self.__worker.start()
+
+    def stop(self, timeout=10.0):
+        """Menghentikan thread polling (menunggu polling yang sedang berjalan)"""
+        self.__stopped.set()
+        self.__wakeup.set()
+        if self.__worker is not None:
+            self.__worker.join(timeout)
+            self.__worker = None
+
+    def is_running(self):
+        return self.__worker is not None and self.__worker.is_alive()
+
+    def __run(self):
+        while not self.__stopped.is_set():
+            self.__wakeup.wait(self.poll_interval)
+            self.__wakeup.clear()
+            if self.__stopped.is_set():
+                return
+            interval = self.full_resync_interval
+            if interval and time.monotonic() - self.__last_full_resync >= interval:
+                self.full_resync()
+            else:
+                self.sync_once()
+
+    def get_stats(self):
+        """
+        Statistik sinkronisasi (polls, changed_rows, full_resyncs, errors, watermark)
+        Returns: Dictionary
+        """
+        with self.__sync_lock:
+            stats = dict(self.__stats)
+            stats['watermarks'] = {table: (str(mark[0]), mark[1]) if mark else None
+                                   for table, mark in self.__watermarks.items()}
+            stats['running'] = self.is_running()
+        return stats
@@ -0,0 +1,389 @@
+"""
+HTTP Service - Katalog sebagai JSON API tanpa layar (untuk kiosk / web front-end)
+Controller dan Model yang sama dengan mode console; hanya View-nya diganti
+JsonView. Request dilayani worker pool berukuran tetap, koneksi database
+memakai connection pool, dan latency setiap endpoint dicatat.
+
+Endpoint (<table> = books / magazines):
+    GET  /<table>?limit=20&after=<cursor>   Satu halaman terurut judul (keyset)
+    GET  /<table>/search?q=<kata kunci>     Pencarian sesuai SEARCH_CONFIG
+    GET  /<table>/<id>                      Satu item
+    POST /<table>                           Tambah item (body JSON seperti Model.to_dict)
+    GET  /health                            Status service
+    GET  /metrics                           Latency per endpoint, pool, statistik query
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from database.query_stats import StatementStats
+from database.storage_backend import CATALOG_TABLES
+from views.json_view import JsonView
+
+
+MAX_PAGE_SIZE = 200
+
+
+class HTTPError(Exception):
+    """Error yang dikirim ke client dengan status HTTP tertentu"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def percentile(ordered, fraction):
+    """Nilai persentil dari list yang sudah terurut"""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class RequestMetrics:
+    """
+    Latency per endpoint, thread-safe
+    Total / histogram memakai StatementStats (seperti statistik query); p50/p95/p99
+    dihitung dari `window` request terakhir per endpoint
+    """
+
+    def __init__(self, window=2048):
+        self.__lock = threading.Lock()
+        self.__window = window
+        self.__routes = {}
+        self.__in_flight = 0
+        self.__started = time.time()
+
+    def begin(self):
+        with self.__lock:
+            self.__in_flight += 1
+
+    def record(self, route, elapsed_ms, status):
+        with self.__lock:
+            self.__in_flight -= 1
+            entry = self.__routes.get(route)
+            if entry is None:
+                entry = (StatementStats(), deque(maxlen=self.__window))
+                self.__routes[route] = entry
+            stats, recent = entry
+            stats.add(elapsed_ms, None, "error" if status >= 500 else None)
+            recent.append(elapsed_ms)
+
+    def snapshot(self):
+        """Returns: Dictionary {'uptime_s', 'in_flight', 'requests', 'routes': {route: {...}}}"""
+        with self.__lock:
+            routes = {route: (stats.to_dict(), sorted(recent))
+                      for route, (stats, recent) in self.__routes.items()}
+            in_flight = self.__in_flight
+        summary = {}
+        for route, (stats, ordered) in routes.items():
+            del stats['rows']
+            stats.update(p50_ms=percentile(ordered, 0.50), p95_ms=percentile(ordered, 0.95),
+                         p99_ms=percentile(ordered, 0.99))
+            summary[route] = stats
+        return {
+            'uptime_s': time.time() - self.__started,
+            'in_flight': in_flight,
+            'requests': sum(stats['count'] for stats in summary.values()),
+            'routes': summary
+        }
+
+
+# Jawaban untuk koneksi yang ditolak karena antrian worker penuh (ditulis langsung ke socket)
+OVERLOADED_BODY = JsonView.dumps(JsonView().render_error("Service sedang penuh, coba lagi sebentar"))
+OVERLOADED_RESPONSE = (b"HTTP/1.0 503 Service Unavailable\r\n"
+                       b"Content-Type: application/json; charset=utf-8\r\n"
+                       b"Retry-After: 1\r\n"
+                       b"Content-Length: %d\r\n\r\n" % len(OVERLOADED_BODY)) + OVERLOADED_BODY
+
+
+class PooledHTTPServer(HTTPServer):
+    """
+    HTTPServer yang menyerahkan setiap koneksi ke ThreadPoolExecutor berukuran tetap
+    (ThreadingHTTPServer membuat satu thread baru per koneksi tanpa batas)
+
+    Koneksi yang menunggu worker dibatasi max_pending; koneksi berikutnya langsung
+    dijawab 503 agar antrian executor tidak tumbuh tanpa batas.
+    """
+
+    def __init__(self, address, handler_class, workers, backlog=128, max_pending=None):
+        self.request_queue_size = backlog
+        super().__init__(address, handler_class)
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='http-worker')
+        # Koneksi yang sedang diproses + menunggu worker
+        self.__slots = threading.BoundedSemaphore(workers + (workers * 4 if max_pending is None else max_pending))
+        self.rejected = 0
+
+    def process_request(self, request, client_address):
+        if not self.__slots.acquire(blocking=False):
+            self.rejected += 1
+            self.__reject(request)
+            return
+        try:
+            self.executor.submit(self.__process, request, client_address)
+        except RuntimeError:
+            # Executor sudah shutdown
+            self.__slots.release()
+            self.shutdown_request(request)
+
+    def __reject(self, request):
+        try:
+            request.settimeout(1.0)
+            request.sendall(OVERLOADED_RESPONSE)
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+    def __process(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+            self.__slots.release()
+
+    def server_close(self):
+        super().server_close()
+        self.executor.shutdown(wait=True)
+
+
+class CatalogRequestHandler(BaseHTTPRequestHandler):
+    """Menerjemahkan request HTTP ke CatalogService.handle"""
+
+    server_version = "PerpustakaanService/1.0"
+
+    def setup(self):
+        # Klien yang tersambung tanpa mengirim request tidak menahan worker selamanya
+        self.timeout = self.server.service.request_timeout
+        super().setup()
+
+    def do_GET(self):
+        self.__dispatch('GET')
+
+    def do_POST(self):
+        self.__dispatch('POST')
+
+    def __dispatch(self, method):
+        service = self.server.service
+        body = b""
+        if method == 'POST':
+            try:
+                length = int(self.headers.get('Content-Length') or 0)
+            except ValueError:
+                length = -1
+            if length < 0 or length > service.max_body_bytes:
+                self.__send(413, service.view.render_error("Body terlalu besar atau Content-Length salah"))
+                return
+            body = self.rfile.read(length)
+        status, payload = service.handle(method, self.path, body)
+        self.__send(status, payload)
+
+    def __send(self, status, payload):
+        data = JsonView.dumps(payload)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        if self.server.service.access_log:
+            super().log_message(format, *args)
+
+
+class CatalogService:
+    """
+    Service HTTP/JSON di atas LibraryController
+
+    handle() berisi seluruh routing dan tidak bergantung pada socket, sehingga
+    bisa dipanggil langsung (misal dari benchmark); start() / serve_forever()
+    menjalankannya sebagai server HTTP.
+    """
+
+    def __init__(self, controller, host='127.0.0.1', port=8080, workers=8,
+                 max_body_bytes=64 * 1024, metrics_window=2048, access_log=False,
+                 request_timeout=10.0, max_pending=None):
+        """
+        Args:
+            controller: LibraryController (view-nya sebaiknya JsonView)
+            workers: Jumlah thread worker (request bersamaan yang diproses)
+            request_timeout: Detik menunggu klien mengirim request / body sebelum koneksi ditutup
+            max_pending: Koneksi yang boleh menunggu worker (default 4x workers), sisanya 503
+            max_body_bytes: Ukuran maksimal body POST
+            metrics_window: Jumlah request terakhir per endpoint untuk p50/p95/p99
+            access_log: Tulis satu baris log per request ke stderr
+        """
+        self.controller = controller
+        self.view = controller.view if isinstance(controller.view, JsonView) else JsonView()
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.max_body_bytes = max_body_bytes
+        self.access_log = access_log
+        self.request_timeout = request_timeout
+        self.max_pending = max_pending
+        self.metrics = RequestMetrics(metrics_window)
+        self.__server = None
+        self.__thread = None
+        self.__enable_connection_pool()
+
+    def __enable_connection_pool(self):
+        """Koneksi MySQL: aktifkan connection pool seukuran worker jika belum aktif"""
+        storage = self.controller.storage
+        backends = [getattr(storage, 'primary', storage)]
+        backends += [replica.backend for replica in getattr(storage, 'replicas', [])]
+        for backend in backends:
+            db = getattr(backend, 'db', None)
+            if db is not None and not db.is_pooled():
+                db.enable_pool(min_size=1, max_size=self.workers)
+
+    # ========== ROUTING ==========
+
+    def handle(self, method, path, body=b""):
+        """
+        Memproses satu request
+        Returns: (status HTTP, payload dictionary)
+
+        Backend tidak raise saat query baca gagal (hasilnya kosong), jadi GET yang
+        query-nya gagal dideteksi dari read_errors thread ini dan dijawab 503,
+        bukan katalog kosong / 404
+        """
+        started = time.perf_counter()
+        self.metrics.begin()
+        route = f"{method} ?"
+        storage = self.controller.storage
+        errors_before = storage.thread_read_errors()
+        try:
+            route, action = self.__route(method, path)
+            status, payload = action(body)
+        except HTTPError as e:
+            status, payload = e.status, self.view.render_error(str(e))
+        except ValueError as e:
+            status, payload = 400, self.view.render_error(str(e))
+        except Exception as e:
+            status, payload = 500, self.view.render_error(f"Terjadi error: {e}")
+        if method == 'GET' and status < 500 and storage.thread_read_errors() > errors_before:
+            status, payload = 503, self.view.render_error("Database tidak tersedia, coba lagi nanti")
+        self.metrics.record(route, (time.perf_counter() - started) * 1000, status)
+        return status, payload
+
+    def __route(self, method, path):
+        """
+        Menentukan endpoint sebelum dijalankan (label route tetap tercatat
+        walaupun endpoint-nya menjawab dengan error)
+        Returns: (label route, action(body) -> (status, payload))
+        """
+        url = urlsplit(path)
+        parts = [part for part in url.path.split('/') if part]
+        query = parse_qs(url.query)
+
+        if parts == ['health'] and method == 'GET':
+            return "GET /health", lambda body: (200, {'status': 'ok'})
+        if parts == ['metrics'] and method == 'GET':
+            return "GET /metrics", lambda body: (200, self.get_metrics())
+        if not parts or parts[0] not in CATALOG_TABLES or len(parts) > 2:
+            raise HTTPError(404, f"Endpoint tidak ditemukan: {url.path}")
+
+        table = parts[0]
+        if len(parts) == 1:
+            if method == 'GET':
+                return f"GET /{table}", lambda body: (200, self.__list(table, query))
+            if method == 'POST':
+                return f"POST /{table}", lambda body: self.__create(table, body)
+        elif method == 'GET' and parts[1] == 'search':
+            return f"GET /{table}/search", lambda body: (200, self.__search(table, query))
+        elif method == 'GET':
+            return f"GET /{table}/<id>", lambda body: (200, self.__get(table, parts[1]))
+        raise HTTPError(405, f"Method {method} tidak didukung untuk {url.path}")
+
+    @staticmethod
+    def __param(query, name, default=None):
+        values = query.get(name)
+        return values[0] if values else default
+
+    def __list(self, table, query):
+        try:
+            limit = int(self.__param(query, 'limit', 20))
+        except ValueError:
+            raise ValueError("limit harus berupa angka") from None
+        if not 1 <= limit <= MAX_PAGE_SIZE:
+            raise ValueError(f"limit harus antara 1 dan {MAX_PAGE_SIZE}")
+        after = self.view.decode_cursor(self.__param(query, 'after'))
+        items, next_cursor = self.controller._fetch_page(table, after, limit)
+        return self.view.render_page(items, next_cursor)
+
+    def __search(self, table, query):
+        keyword = (self.__param(query, 'q') or "").strip()
+        if not keyword:
+            raise ValueError("Parameter q (kata kunci) wajib diisi")
+        items = self.controller._search(table, keyword)
+        return {'query': keyword, 'items': self.view.render_items(items)}
+
+    def __get(self, table, text):
+        try:
+            item_id = int(text)
+        except ValueError:
+            raise HTTPError(404, f"Id tidak valid: {text}") from None
+        item = self.controller.get_item(table, item_id)
+        if item is None:
+            raise HTTPError(404, f"Item {item_id} tidak ditemukan di {table}")
+        return self.view.item_to_dict(item)
+
+    def __create(self, table, body):
+        data = self.view.parse_item(table, body)
+        item, stored = self.controller.create_item(table, data)
+        # 202: item diterima antrian write-behind, id belum ada
+        return (201 if stored else 202), self.view.item_to_dict(item)
+
+    def get_metrics(self):
+        """Latency per endpoint + statistik pool koneksi dan query (jika ada)"""
+        metrics = self.metrics.snapshot()
+        metrics['workers'] = self.workers
+        metrics['rejected_overloaded'] = self.__server.rejected if self.__server is not None else 0
+        storage = self.controller.storage
+        db = getattr(getattr(storage, 'primary', storage), 'db', None)
+        metrics['db_pool'] = db.get_pool_stats() if db is not None else None
+        metrics['queries'] = storage.get_query_stats(top=10)
+        return metrics
+
+    # ========== SERVER ==========
+
+    def __create_server(self):
+        server = PooledHTTPServer((self.host, self.port), CatalogRequestHandler, self.workers,
+                                  max_pending=self.max_pending)
+        server.service = self
+        # Port 0 = dipilih sistem operasi
+        self.port = server.server_address[1]
+        self.__server = server
+        return server
+
+    def serve_forever(self):
+        """Menjalankan server di thread ini sampai shutdown() / Ctrl+C"""
+        server = self.__server or self.__create_server()
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+    def start(self):
+        """Menjalankan server di thread latar belakang; Returns: URL dasar service"""
+        self.__create_server()
+        self.__thread = threading.Thread(target=self.serve_forever, name='http-service', daemon=True)
+        self.__thread.start()
+        return self.url
+
+    @property
+    def url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def shutdown(self):
+        if self.__server is not None:
+            self.__server.shutdown()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
@@ -0,0 +1,367 @@
+"""
+Parallel Loader - Import data massal memakai beberapa proses sekaligus
+File input dibagi menjadi beberapa rentang byte (dipotong di batas baris),
+setiap rentang di-parse, divalidasi, dan di-insert oleh proses worker dengan
+koneksi database miliknya sendiri. Hasil akhirnya dicek ulang ke database
+(jumlah baris dan duplikat) dalam laporan konsistensi.
+
+Syarat file: satu record per baris (CSV tanpa field multi-baris, atau JSONL).
+"""
+
+import csv
+import json
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from database.backend_factory import create_backend
+from services.bulk_importer import ITEM_TYPES, ImportReport, build_item, detect_format
+
+
+# Kolom yang dianggap identitas item saat menghitung duplikat
+DUPLICATE_KEYS = {
+    'book': ('isbn',),
+    'magazine': ('title', 'publisher', 'issue_number')
+}
+
+MAX_REJECT_SAMPLES = 100
+
+# Backend milik proses worker, dibuat sekali per proses oleh init_worker
+_worker_storage = None
+
+
+def split_ranges(path, parts, start=0):
+    """
+    Membagi file menjadi maksimal `parts` rentang byte [awal, akhir)
+    Setiap batas digeser ke awal baris berikutnya agar tidak ada baris terpotong
+    """
+    size = os.path.getsize(path)
+    if size <= start:
+        return []
+    step = max(1, (size - start) // parts)
+    boundaries = [start]
+    with open(path, 'rb') as f:
+        for position in range(start + step, size, step):
+            if position <= boundaries[-1]:
+                continue
+            f.seek(position - 1)
+            f.readline()  # Habiskan sisa baris tempat posisi jatuh
+            boundary = f.tell()
+            if boundary >= size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+    boundaries.append(size)
+    return list(zip(boundaries, boundaries[1:]))
+
+
+def read_header(path):
+    """
+    Header CSV dan posisi byte baris data pertama
+    Returns: (list nama kolom, offset)
+    """
+    with open(path, 'rb') as f:
+        line = f.readline()
+    header = next(csv.reader([line.decode('utf-8-sig')]))
+    return [name.strip() for name in header], len(line)
+
+
+def iter_range(path, start, end):
+    """Yields: (offset byte, baris mentah) untuk setiap baris yang dimulai di [start, end)"""
+    with open(path, 'rb') as f:
+        f.seek(start)
+        position = start
+        while position < end:
+            line = f.readline()
+            if not line:
+                break
+            yield position, line
+            position += len(line)
+
+
+def count_lines(path, start, end):
+    """Jumlah baris tidak kosong yang dimulai di [start, end), None jika file tidak bisa dibaca"""
+    try:
+        return sum(1 for _, line in iter_range(path, start, end) if line.strip())
+    except OSError:
+        return None
+
+
+def init_worker(engine, sqlite_path):
+    """Initializer ProcessPoolExecutor: setiap worker membuka koneksinya sendiri"""
+    global _worker_storage
+    _worker_storage = create_backend(engine, sqlite_path)
+
+
+def load_range(task):
+    """
+    Dijalankan di proses worker: parse + validasi + insert satu rentang byte
+
+    Args:
+        task: Dictionary (path, fmt, header, start, end, item_type, batch_size,
+              commit_every, reject_file)
+    Returns: Dictionary hasil (pid, read, inserted, rejected, failed, samples, error)
+    """
+    spec = ITEM_TYPES[task['item_type']]
+    table = spec['table']
+    columns = spec['columns']
+    batch_size = task['batch_size']
+    chunk_size = batch_size * task['commit_every']
+    header = task['header']
+
+    result = {
+        'pid': os.getpid(),
+        'range': (task['start'], task['end']),
+        'read': 0,
+        'inserted': 0,
+        'rejected': 0,
+        'failed': 0,
+        'reject_samples': [],
+        'error': None,
+        'unaccounted': False,   # Rentang berhenti di tengah dan sisa barisnya tidak terhitung
+        'elapsed': 0.0
+    }
+    started = time.perf_counter()
+    reject_out = open(task['reject_file'], 'w', encoding='utf-8') if task['reject_file'] else None
+    chunk = []
+    next_offset = task['start']     # Awal baris yang belum dibaca
+    unsettled = 0                   # Baris terbaca yang belum masuk chunk / ditolak
+
+    try:
+        for offset, raw in iter_range(task['path'], task['start'], task['end']):
+            next_offset = offset + len(raw)
+            if not raw.strip():
+                continue
+            result['read'] += 1
+            unsettled = 1
+            record = None
+            try:
+                text = raw.decode('utf-8').strip()
+                if task['fmt'] == 'csv':
+                    record = dict(zip(header, next(csv.reader([text]))))
+                else:
+                    try:
+                        record = json.loads(text)
+                    except ValueError as e:
+                        raise ValueError(f"JSON tidak valid: {e}")
+                    if not isinstance(record, dict):
+                        raise ValueError("Setiap baris JSONL harus berupa object")
+                data = build_item(task['item_type'], record).to_dict()
+            except (ValueError, csv.Error) as e:
+                unsettled = 0
+                result['rejected'] += 1
+                if len(result['reject_samples']) < MAX_REJECT_SAMPLES:
+                    result['reject_samples'].append((f"byte {offset}", str(e)))
+                if reject_out:
+                    reject_out.write(json.dumps({
+                        'offset': offset,
+                        'reason': str(e),
+                        'record': record if isinstance(record, dict) else None
+                    }, ensure_ascii=False) + "\n")
+                continue
+
+            chunk.append(tuple(data[column] for column in columns))
+            unsettled = 0
+            if len(chunk) >= chunk_size:
+                result['inserted'] += _worker_storage.bulk_insert(table, chunk, batch_size)
+                chunk = []
+
+        if chunk:
+            result['inserted'] += _worker_storage.bulk_insert(table, chunk, batch_size)
+            chunk = []
+    except Exception as e:
+        # Chunk yang sedang ditulis sudah di-rollback oleh backend; baris sisa
+        # rentang ini tidak diproses sehingga ikut dihitung gagal (dan terbaca)
+        remaining = count_lines(task['path'], next_offset, task['end'])
+        if remaining is None:
+            result['error'] = f"{e} (sisa rentang tidak bisa dihitung)"
+            result['unaccounted'] = True
+        else:
+            result['error'] = str(e)
+            result['read'] += remaining
+        result['failed'] = len(chunk) + unsettled + (remaining or 0)
+    finally:
+        if reject_out:
+            reject_out.close()
+        result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+class ParallelLoadReport(ImportReport):
+    """
+    ImportReport ditambah rincian per worker dan hasil cek konsistensi
+    (INHERITANCE: tampil di view yang sama dengan import biasa)
+    """
+
+    def __init__(self, item_type, source, workers):
+        super().__init__(item_type, source, max_reject_samples=MAX_REJECT_SAMPLES)
+        self.workers = workers
+        self.chunks = 0
+        self.per_worker = {}
+        self.errors = []
+        self.count_before = None
+        self.count_after = None
+        self.duplicates = None
+        self.unaccounted_ranges = 0
+
+    @property
+    def consistent(self):
+        """True jika pertambahan baris di tabel sama dengan jumlah yang dilaporkan worker"""
+        if self.count_before is None or self.count_after is None:
+            return None
+        if self.unaccounted_ranges:
+            return False
+        return self.count_after - self.count_before == self.inserted
+
+    def add_result(self, result):
+        self.chunks += 1
+        self.read += result['read']
+        self.inserted += result['inserted']
+        self.failed += result['failed']
+        self.unaccounted_ranges += result['unaccounted']
+        for offset, reason in result['reject_samples']:
+            self.add_reject(offset, reason)
+        # add_reject sudah menghitung sampel; sisanya ditambahkan langsung
+        self.rejected += result['rejected'] - len(result['reject_samples'])
+        if result['error']:
+            self.errors.append(f"byte {result['range'][0]}-{result['range'][1]}: {result['error']}")
+            self.error = self.errors[0]
+
+        worker = self.per_worker.setdefault(result['pid'], {
+            'chunks': 0, 'read': 0, 'inserted': 0, 'rejected': 0, 'busy_s': 0.0
+        })
+        worker['chunks'] += 1
+        worker['read'] += result['read']
+        worker['inserted'] += result['inserted']
+        worker['rejected'] += result['rejected']
+        worker['busy_s'] += result['elapsed']
+
+    def to_dict(self):
+        data = super().to_dict()
+        data.update({
+            'workers': self.workers,
+            'chunks': self.chunks,
+            'per_worker': self.per_worker,
+            'errors': self.errors,
+            'count_before': self.count_before,
+            'count_after': self.count_after,
+            'duplicates': self.duplicates,
+            'unaccounted_ranges': self.unaccounted_ranges,
+            'consistent': self.consistent
+        })
+        return data
+
+
+class ParallelLoader:
+    """
+    Import paralel untuk Book dan Magazine
+
+    Alur:
+    1. File dibagi menjadi workers * chunks_per_worker rentang byte
+    2. Setiap rentang dikerjakan satu task di ProcessPoolExecutor
+       (parse, validasi lewat Model, bulk_insert dengan koneksi worker sendiri)
+    3. Hasil task digabung, lalu jumlah baris & duplikat dicek ke database
+    """
+
+    def __init__(self, engine=None, sqlite_path=None, workers=4, batch_size=1000,
+                 commit_every=10, chunks_per_worker=4, reject_file=None):
+        """
+        Args:
+            engine / sqlite_path: Sama dengan create_backend; setiap worker membuat backend sendiri
+            workers: Jumlah proses
+            batch_size: Jumlah baris per executemany
+            commit_every: Jumlah batch per transaksi
+            chunks_per_worker: Rentang per worker (lebih banyak = pembagian beban lebih rata)
+            reject_file: Path file JSONL untuk baris yang ditolak (opsional)
+        """
+        if workers < 1 or batch_size < 1 or commit_every < 1 or chunks_per_worker < 1:
+            raise ValueError("workers, batch_size, commit_every, dan chunks_per_worker harus >= 1")
+        if sqlite_path == ':memory:':
+            raise ValueError("Database ':memory:' tidak bisa dipakai bersama oleh beberapa proses")
+        self.engine = engine
+        self.sqlite_path = sqlite_path
+        self.workers = workers
+        self.batch_size = batch_size
+        self.commit_every = commit_every
+        self.chunks_per_worker = chunks_per_worker
+        self.reject_file = reject_file
+
+    def load_file(self, path, item_type, fmt=None, progress=None):
+        """
+        Import satu file secara paralel
+
+        Args:
+            path: Path file CSV / JSONL
+            item_type: 'book' atau 'magazine'
+            fmt: 'csv' / 'jsonl' (default: dari ekstensi file)
+            progress: Callable(report) yang dipanggil setiap satu rentang selesai
+
+        Returns: ParallelLoadReport
+        """
+        if item_type not in ITEM_TYPES:
+            raise ValueError(f"Jenis item tidak dikenal: {item_type}")
+        fmt = fmt or detect_format(path)
+        table = ITEM_TYPES[item_type]['table']
+
+        report = ParallelLoadReport(item_type, path, self.workers)
+        started = time.perf_counter()
+
+        # Backend di proses utama: membuat schema (SQLite) sebelum worker menulis,
+        # dan dipakai untuk cek konsistensi
+        storage = create_backend(self.engine, self.sqlite_path)
+        try:
+            report.count_before = storage.count(table)
+
+            header, data_start = read_header(path) if fmt == 'csv' else (None, 0)
+            ranges = split_ranges(path, self.workers * self.chunks_per_worker, data_start)
+            tasks = [{
+                'path': path,
+                'fmt': fmt,
+                'header': header,
+                'start': start,
+                'end': end,
+                'item_type': item_type,
+                'batch_size': self.batch_size,
+                'commit_every': self.commit_every,
+                'reject_file': f"{self.reject_file}.part{index}" if self.reject_file else None
+            } for index, (start, end) in enumerate(ranges)]
+
+            # spawn: worker mulai bersih, tidak mewarisi koneksi database proses utama
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=context,
+                                     initializer=init_worker,
+                                     initargs=(self.engine, self.sqlite_path)) as pool:
+                futures = [pool.submit(load_range, task) for task in tasks]
+                for future in as_completed(futures):
+                    try:
+                        report.add_result(future.result())
+                    except Exception as e:
+                        report.errors.append(str(e))
+                        report.error = report.errors[0]
+                    report.elapsed = time.perf_counter() - started
+                    if progress:
+                        progress(report)
+
+            self.__merge_reject_files(tasks)
+            # Tabel diubah oleh proses worker: hasil COUNT di cache proses utama sudah basi
+            storage.invalidate_cache(table)
+            report.count_after = storage.count(table)
+            report.duplicates = storage.count_duplicates(table, DUPLICATE_KEYS[item_type])
+        finally:
+            storage.close()
+            report.elapsed = time.perf_counter() - started
+        return report
+
+    def __merge_reject_files(self, tasks):
+        """Gabungkan file reject per rentang menjadi satu reject_file (urut posisi file)"""
+        if not self.reject_file:
+            return
+        with open(self.reject_file, 'wb') as out:
+            for task in tasks:
+                part = task['reject_file']
+                if os.path.exists(part):
+                    with open(part, 'rb') as f:
+                        shutil.copyfileobj(f, out)
+                    os.remove(part)
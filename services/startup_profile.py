@@ -0,0 +1,111 @@
+"""
+Startup Profile - Mengukur cold start aplikasi
+Waktu import per modul (import hook), lalu tonggak startup seperti
+backend siap, menu tampil (time-to-menu), dan query pertama selesai
+(time-to-first-query), semuanya dihitung dari awal main.py dijalankan
+"""
+
+import sys
+import time
+
+
+class _TimedLoader:
+    """Pembungkus loader modul: exec_module diukur, method lain diteruskan"""
+
+    def __init__(self, loader, timer, name):
+        self.__loader = loader
+        self.__timer = timer
+        self.__name = name
+
+    def create_module(self, spec):
+        return self.__loader.create_module(spec)
+
+    def exec_module(self, module):
+        self.__timer.enter(self.__name)
+        try:
+            self.__loader.exec_module(module)
+        finally:
+            self.__timer.leave(self.__name)
+
+    def __getattr__(self, name):
+        return getattr(self.__loader, name)
+
+
+class ImportTimer:
+    """
+    Meta path finder yang mencatat lama setiap import (seperti python -X importtime)
+
+    cumulative_ms = termasuk import di dalamnya, self_ms = modul itu sendiri.
+    Hanya modul yang diimport setelah install() yang tercatat.
+    """
+
+    def __init__(self):
+        self.records = []       # (nama modul, cumulative_ms, self_ms, kedalaman)
+        self.__stack = []       # [waktu mulai, waktu import anak]
+
+    def install(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        if spec.loader is not None and hasattr(spec.loader, 'exec_module'):
+            spec.loader = _TimedLoader(spec.loader, self, name)
+        return spec
+
+    def enter(self, name):
+        self.__stack.append([time.perf_counter(), 0.0])
+
+    def leave(self, name):
+        started, children = self.__stack.pop()
+        elapsed = (time.perf_counter() - started) * 1000
+        self.records.append((name, elapsed, elapsed - children, len(self.__stack)))
+        if self.__stack:
+            self.__stack[-1][1] += elapsed
+
+    def top(self, count=15):
+        """Modul dengan waktu import sendiri (self_ms) terbesar"""
+        return sorted(self.records, key=lambda record: record[2], reverse=True)[:count]
+
+    def total_ms(self):
+        """Total waktu import tingkat teratas"""
+        return sum(cumulative for _, cumulative, _, depth in self.records if depth == 0)
+
+
+class StartupProfile:
+    """Tonggak waktu startup, dihitung dari `origin` (time.perf_counter di awal main.py)"""
+
+    def __init__(self, origin=None, import_timer=None):
+        self.origin = time.perf_counter() if origin is None else origin
+        self.import_timer = import_timer
+        self.marks = []
+
+    def mark(self, name):
+        """Catat tonggak `name` sekarang; Returns: ms sejak origin"""
+        elapsed = (time.perf_counter() - self.origin) * 1000
+        self.marks.append((name, elapsed))
+        return elapsed
+
+    def report(self, top=15):
+        """
+        Returns: Dictionary {'marks': [(nama, ms)], 'imports_ms', 'imports': [...]}
+        """
+        timer = self.import_timer
+        return {
+            'marks': list(self.marks),
+            'imports_ms': timer.total_ms() if timer else None,
+            'imports': [{'module': name, 'cumulative_ms': cumulative, 'self_ms': own}
+                        for name, cumulative, own, _ in timer.top(top)] if timer else []
+        }
@@ -0,0 +1,152 @@
+"""
+Unified Catalog - Listing dan pencarian gabungan semua tabel katalog
+Setiap tabel di-query bersamaan (thread pool), lalu aliran baris yang sudah
+terurut judul digabung secara lazy dengan k-way merge (heapq.merge), sehingga
+katalog lengkap bisa dibaca tanpa memuat seluruh isi tabel ke memory.
+"""
+
+import heapq
+import threading
+
+from database.storage_backend import CATALOG_TABLES
+
+
+# Penanda cursor tabel yang sudah habis dibaca
+END = 'end'
+
+
+def merge_key(row):
+    """
+    Kunci urutan gabungan: judul tanpa beda huruf besar/kecil (setara collation
+    NOCASE / *_ci di database), lalu id agar urutan stabil
+    """
+    return (row[1] or "").casefold(), row[0] or 0
+
+
+class UnifiedCatalog:
+    """
+    Gabungan beberapa tabel katalog, urut (judul, id)
+
+    Cursor halaman adalah dictionary tabel -> cursor keyset milik tabel itu
+    ((title, id) baris terakhir yang sudah ditampilkan, None = belum mulai,
+    END = habis), sehingga setiap halaman tetap memakai keyset pagination per tabel.
+    """
+
+    def __init__(self, storage, tables=None, searcher=None):
+        """
+        Args:
+            storage: StorageBackend sumber data
+            tables: Tabel yang digabung (default: semua CATALOG_TABLES)
+            searcher: Callable(table, keyword) -> list of rows (default: storage.search)
+        """
+        tables = list(tables or CATALOG_TABLES)
+        for table in tables:
+            if table not in CATALOG_TABLES:
+                raise ValueError(f"Tabel tidak dikenal: {table}")
+        self.storage = storage
+        self.tables = tables
+        self.searcher = searcher or storage.search
+        # Thread pool dibuat saat pertama dipakai (startup tidak membayar import & thread-nya)
+        self.__pool = None
+        self.__pool_lock = threading.Lock()
+
+    def __executor(self):
+        with self.__pool_lock:
+            if self.__pool is None:
+                from concurrent.futures import ThreadPoolExecutor
+                self.__pool = ThreadPoolExecutor(max_workers=len(self.tables),
+                                                 thread_name_prefix='catalog')
+            return self.__pool
+
+    def __run_all(self, function, *args):
+        """Menjalankan function(table, *args) untuk semua tabel secara bersamaan"""
+        pool = self.__executor()
+        futures = [pool.submit(function, table, *args) for table in self.tables]
+        return [future.result() for future in futures]
+
+    def count(self):
+        """Jumlah seluruh item di semua tabel"""
+        return sum(self.__run_all(self.storage.count))
+
+    def list_page(self, cursors=None, limit=20):
+        """
+        Satu halaman gabungan terurut judul
+
+        Setiap tabel diminta `limit` baris setelah cursor-nya (bersamaan), lalu
+        hasilnya di-merge dan diambil `limit` teratas. Cursor tabel hanya maju
+        sebanyak baris tabel itu yang benar-benar tampil.
+
+        Args:
+            cursors: Dictionary tabel -> cursor (None = halaman pertama)
+            limit: Jumlah item per halaman
+
+        Returns: (list of (table, row), next_cursors) - next_cursors None jika halaman terakhir
+        """
+        cursors = dict(cursors or {table: None for table in self.tables})
+        active = [table for table in self.tables if cursors.get(table) != END]
+        pool = self.__executor()
+        futures = {table: pool.submit(self.storage.list_page, table, cursors.get(table), limit)
+                   for table in active}
+        pages = {table: future.result() for table, future in futures.items()}
+
+        streams = [[(merge_key(row), position, table, row) for row in pages[table][0]]
+                   for position, table in enumerate(active)]
+        entries = []
+        taken = {}
+        for _, _, table, row in heapq.merge(*streams):
+            if len(entries) >= limit:
+                break
+            entries.append((table, row))
+            taken[table] = taken.get(table, 0) + 1
+
+        for table in active:
+            rows, next_cursor = pages[table]
+            used = taken.get(table, 0)
+            if used == len(rows) and next_cursor is None:
+                cursors[table] = END
+            elif used:
+                cursors[table] = (rows[used - 1][1], rows[used - 1][0])
+
+        has_next = any(cursor != END for cursor in cursors.values())
+        return entries, (cursors if has_next else None)
+
+    def __stream(self, table, chunk_size):
+        """
+        Baris satu tabel per chunk lewat keyset pagination; chunk berikutnya
+        sudah diminta (prefetch) selagi chunk sekarang diproses konsumen
+        """
+        pool = self.__executor()
+        future = pool.submit(self.storage.list_page, table, None, chunk_size)
+        while future is not None:
+            rows, next_cursor = future.result()
+            future = (pool.submit(self.storage.list_page, table, next_cursor, chunk_size)
+                      if next_cursor is not None else None)
+            for row in rows:
+                yield merge_key(row), table, row
+
+    def iter_entries(self, chunk_size=500):
+        """
+        Generator seluruh katalog terurut judul: (table, row)
+        Memory sebanding chunk_size x jumlah tabel, bukan ukuran tabel
+        """
+        streams = [self.__stream(table, chunk_size) for table in self.tables]
+        for _, table, row in heapq.merge(*streams, key=lambda entry: entry[0]):
+            yield table, row
+
+    def search(self, keyword):
+        """
+        Pencarian di semua tabel sekaligus (bersamaan)
+        Setiap tabel menyumbang hasil teratasnya (lihat searcher), lalu hasil
+        gabungan diurutkan judul dengan k-way merge
+        Returns: List of (table, row)
+        """
+        results = self.__run_all(self.searcher, keyword)
+        streams = [sorted(((merge_key(row), table, row) for row in rows), key=lambda entry: entry[0])
+                   for table, rows in zip(self.tables, results)]
+        return [(table, row) for _, table, row in heapq.merge(*streams, key=lambda entry: entry[0])]
+
+    def close(self):
+        with self.__pool_lock:
+            if self.__pool is not None:
+                self.__pool.shutdown(wait=False)
+                self.__pool = None
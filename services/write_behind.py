@@ -0,0 +1,325 @@
+"""
+Write-Behind Queue - Penyimpanan item baru di latar belakang
+Item yang sudah divalidasi langsung dikonfirmasi ke user, lalu thread worker
+menyimpannya per batch (satu transaksi per tabel) saat antrian penuh atau
+setelah flush_interval. Batch yang gagal diulang per baris: baris yang gagal
+disimpan ke spill file (JSONL, fsync) dan dikirim ulang secara berkala, termasuk
+setelah aplikasi dibuka kembali. Baris yang ditolak database padahal baris lain
+berhasil disimpan dipindahkan ke reject file agar tidak diulang terus.
+"""
+
+import json
+import os
+import threading
+import time
+
+from database.storage_backend import CATALOG_TABLES, insert_columns
+
+
+class PendingWrite:
+    """Satu item yang belum tersimpan di database"""
+
+    __slots__ = ('table', 'data', 'submitted_at', 'error')
+
+    def __init__(self, table, data, submitted_at=None):
+        self.table = table
+        self.data = data
+        self.submitted_at = submitted_at or time.time()
+        self.error = None
+
+    def to_dict(self):
+        record = {'table': self.table, 'data': self.data, 'submitted_at': self.submitted_at}
+        if self.error is not None:
+            record['error'] = self.error
+        return record
+
+
+class WriteBehindQueue:
+    """
+    Antrian tulis dengan worker thread
+
+    Item tetap terlihat lewat pending() sejak submit sampai benar-benar
+    tersimpan (termasuk selama ditulis dan selama berada di spill file),
+    sehingga controller bisa menampilkannya di listing dan pencarian.
+    """
+
+    def __init__(self, storage, max_batch=50, flush_interval=2.0,
+                 spill_file='pending_writes.jsonl', retry_interval=10.0, on_flushed=None,
+                 reject_file='rejected_writes.jsonl'):
+        """
+        Args:
+            storage: StorageBackend tujuan (harus mendukung insert_batch)
+            max_batch: Jumlah item di antrian yang memicu flush segera
+            flush_interval: Detik maksimal item menunggu sebelum di-flush
+            spill_file: Path JSONL untuk batch yang gagal disimpan (None = tanpa spill)
+            retry_interval: Detik antar percobaan ulang isi spill file
+            on_flushed: Callable(table, item_id, data) untuk setiap item yang tersimpan
+            reject_file: Path JSONL untuk baris yang ditolak database (None = hanya dibuang)
+        """
+        if max_batch < 1 or flush_interval <= 0:
+            raise ValueError("max_batch harus >= 1 dan flush_interval > 0")
+        self.storage = storage
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.spill_file = spill_file
+        self.retry_interval = retry_interval
+        self.on_flushed = on_flushed
+        self.reject_file = reject_file
+
+        self.__lock = threading.Lock()
+        self.__wakeup = threading.Condition(self.__lock)
+        self.__flush_lock = threading.Lock()
+        self.__pending = []
+        self.__flushing = []
+        self.__spilled = self.__load_spill()
+        self.__last_retry = 0.0
+        self.__stopped = False
+        self.__stats = {
+            'submitted': 0,
+            'flushed': 0,
+            'batches': 0,
+            'failures': 0,
+            'spilled': 0,
+            'rejected': 0,      # Baris yang ditolak database (dipindah ke reject file)
+            'recovered': len(self.__spilled),
+            'last_error': None
+        }
+        self.__worker = threading.Thread(target=self.__run, name='write-behind', daemon=True)
+        self.__worker.start()
+
+    # ========== API ==========
+
+    def submit(self, table, data):
+        """
+        Menambahkan item ke antrian (tidak menunggu database)
+        Args:
+            data: Dictionary hasil Model.to_dict() yang sudah divalidasi
+        """
+        if table not in CATALOG_TABLES:
+            raise ValueError(f"Tabel tidak dikenal: {table}")
+        with self.__lock:
+            if self.__stopped:
+                raise RuntimeError("Write-behind queue sudah ditutup")
+            self.__pending.append(PendingWrite(table, dict(data)))
+            self.__stats['submitted'] += 1
+            if len(self.__pending) >= self.max_batch:
+                self.__wakeup.notify()
+
+    def pending(self, table=None):
+        """
+        Item yang belum tersimpan (di antrian, sedang ditulis, atau di spill file)
+        Returns: List of dictionary data
+        """
+        with self.__lock:
+            entries = self.__spilled + self.__flushing + self.__pending
+        return [entry.data for entry in entries if table is None or entry.table == table]
+
+    def pending_count(self, table=None):
+        return len(self.pending(table))
+
+    def flush(self, retry_spill=True):
+        """
+        Menyimpan semua item di antrian sekarang juga (dipanggil worker atau saat keluar)
+        Args:
+            retry_spill: Coba kirim ulang isi spill file (mengabaikan retry_interval)
+        Returns: Jumlah item yang berhasil disimpan
+        """
+        with self.__flush_lock:
+            saved = 0
+            now = time.monotonic()
+            if self.__spilled and (retry_spill or now - self.__last_retry >= self.retry_interval):
+                self.__last_retry = now
+                spilled = list(self.__spilled)
+                stored, failed = self.__write(spilled)
+                saved += stored
+                if len(failed) != len(spilled):
+                    self.__rewrite_spill(failed)
+                    with self.__lock:
+                        self.__spilled = failed
+
+            with self.__lock:
+                batch = self.__pending
+                self.__pending = []
+                self.__flushing = batch
+            if batch:
+                stored, failed = self.__write(batch)
+                saved += stored
+                if failed:
+                    self.__append_spill(failed)
+                with self.__lock:
+                    self.__spilled.extend(failed)
+                    self.__flushing = []
+            return saved
+
+    def close(self, timeout=30.0):
+        """
+        Menghentikan worker setelah flush terakhir
+        Returns: Statistik akhir (lihat get_stats)
+        """
+        with self.__lock:
+            self.__stopped = True
+            self.__wakeup.notify()
+        self.__worker.join(timeout)
+        # Jaga-jaga jika worker sudah berhenti lebih dulu: sisa antrian tetap disimpan
+        self.flush()
+        return self.get_stats()
+
+    def get_stats(self):
+        """
+        Statistik antrian (submitted, flushed, batches, failures, spilled, rejected, pending)
+        Returns: Dictionary
+        """
+        with self.__lock:
+            stats = dict(self.__stats)
+            stats['pending'] = len(self.__pending) + len(self.__flushing)
+            stats['spill_pending'] = len(self.__spilled)
+        return stats
+
+    # ========== WORKER ==========
+
+    def __run(self):
+        while True:
+            with self.__lock:
+                if not self.__stopped and len(self.__pending) < self.max_batch:
+                    self.__wakeup.wait(self.flush_interval)
+                stopping = self.__stopped
+            # Spill file dicoba ulang hanya tiap retry_interval, kecuali saat berhenti
+            self.flush(retry_spill=stopping)
+            if stopping:
+                return
+
+    def __write(self, entries):
+        """
+        Simpan entries ke database, satu transaksi per tabel
+
+        Batch yang gagal diulang per baris agar satu baris buruk (misal nilai di
+        luar jangkauan kolom) tidak menahan baris lain yang sudah dikonfirmasi ke
+        user. Jika sebagian baris berhasil, baris yang tetap gagal berarti ditolak
+        database dan dipindah ke reject file; jika semuanya gagal (database tidak
+        bisa dihubungi) semuanya dikembalikan untuk dicoba lagi.
+
+        Returns: (jumlah tersimpan, entries yang gagal dan perlu dicoba lagi)
+        """
+        by_table = {}
+        for entry in entries:
+            by_table.setdefault(entry.table, []).append(entry)
+
+        saved = 0
+        failed = []
+        for table, table_entries in by_table.items():
+            columns = insert_columns(table)
+            rows = [tuple(entry.data.get(column) for column in columns) for entry in table_entries]
+            try:
+                ids = self.storage.insert_batch(table, rows)
+            except Exception as e:
+                self.__record_failure(e)
+                if len(table_entries) == 1:
+                    failed.extend(table_entries)
+                    continue
+                stored, rejected = self.__write_rows(table, table_entries, rows)
+                saved += stored
+                if stored:
+                    self.__reject(rejected)
+                else:
+                    failed.extend(rejected)
+                continue
+            self.__stored(table, table_entries, ids)
+            saved += len(table_entries)
+        return saved, failed
+
+    def __write_rows(self, table, entries, rows):
+        """
+        Simpan baris satu per satu (satu transaksi per baris)
+        Returns: (jumlah tersimpan, entries yang gagal)
+        """
+        saved = 0
+        failed = []
+        for entry, row in zip(entries, rows):
+            try:
+                ids = self.storage.insert_batch(table, [row])
+            except Exception as e:
+                entry.error = str(e)
+                failed.append(entry)
+                continue
+            self.__stored(table, [entry], ids)
+            saved += 1
+        return saved, failed
+
+    def __record_failure(self, error):
+        with self.__lock:
+            self.__stats['failures'] += 1
+            self.__stats['last_error'] = str(error)
+
+    def __stored(self, table, entries, ids):
+        with self.__lock:
+            self.__stats['flushed'] += len(entries)
+            self.__stats['batches'] += 1
+        if self.on_flushed:
+            for entry, item_id in zip(entries, ids):
+                try:
+                    self.on_flushed(table, item_id, entry.data)
+                except Exception as e:
+                    # Data sudah tersimpan; kegagalan callback tidak boleh menghentikan worker
+                    with self.__lock:
+                        self.__stats['last_error'] = f"on_flushed: {e}"
+
+    # ========== SPILL FILE ==========
+
+    def __load_spill(self):
+        """Membaca item yang gagal disimpan pada sesi sebelumnya"""
+        if not self.spill_file or not os.path.exists(self.spill_file):
+            return []
+        entries = []
+        with open(self.spill_file, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                    entries.append(PendingWrite(record['table'], record['data'],
+                                                record.get('submitted_at')))
+                except (ValueError, KeyError):
+                    # Baris terakhir bisa terpotong jika proses mati saat menulis
+                    continue
+        return entries
+
+    def __append_spill(self, entries):
+        if not self.spill_file:
+            return
+        with open(self.spill_file, 'a', encoding='utf-8') as f:
+            f.write("".join(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+                            for entry in entries))
+            f.flush()
+            os.fsync(f.fileno())
+        with self.__lock:
+            self.__stats['spilled'] += len(entries)
+
+    def __reject(self, entries):
+        """Baris yang ditolak database: dicatat di reject file dan tidak dicoba lagi"""
+        if not entries:
+            return
+        if self.reject_file:
+            with open(self.reject_file, 'a', encoding='utf-8') as f:
+                f.write("".join(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+                                for entry in entries))
+                f.flush()
+                os.fsync(f.fileno())
+        with self.__lock:
+            self.__stats['rejected'] += len(entries)
+
+    def __rewrite_spill(self, entries):
+        """Ganti isi spill file dengan entries yang masih gagal (atomik lewat file sementara)"""
+        if not self.spill_file:
+            return
+        if not entries:
+            if os.path.exists(self.spill_file):
+                os.remove(self.spill_file)
+            return
+        temporary = self.spill_file + ".tmp"
+        with open(temporary, 'w', encoding='utf-8') as f:
+            f.write("".join(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n"
+                            for entry in entries))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temporary, self.spill_file)
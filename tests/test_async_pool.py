@@ -0,0 +1,200 @@
+"""
+Test AsyncConnectionPool - Perhitungan slot saat acquire timeout, dibatalkan,
+dan saat koneksi dibuang / gagal dibuat
+"""
+
+import asyncio
+import unittest
+
+from database.async_connection import AsyncConnectionPool
+from database.connection_pool import PoolTimeoutError
+
+
+class FakeConnection:
+    """Koneksi palsu: hanya status closed yang dipakai pool"""
+
+    def __init__(self, number):
+        self.number = number
+        self.closed = False
+
+    async def rollback(self):
+        pass
+
+    async def close(self):
+        self.closed = True
+
+
+class AsyncConnectionPoolTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.created = []
+        self.failures = 0
+
+    async def factory(self):
+        await asyncio.sleep(0)
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("server tidak bisa dihubungi")
+        connection = FakeConnection(len(self.created) + 1)
+        self.created.append(connection)
+        return connection
+
+    def make_pool(self, max_size=1, timeout=1.0):
+        return AsyncConnectionPool(self.factory, max_size=max_size, timeout=timeout)
+
+    async def waiting(self, pool):
+        """Task acquire yang sudah masuk antrian penunggu"""
+        waits = pool.get_stats()['waits']
+        task = asyncio.ensure_future(pool.acquire())
+        while pool.get_stats()['waits'] == waits:
+            await asyncio.sleep(0)
+        return task
+
+    @staticmethod
+    async def settle(pool, task):
+        """
+        Tunggu task acquire yang dibatalkan setelah menerima koneksi / slot
+        Python < 3.12: wait_for mengembalikan hasilnya walau task dibatalkan,
+        jadi koneksi itu dikembalikan di sini; 3.12+: pool meneruskannya sendiri
+        """
+        try:
+            connection = await task
+        except asyncio.CancelledError:
+            return
+        await pool.release(connection)
+
+    def assert_slots(self, pool, size, idle):
+        stats = pool.get_stats()
+        self.assertEqual((stats['size'], stats['idle']), (size, idle))
+        self.assertLessEqual(stats['size'], stats['max_size'])
+
+    # ========== TIMEOUT ==========
+
+    async def test_timeout_keeps_slot_of_borrowed_connection(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        with self.assertRaises(PoolTimeoutError):
+            await pool.acquire(timeout=0.01)
+        self.assertEqual(pool.get_stats()['timeouts'], 1)
+        self.assert_slots(pool, size=1, idle=0)
+
+        await pool.release(held)
+        self.assert_slots(pool, size=1, idle=1)
+        self.assertIs(await pool.acquire(timeout=0.01), held)
+        self.assertEqual(len(self.created), 1)
+
+    async def test_timed_out_waiter_is_skipped_on_release(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        with self.assertRaises(PoolTimeoutError):
+            await pool.acquire(timeout=0.01)
+        second = await self.waiting(pool)
+
+        await pool.release(held)
+        self.assertIs(await second, held)
+        self.assert_slots(pool, size=1, idle=0)
+
+    # ========== CANCEL ==========
+
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        waiter = await self.waiting(pool)
+        waiter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiter
+
+        await pool.release(held)
+        self.assert_slots(pool, size=1, idle=1)
+
+    async def test_connection_handed_to_cancelled_waiter_goes_to_next(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        first = await self.waiting(pool)
+        second = await self.waiting(pool)
+
+        # Koneksi diserahkan ke penunggu pertama, lalu penunggu itu dibatalkan
+        # sebelum sempat berjalan: koneksi harus diteruskan ke penunggu berikutnya
+        await pool.release(held)
+        first.cancel()
+        await self.settle(pool, first)
+        self.assertIs(await second, held)
+        self.assert_slots(pool, size=1, idle=0)
+
+    async def test_slot_handed_to_cancelled_waiter_goes_to_next(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        first = await self.waiting(pool)
+        second = await self.waiting(pool)
+
+        await pool.release(held, discard=True)
+        first.cancel()
+        await self.settle(pool, first)
+        connection = await second
+        self.assertIsNot(connection, held)
+        self.assertEqual(len(self.created), 2)
+        self.assert_slots(pool, size=1, idle=0)
+
+    # ========== DISCARD / FACTORY GAGAL ==========
+
+    async def test_discard_lets_waiter_create_new_connection(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        waiter = await self.waiting(pool)
+
+        await pool.release(held, discard=True)
+        self.assertTrue(held.closed)
+        self.assertEqual((await waiter).number, 2)
+        self.assertEqual(pool.get_stats()['discarded'], 1)
+        self.assert_slots(pool, size=1, idle=0)
+
+    async def test_factory_failure_returns_slot_to_next_waiter(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        first = await self.waiting(pool)
+        second = await self.waiting(pool)
+
+        self.failures = 1
+        await pool.release(held, discard=True)
+        with self.assertRaises(ConnectionError):
+            await first
+        self.assertEqual((await second).number, 2)
+        self.assert_slots(pool, size=1, idle=0)
+
+    async def test_factory_failure_without_waiters_frees_slot(self):
+        pool = self.make_pool()
+        self.failures = 1
+        with self.assertRaises(ConnectionError):
+            await pool.acquire()
+        self.assert_slots(pool, size=0, idle=0)
+        self.assertEqual((await pool.acquire(timeout=0.01)).number, 1)
+
+    # ========== URUTAN & CLOSE ==========
+
+    async def test_waiters_are_served_in_fifo_order(self):
+        pool = self.make_pool(max_size=2)
+        held = [await pool.acquire(), await pool.acquire()]
+        first = await self.waiting(pool)
+        second = await self.waiting(pool)
+
+        await pool.release(held[1])
+        await pool.release(held[0])
+        self.assertIs(await first, held[1])
+        self.assertIs(await second, held[0])
+        self.assert_slots(pool, size=2, idle=0)
+
+    async def test_close_fails_waiters_and_closes_returned_connections(self):
+        pool = self.make_pool()
+        held = await pool.acquire()
+        waiter = await self.waiting(pool)
+
+        await pool.close()
+        with self.assertRaises(PoolTimeoutError):
+            await waiter
+        await pool.release(held)
+        self.assertTrue(held.closed)
+        self.assert_slots(pool, size=0, idle=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
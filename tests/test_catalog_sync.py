@@ -0,0 +1,141 @@
+"""
+Test CatalogSync - Watermark (updated_at, id), pengiriman ulang di jendela lag,
+batch, kegagalan di tengah polling, dan full resync setelah listener gagal
+"""
+
+import unittest
+
+from database.sqlite_backend import SQLiteBackend
+from services.catalog_sync import CatalogSync
+
+
+class ClockedBackend(SQLiteBackend):
+    """SQLite dengan CURRENT_TIMESTAMP yang diatur test dan changed_since yang bisa dibuat gagal"""
+
+    def __init__(self):
+        super().__init__(':memory:', maintain_stats=False)
+        self.now = '2026-01-01 10:00:00'
+        self.fail_after_calls = None
+        self.calls = 0
+
+    def current_timestamp(self):
+        return self.now
+
+    def changed_since(self, table, watermark=None, limit=1000):
+        self.calls += 1
+        if self.fail_after_calls is not None and self.calls > self.fail_after_calls:
+            raise RuntimeError("koneksi putus")
+        return super().changed_since(table, watermark, limit)
+
+    def add_book(self, title, updated_at):
+        def work(cursor):
+            cursor.execute("INSERT INTO books (title, author, year, isbn, updated_at) "
+                           "VALUES (?, ?, ?, ?, ?)", (title, "Penulis", 2000, None, updated_at))
+            return cursor.lastrowid
+        return self._transaction(work, tables=('books',))
+
+
+class CatalogSyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.storage = ClockedBackend()
+        self.delivered = []
+        self.resets = []
+
+    def tearDown(self):
+        self.storage.close()
+
+    def make_sync(self, lag=2.0, batch_size=1000):
+        sync = CatalogSync(self.storage, tables=['books'], batch_size=batch_size, lag=lag)
+        sync.add_listener(lambda table, rows: self.delivered.extend(row[1] for row in rows),
+                          on_reset=self.resets.append)
+        return sync
+
+    def poll(self, sync):
+        """Returns: Judul yang dikirim ke listener pada satu polling"""
+        self.delivered = []
+        sync.sync_once()
+        return self.delivered
+
+    # ========== WATERMARK & LAG ==========
+
+    def test_rows_inside_lag_window_are_redelivered_until_settled(self):
+        self.storage.add_book("Lama", '2026-01-01 09:59:00')
+        self.storage.add_book("Baru", '2026-01-01 09:59:59')
+        sync = self.make_sync(lag=2.0)
+
+        self.assertEqual(self.poll(sync), ["Lama", "Baru"])
+        # Batas aman 09:59:58: watermark berhenti di "Lama", "Baru" dikirim ulang
+        self.assertEqual(sync.get_watermarks()['books'][0], '2026-01-01 09:59:00')
+        self.assertEqual(self.poll(sync), ["Baru"])
+
+        self.storage.now = '2026-01-01 10:00:05'
+        self.assertEqual(self.poll(sync), ["Baru"])
+        self.assertEqual(sync.get_watermarks()['books'][0], '2026-01-01 09:59:59')
+        self.assertEqual(self.poll(sync), [])
+
+    def test_late_commit_inside_lag_window_is_not_missed(self):
+        self.storage.add_book("Pertama", '2026-01-01 09:59:59')
+        sync = self.make_sync(lag=2.0)
+        self.assertEqual(self.poll(sync), ["Pertama"])
+
+        # Transaksi yang commit terlambat dengan updated_at sebelum baris yang sudah terkirim
+        self.storage.add_book("Terlambat", '2026-01-01 09:59:58')
+        self.assertEqual(self.poll(sync), ["Terlambat", "Pertama"])
+
+    def test_mark_current_skips_settled_rows_but_rereads_lag_window(self):
+        self.storage.add_book("Sudah di-scan", '2026-01-01 09:50:00')
+        self.storage.add_book("Di jendela lag", '2026-01-01 09:59:59')
+        sync = self.make_sync(lag=2.0)
+        self.assertTrue(sync.mark_current())
+        self.assertEqual(sync.get_watermarks()['books'], ('2026-01-01 09:59:58', None))
+
+        self.assertEqual(self.poll(sync), ["Di jendela lag"])
+
+    def test_same_second_rows_across_batches_are_delivered_once(self):
+        for number in range(5):
+            self.storage.add_book(f"Buku {number}", '2026-01-01 09:00:00')
+        sync = self.make_sync(lag=0, batch_size=2)
+
+        self.assertEqual(self.poll(sync), [f"Buku {number}" for number in range(5)])
+        self.assertEqual(sync.get_watermarks()['books'], ('2026-01-01 09:00:00', 5))
+        self.assertEqual(self.poll(sync), [])
+
+    # ========== KEGAGALAN ==========
+
+    def test_failure_mid_pull_keeps_progress_of_delivered_batches(self):
+        for number in range(4):
+            self.storage.add_book(f"Buku {number}", f'2026-01-01 09:00:0{number}')
+        sync = self.make_sync(lag=0, batch_size=2)
+        self.storage.fail_after_calls = 1
+
+        self.assertEqual(self.poll(sync), ["Buku 0", "Buku 1"])
+        self.assertEqual(sync.get_stats()['errors'], 1)
+        self.assertEqual(sync.get_watermarks()['books'], ('2026-01-01 09:00:01', 2))
+
+        self.storage.fail_after_calls = None
+        self.assertEqual(self.poll(sync), ["Buku 2", "Buku 3"])
+
+    def test_listener_error_triggers_full_resync(self):
+        self.storage.add_book("A", '2026-01-01 09:00:00')
+        sync = self.make_sync(lag=0)
+        failing = [True]
+
+        def flaky(table, rows):
+            if failing[0]:
+                failing[0] = False
+                raise ValueError("index rusak")
+        sync.add_listener(flaky)
+
+        self.assertEqual(self.poll(sync), ["A"])
+        self.assertEqual(self.resets, [])
+        self.storage.add_book("B", '2026-01-01 09:30:00')
+
+        # Polling berikutnya: listener dikosongkan lalu semua baris dikirim ulang
+        self.assertEqual(self.poll(sync), ["A", "B"])
+        self.assertEqual(self.resets, ['books'])
+        self.assertEqual(sync.get_stats()['full_resyncs'], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
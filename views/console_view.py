@@ -3,6 +3,44 @@ Console View - Interface untuk berinteraksi dengan user
 Bagian VIEW dari MVC
 """
 
+import sys
+from contextlib import contextmanager
+
+from config import DISPLAY_CONFIG
+
+try:
+    import readline
+except ImportError:  # Windows tanpa readline: saran tetap bisa lewat akhiran '?'
+    readline = None
+
+
+@contextmanager
+def tab_completion(suggest):
+    """
+    Selama blok berjalan, tombol Tab pada input() melengkapi ketikan memakai
+    suggest(prefix) (seluruh baris dianggap satu prefix)
+    """
+    if readline is None:
+        yield
+        return
+    options = []
+
+    def complete(text, state):
+        if state == 0:
+            options[:] = suggest(text) if text.strip() else []
+        return options[state] if state < len(options) else None
+
+    previous_completer = readline.get_completer()
+    previous_delims = readline.get_completer_delims()
+    readline.set_completer(complete)
+    readline.set_completer_delims("")
+    readline.parse_and_bind("tab: complete")
+    try:
+        yield
+    finally:
+        readline.set_completer(previous_completer)
+        readline.set_completer_delims(previous_delims)
+
 
 class ConsoleView:
     """
@@ -14,6 +52,15 @@ class ConsoleView:
     3. TIDAK mengandung logika bisnis (itu tugas Controller dan Model)
     """
     
+    def __init__(self, layout=None, render_batch=None):
+        """
+        Args:
+            layout: 'table' (satu baris per item) atau 'detail' (display_info lengkap)
+            render_batch: Jumlah baris yang digabung dalam satu kali write ke layar
+        """
+        self.layout = layout or DISPLAY_CONFIG.get('layout', 'table')
+        self.render_batch = render_batch or DISPLAY_CONFIG.get('render_batch', 200)
+    
     def clear_screen(self):
         """Clear console screen"""
         print("\n" * 2)
@@ -31,6 +78,8 @@ class ConsoleView:
         print("MENU UTAMA:")
         print("1. Kelola Buku")
         print("2. Kelola Majalah")
+        print("3. Katalog Gabungan (Buku + Majalah)")
+        print("4. Statistik Katalog")
         print("0. Keluar")
         print("─" * 50)
     
@@ -54,6 +103,24 @@ class ConsoleView:
         print("0. Kembali ke Menu Utama")
         print("─" * 50)
     
+    def show_catalog_menu(self):
+        """Tampilkan menu katalog gabungan"""
+        print("\n" + "─" * 50)
+        print("MENU KATALOG GABUNGAN:")
+        print("1. Tampilkan Semua Item")
+        print("2. Cari di Buku & Majalah")
+        print("0. Kembali ke Menu Utama")
+        print("─" * 50)
+    
+    def show_stats_menu(self):
+        """Tampilkan menu statistik"""
+        print("\n" + "─" * 50)
+        print("MENU STATISTIK:")
+        print("1. Tampilkan Statistik")
+        print("2. Hitung Ulang dari Data Katalog")
+        print("0. Kembali ke Menu Utama")
+        print("─" * 50)
+    
     def get_input(self, prompt="Pilih menu: "):
         """Mendapatkan input dari user"""
         return input(prompt).strip()
@@ -69,24 +136,91 @@ class ConsoleView:
             except ValueError:
                 self.show_error("Input harus berupa angka!")
     
-    def display_items(self, items, title="DAFTAR ITEM"):
+    def display_items(self, items, title="DAFTAR ITEM", total=None):
         """
-        Menampilkan list of items (Book atau Magazine)
-        Demonstrasi POLYMORPHISM: semua item punya method display_info()
+        Menampilkan items (Book atau Magazine) dari list maupun generator
+        Demonstrasi POLYMORPHISM: semua item punya method display_info() dan display_row()
+        
+        Args:
+            items: Iterable item, tidak perlu list (tidak memakai len())
+            total: Jumlah seluruh item (misal dari COUNT query), default = jumlah yang tampil
         """
-        print("\n" + "=" * 50)
-        print(f" {title} ".center(50, "="))
-        print("=" * 50)
+        sys.stdout.write("\n" + "=" * 50 + "\n" + f" {title} ".center(50, "=") + "\n" + "=" * 50 + "\n")
         
-        if not items or len(items) == 0:
+        shown = self.render_items(items or ())
+        if shown == 0:
             print("Tidak ada data.")
-        else:
-            for item in items:
+        
+        print(f"Total: {shown if total is None else total} item")
+    
+    def render_items(self, items, layout=None):
+        """
+        Menulis item ke layar per batch: teks satu batch digabung lalu ditulis sekali,
+        bukan print() per baris
+        
+        Layout 'table': satu baris per item (display_row), judul kolom diulang
+        setiap jenis item berganti. Layout 'detail': display_info() lengkap.
+        Returns: Jumlah item yang ditulis
+        """
+        layout = layout or self.layout
+        write = sys.stdout.write
+        separator = "-" * 50
+        buffer = []
+        header = None
+        shown = 0
+        for item in items:
+            if layout == 'table':
+                row_header = item.ROW_HEADER
+                if row_header != header:
+                    header = row_header
+                    buffer.append(header)
+                    buffer.append("-" * len(header))
+                buffer.append(item.display_row())
+            else:
                 # POLYMORPHISM: display_info() berbeda untuk Book dan Magazine
-                print(item.display_info())
-                print("-" * 50)
+                buffer.append(item.display_info())
+                buffer.append(separator)
+            shown += 1
+            if len(buffer) >= self.render_batch:
+                write("\n".join(buffer) + "\n")
+                buffer.clear()
+        if buffer:
+            write("\n".join(buffer) + "\n")
+        sys.stdout.flush()
+        return shown
+    
+    def toggle_layout(self):
+        """Berganti antara tampilan tabel dan detail"""
+        self.layout = 'detail' if self.layout == 'table' else 'table'
+    
+    def get_page_action(self, has_prev, has_next, total_pages=None):
+        """
+        Menanyakan navigasi halaman
+        Returns: 'n' (berikutnya), 'p' (sebelumnya), 'r' (tampilkan ulang setelah
+                 ganti layout), nomor halaman (int) untuk lompat, atau 'q' (selesai)
+        """
+        options = []
+        if has_next:
+            options.append("n=berikutnya")
+        if has_prev:
+            options.append("p=sebelumnya")
+        if total_pages and total_pages > 1:
+            options.append(f"nomor 1-{total_pages}=lompat")
+        if not options:
+            return 'q'
+        options.append("t=ganti tampilan")
+        options.append("q=selesai")
         
-        print(f"Total: {len(items) if items else 0} item")
+        while True:
+            action = input(f"\n[{', '.join(options)}]: ").strip().lower() or 'q'
+            if action == 't':
+                self.toggle_layout()
+                return 'r'
+            if not action.isdigit():
+                return action
+            if total_pages and 1 <= int(action) <= total_pages:
+                return int(action)
+            self.show_error(f"Halaman harus antara 1 dan {total_pages or 1}!")
     
     def get_book_input(self):
         """Mendapatkan input untuk buku baru"""
@@ -134,9 +268,145 @@ class ConsoleView:
             'issue_number': issue_number
         }
     
-    def get_search_keyword(self):
-        """Mendapatkan keyword untuk pencarian"""
-        return input("\nMasukkan kata kunci pencarian: ").strip()
+    def get_search_keyword(self, suggest=None):
+        """
+        Mendapatkan keyword untuk pencarian
+        
+        Args:
+            suggest: Callable(prefix) -> list of teks saran (autocomplete, opsional).
+                     Tekan Tab untuk melengkapi, atau akhiri ketikan dengan '?'
+                     untuk memilih dari daftar saran.
+        """
+        if suggest is None:
+            return input("\nMasukkan kata kunci pencarian: ").strip()
+        
+        prompt = "\nMasukkan kata kunci pencarian (Tab / akhiri '?' untuk saran): "
+        with tab_completion(suggest):
+            keyword = input(prompt).strip()
+            while keyword.endswith('?'):
+                options = suggest(keyword[:-1])
+                if not options:
+                    self.show_info(f"Tidak ada saran untuk '{keyword[:-1]}'")
+                    keyword = input(prompt).strip()
+                    continue
+                for number, text in enumerate(options, start=1):
+                    print(f"  {number}. {text}")
+                choice = input("Pilih nomor saran, atau ketik kata kunci: ").strip()
+                if choice.isdigit() and 1 <= int(choice) <= len(options):
+                    return options[int(choice) - 1]
+                keyword = choice
+        return keyword
+    
+    def show_import_report(self, report):
+        """Tampilkan ringkasan hasil import data massal"""
+        print("\n" + "=" * 50)
+        print(" HASIL IMPORT ".center(50, "="))
+        print("=" * 50)
+        print(f"File      : {report.source}")
+        print(f"Jenis     : {report.item_type}")
+        print(f"Dibaca    : {report.read} baris")
+        print(f"Tersimpan : {report.inserted} baris")
+        print(f"Ditolak   : {report.rejected} baris")
+        print(f"Waktu     : {report.elapsed:.2f} detik ({report.rows_per_second:,.0f} baris/detik)")
+        for location, reason in report.reject_samples[:10]:
+            # Import biasa mencatat nomor baris, import paralel mencatat posisi byte (teks)
+            location = location if isinstance(location, str) else f"baris {location}"
+            print(f"   - {location}: {reason}")
+        if report.rejected > 10:
+            print(f"   ... dan {report.rejected - 10} penolakan lainnya")
+        if report.error:
+            self.show_error(f"Import berhenti: {report.error} ({report.failed} baris di-rollback)")
+    
+    def show_load_consistency(self, report):
+        """Tampilkan rincian worker dan hasil cek konsistensi import paralel"""
+        print(f"Worker    : {report.workers} proses, {report.chunks} rentang")
+        for pid, worker in sorted(report.per_worker.items()):
+            print(f"   - pid {pid}: {worker['inserted']} tersimpan, {worker['rejected']} ditolak "
+                  f"({worker['chunks']} rentang, sibuk {worker['busy_s']:.2f} detik)")
+        if report.count_after is not None:
+            added = report.count_after - report.count_before
+            print(f"Database  : {report.count_before} -> {report.count_after} baris (+{added})")
+            print(f"Duplikat  : {report.duplicates} baris")
+            if report.consistent:
+                self.show_success("Jumlah baris di database sesuai laporan worker")
+            elif report.unaccounted_ranges:
+                self.show_error(f"Tidak konsisten: {report.unaccounted_ranges} rentang berhenti di tengah "
+                                f"dan sisa barisnya tidak terhitung")
+            else:
+                self.show_error(f"Tidak konsisten: worker melaporkan {report.inserted} baris, "
+                                f"database bertambah {added} (ada proses lain yang menulis?)")
+        for error in report.errors[1:]:
+            self.show_error(error)
+    
+    def show_export_report(self, report):
+        """Tampilkan ringkasan hasil export katalog"""
+        print("\n" + "=" * 50)
+        print(" HASIL EXPORT ".center(50, "="))
+        print("=" * 50)
+        print(f"File      : {report.destination}")
+        print(f"Jenis     : {report.item_type}")
+        print(f"Format    : {report.fmt}" + (f" ({report.compression})" if report.compression else ""))
+        print(f"Ditulis   : {report.rows} baris, {report.bytes_written / 1024 / 1024:.2f} MB")
+        print(f"Waktu     : {report.elapsed:.2f} detik ({report.rows_per_second:,.0f} baris/detik, "
+              f"{report.megabytes_per_second:.1f} MB/detik)")
+        if report.error:
+            self.show_error(f"Export gagal: {report.error}")
+    
+    def show_query_stats(self, stats):
+        """Tampilkan ringkasan statistik query (diurutkan dari total waktu terbesar)"""
+        print("\n" + "=" * 50)
+        print(" STATISTIK QUERY ".center(50, "="))
+        print("=" * 50)
+        print(f"Total     : {stats['total_queries']} query, {stats['total_ms']:.1f} ms")
+        print(f"Lambat    : {stats['slow_queries']} query")
+        prepared = stats.get('prepared')
+        if prepared:
+            print(f"Prepared  : {prepared['statements']} statement, {prepared['prepares']} prepare "
+                  f"({prepared['reprepares']} ulang), {prepared['executes']} eksekusi, "
+                  f"{prepared['fallbacks']} tanpa prepare")
+        for entry in stats['statements']:
+            statement = entry['statement']
+            if len(statement) > 70:
+                statement = statement[:67] + "..."
+            print(f"\n{statement}")
+            print(f"   {entry['count']}x  total {entry['total_ms']:.1f} ms  "
+                  f"avg {entry['avg_ms']:.2f} ms  max {entry['max_ms']:.2f} ms  "
+                  f"baris {entry['rows']}  error {entry['errors']}")
+            histogram = "  ".join(f"{label}:{count}" for label, count in entry['histogram'].items() if count)
+            print(f"   {histogram}")
+    
+    def show_startup_profile(self, report):
+        """Tampilkan laporan cold start (lihat StartupProfile.report)"""
+        print("\n" + "=" * 50)
+        print(" PROFIL STARTUP ".center(50, "="))
+        print("=" * 50)
+        for name, elapsed in report['marks']:
+            print(f"{name:<36} {elapsed:>9.1f} ms")
+        if report['imports_ms'] is not None:
+            print(f"\nImport modul aplikasi: {report['imports_ms']:.1f} ms, terlama (tanpa sub-import):")
+            for entry in report['imports']:
+                print(f"   {entry['module'][:34]:<34} {entry['self_ms']:>7.1f} ms "
+                      f"(total {entry['cumulative_ms']:.1f})")
+    
+    def show_catalog_stats(self, stats):
+        """
+        Tampilkan statistik katalog sebagai grafik batang teks
+        Args:
+            stats: Dictionary judul bagian -> list of (kelompok, jumlah)
+        """
+        print("\n" + "=" * 50)
+        print(" STATISTIK KATALOG ".center(50, "="))
+        print("=" * 50)
+        for section, rows in stats.items():
+            print(f"\n{section}:")
+            if not rows:
+                print("   (belum ada data)")
+                continue
+            highest = max(count for _, count in rows)
+            for bucket, count in rows:
+                label = (bucket or "(kosong)")[:24]
+                bar = "█" * max(1, round(count / highest * 20))
+                print(f"   {label:<24} {count:>7}  {bar}")
     
     def show_success(self, message):
         """Tampilkan pesan sukses"""
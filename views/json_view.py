@@ -0,0 +1,111 @@
+"""
+JSON View - Tampilan untuk service HTTP (pasangan ConsoleView)
+Mengubah item Model menjadi dictionary JSON dan membaca input JSON,
+sehingga controller dan model yang sama dipakai console maupun service
+"""
+
+import base64
+import json
+from collections import deque
+
+from database.storage_backend import insert_columns
+
+
+# Field bertipe angka; field lain teks
+INTEGER_FIELDS = ('year', 'issue_number')
+
+
+class JsonView:
+    """
+    View tanpa layar: method show_* menyimpan pesan terakhir (dipakai jika
+    controller melaporkan sesuatu), method lain menyusun / membaca JSON
+    """
+
+    def __init__(self, max_messages=100):
+        self.messages = deque(maxlen=max_messages)
+
+    # ========== OUTPUT ==========
+
+    def item_to_dict(self, item):
+        """Item (Book / Magazine / row view) -> dictionary JSON"""
+        data = {'id': item.get_id(), 'type': item.KIND}
+        data.update(item.to_dict())
+        return data
+
+    def render_items(self, items):
+        return [self.item_to_dict(item) for item in items]
+
+    def render_page(self, items, next_cursor):
+        """Satu halaman listing; next_cursor dikodekan agar bisa dikirim balik apa adanya"""
+        return {
+            'items': self.render_items(items),
+            'next': self.encode_cursor(next_cursor)
+        }
+
+    def render_error(self, message):
+        return {'error': message}
+
+    @staticmethod
+    def dumps(data):
+        return json.dumps(data, ensure_ascii=False, default=str).encode('utf-8')
+
+    # ========== INPUT ==========
+
+    @staticmethod
+    def encode_cursor(cursor):
+        """Cursor keyset (title, id) -> string aman untuk URL, None tetap None"""
+        if cursor is None:
+            return None
+        raw = json.dumps(list(cursor), ensure_ascii=False).encode('utf-8')
+        return base64.urlsafe_b64encode(raw).decode('ascii').rstrip("=")
+
+    @staticmethod
+    def decode_cursor(text):
+        """
+        Kebalikan encode_cursor
+        Raises: ValueError jika cursor rusak
+        """
+        if not text:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+            title, item_id = json.loads(raw.decode('utf-8'))
+        except (ValueError, TypeError) as e:
+            raise ValueError("Cursor tidak valid") from e
+        if not isinstance(title, str) or not isinstance(item_id, int):
+            raise ValueError("Cursor tidak valid")
+        return title, item_id
+
+    def parse_item(self, table, body):
+        """
+        Body request JSON -> dictionary field item (field lain diabaikan)
+        Raises: ValueError jika JSON rusak atau tipe field salah
+        """
+        try:
+            payload = json.loads(body.decode('utf-8') if isinstance(body, bytes) else body)
+        except (ValueError, UnicodeDecodeError) as e:
+            raise ValueError(f"Body bukan JSON yang valid: {e}") from e
+        if not isinstance(payload, dict):
+            raise ValueError("Body harus berupa object JSON")
+
+        data = {}
+        for field in insert_columns(table):
+            value = payload.get(field)
+            if value is not None:
+                expected = int if field in INTEGER_FIELDS else str
+                if isinstance(value, bool) or not isinstance(value, expected):
+                    kind = "angka" if expected is int else "teks"
+                    raise ValueError(f"Field {field} harus berupa {kind}")
+            data[field] = value
+        return data
+
+    # ========== PESAN (dipanggil controller) ==========
+
+    def show_success(self, message):
+        self.messages.append(('success', message))
+
+    def show_error(self, message):
+        self.messages.append(('error', message))
+
+    def show_info(self, message):
+        self.messages.append(('info', message))